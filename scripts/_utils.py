@@ -1,6 +1,11 @@
+import time
 from pathlib import Path
 
+from htpy_uikit.classes import collect_classes
+from htpy_uikit.cssgen import build_css
+from htpy_uikit.cssgen import html_classes
 from htpy_uikit.demo import demo_page
+from htpy_uikit.demo.hydration import hydration_document
 
 ROOT = Path(__file__).resolve().parent.parent
 THEME_SRC = ROOT / "src" / "htpy_uikit" / "tailwind-themes" / "theme.css"
@@ -8,10 +13,37 @@ DIST = ROOT / "dist"
 INPUT_TAILWIND_CSS = ROOT / "scripts" / "input.css"
 
 
-def build_demo_assets() -> None:
+def build_demo_assets() -> str:
     DIST.mkdir(parents=True, exist_ok=True)
-    (DIST / "index.html").write_text(demo_page(), encoding="utf-8")
+    html = demo_page()
+    (DIST / "index.html").write_text(html, encoding="utf-8")
+    # Init-time comparison pages for lazy hydration.
+    for name, lazy in (("hydration.html", False), ("hydration-lazy.html", True)):
+        page = str(hydration_document(lazy=lazy))
+        (DIST / name).write_text(page, encoding="utf-8")
     (DIST / "theme.css").write_text(THEME_SRC.read_text(encoding="utf-8"), encoding="utf-8")
     (DIST / "input.css").write_text(
         INPUT_TAILWIND_CSS.read_text(encoding="utf-8"), encoding="utf-8"
     )
+    return html
+
+
+def build_demo_css(html: str | None = None) -> None:
+    """Write ``dist/output.css`` with the pure-Python generator (no Node required).
+
+    The vocabulary is every class the components can emit plus the classes in the rendered
+    demo page; the result is cached by content hash, so unchanged restarts are instant.
+    """
+    start = time.perf_counter()
+    classes = collect_classes(use_cache=True) | html_classes(html or demo_page())
+    classes |= html_classes(str(hydration_document(lazy=False, rows=1)))
+    result = build_css(classes, THEME_SRC.read_text(encoding="utf-8"))
+    DIST.mkdir(parents=True, exist_ok=True)
+    (DIST / "output.css").write_text(result.css, encoding="utf-8")
+    ms = (time.perf_counter() - start) * 1000
+    print(f"✓ CSS generated for {len(classes)} classes in {ms:.0f}ms ({result.digest})")
+    if result.unsupported:
+        # Marker classes used only as JS/CSS hooks land here too, so this warns instead
+        # of failing; a utility in this list gets no CSS.
+        names = " ".join(result.unsupported)
+        print(f"! {len(result.unsupported)} classes have no generated rule: {names}")
@@ -0,0 +1,107 @@
+"""Startup benchmark for the non-interactive ``htpyuikit`` commands.
+
+Runs each command in a fresh interpreter and reports wall time (best and median of
+``--repeat`` runs) next to a bare ``python -c pass`` baseline. With ``--check`` the
+script exits non-zero when a command's median exceeds ``--target-ms`` above the
+baseline, or when importing the CLI drags in the interactive-only dependencies.
+
+Usage:
+    PYTHONPATH=src python -m scripts.bench_cli [--repeat N] [--target-ms MS] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Commands that must start fast; they are what scripted callers (pre-commit hooks) run.
+COMMANDS: list[list[str]] = [["--version"], ["list"], ["themes"]]
+DEFAULT_TARGET_MS = 150.0
+
+# Only the interactive pickers may import these.
+INTERACTIVE_MODULES = ("questionary", "prompt_toolkit")
+
+_RUN_CLI = "from htpy_uikit.cli import main; main()"
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT / "src"), env.get("PYTHONPATH", "")) if p
+    )
+    return env
+
+
+def time_command(argv: list[str], repeat: int) -> list[float]:
+    """Return wall times in milliseconds for ``repeat`` fresh runs of ``argv``."""
+    env = _env()
+    times: list[float] = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        subprocess.run(argv, env=env, check=True, capture_output=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def leaked_interactive_modules() -> list[str]:
+    """Return interactive-only modules loaded by a plain ``import htpy_uikit.cli``."""
+    code = (
+        "import sys, htpy_uikit.cli; "
+        f"print(' '.join(m for m in {INTERACTIVE_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], env=_env(), check=True, capture_output=True, text=True
+    )
+    return proc.stdout.split()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure htpyuikit CLI startup time")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command (default: 10)")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=DEFAULT_TARGET_MS,
+        help=f"Allowed median wall time above the bare interpreter (default: {DEFAULT_TARGET_MS:g})",
+    )
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if a target is missed")
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(time_command([sys.executable, "-c", "pass"], args.repeat))
+    print(f"python -c pass: {baseline:.1f} ms (median)\n")
+
+    failures: list[str] = []
+    width = max(len(" ".join(c)) for c in COMMANDS)
+    print(f"{'command':<{width}}  {'best ms':>8}  {'median ms':>9}  {'overhead':>8}")
+    for command in COMMANDS:
+        times = time_command([sys.executable, "-c", _RUN_CLI, *command], args.repeat)
+        median = statistics.median(times)
+        overhead = median - baseline
+        label = " ".join(command)
+        flag = ""
+        if overhead > args.target_ms:
+            failures.append(label)
+            flag = "  OVER"
+        print(f"{label:<{width}}  {min(times):>8.1f}  {median:>9.1f}  {overhead:>8.1f}{flag}")
+
+    leaked = leaked_interactive_modules()
+    if leaked:
+        print(f"\nimport htpy_uikit.cli loaded interactive-only modules: {', '.join(leaked)}")
+        failures.extend(leaked)
+
+    if failures:
+        print(f"\nTargets missed: {', '.join(failures)}")
+        return 1 if args.check else 0
+    print(f"\nAll commands within {args.target_ms:g} ms of interpreter startup.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
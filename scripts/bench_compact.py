@@ -0,0 +1,82 @@
+"""HTML size comparison between full utility classes and compact semantic classes.
+
+Renders a few class-heavy fixtures once with the default ``_styles.py`` output and once
+with ``HTPY_UIKIT_COMPACT_CLASSES=1`` (each in a fresh interpreter, since the mode is
+fixed at import) and reports raw and gzip bytes per fixture.
+
+Usage:
+    PYTHONPATH=src python -m scripts.bench_compact [--options N] [--rows N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_RENDER = """
+import gzip, json, sys
+from htpy_uikit.components import button_component, select_component, table_component
+from htpy_uikit.demo import demo_page
+
+n_options, n_rows = int(sys.argv[1]), int(sys.argv[2])
+fixtures = {
+    f"select ({n_options} options)": lambda: select_component(
+        id="s", options=[{"value": str(i), "label": f"Option {i}"} for i in range(n_options)]
+    ),
+    f"table ({n_rows} rows x button)": lambda: table_component(
+        headers=["Name", "Action"],
+        rows=[[f"Row {i}", button_component(variant="outline", size="sm")["Edit"]]
+              for i in range(n_rows)],
+    ),
+    "demo_page": demo_page,
+}
+out = {}
+for name, render in fixtures.items():
+    html = str(render()).encode()
+    out[name] = [len(html), len(gzip.compress(html))]
+print(json.dumps(out))
+"""
+
+
+def render_sizes(compact: bool, n_options: int, n_rows: int) -> dict[str, list[int]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT / "src"), env.get("PYTHONPATH", "")) if p
+    )
+    env["HTPY_UIKIT_COMPACT_CLASSES"] = "1" if compact else "0"
+    proc = subprocess.run(
+        [sys.executable, "-c", _RENDER, str(n_options), str(n_rows)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare HTML size with compact classes")
+    parser.add_argument("--options", type=int, default=1000, help="Options in the select")
+    parser.add_argument("--rows", type=int, default=500, help="Rows in the table")
+    args = parser.parse_args(argv)
+
+    full = render_sizes(False, args.options, args.rows)
+    compact = render_sizes(True, args.options, args.rows)
+    print(f"{'fixture':<30} {'full':>10} {'compact':>10} {'saved':>10}   gzip full/compact")
+    for name, (raw, gz) in full.items():
+        c_raw, c_gz = compact[name]
+        print(
+            f"{name:<30} {raw / 1024:>8.1f}KB {c_raw / 1024:>8.1f}KB "
+            f"{(raw - c_raw) / 1024:>8.1f}KB   {gz / 1024:.1f}KB/{c_gz / 1024:.1f}KB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+"""Import-time benchmark for ``htpy_uikit.components.*``.
+
+Each module is imported in a fresh interpreter under ``python -X importtime`` so the
+numbers reflect a worker cold start. Besides the module's cumulative time, the report
+shows the "kit" time: the summed self time of every ``htpy_uikit`` module loaded by that
+import. Third-party imports (htpy, markupsafe) dominate the cumulative figure and are
+out of our hands, so budgets apply to the kit time only. Numbers are the best of
+``--repeat`` runs.
+
+Usage:
+    PYTHONPATH=src python -m scripts.bench_import [--repeat N] [--check] [module ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from htpy_uikit.registry import COMPONENTS_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "htpy_uikit.components"
+
+# Kit import-time budgets in milliseconds. Modules not listed use DEFAULT_BUDGET_MS.
+DEFAULT_BUDGET_MS = 50.0
+BUDGETS_MS: dict[str, float] = {
+    # The lazy facade must not import any component module.
+    PACKAGE: 5.0,
+    f"{PACKAGE}._styles": 10.0,
+    f"{PACKAGE}._utils": 8.0,
+    # Must stay clear of the _types_lucide Literal at runtime.
+    f"{PACKAGE}.lucide": 10.0,
+    f"{PACKAGE}.icons": 25.0,
+}
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s?( *)(\S+)$")
+
+
+def iter_component_modules() -> list[str]:
+    """Return the dotted names of every module in the components package."""
+    return sorted(
+        f"{PACKAGE}.{p.stem}" for p in COMPONENTS_DIR.glob("*.py") if p.stem != "__init__"
+    )
+
+
+def measure_import(module: str) -> tuple[int, int]:
+    """Import ``module`` in a fresh interpreter; return ``(cumulative_us, kit_us)``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT / "src"), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative_us: int | None = None
+    kit_us = 0
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        name = m.group(4)
+        if name == "htpy_uikit" or name.startswith("htpy_uikit."):
+            kit_us += int(m.group(1))
+        if name == module:
+            cumulative_us = int(m.group(2))
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry found for {module}")
+    return cumulative_us, kit_us
+
+
+def best_of(module: str, repeat: int) -> tuple[int, int]:
+    """Return the fastest ``(cumulative_us, kit_us)`` over ``repeat`` runs."""
+    runs = [measure_import(module) for _ in range(max(1, repeat))]
+    return min(r[0] for r in runs), min(r[1] for r in runs)
+
+
+def budget_for(module: str) -> float:
+    return BUDGETS_MS.get(module, DEFAULT_BUDGET_MS)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold import time of components")
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        help="Module names to measure (default: every htpy_uikit.components module)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per module; best is kept (default: 5)"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero if any module exceeds its budget"
+    )
+    args = parser.parse_args(argv)
+
+    modules = [
+        m if m == PACKAGE or m.startswith(f"{PACKAGE}.") else f"{PACKAGE}.{m}" for m in args.modules
+    ] or [PACKAGE, *iter_component_modules()]
+    width = max(len(m) for m in modules)
+
+    over: list[str] = []
+    print(f"{'module':<{width}}  {'cumul ms':>8}  {'kit ms':>8}  {'budget':>8}")
+    for module in modules:
+        cumulative_us, kit_us = best_of(module, args.repeat)
+        budget = budget_for(module)
+        flag = ""
+        if kit_us / 1000 > budget:
+            over.append(module)
+            flag = "  OVER"
+        print(
+            f"{module:<{width}}  {cumulative_us / 1000:>8.2f}  {kit_us / 1000:>8.2f}"
+            f"  {budget:>8.1f}{flag}"
+        )
+
+    if over:
+        print(f"\n{len(over)} module(s) over budget: {', '.join(over)}")
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
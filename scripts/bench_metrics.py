@@ -0,0 +1,149 @@
+"""Render overhead of the production metrics (``components/metrics.py``).
+
+Two measurements:
+
+- Per call: ``timeit`` of the metrics wrapper around a trivial component minus the bare
+  component, for an unsampled call and for a sampled one (build plus serialization).
+- Per page: the demo page through ``render_page``, alternately with metrics off and at
+  each sample rate.
+
+Render-to-render noise on a shared machine is often larger than the overhead itself, and
+it drifts within seconds. So every configuration is timed next to a metrics-off render
+(one warm render each, with the garbage collector paused as ``timeit`` does, and the
+order flipped every pair), and the measured overhead is the median over ``--pairs`` of
+the on/off ratios. ``--check`` gates on that measured number; the estimate ``calls per
+page x wrapper cost / page time`` is printed next to it for reference.
+
+Usage:
+    PYTHONPATH=src python -m scripts.bench_metrics [--pairs N] [--check [--max-overhead PCT]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable
+
+from htpy import span
+
+from htpy_uikit.components import metrics
+from htpy_uikit.components._instrument import ComponentFunction
+from htpy_uikit.demo import demo_page
+
+DEFAULT_RATES = (0.01, 0.05, 0.2, 1.0)
+DEFAULT_RATE = metrics.enable_metrics.__kwdefaults__["sample_rate"]
+
+
+def _noop():
+    return span["x"]
+
+
+def wrapper_cost(sampled: bool, number: int = 50_000) -> float:
+    """Seconds the wrapper adds to one call of a trivial component.
+
+    Unsampled calls are timed without serialization, which they leave untouched;
+    sampled calls include it, since their cost is in the observed serialization.
+    """
+    target = ComponentFunction("noop", __name__, _noop)
+    wrapped = metrics._metered(target, metrics.MetricsRegistry(), 1.0 if sampled else 0.0)
+
+    def best(func: Callable[[], object]) -> float:
+        stmt = (lambda: str(func())) if sampled else func
+        return min(timeit.repeat(stmt, number=number, repeat=7)) / number
+
+    return max(0.0, best(wrapped) - best(_noop))
+
+
+def time_render(rate: float | None) -> float:
+    """CPU seconds of one render with metrics off (None) or at ``rate``."""
+    if rate is not None:
+        metrics.enable_metrics(sample_rate=rate)
+    try:
+        # Patching rebinds module globals, which drops the interpreter's cached lookups;
+        # production enables metrics once, so time a warm render.
+        metrics.render_page("demo", demo_page)
+        gc.collect()
+        gc.disable()
+        try:
+            # CPU time of this process: other load on a shared machine does not count.
+            start = time.process_time()
+            metrics.render_page("demo", demo_page)
+            return time.process_time() - start
+        finally:
+            gc.enable()
+    finally:
+        metrics.disable_metrics()
+
+
+def page_ratios(rates: list[float], pairs: int) -> tuple[list[float], dict[float, list[float]]]:
+    """Metrics-off render times, and per rate the ratios of adjacent on/off renders."""
+    off_times: list[float] = []
+    ratios: dict[float, list[float]] = {rate: [] for rate in rates}
+    for i in range(pairs + 1):
+        for rate in rates:
+            if i % 2:
+                off, on = time_render(None), time_render(rate)
+            else:
+                on, off = time_render(rate), time_render(None)
+            if i:  # pair 0 warms up imports and the patched wrappers
+                off_times.append(off)
+                ratios[rate].append(on / off)
+    return off_times, ratios
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the render overhead of metrics")
+    parser.add_argument("--pairs", type=int, default=60, help="Off/on render pairs per rate")
+    parser.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        default=DEFAULT_RATES,
+        help="Sample rates to compare with metrics off",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=f"Exit non-zero when the measured overhead at sample_rate={DEFAULT_RATE:g} "
+        "exceeds --max-overhead",
+    )
+    parser.add_argument("--max-overhead", type=float, default=3.0, help="Percent (default 3)")
+    args = parser.parse_args(argv)
+
+    unsampled, sampled = wrapper_cost(False), wrapper_cost(True)
+    print(
+        f"wrapper cost per call: {unsampled * 1e6:.2f} µs unsampled, {sampled * 1e6:.2f} µs sampled"
+    )
+
+    registry = metrics.enable_metrics(sample_rate=0.0)
+    metrics.render_page("demo", demo_page)
+    metrics.disable_metrics()
+    calls = sum(row["count"] for row in registry.snapshot()["components"].values())
+
+    rates = sorted({*args.rates, DEFAULT_RATE})
+    off_times, ratios = page_ratios(rates, max(1, args.pairs))
+    base = statistics.median(off_times)
+    print(f"demo_page: {calls} component calls, {base * 1000:.2f} ms with metrics off")
+    print(f"{'metrics':<16} {'measured':>9} {'estimate':>9}   (median of {args.pairs} pairs)")
+    measured: dict[float, float] = {}
+    for rate in rates:
+        measured[rate] = 100 * (statistics.median(ratios[rate]) - 1)
+        cost = calls * ((1 - rate) * unsampled + rate * sampled)
+        print(f"{f'sample_rate={rate:g}':<16} {measured[rate]:>8.1f}% {100 * cost / base:>8.2f}%")
+
+    if args.check and measured[DEFAULT_RATE] > args.max_overhead:
+        print(
+            f"measured overhead at sample_rate={DEFAULT_RATE:g} is "
+            f"{measured[DEFAULT_RATE]:.1f}%, above {args.max_overhead:g}%",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
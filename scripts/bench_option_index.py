@@ -0,0 +1,141 @@
+"""Build time, query latency and update cost of ``OptionIndex`` at 10k/100k/1M options.
+
+Generates deterministic customer-style labels ("Harper Lindqvist (Acme Logistics) #004217"),
+builds an index per size and times a mix of queries (one letter, word prefix, two words,
+mid-word substring, typo) against a linear ``in`` scan over the labels as baseline. With
+NumPy installed, the pure-Python and NumPy scoring paths are both reported, and
+``--check`` fails unless NumPy scores the typo query faster at every size from the
+default ``numpy_threshold`` up.
+
+Usage:
+    PYTHONPATH=src python -m scripts.bench_option_index [--sizes 10000 100000 1000000] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from htpy_uikit.components import option_index
+from htpy_uikit.components.option_index import OptionIndex
+
+FIRST = "Harper Liam Olivia Noah Amelia Mateo Sofia Elias Maya Luca Aria Kenji Zara Omar Ines"
+LAST = "Lindqvist Okafor Moreau Tanaka Schultz Rossi Novak Haddad Costa Nguyen Walsh Ivanova"
+COMPANY = "Acme Globex Initech Umbrella Stark Wayne Tyrell Cyberdyne Soylent Hooli Vandelay"
+KIND = "Logistics Foods Labs Holdings Partners Systems Studio Analytics Retail Energy"
+
+# Index size from which ``OptionIndex`` scores fuzzy matches with NumPy by default.
+NUMPY_THRESHOLD = OptionIndex.__init__.__kwdefaults__["numpy_threshold"]
+
+QUERIES = {
+    "one letter": "h",
+    "word prefix": "lindq",
+    "two words": "olivia tan",
+    "substring": "ogist",
+    "typo": "umbrela labs",
+}
+
+
+def make_options(n: int, seed: int = 0) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    first, last, company, kind = (s.split() for s in (FIRST, LAST, COMPANY, KIND))
+    return [
+        {
+            "value": f"c{i}",
+            "label": f"{rng.choice(first)} {rng.choice(last)} "
+            f"({rng.choice(company)} {rng.choice(kind)}) #{i:06}",
+        }
+        for i in range(n)
+    ]
+
+
+def best_ms(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return 1000 * statistics.median(times)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark OptionIndex")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Index sizes"
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Results per query")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (median)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=f"Exit non-zero unless NumPy wins the typo query from {NUMPY_THRESHOLD:,} options",
+    )
+    args = parser.parse_args(argv)
+
+    paths = {"python": None}
+    if option_index.np is not None:
+        paths["numpy"] = 0
+    elif args.check:
+        print("--check compares against the NumPy path; install numpy", file=sys.stderr)
+        return 1
+    else:
+        print("numpy not installed; benchmarking the pure-Python path only")
+    failures = []
+
+    for size in args.sizes:
+        options = make_options(size)
+        labels = [o["label"].casefold() for o in options]
+        start = time.perf_counter()
+        index = OptionIndex(options, numpy_threshold=None)
+        build = time.perf_counter() - start
+        print(f"\n{size:,} options: built in {build:.2f}s")
+
+        header = f"{'query':<12} {'linear scan':>12}" + "".join(f" {p:>10}" for p in paths)
+        print(header)
+        for name, query in QUERIES.items():
+            needle = query.casefold()
+            scan = best_ms(
+                lambda n=needle, xs=labels: [x for x in xs if n in x][: args.limit], args.repeat
+            )
+            row = f"{name:<12} {scan:>10.2f}ms"
+            times = {}
+            for path, threshold in paths.items():
+                index.numpy_threshold = threshold
+                index.search(query, args.limit)  # warm (NumPy builds its postings once)
+                times[path] = best_ms(
+                    lambda q=query, ix=index: ix.search(q, args.limit), args.repeat
+                )
+                row += f" {times[path]:>8.2f}ms"
+            print(row)
+            numpy_applies = name == "typo" and "numpy" in times and size >= NUMPY_THRESHOLD
+            if numpy_applies and times["numpy"] >= times["python"]:
+                failures.append(
+                    f"{size:,} options: numpy {times['numpy']:.2f}ms is not faster "
+                    f"than python {times['python']:.2f}ms on the typo query"
+                )
+        index.numpy_threshold = None
+
+        extra = make_options(1000, seed=1)
+        for option in extra:
+            option["value"] = f"x{option['value']}"
+        start = time.perf_counter()
+        index.update(extra)
+        added = time.perf_counter() - start
+        start = time.perf_counter()
+        for option in extra:
+            index.remove(option["value"])
+        removed = time.perf_counter() - start
+        print(f"add 1000: {added * 1000:.1f}ms, remove 1000: {removed * 1000:.1f}ms")
+
+    if args.check and failures:
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+"""Check that minified inline scripts/styles match the originals and report bytes saved.
+
+Renders the components with inline Alpine state once with the default output and once
+with ``HTPY_UIKIT_MINIFY=1`` (each in a fresh interpreter, since the mode is fixed at
+import). The two documents must have the same elements and attributes; every value that
+differs must be the same JavaScript (or CSS) token stream with only comments and
+whitespace removed. When ``node`` is on PATH each minified expression is also
+syntax-checked, which catches a dropped line break that automatic semicolon insertion
+relied on.
+
+Usage:
+    PYTHONPATH=src python -m scripts.check_minify [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from html.parser import HTMLParser
+from pathlib import Path
+
+from htpy_uikit.components._utils import iter_js_tokens
+from htpy_uikit.components._utils import minify_css
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_RENDER = """
+import json
+import random
+from htpy_uikit.components.alert_dialog import alert_dialog_host
+from htpy_uikit.components.combobox import combobox
+from htpy_uikit.components.dropdown_menu import dropdown_menu, dropdown_menu_item
+from htpy_uikit.components.modal import modal_host
+from htpy_uikit.components.select import multiselect_component, select_component
+from htpy_uikit.components.theme_toggle import theme_toggle
+from htpy_uikit.components.toast import toaster
+from htpy_uikit.components.tooltip import tooltip
+
+options = [{"value": str(i), "label": f"Option {i}"} for i in range(5)]
+fixtures = {
+    "select": lambda: select_component(id="s", options=options, value="1"),
+    "multiselect": lambda: multiselect_component(id="m", options=options, values=["1"]),
+    "combobox": lambda: combobox(id="c", options=options),
+    "dropdown_menu": lambda: dropdown_menu(trigger="Open", id="d")[dropdown_menu_item("Item")],
+    "tooltip": lambda: tooltip(content="Hint")["Hover"],
+    "theme_toggle": theme_toggle,
+    "toaster": toaster,
+    "alert_dialog_host": alert_dialog_host,
+    "modal_host": modal_host,
+}
+random.seed(0)  # generated ids must match across the two runs
+print(json.dumps({name: str(render()) for name, render in fixtures.items()}))
+"""
+
+# Attributes holding CSS rather than JavaScript.
+_CSS_ATTRS = {"style"}
+
+
+class _Elements(HTMLParser):
+    """Flatten a document into ``(tag, attrs, text)`` triples."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.elements: list[tuple[str, list[tuple[str, str]], str]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.elements.append((tag, [(k, v or "") for k, v in attrs], ""))
+
+    def handle_data(self, data: str) -> None:
+        if self.elements and self.elements[-1][0] == "style":
+            tag, attrs, text = self.elements[-1]
+            self.elements[-1] = (tag, attrs, text + data)
+
+
+def parse(html: str) -> list[tuple[str, list[tuple[str, str]], str]]:
+    parser = _Elements()
+    parser.feed(html)
+    return parser.elements
+
+
+def js_tokens(code: str) -> list[str]:
+    return [token for _, token in iter_js_tokens(code)]
+
+
+def css_tokens(code: str) -> str:
+    # The minifier's own output is the canonical form: comments and spacing removed.
+    return minify_css(code)
+
+
+def render(minify: bool) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT / "src"), env.get("PYTHONPATH", "")) if p
+    )
+    env["HTPY_UIKIT_MINIFY"] = "1" if minify else "0"
+    proc = subprocess.run(
+        [sys.executable, "-c", _RENDER], env=env, check=True, capture_output=True, text=True
+    )
+    return json.loads(proc.stdout)
+
+
+def compare(name: str, full: str, small: str) -> tuple[list[str], list[str]]:
+    """Return (problems, minified JS expressions) for one component."""
+    problems: list[str] = []
+    expressions: list[str] = []
+    a, b = parse(full), parse(small)
+    if [e[0] for e in a] != [e[0] for e in b]:
+        return [f"{name}: element structure differs"], []
+    for (tag, attrs_a, text_a), (_, attrs_b, text_b) in zip(a, b, strict=True):
+        if [k for k, _ in attrs_a] != [k for k, _ in attrs_b]:
+            problems.append(f"{name}: <{tag}> attribute names differ")
+            continue
+        if css_tokens(text_a) != css_tokens(text_b):
+            problems.append(f"{name}: <{tag}> stylesheet tokens differ")
+        for (key, va), (_, vb) in zip(attrs_a, attrs_b, strict=True):
+            if va == vb:
+                continue
+            if key in _CSS_ATTRS:
+                same = css_tokens(va) == css_tokens(vb)
+            else:
+                same = js_tokens(va) == js_tokens(vb)
+                expressions.append(vb)
+            if not same:
+                problems.append(f"{name}: <{tag} {key}> tokens differ")
+    return problems, expressions
+
+
+def node_check(expressions: list[str]) -> list[str]:
+    """Syntax-check each expression with ``node --check``; empty when node is missing."""
+    node = shutil.which("node")
+    if not node:
+        return []
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, expr in enumerate(expressions):
+            path = Path(tmp) / f"expr{i}.js"
+            path.write_text(f"void function () {{ return (\n{expr}\n); }};\n", encoding="utf-8")
+            proc = subprocess.run(
+                [node, "--check", str(path)], check=False, capture_output=True, text=True
+            )
+            if proc.returncode:
+                problems.append(f"node --check failed:\n{proc.stderr.strip()}")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify and measure inline JS/CSS minification")
+    parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero on any difference beyond whitespace"
+    )
+    args = parser.parse_args(argv)
+
+    full = render(False)
+    small = render(True)
+    problems: list[str] = []
+    expressions: list[str] = []
+    print(f"{'component':<16} {'full':>9} {'minified':>9} {'saved':>7}   gzip full/minified")
+    for name, html in full.items():
+        found, exprs = compare(name, html, small[name])
+        problems += found
+        expressions += exprs
+        raw, mini = html.encode(), small[name].encode()
+        saved = 100 * (len(raw) - len(mini)) / len(raw)
+        print(
+            f"{name:<16} {len(raw):>8}B {len(mini):>8}B {saved:>6.1f}%   "
+            f"{len(gzip.compress(raw))}B/{len(gzip.compress(mini))}B"
+        )
+    problems += node_check(expressions)
+    if not shutil.which("node"):
+        print("node not found; skipped the syntax check")
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if not problems:
+        print(f"ok: {len(expressions)} minified scripts are token-for-token equivalent")
+    return 1 if problems and args.check else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
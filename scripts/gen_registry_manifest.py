@@ -0,0 +1,130 @@
+"""Generate ``src/htpy_uikit/registry.json``, the component registry manifest.
+
+The manifest records, for every package module, its exported names, docstring summary,
+internal dependencies and content hash, so the CLI can list and resolve components
+without parsing any source file. The same exports also generate the ``_EXPORTS`` map
+and ``__all__`` of ``components/__init__.py``, the lazy package facade. Re-run after
+changing a component; ``--check`` exits non-zero when the committed manifest or facade
+is stale (useful in CI).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from htpy_uikit.registry import COMPONENTS_DIR
+from htpy_uikit.registry import MANIFEST_PATH
+from htpy_uikit.registry import build_manifest
+
+FACADE_PATH = COMPONENTS_DIR / "__init__.py"
+# The generated block: the ``_EXPORTS`` literal through ``__all__``.
+_FACADE_BLOCK_RE = re.compile(
+    r"^_EXPORTS: dict\[str, tuple\[str, \.\.\.\]\] = \{\n.*?^__all__ = \(\n.*?^\)\n",
+    re.MULTILINE | re.DOTALL,
+)
+_LINE_LENGTH = 100
+
+
+def render_manifest() -> str:
+    return json.dumps(build_manifest(), indent=2) + "\n"
+
+
+def facade_exports(manifest: dict) -> dict[str, tuple[str, ...]]:
+    """Public component module -> its exports, minus a function named like the module.
+
+    The import system binds the submodule to that name, so such a function is reached
+    through the module (``components.dialog.dialog``).
+    """
+    exports: dict[str, tuple[str, ...]] = {}
+    owners: dict[str, str] = {}
+    for key, entry in manifest["modules"].items():
+        folder, _, filename = key.partition("/")
+        stem = filename.removesuffix(".py")
+        if folder != "components" or stem.startswith("_"):
+            continue
+        names = tuple(name for name in entry["exports"] if name != stem)
+        for name in names:
+            if name in owners:
+                raise SystemExit(f"{name} is exported by both {owners[name]} and {stem}")
+            owners[name] = stem
+        exports[stem] = names
+    return dict(sorted(exports.items()))
+
+
+def _render_tuple(prefix: str, names: tuple[str, ...], suffix: str) -> list[str]:
+    # Laid out as ``ruff format`` would: on one line when it fits, else one per line.
+    items = ", ".join(f'"{n}"' for n in names) + ("," if len(names) == 1 else "")
+    line = f"{prefix}({items}){suffix}"
+    if len(line) <= _LINE_LENGTH:
+        return [line]
+    indent = " " * (len(prefix) - len(prefix.lstrip()) + 4)
+    return [f"{prefix}(", *(f'{indent}"{n}",' for n in names), f"{indent[4:]}){suffix}"]
+
+
+def render_facade(source: str, exports: dict[str, tuple[str, ...]]) -> str:
+    """Return ``components/__init__.py`` with its generated block rebuilt from ``exports``."""
+    lines = ["_EXPORTS: dict[str, tuple[str, ...]] = {"]
+    for module, names in exports.items():
+        lines += _render_tuple(f'    "{module}": ', names, ",")
+    lines += ["}", "", "_EXPORT_TO_MODULE: dict[str, str] = {"]
+    lines += ["    name: module for module, names in _EXPORTS.items() for name in names", "}"]
+    lines += ["", "__all__ = (", *(f'    "{n}",' for n in sorted(sum(exports.values(), ()))), ")"]
+    block = "\n".join(lines) + "\n"
+    new, count = _FACADE_BLOCK_RE.subn(lambda _: block, source)
+    if count != 1:
+        raise SystemExit(f"{FACADE_PATH}: generated _EXPORTS/__all__ block not found")
+    return new
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    old = path.read_text(encoding="utf-8") if path.exists() else None
+    if old == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the component registry manifest")
+    parser.add_argument(
+        "--dest",
+        type=Path,
+        default=MANIFEST_PATH,
+        help="Destination path for the manifest (default: the package's registry.json)",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Do not write; exit 1 if the manifest is stale"
+    )
+    args = parser.parse_args(argv)
+
+    # The facade is itself a manifest entry, so it is rebuilt first.
+    facade_source = FACADE_PATH.read_text(encoding="utf-8")
+    facade = render_facade(facade_source, facade_exports(build_manifest()))
+    if args.check:
+        stale = [FACADE_PATH] if facade != facade_source else []
+        current = args.dest.read_text(encoding="utf-8") if args.dest.exists() else None
+        if current != render_manifest():
+            stale.append(args.dest)
+        for path in stale:
+            print(f"{path} is stale; run: python -m scripts.gen_registry_manifest")
+        if stale:
+            return 1
+        print(f"{args.dest} is up-to-date")
+        return 0
+
+    if write_if_changed(FACADE_PATH, facade):
+        print(f"Updated {FACADE_PATH}")
+    content = render_manifest()
+    changed = write_if_changed(args.dest, content)
+    out = "updated" if changed else "up-to-date"
+    modules = len(json.loads(content)["modules"])
+    print(f"Wrote {args.dest} ({out}) with {modules} modules")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,44 +1,78 @@
-import subprocess
-
 from flask import Flask
 from flask import Response
 from flask import abort
+from flask import request
 from flask import send_file
 
-from htpy_uikit.demo import demo_page
+from htpy_uikit.components.combobox import combobox_results
+from htpy_uikit.components.option_index import OptionIndex
+from htpy_uikit.components.server_timing import init_flask
+from htpy_uikit.components.server_timing import render_timed
+from htpy_uikit.components.tabs import tab_panel
+from htpy_uikit.demo.accordion import FAQ_PANELS
+from htpy_uikit.demo.dialog import edit_profile_form
+from htpy_uikit.demo.hydration import hydration_document
+from htpy_uikit.demo.main import demo_document
+from htpy_uikit.demo.tabs import DASHBOARD_TABS
 
 from ._utils import DIST
-from ._utils import ROOT
 from ._utils import build_demo_assets
+from ._utils import build_demo_css
+
+app = Flask(__name__, static_folder=None)
+# Server-Timing header per response: page build/serialize plus one entry per demo section
+# (devtools > Network > Timing).
+init_flask(app)
+
+
+@app.get("/")
+def index() -> Response:
+    return Response(
+        render_timed(lambda: demo_document(server=True)), mimetype="text/html; charset=utf-8"
+    )
+
 
+# Backs the demo's remote-search combobox.
+CUSTOMERS = OptionIndex({"value": f"c-{i:05}", "label": f"Customer {i:05}"} for i in range(80_000))
 
-def build_tailwind_css() -> None:
-    """Build Tailwind CSS using pnpm/local binary with a pnpm dlx fallback."""
+
+@app.get("/demo/customers")
+def customers() -> Response:
+    query = request.args.get("q", "")
+    limit = min(request.args.get("limit", 20, type=int), 100)
+    matches = CUSTOMERS.search(query, limit)
+    return Response(render_timed(lambda: combobox_results(matches, limit=limit)))
+
+
+@app.get("/demo/tabs")
+def tab() -> Response:
     try:
-        subprocess.run(
-            [
-                "npx",
-                "@tailwindcss/cli",
-                "-i",
-                "dist/input.css",
-                "-o",
-                "dist/output.css",
-            ],
-            check=True,
-            cwd=ROOT,
-        )
-        print("✓ Tailwind CSS built successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to build Tailwind CSS: {e}")
-        raise
+        panel = tab_panel(DASHBOARD_TABS, request.args.get("tab", ""))
+    except ValueError:
+        abort(404)
+    return Response(render_timed(lambda: panel))
 
 
-app = Flask(__name__, static_folder=None)
+@app.get("/demo/dialog/edit-profile")
+def edit_profile() -> Response:
+    return Response(render_timed(edit_profile_form))
 
 
-@app.get("/")
-def index() -> Response:
-    return Response(demo_page(), mimetype="text/html; charset=utf-8")
+@app.get("/demo/panels")
+def panel() -> Response:
+    key = request.args.get("key", "")
+    if key not in FAQ_PANELS:
+        abort(404)
+    return Response(render_timed(lambda: FAQ_PANELS.render(key)))
+
+
+@app.get("/hydration.html")
+@app.get("/hydration-lazy.html")
+def hydration() -> Response:
+    lazy = request.path == "/hydration-lazy.html"
+    return Response(
+        render_timed(lambda: hydration_document(lazy=lazy)), mimetype="text/html; charset=utf-8"
+    )
 
 
 @app.get("/output.css")
@@ -49,6 +83,5 @@ def output_css() -> Response:
 
 
 if __name__ == "__main__":
-    build_demo_assets()
-    build_tailwind_css()
+    build_demo_css(build_demo_assets())
     app.run(host="127.0.0.1", port=8000, debug=True)
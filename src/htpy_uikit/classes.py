@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .registry import COMPONENTS_DIR
+
+if TYPE_CHECKING:
+    import ast
+
+
+# A static value: alternative strings, or a table (dict) of them.
+_Value = list[str] | dict[str, list[str]]
+
+# Keyword/dict keys whose value is a plain class string.
+CLASS_KEYS = {"class_", "class"}
+# Keys whose value is an Alpine class binding (JS expression).
+CLASS_BINDING_KEYS = {":class", "x-bind:class"}
+# Functions whose string arguments are class strings.
+CLASS_FUNCS = {"merge_classes"}
+# Attribute prefixes whose values are class strings (Alpine transition classes).
+CLASS_KEY_PREFIXES = ("x-transition:",)
+
+# Cap on f-string alternative combinations before falling back to per-part tokens.
+_MAX_COMBINATIONS = 256
+
+# Quoted JS strings used as Alpine :class object keys or ternary branches.
+_JS_CLASS_STRING_RE = re.compile(r"[?:]\s*'([^']*)'|'([^']*)'(?=\s*:)")
+# Classes set from inline JS (``el.className = '...'``, ``classList.add('...')``).
+_JS_CLASS_CALL_RE = re.compile(
+    r"className\s*=\s*'([^']*)'|classList\.(?:add|remove|toggle)\(\s*'([^']*)'"
+)
+_TOKEN_RE = re.compile(r"^[!-~]+$")
+# Placeholder bound to a function parameter while its body is scanned; a placeholder that
+# reaches a class context marks the parameter as taking classes. The NUL keeps it from
+# ever passing ``is_class_token`` and the spaces keep it a token of its own.
+_PARAM = "\0"
+
+
+def _is_class_name(name: str) -> bool:
+    # base_classes, color_classes_map, width_class, get_align_classes; not class_name helpers
+    lowered = name.lower().rstrip("_")
+    return "classes" in lowered or lowered.endswith("class")
+
+
+def is_class_token(token: str) -> bool:
+    """Whether ``token`` can be a Tailwind candidate (not JS/Python punctuation)."""
+    return (
+        bool(_TOKEN_RE.match(token))
+        and any(c.isalpha() for c in token)
+        and token[0] not in "'\"{}(,;"
+        and token[-1] not in ",;{"
+        and "${" not in token
+    )
+
+
+def _tokens(values: list[str] | None) -> set[str]:
+    out: set[str] = set()
+    for v in values or ():
+        out.update(t for t in v.split() if is_class_token(t))
+    return out
+
+
+def _param_marker(func: str, param: str) -> str:
+    return f" {_PARAM}{func}.{param} "
+
+
+def _param_refs(values: list[str] | None) -> set[str]:
+    # ``func.param`` of every placeholder in ``values``.
+    return {t[1:] for v in values or () for t in v.split() if t.startswith(_PARAM)}
+
+
+def _is_class_key(key: object) -> bool:
+    return isinstance(key, str) and (key in CLASS_KEYS or key.startswith(CLASS_KEY_PREFIXES))
+
+
+def _js_class_tokens(values: list[str] | None) -> set[str]:
+    out: set[str] = set()
+    for v in values or ():
+        for m in _JS_CLASS_STRING_RE.finditer(v):
+            out |= _tokens([m[1] if m[1] is not None else m[2]])
+    return out
+
+
+_TRANSPARENT_CALLS = {"Markup", "str", "inline_js", "inline_css", "js_template"}
+
+
+class _ModuleScanner:
+    """Statically evaluate class strings in one module.
+
+    String constants, f-strings, ``+``, conditional expressions and dict tables are
+    folded, including names imported from sibling modules (``from ._styles import X``).
+    Lists built up with ``append``/``extend``/``+=`` and read back through ``" ".join``
+    fold too, as do ``str.replace`` results. Folded values are collected wherever they
+    land in a class context: ``class_=`` and ``*_classes``/``*_class`` keywords,
+    ``"class_"``/``":class"``/``"x-transition:*"`` dict entries, ``merge_classes()``
+    arguments, ``*_classes``/``*_class`` variables and the return values of ``*classes*``
+    functions. Parameters that reach a class context (``skeleton(width=...)``) are
+    recorded in ``class_params``; ``ClassCollector`` then collects the keyword arguments
+    passed to them, including parameter defaults.
+    """
+
+    def __init__(self, path: Path, collector: ClassCollector) -> None:
+        self.path = path
+        self.collector = collector
+        self.env: dict[str, _Value] = {}
+        self.classes: set[str] = set()
+        # ``func.param`` names that take classes, and every ``(func, keyword, values)`` call.
+        self.class_params: set[str] = set()
+        self.calls: list[tuple[str, str, list[str]]] = []
+
+    # -- evaluation ---------------------------------------------------------
+
+    def eval(self, node: ast.AST | None, env: dict[str, _Value]) -> list[str] | None:
+        value = self.eval_value(node, env)
+        if isinstance(value, dict):
+            return [v for alts in value.values() for v in alts]
+        return value
+
+    def eval_value(self, node: ast.AST | None, env: dict[str, _Value]) -> _Value | None:
+        import ast
+
+        if node is None:
+            return None
+        if isinstance(node, ast.Constant):
+            return [node.value] if isinstance(node.value, str) else None
+        if isinstance(node, ast.Name):
+            return env.get(node.id)
+        if isinstance(node, ast.JoinedStr):
+            return self._eval_fstring(node, env)
+        if isinstance(node, ast.FormattedValue):
+            return self.eval(node.value, env)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            return self._join([self.eval(node.left, env), self.eval(node.right, env)])
+        if isinstance(node, ast.IfExp):
+            alts = (self.eval(node.body, env) or []) + (self.eval(node.orelse, env) or [])
+            return alts or None
+        if isinstance(node, ast.Dict):
+            table: dict[str, list[str]] = {}
+            for k, v in zip(node.keys, node.values):
+                alts = self.eval(v, env)
+                if isinstance(k, ast.Constant) and alts:
+                    table[str(k.value)] = alts
+            return table or None
+        if isinstance(node, (ast.List, ast.Tuple)):
+            alts = [a for elt in node.elts for a in (self.eval(elt, env) or [])]
+            return alts or None
+        if isinstance(node, ast.Subscript):
+            table = self.eval_value(node.value, env)
+            if isinstance(table, dict):
+                key = node.slice
+                if isinstance(key, ast.Constant) and str(key.value) in table:
+                    return table[str(key.value)]
+                return [v for alts in table.values() for v in alts]
+            return None
+        if isinstance(node, ast.Call):
+            # Markup("...")/str("...") and the inline script minifiers keep string
+            # literals intact, so they are transparent wrappers.
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in _TRANSPARENT_CALLS and node.args:
+                return self.eval(node.args[0], env)
+            if not isinstance(func, ast.Attribute):
+                return None
+            if (
+                func.attr == "join"
+                and isinstance(func.value, ast.Constant)
+                and isinstance(func.value.value, str)
+                and len(node.args) == 1
+            ):
+                # " ".join(parts): every part is an alternative of the joined string.
+                return self.eval(node.args[0], env)
+            if func.attr == "replace" and len(node.args) == 2:
+                old, new = node.args
+                base = self.eval(func.value, env)
+                if (
+                    base
+                    and isinstance(old, ast.Constant)
+                    and isinstance(new, ast.Constant)
+                    and isinstance(old.value, str)
+                    and isinstance(new.value, str)
+                ):
+                    return base + [b.replace(old.value, new.value) for b in base]
+            return None
+        return None
+
+    def _eval_fstring(self, node: ast.JoinedStr, env: dict[str, _Value]) -> list[str]:
+        # Unknown parts (parameters, calls) act as a separator so literal tokens survive.
+        return self._join([self.eval(part, env) for part in node.values]) or []
+
+    def _join(self, parts: list[list[str] | None]) -> list[str] | None:
+        options = [p or [" "] for p in parts]
+        total = 1
+        for p in options:
+            total *= len(p)
+        if total <= _MAX_COMBINATIONS:
+            return ["".join(combo) for combo in itertools.product(*options)]
+        # Too many combinations: keep every part's alternatives as separate strings.
+        return [alt for p in options for alt in p]
+
+    # -- scanning -----------------------------------------------------------
+
+    def scan(self, tree: ast.Module) -> None:
+        import ast
+
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.level == 1 and stmt.module:
+                sibling = self.collector.module_env(stmt.module.split(".")[0])
+                for alias in stmt.names:
+                    if alias.name in sibling:
+                        self.env[alias.asname or alias.name] = sibling[alias.name]
+        self._scan_scope(tree, self.env, func_name=None)
+
+    def _scan_scope(self, scope: ast.AST, env: dict[str, _Value], func_name: str | None) -> None:
+        import ast
+
+        nodes = sorted(
+            self._iter_scope(scope),
+            key=lambda n: (getattr(n, "lineno", 0), getattr(n, "col_offset", 0)),
+        )
+        for node in nodes:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._scan_scope(node, self._bind_params(node, env), func_name=node.name)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                self._assign(node, env)
+            elif isinstance(node, ast.Return) and func_name and _is_class_name(func_name):
+                self._collect(self.eval(node.value, env))
+            elif isinstance(node, ast.Call):
+                self._call(node, env)
+            elif isinstance(node, ast.Dict):
+                for k, v in zip(node.keys, node.values):
+                    if isinstance(k, ast.Constant) and _is_class_key(k.value):
+                        self._collect(self.eval(v, env))
+                    elif isinstance(k, ast.Constant) and k.value in CLASS_BINDING_KEYS:
+                        self.classes |= _js_class_tokens(self.eval(v, env))
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                for m in _JS_CLASS_CALL_RE.finditer(node.value):
+                    self.classes |= _tokens([m[1] if m[1] is not None else m[2]])
+
+    def _collect(self, values: list[str] | None) -> None:
+        self.classes |= _tokens(values)
+        self.class_params |= _param_refs(values)
+
+    def _bind_params(self, node: ast.FunctionDef, env: dict[str, _Value]) -> dict[str, _Value]:
+        # Each parameter folds to its placeholder plus its default.
+        args = node.args
+        positional = args.posonlyargs + args.args
+        defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+        scope = dict(env)
+        for arg, default in [*zip(positional, defaults), *zip(args.kwonlyargs, args.kw_defaults)]:
+            scope[arg.arg] = [_param_marker(node.name, arg.arg), *(self.eval(default, env) or [])]
+        return scope
+
+    def _iter_scope(self, scope: ast.AST):
+        """Yield nodes of ``scope`` without descending into nested function bodies."""
+        import ast
+
+        stack = list(ast.iter_child_nodes(scope))
+        while stack:
+            node = stack.pop()
+            yield node
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                stack.extend(ast.iter_child_nodes(node))
+
+    def _assign(self, node: ast.AST, env: dict[str, _Value]) -> None:
+        import ast
+
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        value = self.eval_value(node.value, env)
+        for target in targets:
+            if isinstance(target, ast.Name):
+                if isinstance(node, ast.AugAssign) and isinstance(value, list):
+                    prev = env.get(target.id)
+                    value = (prev if isinstance(prev, list) else []) + value
+                if value is not None:
+                    env[target.id] = value
+                if _is_class_name(target.id):
+                    self._collect(self.eval(node.value, env))
+            elif isinstance(target, ast.Subscript) and isinstance(target.slice, ast.Constant):
+                key = target.slice.value
+                if _is_class_key(key):
+                    self._collect(self.eval(node.value, env))
+                elif key in CLASS_BINDING_KEYS:
+                    self.classes |= _js_class_tokens(self.eval(node.value, env))
+
+    def _call(self, node: ast.Call, env: dict[str, _Value]) -> None:
+        import ast
+
+        func = node.func
+        callee = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        for kw in node.keywords:
+            if kw.arg is None:
+                continue
+            values = self.eval(kw.value, env)
+            if kw.arg in CLASS_KEYS or _is_class_name(kw.arg) or callee in CLASS_FUNCS:
+                self._collect(values)
+            if callee and values:
+                self.calls.append((callee, kw.arg, values))
+        if callee in CLASS_FUNCS:
+            for arg in node.args:
+                self._collect(self.eval(arg, env))
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr in {"append", "extend", "insert"}
+            and isinstance(func.value, ast.Name)
+        ):
+            # Track the list's contents, for a later " ".join(...) in a class context.
+            args = node.args[1:] if func.attr == "insert" else node.args
+            values = [v for arg in args for v in self.eval(arg, env) or ()]
+            name = func.value.id
+            if values:
+                prev = env.get(name)
+                env[name] = (prev if isinstance(prev, list) else []) + values
+            if _is_class_name(name):
+                self._collect(values)
+
+    def resolve_calls(self, class_params: set[str]) -> bool:
+        """Collect keyword arguments passed to ``class_params``; True if new ones appeared."""
+        before = len(self.class_params)
+        for callee, keyword, values in self.calls:
+            if f"{callee}.{keyword}" in class_params:
+                self._collect(values)
+        return len(self.class_params) > before
+
+
+class ClassCollector:
+    """Collect the Tailwind classes used by every component module in ``src_dir``."""
+
+    def __init__(self, src_dir: Path = COMPONENTS_DIR) -> None:
+        self.src_dir = src_dir
+        self._scanners: dict[str, _ModuleScanner] = {}
+
+    def _scanner(self, stem: str) -> _ModuleScanner | None:
+        import ast
+
+        if stem in self._scanners:
+            return self._scanners[stem]
+        path = self.src_dir / f"{stem}.py"
+        if not path.exists():
+            return None
+        scanner = _ModuleScanner(path, self)
+        # Register before scanning so import cycles terminate.
+        self._scanners[stem] = scanner
+        try:
+            scanner.scan(ast.parse(path.read_bytes()))
+        except SyntaxError:
+            pass
+        return scanner
+
+    def module_env(self, stem: str) -> dict[str, _Value]:
+        scanner = self._scanner(stem)
+        return scanner.env if scanner else {}
+
+    def classes_by_file(self) -> dict[str, set[str]]:
+        """Map each module filename to the classes it uses."""
+        paths = sorted(self.src_dir.glob("*.py"))
+        scanners = [(path, s) for path in paths if (s := self._scanner(path.stem)) is not None]
+        # Class parameters can be forwarded through other functions' parameters, so keep
+        # resolving calls until no new class parameter appears.
+        changed = True
+        while changed:
+            class_params = set().union(*(s.class_params for _, s in scanners))
+            changed = False
+            for _, scanner in scanners:
+                changed |= scanner.resolve_calls(class_params)
+        out: dict[str, set[str]] = {}
+        for path, scanner in scanners:
+            classes = set(scanner.classes)
+            # The shared style module is pure vocabulary: every ``*_CLASSES`` constant counts.
+            if path.stem == "_styles":
+                for name, value in scanner.env.items():
+                    if name.endswith("_CLASSES") and isinstance(value, list):
+                        classes |= _tokens(value)
+            if classes:
+                out[path.name] = classes
+        return out
+
+
+def collect_classes(src_dir: Path = COMPONENTS_DIR, *, use_cache: bool = False) -> set[str]:
+    """Return the deduplicated set of Tailwind classes used by the components in ``src_dir``.
+
+    With ``use_cache`` the result is stored under ``$XDG_CACHE_HOME/htpy-uikit`` keyed by
+    a hash of the sources and of this collector, so repeated runs over unchanged files
+    skip parsing.
+    """
+    if not use_cache:
+        return set().union(*ClassCollector(src_dir).classes_by_file().values())
+    h = hashlib.sha256(Path(__file__).read_bytes())
+    for path in sorted(src_dir.glob("*.py")):
+        h.update(path.name.encode() + b"\0" + path.read_bytes())
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache = Path(base) / "htpy-uikit" / f"classes-{h.hexdigest()[:16]}.txt"
+    try:
+        return set(cache.read_text(encoding="utf-8").split())
+    except OSError:
+        pass
+    classes = collect_classes(src_dir)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(render_safelist(classes), encoding="utf-8")
+    except OSError:
+        pass  # the cache is an optimisation; a read-only home must not break the scan
+    return classes
+
+
+def render_safelist(classes: set[str]) -> str:
+    """One class per line, sorted, ready to be picked up by Tailwind ``@source``."""
+    return "".join(f"{c}\n" for c in sorted(classes))
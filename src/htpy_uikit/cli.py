@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import ast
 import shutil
 import sys
-import tomllib
 from collections import Counter
 from enum import Enum
 from pathlib import Path
@@ -11,15 +9,25 @@ from typing import Iterable
 from typing import Sequence
 
 import click
-import questionary
 
 from . import __version__ as VERSION
-from .registry import PKG_DIR
+from .classes import ClassCollector
+from .classes import render_safelist
+from .lockfile import LOCKFILE_NAME
+from .lockfile import Lockfile
+from .registry import COMPONENTS_DIR
 from .registry import Component
+from .registry import dependency_chains
+from .registry import file_hashes
+from .registry import get_graph
+from .registry import get_index
 from .registry import list_components
 from .registry import resolve_name_to_path
+from .registry import transitive_deps
 from .themes import list_themes
 from .themes import resolve_theme
+from .usage import analyze_usage
+from .usage import css_bytes_by_class
 
 
 def _read_text(p: Path) -> str:
@@ -31,57 +39,14 @@ def _write_text(p: Path, content: str) -> None:
     p.write_text(content, encoding="utf-8")
 
 
-def _iter_internal_imports(py_src: str, file_dir: Path) -> Iterable[Path]:
-    """Yield package file paths imported from this file (relative and absolute)."""
-    try:
-        tree = ast.parse(py_src)
-    except SyntaxError:
-        return []
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
-            # Relative imports e.g. from .icons import x
-            if node.level:
-                # level=1 -> current package; level=2 -> parent, etc.
-                base = file_dir
-                steps_up = max(0, node.level - 1)
-                for _ in range(steps_up):
-                    base = base.parent
-                mod = (node.module or "").split(".")[0]
-                if mod:
-                    cand = base / f"{mod}.py"
-                    if cand.exists():
-                        yield cand
-            # Absolute import from our package
-            elif node.module and node.module.startswith("htpy_uikit."):
-                parts = node.module.split(".")[1:]
-                cand = PKG_DIR.joinpath(*parts).with_suffix(".py")
-                if cand.exists():
-                    yield cand
-        elif isinstance(node, ast.Import):
-            # import htpy_uikit.icons as icons
-            for n in node.names:
-                name = n.name
-                if name.startswith("htpy_uikit."):
-                    parts = name.split(".")[1:]
-                    cand = PKG_DIR.joinpath(*parts).with_suffix(".py")
-                    if cand.exists():
-                        yield cand
-
-
 def _resolve_dependencies(entry_files: Sequence[Path]) -> list[Path]:
     """Given starting files, return all required files in package order (unique)."""
+    index = get_index()
+    entry_keys = [c.key for c in map(index.for_path, entry_files) if c]
     wanted: dict[str, Path] = {}
-    queue: list[Path] = list(entry_files)
-
-    while queue:
-        fp = queue.pop(0)
-        name = fp.stem
-        if name not in wanted:
-            wanted[name] = fp
-            src = _read_text(fp)
-            for dep in _iter_internal_imports(src, file_dir=fp.parent):
-                queue.append(dep)
+    for key in transitive_deps(entry_keys):
+        p = index.modules[key].path
+        wanted.setdefault(p.stem, p)
     # return in stable order: support files first so copies don't break imports
     internals = []
     components = []
@@ -117,6 +82,10 @@ def _copy_file(
         if dest_bytes == src_bytes:
             return dest, CopyStatus.SKIPPED_UNCHANGED
         if not force:
+            # Interactive-only: importing questionary pulls in prompt_toolkit, so it stays out of
+            # the startup path for non-interactive commands (see scripts/bench_cli.py).
+            import questionary
+
             overwrite = questionary.confirm(f"{dest} exists. Overwrite?", default=False).ask()
             if not overwrite:
                 click.echo(f"Skipped {dest}")
@@ -144,6 +113,8 @@ def _load_config() -> dict:
     pj = _find_pyproject()
     if not pj:
         return {}
+    import tomllib
+
     try:
         data = tomllib.loads(_read_text(pj))
     except Exception:
@@ -157,6 +128,14 @@ def _load_config() -> dict:
             out["components_dir"] = str((pj.parent / cfg["components_dir"]).resolve())
         if isinstance(cfg.get("theme_path"), str):
             out["theme_path"] = str((pj.parent / cfg["theme_path"]).resolve())
+        if isinstance(cfg.get("classes_path"), str):
+            out["classes_path"] = str((pj.parent / cfg["classes_path"]).resolve())
+        if isinstance(cfg.get("compact_css_path"), str):
+            out["compact_css_path"] = str((pj.parent / cfg["compact_css_path"]).resolve())
+        if isinstance(cfg.get("size_target"), str):
+            out["size_target"] = cfg["size_target"]
+        if isinstance(cfg.get("size_budgets"), dict):
+            out["size_budgets"] = dict(cfg["size_budgets"])
     return out
 
 
@@ -176,12 +155,21 @@ def list_cmd() -> None:
         click.echo("No components found.")
         return
     width = max(len(c.name) for c in comps)
+    file_width = max(len(c.path.name) for c in comps) + 2
     click.echo("Available components:\n")
     for i, c in enumerate(comps, start=1):
-        click.echo(f"{i:>2}. {c.name:<{width}}  ({c.path.name})")
+        line = f"{i:>2}. {c.name:<{width}}  {f'({c.path.name})':<{file_width}}"
+        click.echo(f"{line}  {c.summary}".rstrip())
+    support = sorted(c.name for c in get_index().modules.values() if c.support)
+    if support:
+        click.echo(
+            f"\nSupport modules (copied as dependencies, or add by name): {', '.join(support)}"
+        )
 
 
 def _interactive_pick(comps: list[Component]) -> list[Component]:
+    import questionary
+
     qChoice = getattr(questionary, "Choice", None)
     if qChoice is not None:
         choices = [qChoice(title=f"{c.name} ({c.path.name})", value=c) for c in comps]
@@ -205,6 +193,14 @@ def _interactive_pick(comps: list[Component]) -> list[Component]:
     return [lookup[s] for s in selected if s in lookup]
 
 
+def _components_dest(dest: Path | None) -> Path:
+    """Return ``dest`` or the configured/default components directory."""
+    if dest is not None:
+        return dest
+    cfg = _load_config()
+    return Path(cfg.get("components_dir") or Path("./components")).resolve()
+
+
 @cli.command("add")
 @click.argument("components", nargs=-1)
 @click.option(
@@ -251,16 +247,10 @@ def add_cmd(components: tuple[str, ...], dest: Path | None, select_all: bool, fo
             unique_paths.append(p)
             seen.add(p)
     # Convert to components
-    chosen = []
-    for p in unique_paths:
-        match = next((c for c in comps if c.path == p), None)
-        chosen.append(match or Component(name=p.stem, path=p))
+    index = get_index()
+    chosen = [index.for_path(p) or Component(name=p.stem, path=p) for p in unique_paths]
 
-    # Load config and compute defaults
-    cfg = _load_config()
-    default_dest = Path(cfg.get("components_dir") or Path("./components")).resolve()
-    if dest is None:
-        dest = default_dest
+    dest = _components_dest(dest)
 
     entry_files = [c.path for c in chosen]
     files = _resolve_dependencies(entry_files)
@@ -271,10 +261,25 @@ def add_cmd(components: tuple[str, ...], dest: Path | None, select_all: bool, fo
     init_py = dest / "__init__.py"
     if not init_py.exists():
         _write_text(init_py, "")
+    lock = Lockfile.load(dest)
+    locked_before = dict(lock.entries)
+    hashes = file_hashes()
     status_counts: Counter[CopyStatus] = Counter()
     for src in files:
-        _, status = _copy_file(src, dest, force=force)
+        key = index.for_path(src).key
+        upstream = hashes[key]
+        entry = lock.entries.get(src.name)
+        target = dest / src.name
+        # Installed from this exact upstream version and untouched since: nothing to read.
+        if entry and entry.sha256 == upstream and not lock.is_modified(target):
+            status = CopyStatus.SKIPPED_UNCHANGED
+        else:
+            target, status = _copy_file(src, dest, force=force)
+        if status != CopyStatus.SKIPPED_USER:
+            lock.record(target, key, upstream)
         status_counts[status] += 1
+    if lock.entries != locked_before:
+        lock.save()
 
     copied = status_counts[CopyStatus.COPIED]
     if copied:
@@ -296,6 +301,557 @@ def add_cmd(components: tuple[str, ...], dest: Path | None, select_all: bool, fo
     click.echo("\nDone. Remember to run your Tailwind build.")
 
 
+@cli.command("update")
+@click.argument("components", nargs=-1)
+@click.option(
+    "--dest",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory holding the vendored components (and their lockfile).",
+)
+@click.option(
+    "-y",
+    "--yes",
+    "force",
+    is_flag=True,
+    help="Overwrite locally modified files without prompting (alias: --force).",
+)
+@click.option("--force", "force", is_flag=True, help="Overwrite locally modified files.")
+@click.option("--dry-run", is_flag=True, help="Report what would change without copying.")
+def update_cmd(components: tuple[str, ...], dest: Path | None, force: bool, dry_run: bool) -> None:
+    """Update vendored components whose upstream version changed."""
+    dest = _components_dest(dest)
+    lock = Lockfile.load(dest)
+    if not lock.entries:
+        click.echo(f"No {LOCKFILE_NAME} in {dest}; run `htpyuikit add` first.", err=True)
+        sys.exit(1)
+
+    index = get_index()
+    if components:
+        roots = [_resolve_or_exit(t).key for t in components]
+    else:
+        roots = [e.source for e in lock.entries.values() if e.source in index.modules]
+    for e in lock.entries.values():
+        if e.source not in index.modules:
+            click.echo(f"{e.source} is no longer shipped upstream; left in place.")
+
+    hashes = file_hashes()
+    locked_before = dict(lock.entries)
+    counts: Counter[str] = Counter()
+    # Walk the current graph so dependencies introduced upstream get vendored too.
+    for key in transitive_deps(roots):
+        src = index.modules[key].path
+        target = dest / src.name
+        entry = lock.entries.get(src.name)
+        upstream = hashes[key]
+        if entry is not None and entry.sha256 == upstream and target.exists():
+            if lock.is_modified(target):
+                counts["modified"] += 1
+                click.echo(f"{target.name} has local changes (upstream unchanged); kept.")
+            else:
+                counts["unchanged"] += 1
+            continue
+        if entry is None:
+            action, verb = "added", "add"
+        elif not target.exists():
+            action, verb = "restored", "restore"
+        else:
+            action, verb = "updated", "update"
+        if dry_run:
+            click.echo(f"Would {verb} {target}")
+            counts[action] += 1
+            continue
+        local_changes = action == "updated" and lock.is_modified(target)
+        target, status = _copy_file(src, dest, force=force or not local_changes)
+        if status == CopyStatus.SKIPPED_USER:
+            counts["declined"] += 1
+            continue
+        lock.record(target, key, upstream)
+        counts[action] += 1
+    if not dry_run and lock.entries != locked_before:
+        lock.save()
+
+    parts = [
+        f"{counts[k]} {label}"
+        for k, label in (
+            ("updated", "updated"),
+            ("added", "added"),
+            ("restored", "restored"),
+            ("unchanged", "up-to-date"),
+            ("modified", "locally modified"),
+            ("declined", "overwrite declined"),
+        )
+        if counts[k]
+    ]
+    prefix = "Dry run: " if dry_run else ""
+    click.echo(f"\n{prefix}{'; '.join(parts) or 'nothing to do'}.")
+
+
+def _fmt_bytes(n: int) -> str:
+    return f"{n / 1024:.1f} KB" if abs(n) >= 1024 else f"{n} B"
+
+
+def _project_root(project: Path | None) -> Path:
+    if project is not None:
+        return project.resolve()
+    pj = _find_pyproject()
+    return pj.parent if pj else Path.cwd().resolve()
+
+
+def _usage_options(f):
+    f = click.option(
+        "--project",
+        type=click.Path(file_okay=False, exists=True, path_type=Path),
+        default=None,
+        help="Project root to scan for imports. Defaults to the pyproject.toml directory.",
+    )(f)
+    return click.option(
+        "--dest",
+        type=click.Path(file_okay=False, exists=True, path_type=Path),
+        default=None,
+        help="Directory holding the vendored components.",
+    )(f)
+
+
+@cli.command("doctor")
+@_usage_options
+@click.option(
+    "--css",
+    "css_path",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    default=None,
+    help="Compiled Tailwind CSS; enables per-file CSS byte attribution.",
+)
+def doctor_cmd(dest: Path | None, project: Path | None, css_path: Path | None) -> None:
+    """Report vendored components your project never imports."""
+    dest = _components_dest(dest)
+    report = analyze_usage(dest, _project_root(project), with_tokens=css_path is not None)
+    css_sizes = css_bytes_by_class(_read_text(css_path)) if css_path else {}
+
+    def css_bytes(tokens: set[str]) -> int:
+        return sum(css_sizes.get(t, 0) for t in tokens)
+
+    def names(files: Iterable[str]) -> str:
+        return ", ".join(Path(n).stem for n in sorted(files)) or "-"
+
+    click.echo(
+        f"Scanned {len(report.project_files)} project files; "
+        f"{len(report.vendored)} files vendored in {dest}.\n"
+    )
+    click.echo(f"Imported by your code ({len(report.used)}): {names(report.used)}")
+    deps_only = report.needed - report.used
+    click.echo(f"Needed as dependencies ({len(deps_only)}): {names(deps_only)}")
+    if not report.unused:
+        click.echo("\nEvery vendored file is in use.")
+        return
+
+    width = max(len(n) for n in report.unused)
+    for title, group in (
+        ("Unused components", report.unused_components),
+        ("Only needed by unused components", report.transitive_only),
+    ):
+        if not group:
+            continue
+        click.echo(f"\n{title} ({len(group)}):")
+        for n in group:
+            size = _fmt_bytes(report.vendored[n].stat().st_size)
+            line = f"  {n:<{width}}  {size:>9}"
+            if css_path:
+                line += f"  {_fmt_bytes(css_bytes(report.unique_tokens(n))):>9} CSS"
+            click.echo(line)
+
+    total_src = sum(report.vendored[n].stat().st_size for n in report.unused)
+    summary = f"{len(report.unused)} files, {_fmt_bytes(total_src)} source"
+    if css_path:
+        summary += f", {_fmt_bytes(css_bytes(report.prunable_tokens()))} CSS"
+    click.echo(f"\nPruning would remove {summary}. Run `htpyuikit prune` to delete them.")
+    if not css_path:
+        click.echo("Pass --css path/to/output.css to see CSS bytes per file.")
+
+
+@cli.command("prune")
+@_usage_options
+@click.option("-y", "--yes", "force", is_flag=True, help="Delete without prompting.")
+@click.option("--dry-run", is_flag=True, help="List the files that would be deleted.")
+def prune_cmd(dest: Path | None, project: Path | None, force: bool, dry_run: bool) -> None:
+    """Delete vendored components your project never imports."""
+    dest = _components_dest(dest)
+    report = analyze_usage(dest, _project_root(project))
+    if not report.unused:
+        click.echo("Every vendored file is in use; nothing to prune.")
+        return
+    for n in report.unused:
+        click.echo(f"{'Would delete' if dry_run else 'Unused'}: {report.vendored[n]}")
+    if dry_run:
+        return
+    if not force:
+        import questionary
+
+        if not questionary.confirm(f"Delete {len(report.unused)} files?", default=False).ask():
+            click.echo("Nothing deleted.")
+            return
+    lock = Lockfile.load(dest)
+    for n in report.unused:
+        report.vendored[n].unlink()
+        lock.entries.pop(n, None)
+    if lock.path.exists():
+        lock.save()
+    click.echo(f"Deleted {len(report.unused)} files. Remember to run your Tailwind build.")
+
+
+def _resolve_or_exit(token: str) -> Component:
+    comp = get_index().get(token)
+    if comp is None:
+        click.echo(f"Unknown component: {token}", err=True)
+        sys.exit(2)
+    return comp
+
+
+@cli.command("graph")
+@click.argument("components", nargs=-1)
+@click.option(
+    "-t",
+    "--transitive",
+    is_flag=True,
+    help="Show every file a component pulls in, not just its direct imports.",
+)
+def graph_cmd(components: tuple[str, ...], transitive: bool) -> None:
+    """Show the dependency graph of components."""
+    index = get_index()
+    comps = [_resolve_or_exit(t) for t in components] or list_components()
+    width = max(len(c.name) for c in comps)
+    for c in comps:
+        if transitive:
+            deps = [k for k in transitive_deps([c.key]) if k != c.key]
+        else:
+            deps = list(get_graph()[c.key])
+        names = sorted(index.modules[k].name for k in deps)
+        click.echo(f"{c.name:<{width}}  -> {', '.join(names) if names else '(none)'}")
+
+
+@cli.command("why")
+@click.argument("component")
+def why_cmd(component: str) -> None:
+    """Explain which components pull in a component or support file."""
+    index = get_index()
+    target = _resolve_or_exit(component)
+    chains = dependency_chains(target.key)
+    public = {c.key for c in index.components}
+    dependents = sorted(
+        (chain for key, chain in chains.items() if key in public),
+        key=lambda chain: index.modules[chain[0]].name,
+    )
+    if not dependents:
+        click.echo(f"No component depends on {target.name}.")
+        return
+    click.echo(f"{target.name} is required by {len(dependents)} component(s):\n")
+    for chain in dependents:
+        click.echo("  " + " -> ".join(index.modules[k].name for k in chain))
+
+
+@cli.command("classes")
+@click.option(
+    "--src",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Components directory to scan. Defaults to your vendored components, else the package.",
+)
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Safelist file to write. Defaults to pyproject config or ./styles/htpy-uikit-classes.txt.",
+)
+@click.option("--stats", is_flag=True, help="Also print the number of classes per file.")
+def classes_cmd(src: Path | None, out: Path | None, stats: bool) -> None:
+    """Write the Tailwind classes used by the components to a safelist file.
+
+    Point Tailwind at the file with ``@source`` so classes assembled at render time (from
+    lists, parameters and shared constants) are generated too.
+    """
+    if src is None:
+        vendored = _components_dest(None)
+        src = vendored if any(vendored.glob("*.py")) else COMPONENTS_DIR
+    if not src.is_dir():
+        click.echo(f"Not a directory: {src}", err=True)
+        sys.exit(1)
+    cfg = _load_config()
+    out = (out or Path(cfg.get("classes_path") or "./styles/htpy-uikit-classes.txt")).resolve()
+
+    by_file = ClassCollector(src).classes_by_file()
+    classes = set().union(*by_file.values())
+    content = render_safelist(classes)
+    if out.exists() and _read_text(out) == content:
+        click.echo(f"{out} is up-to-date ({len(classes)} classes)")
+    else:
+        _write_text(out, content)
+        click.echo(f"Wrote {len(classes)} classes from {len(by_file)} files to {out}")
+    if stats:
+        for name, found in sorted(by_file.items(), key=lambda kv: -len(kv[1])):
+            click.echo(f"  {name:<24} {len(found):>4}")
+    click.echo(
+        f'Reference it from your Tailwind entry CSS: @source "<relative path to {out.name}>";'
+    )
+
+
+@cli.command("compact-css")
+@click.option(
+    "--dest",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Stylesheet path. Defaults to pyproject config or ./styles/htpy-uikit-compact.css.",
+)
+def compact_css_cmd(dest: Path | None) -> None:
+    """Write the @apply stylesheet behind the compact semantic classes.
+
+    Run the app with ``HTPY_UIKIT_COMPACT_CLASSES=1`` and import this file after the theme
+    so components render ``uk-btn``-style classes instead of full utility strings. The
+    rules come from your vendored ``_styles.py`` when present, else from the package.
+    """
+    import runpy
+
+    styles = _components_dest(None) / "_styles.py"
+    if not styles.exists():
+        styles = COMPONENTS_DIR / "_styles.py"
+    namespace = runpy.run_path(str(styles))
+    if "compact_stylesheet" not in namespace:
+        click.echo(f"{styles} predates compact mode; run `htpyuikit update` first.", err=True)
+        sys.exit(1)
+    content = namespace["compact_stylesheet"]()
+
+    cfg = _load_config()
+    dest = (
+        dest or Path(cfg.get("compact_css_path") or "./styles/htpy-uikit-compact.css")
+    ).resolve()
+    if dest.exists() and _read_text(dest) == content:
+        click.echo(f"{dest} is up-to-date")
+        return
+    _write_text(dest, content)
+    click.echo(f"Wrote {len(namespace['CLASS_DEFINITIONS'])} semantic classes to {dest}")
+
+
+DEMO_PAGE = "htpy_uikit.demo:demo_page"
+
+
+def _load_target(spec: str):
+    """Import ``module:callable`` from the project (cwd first on ``sys.path``)."""
+    import importlib
+
+    module_name, _, attr = spec.partition(":")
+    if not module_name or not attr:
+        click.echo(f"Expected module:callable, got {spec!r}", err=True)
+        sys.exit(2)
+    if str(Path.cwd()) not in sys.path:
+        sys.path.insert(0, str(Path.cwd()))
+    try:
+        obj = importlib.import_module(module_name)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as exc:
+        click.echo(f"Cannot load {spec}: {exc}", err=True)
+        sys.exit(2)
+    if not callable(obj):
+        click.echo(f"{spec} is not callable", err=True)
+        sys.exit(2)
+    return obj
+
+
+def _instrumented_package(target: str, package: str | None) -> str:
+    """Components package to instrument: explicit, the vendored one for app pages, or ours."""
+    if package:
+        return package
+    if target != DEMO_PAGE:
+        from .usage import package_name_for
+
+        vendored = _components_dest(None)
+        if any(vendored.glob("*.py")):
+            return package_name_for(vendored)
+    return "htpy_uikit.components"
+
+
+@cli.command("size")
+@click.argument("target", required=False)
+@click.option(
+    "--components",
+    "package",
+    default=None,
+    help="Components package to attribute bytes to. Defaults to your vendored components.",
+)
+@click.option(
+    "--budget",
+    "budgets",
+    multiple=True,
+    metavar="NAME[.METRIC]=SIZE",
+    help="Fail when exceeded, e.g. total.gzip=40KB or select_component=20KB. Repeatable.",
+)
+@click.option("--top", type=int, default=20, show_default=True, help="Rows to show; 0 for all.")
+@click.option("--json", "as_json", is_flag=True, help="Print the full report as JSON.")
+def size_cmd(
+    target: str | None, package: str | None, budgets: tuple[str, ...], top: int, as_json: bool
+) -> None:
+    """Report the HTML bytes each component contributes to a rendered page.
+
+    TARGET is a ``module:callable`` returning the page (default: pyproject ``size_target``,
+    else the demo page). Each component's own bytes are split into class attributes,
+    Alpine/JS, SVG, text and other markup, with standalone gzip/brotli estimates. Budgets
+    come from ``--budget`` and pyproject ``size_budgets``; any overrun exits with status 1.
+    """
+    from .payload import PAGE
+    from .payload import check_budgets
+    from .payload import measure_payload
+
+    cfg = _load_config()
+    target = target or cfg.get("size_target") or DEMO_PAGE
+    limits: dict[str, str | int] = dict(cfg.get("size_budgets") or {})
+    for item in budgets:
+        key, sep, value = item.partition("=")
+        if not sep:
+            click.echo(f"Invalid budget {item!r}; expected NAME[.METRIC]=SIZE", err=True)
+            sys.exit(2)
+        limits[key.strip()] = value.strip()
+
+    render = _load_target(target)
+    report = measure_payload(render, _instrumented_package(target, package))
+    try:
+        failures, skipped = check_budgets(report, limits)
+    except ValueError as exc:
+        click.echo(str(exc), err=True)
+        sys.exit(2)
+
+    if as_json:
+        import json
+
+        click.echo(json.dumps({**report.to_json(), "failures": failures}, indent=2))
+    else:
+        brotli = _fmt_bytes(report.brotli) if report.brotli is not None else "n/a"
+        click.echo(
+            f"{target}: {_fmt_bytes(report.raw)} raw, {_fmt_bytes(report.gzip)} gzip, "
+            f"{brotli} brotli\n"
+        )
+        rows = report.sorted_components()
+        shown = rows[:top] if top > 0 else rows
+        width = max([len(c.name) for c in shown] + [9])
+        columns = ("calls", "own", "incl", "class", "js", "svg", "text", "other", "gzip", "br")
+        click.echo(f"{'component':<{width}} " + " ".join(f"{c:>9}" for c in columns))
+        for c in shown:
+            values = [
+                str(c.calls) if c.name != PAGE else "-",
+                *(_fmt_bytes(v) for v in (c.raw, c.inclusive, *c.bytes.values(), c.gzip)),
+                _fmt_bytes(c.brotli) if c.brotli is not None else "n/a",
+            ]
+            click.echo(f"{c.name:<{width}} " + " ".join(f"{v:>9}" for v in values))
+        if len(rows) > len(shown):
+            click.echo(f"... {len(rows) - len(shown)} more (use --top 0)")
+        if report.brotli is None:
+            click.echo("\nInstall `brotli` for brotli sizes.")
+    for message in skipped:
+        click.echo(f"skipped budget {message}", err=True)
+    if failures:
+        for message in failures:
+            click.echo(f"over budget: {message}", err=True)
+        sys.exit(1)
+    checked = len(limits) - len(skipped)
+    if checked and not as_json:
+        click.echo(f"\nAll {checked} budgets met.")
+
+
+@cli.command("profile")
+@click.argument("target", required=False)
+@click.option(
+    "--components",
+    "package",
+    default=None,
+    help="Components package to instrument. Defaults to your vendored components.",
+)
+@click.option("--repeat", type=int, default=5, show_default=True, help="Profiled renders.")
+@click.option(
+    "--sort",
+    type=click.Choice(["exclusive", "inclusive", "calls", "peak"]),
+    default="exclusive",
+    show_default=True,
+)
+@click.option("--top", type=int, default=25, show_default=True, help="Rows to show; 0 for all.")
+@click.option("--no-memory", is_flag=True, help="Skip the tracemalloc peak-memory pass.")
+@click.option(
+    "--speedscope",
+    "speedscope_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a speedscope profile (open at https://www.speedscope.app).",
+)
+@click.option(
+    "--collapsed",
+    "collapsed_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write collapsed stacks (flamegraph.pl / inferno input), in microseconds.",
+)
+def profile_cmd(
+    target: str | None,
+    package: str | None,
+    repeat: int,
+    sort: str,
+    top: int,
+    no_memory: bool,
+    speedscope_path: Path | None,
+    collapsed_path: Path | None,
+) -> None:
+    """Attribute render time and peak memory to each component function.
+
+    TARGET is a ``module:callable`` returning the page (default: the demo page). After one
+    unprofiled warm-up render it is rendered ``--repeat`` times with every component
+    timed while building its elements and while serializing them. Peak memory (above the
+    level at the call) comes from a separate tracemalloc pass so tracing does not skew
+    the timings.
+    """
+    import json
+
+    from .profiler import profile_render
+
+    target = target or DEMO_PAGE
+    render = _load_target(target)
+    package = _instrumented_package(target, package)
+    label = target.partition(":")[2]
+    str(render())  # warm-up: imports and first-call caches stay out of the numbers
+
+    prof = profile_render(render, package, label=label, memory=False, repeat=max(1, repeat))
+    peak = {}
+    if not no_memory:
+        mem = profile_render(render, package, label=label, memory=True)
+        peak = {row.name: row.peak_bytes for row in mem.stats()}
+    rows = prof.stats(sort="exclusive" if sort == "peak" else sort)
+    if sort == "peak":
+        rows.sort(key=lambda r: -peak.get(r.name, 0))
+
+    runs = max(1, repeat)
+    total_ms = sum(r.exclusive_ns for r in rows) / runs / 1e6
+    click.echo(f"{target}: {total_ms:.2f} ms per render (mean of {runs}, instrumented)\n")
+    shown = rows[:top] if top > 0 else rows
+    width = max([len(r.name) for r in shown] + [9])
+    header = ("calls", "excl ms", "incl ms", "build ms", "serial ms", "excl %", "peak")
+    click.echo(f"{'component':<{width}} " + " ".join(f"{h:>9}" for h in header))
+    for r in shown:
+        values = (
+            f"{r.calls // runs}",
+            f"{r.exclusive_ns / runs / 1e6:.3f}",
+            f"{r.inclusive_ns / runs / 1e6:.3f}",
+            f"{r.build_ns / runs / 1e6:.3f}",
+            f"{r.serialize_ns / runs / 1e6:.3f}",
+            f"{100 * r.exclusive_ns / runs / 1e6 / total_ms:.1f}" if total_ms else "-",
+            _fmt_bytes(peak[r.name]) if r.name in peak else "-",
+        )
+        click.echo(f"{r.name:<{width}} " + " ".join(f"{v:>9}" for v in values))
+    if len(rows) > len(shown):
+        click.echo(f"... {len(rows) - len(shown)} more (use --top 0)")
+
+    if speedscope_path:
+        _write_text(speedscope_path, json.dumps(prof.speedscope(target)))
+        click.echo(f"\nWrote {speedscope_path}")
+    if collapsed_path:
+        _write_text(collapsed_path, prof.collapsed())
+        click.echo(f"Wrote {collapsed_path}")
+
+
 @cli.command("add-theme")
 @click.option("--theme", help="Theme name to copy (omit to choose interactively if multiple).")
 @click.option(
@@ -317,6 +873,8 @@ def add_theme_cmd(theme: str | None, dest: Path | None, force: bool) -> None:
         if len(names) == 1:
             src = resolve_theme(names[0])
         else:
+            import questionary
+
             qChoice = getattr(questionary, "Choice", None)
             choices = [qChoice(title=n, value=n) for n in names] if qChoice else names
             chosen = questionary.select("Select a theme:", choices=choices).ask()
@@ -0,0 +1,376 @@
+"""htpy-uikit components.
+
+Submodules are loaded lazily (PEP 562): importing this package loads no component
+module, and ``components.button_component`` imports ``button`` on first access. A
+function whose name matches its module (``accordion``, ``dialog``, ...) is reached
+through the module, e.g. ``components.dialog.dialog``, since the import system binds
+the submodule to that attribute.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public module -> names it exports through the package facade. Generated from the
+# registry manifest by ``python -m scripts.gen_registry_manifest``; do not edit by hand.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "accordion": ("accordion_single", "accordion_faq"),
+    "alert": (),
+    "alert_dialog": (
+        "AlertDialogTriggerAttrs",
+        "attrs_btn_open_alert_dialog",
+        "attrs_btn_close_alert_dialog",
+        "alert_dialog_destructive",
+        "confirm_dialog",
+        "alert_dialog_host",
+        "attrs_btn_open_alert_dialog_host",
+    ),
+    "avatar": ("avatar_text", "avatar_group"),
+    "badge": (
+        "badge_primary",
+        "badge_secondary",
+        "badge_destructive",
+        "badge_outline",
+        "badge_status",
+        "badge_count",
+        "badge_link",
+    ),
+    "breadcrumb": (),
+    "button": ("button_component",),
+    "card": (
+        "card_with_header",
+        "card_with_footer",
+        "card_simple",
+        "card_header_only",
+        "card_content_only",
+        "card_section_header",
+        "card_section_footer",
+    ),
+    "checkbox": ("checkbox_component", "checkbox_card_component"),
+    "combobox": ("combobox_results",),
+    "deferred": (
+        "deferred_content",
+        "prefetch_js",
+        "prefetch_within_js",
+        "DeferredPanel",
+        "DeferredPanels",
+    ),
+    "dialog": (
+        "dialog_content",
+        "dialog_header",
+        "dialog_title",
+        "dialog_description",
+        "dialog_footer",
+        "dialog_close_button",
+        "dialog_action_button",
+        "attrs_prefetch_dialog",
+    ),
+    "dropdown_menu": (
+        "dropdown_menu_item",
+        "dropdown_menu_separator",
+        "dropdown_menu_label",
+        "dropdown_menu_item_checkbox",
+        "dropdown_menu_item_radio",
+        "dropdown_menu_group",
+        "dropdown_menu_trigger",
+    ),
+    "form": ("form_component", "form_section", "form_field", "form_actions"),
+    "hydrate": ("lazy_hydration_script",),
+    "icons": (
+        "icon_send",
+        "icon_chevron_right",
+        "icon_chevron_left",
+        "icon_arrow_right",
+        "icon_spinner",
+        "icon_trash",
+        "icon_download",
+        "icon_upload",
+        "icon_more",
+        "icon_menu",
+        "icon_check",
+        "icon_pencil",
+        "icon_headset",
+        "icon_close",
+        "icon_search",
+        "icon_settings",
+        "icon_user",
+        "icon_info",
+        "icon_circle_check",
+        "toast_icon_success",
+        "toast_icon_error",
+        "toast_icon_info",
+        "icon_circle_alert",
+        "icon_chevron_down",
+        "icon_chevrons_up_down",
+        "icon_credit_card",
+        "icon_bar",
+        "icon_line",
+        "icon_pie",
+        "icon_logout",
+        "icon_double_chevron",
+        "icon_moon",
+        "icon_sun",
+        "icon_eye",
+        "icon_eye_off",
+        "icon_tag",
+        "icon_plus",
+        "icon_sort_asc",
+        "icon_sort_desc",
+        "icon_pdf_file",
+        "icon_under_construction",
+        "icon_flag_en",
+        "icon_flag_es",
+        "icon_social_facebook",
+        "icon_social_instagram",
+        "icon_social_twitter",
+        "icon_social_github",
+        "icon_social_dribbble",
+    ),
+    "input": ("input_component",),
+    "label": ("label_component", "required_label"),
+    "lucide": (
+        "lucide_icon",
+        "lucide_cdn_script",
+        "lucide_auto_init_script",
+        "lucide_htmx_init_script",
+    ),
+    "metrics": (
+        "MetricsSink",
+        "Histogram",
+        "MetricsRegistry",
+        "enable_metrics",
+        "disable_metrics",
+        "metrics_sink",
+        "render_page",
+    ),
+    "modal": (
+        "attrs_btn_open_modal",
+        "attrs_btn_close_modal",
+        "modal_host",
+        "attrs_btn_open_modal_host",
+        "hx_modal",
+    ),
+    "navbar": ("navbar_simple",),
+    "option_index": ("iter_options", "OptionIndex"),
+    "pagination": (
+        "classes_btn",
+        "simple_pagination",
+        "compact_pagination",
+        "large_pagination",
+        "alpine_pagination",
+    ),
+    "popover": ("popover_simple", "popover_with_title", "popover_trigger_button"),
+    "radio_group": ("radio_group_cards",),
+    "section": ("section_block", "section_header"),
+    "select": ("native_select", "select_component", "multiselect_component"),
+    "server_timing": (
+        "ServerTiming",
+        "current_timing",
+        "render_timed",
+        "timed_section",
+        "init_flask",
+        "ServerTimingMiddleware",
+    ),
+    "skeleton": (
+        "skeleton_text",
+        "skeleton_title",
+        "skeleton_button",
+        "skeleton_avatar",
+        "skeleton_media_row",
+        "skeleton_card",
+        "skeleton_table",
+    ),
+    "slider": (),
+    "switch": ("switch_card",),
+    "table": ("table_component", "simple_table", "table_with_actions"),
+    "tabs": ("tab_panel",),
+    "textarea": ("textarea_component",),
+    "theme_toggle": (),
+    "toast": ("toaster", "toast_trigger", "code_trigger_toast", "build_toast_event"),
+    "tooltip": (),
+}
+
+_EXPORT_TO_MODULE: dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = (
+    "AlertDialogTriggerAttrs",
+    "DeferredPanel",
+    "DeferredPanels",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsSink",
+    "OptionIndex",
+    "ServerTiming",
+    "ServerTimingMiddleware",
+    "accordion_faq",
+    "accordion_single",
+    "alert_dialog_destructive",
+    "alert_dialog_host",
+    "alpine_pagination",
+    "attrs_btn_close_alert_dialog",
+    "attrs_btn_close_modal",
+    "attrs_btn_open_alert_dialog",
+    "attrs_btn_open_alert_dialog_host",
+    "attrs_btn_open_modal",
+    "attrs_btn_open_modal_host",
+    "attrs_prefetch_dialog",
+    "avatar_group",
+    "avatar_text",
+    "badge_count",
+    "badge_destructive",
+    "badge_link",
+    "badge_outline",
+    "badge_primary",
+    "badge_secondary",
+    "badge_status",
+    "build_toast_event",
+    "button_component",
+    "card_content_only",
+    "card_header_only",
+    "card_section_footer",
+    "card_section_header",
+    "card_simple",
+    "card_with_footer",
+    "card_with_header",
+    "checkbox_card_component",
+    "checkbox_component",
+    "classes_btn",
+    "code_trigger_toast",
+    "combobox_results",
+    "compact_pagination",
+    "confirm_dialog",
+    "current_timing",
+    "deferred_content",
+    "dialog_action_button",
+    "dialog_close_button",
+    "dialog_content",
+    "dialog_description",
+    "dialog_footer",
+    "dialog_header",
+    "dialog_title",
+    "disable_metrics",
+    "dropdown_menu_group",
+    "dropdown_menu_item",
+    "dropdown_menu_item_checkbox",
+    "dropdown_menu_item_radio",
+    "dropdown_menu_label",
+    "dropdown_menu_separator",
+    "dropdown_menu_trigger",
+    "enable_metrics",
+    "form_actions",
+    "form_component",
+    "form_field",
+    "form_section",
+    "hx_modal",
+    "icon_arrow_right",
+    "icon_bar",
+    "icon_check",
+    "icon_chevron_down",
+    "icon_chevron_left",
+    "icon_chevron_right",
+    "icon_chevrons_up_down",
+    "icon_circle_alert",
+    "icon_circle_check",
+    "icon_close",
+    "icon_credit_card",
+    "icon_double_chevron",
+    "icon_download",
+    "icon_eye",
+    "icon_eye_off",
+    "icon_flag_en",
+    "icon_flag_es",
+    "icon_headset",
+    "icon_info",
+    "icon_line",
+    "icon_logout",
+    "icon_menu",
+    "icon_moon",
+    "icon_more",
+    "icon_pdf_file",
+    "icon_pencil",
+    "icon_pie",
+    "icon_plus",
+    "icon_search",
+    "icon_send",
+    "icon_settings",
+    "icon_social_dribbble",
+    "icon_social_facebook",
+    "icon_social_github",
+    "icon_social_instagram",
+    "icon_social_twitter",
+    "icon_sort_asc",
+    "icon_sort_desc",
+    "icon_spinner",
+    "icon_sun",
+    "icon_tag",
+    "icon_trash",
+    "icon_under_construction",
+    "icon_upload",
+    "icon_user",
+    "init_flask",
+    "input_component",
+    "iter_options",
+    "label_component",
+    "large_pagination",
+    "lazy_hydration_script",
+    "lucide_auto_init_script",
+    "lucide_cdn_script",
+    "lucide_htmx_init_script",
+    "lucide_icon",
+    "metrics_sink",
+    "modal_host",
+    "multiselect_component",
+    "native_select",
+    "navbar_simple",
+    "popover_simple",
+    "popover_trigger_button",
+    "popover_with_title",
+    "prefetch_js",
+    "prefetch_within_js",
+    "radio_group_cards",
+    "render_page",
+    "render_timed",
+    "required_label",
+    "section_block",
+    "section_header",
+    "select_component",
+    "simple_pagination",
+    "simple_table",
+    "skeleton_avatar",
+    "skeleton_button",
+    "skeleton_card",
+    "skeleton_media_row",
+    "skeleton_table",
+    "skeleton_text",
+    "skeleton_title",
+    "switch_card",
+    "tab_panel",
+    "table_component",
+    "table_with_actions",
+    "textarea_component",
+    "timed_section",
+    "toast_icon_error",
+    "toast_icon_info",
+    "toast_icon_success",
+    "toast_trigger",
+    "toaster",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    module = _EXPORT_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS, *__all__})
@@ -0,0 +1,48 @@
+"""Fragment cache lookup reporting, without the metrics tooling.
+
+Components with a fragment cache call ``record_cache`` on every lookup. It is a global
+read and a ``ContextVar`` lookup until ``metrics.enable_metrics`` installs a counter or a
+request listens with ``listen_cache_lookups`` (``server_timing`` does), so vendoring a
+cached component does not pull in ``metrics`` or ``_instrument``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# ``count_cache`` of the active metrics sink; set by ``metrics.enable_metrics``.
+_counter: Callable[[str, bool], None] | None = None
+
+# Per-request listener for fragment cache lookups, e.g. the Server-Timing recorder.
+_cache_listener: ContextVar[Callable[[str, bool, float], None] | None] = ContextVar(
+    "htpy_uikit_cache_listener", default=None
+)
+
+
+def set_cache_counter(counter: Callable[[str, bool], None] | None) -> None:
+    """Install ``counter(cache, hit)`` for every lookup, or remove it with None."""
+    global _counter
+    _counter = counter
+
+
+@contextmanager
+def listen_cache_lookups(callback: Callable[[str, bool, float], None]) -> Iterator[None]:
+    """Call ``callback(cache, hit, seconds)`` for every lookup in the current context."""
+    token = _cache_listener.set(callback)
+    try:
+        yield
+    finally:
+        _cache_listener.reset(token)
+
+
+def record_cache(cache: str, hit: bool, seconds: float = 0.0) -> None:
+    """Report a fragment cache lookup (and how long it took) to the active sink, if any."""
+    counter = _counter
+    if counter is not None:
+        counter(cache, hit)
+    listener = _cache_listener.get()
+    if listener is not None:
+        listener(cache, hit, seconds)
@@ -0,0 +1,180 @@
+"""Patch the public component functions so tools can observe what they render.
+
+The components carry no instrumentation of their own: ``htpyuikit size``/``profile`` and
+``metrics.enable_metrics`` swap wrappers in and restore the originals afterwards, so
+renders that nobody observes never pay for it.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import pkgutil
+import sys
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import FunctionType
+from types import ModuleType
+from typing import Any
+
+from htpy import BaseElement
+from markupsafe import Markup
+
+# The package this module lives in: ``htpy_uikit.components``, or the app's package once
+# vendored.
+COMPONENTS_PACKAGE = __package__ or "htpy_uikit.components"
+# Public modules that are tooling rather than components; their functions are not patched.
+TOOLING_MODULES = {"metrics", "option_index", "server_timing"}
+
+# Wraps a serialization: receives the component's chunks, yields the chunks to emit.
+Around = Callable[[Iterator[str]], Iterator[str]]
+
+
+@dataclass(frozen=True)
+class ComponentFunction:
+    """A public component function and where it is bound."""
+
+    name: str
+    module: str
+    func: Callable[..., Any]
+    # The ``@with_children`` wrapper holding ``func`` in ``.wrapped``; None for plain functions.
+    owner: Any = None
+
+
+def load_component_modules(package: str = COMPONENTS_PACKAGE) -> list[ModuleType]:
+    """Import the component modules of ``package`` (the package facade loads them lazily)."""
+    pkg = importlib.import_module(package)
+    return [
+        importlib.import_module(f"{package}.{info.name}")
+        for info in pkgutil.iter_modules(pkg.__path__)
+        if not info.name.startswith("_") and info.name not in TOOLING_MODULES
+    ]
+
+
+def iter_component_functions(package: str = COMPONENTS_PACKAGE) -> list[ComponentFunction]:
+    """Public functions defined in the component modules of ``package``."""
+    found: list[ComponentFunction] = []
+    for mod in load_component_modules(package):
+        for name, obj in vars(mod).items():
+            if name.startswith("_"):
+                continue
+            inner = getattr(obj, "wrapped", None)
+            if isinstance(inner, FunctionType) and inner.__module__ == mod.__name__:
+                found.append(ComponentFunction(name, mod.__name__, inner, owner=obj))
+            elif isinstance(obj, FunctionType) and obj.__module__ == mod.__name__:
+                found.append(ComponentFunction(name, mod.__name__, obj))
+    return found
+
+
+@contextmanager
+def patch_components(
+    make_wrapper: Callable[[ComponentFunction], Callable[..., Any]],
+    package: str = COMPONENTS_PACKAGE,
+) -> Iterator[list[ComponentFunction]]:
+    """Replace every public component function with ``make_wrapper(target)`` while active.
+
+    ``@with_children`` components are patched in place on their shared wrapper. Plain
+    functions are bound by value wherever they were imported, so every loaded module
+    attribute holding one is rebound; references stashed in containers are not.
+    """
+    targets = iter_component_functions(package)
+    undo: list[tuple[object, str, object]] = []
+    plain: dict[int, Callable[..., Any]] = {}
+    for target in targets:
+        wrapper = functools.update_wrapper(make_wrapper(target), target.func)
+        if target.owner is not None:
+            undo.append((target.owner, "wrapped", target.func))
+            target.owner.wrapped = wrapper
+        else:
+            plain[id(target.func)] = wrapper
+    originals = {id(t.func): t.func for t in targets if t.owner is None}
+    for mod in list(sys.modules.values()):
+        namespace = getattr(mod, "__dict__", None)
+        if not isinstance(namespace, dict):
+            continue
+        for key, value in list(namespace.items()):
+            if id(value) in originals and originals[id(value)] is value:
+                undo.append((mod, key, value))
+                setattr(mod, key, plain[id(value)])
+    try:
+        yield targets
+    finally:
+        for obj, key, value in reversed(undo):
+            setattr(obj, key, value)
+
+
+class _ObservedNode:
+    """Any other renderable, with its chunks routed through ``around``."""
+
+    __slots__ = ("_around", "_node")
+
+    def __init__(self, node: Any, around: Around) -> None:
+        self._node = node
+        self._around = around
+
+    def iter_chunks(self, context: Any = None) -> Iterator[str]:
+        return self._around(iter(self._node.iter_chunks(context)))
+
+    def __str__(self) -> Markup:
+        return Markup("".join(self.iter_chunks()))
+
+    __html__ = __str__
+
+
+_observed_classes: dict[type, type] = {}
+
+
+def _observed_class(cls: type[BaseElement]) -> type[BaseElement]:
+    # A subclass keeps ``el(attrs)`` / ``el[children]`` working on a component's result;
+    # both build a new element of the same class, so ``around`` is carried over.
+    if cls not in _observed_classes:
+
+        def iter_chunks(self, context=None):
+            return self._around(cls.iter_chunks(self, context))
+
+        def call(self, *args, **kwargs):
+            new = cls.__call__(self, *args, **kwargs)
+            new._around = self._around
+            return new
+
+        namespace: dict[str, Any] = {
+            "__slots__": ("_around",),
+            "iter_chunks": iter_chunks,
+            "__call__": call,
+        }
+        if hasattr(cls, "__getitem__"):
+
+            def getitem(self, children):
+                new = cls.__getitem__(self, children)
+                new._around = self._around
+                return new
+
+            namespace["__getitem__"] = getitem
+        _observed_classes[cls] = type(f"Observed{cls.__name__}", (cls,), namespace)
+    return _observed_classes[cls]
+
+
+def observe_render(result: Any, around: Around) -> Any:
+    """Return ``result`` with its serialization routed through ``around``.
+
+    Non-renderable results (attribute dicts, JS strings) come back unchanged.
+    """
+    if isinstance(result, BaseElement):
+        cls = type(result)
+        inner = getattr(result, "_around", None)
+        if inner is not None:
+            # A component returning another component's element: nest the observers.
+            cls = cls.__mro__[1]
+            outer = around
+
+            def around(chunks: Iterator[str]) -> Iterator[str]:
+                return outer(inner(chunks))
+
+        observed = _observed_class(cls)(result._name, result._attrs, result._children)
+        observed._around = around
+        return observed
+    if hasattr(result, "iter_chunks"):
+        return _ObservedNode(result, around)
+    return result
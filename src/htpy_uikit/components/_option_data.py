@@ -0,0 +1,62 @@
+"""Compact JSON encoding of select/combobox options for client-side rendering.
+
+Large option lists ship as one ``<script type="application/json">`` data island instead
+of one DOM node per option; the component's Alpine state parses it and builds option
+nodes itself. The payload is::
+
+    {"groups": ["Fruits", ...], "options": [[value, label, group], ...]}
+
+where ``group`` indexes ``groups`` (-1 for ungrouped options) and options with an
+``icon`` carry its rendered HTML as a fourth element.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from htpy import Renderable
+from htpy import script
+from markupsafe import Markup
+
+
+def option_data(items: Iterable[Any]) -> dict[str, list[Any]]:
+    """Return the island payload for ``SelectOption``/``SelectItem``/``SelectGroup`` entries.
+
+    Args:
+        items: Options and groups, in display order.
+
+    Returns:
+        dict[str, list[Any]]: ``{"groups": [...], "options": [...]}``.
+    """
+    groups: list[str] = []
+    rows: list[list[Any]] = []
+
+    def add(item: Any, group: int) -> None:
+        row = [item.get("value", ""), item.get("label", ""), group]
+        if item.get("icon") is not None:
+            row.append(str(item["icon"]))
+        rows.append(row)
+
+    for item in items:
+        if item.get("type") == "group":
+            groups.append(item.get("label", ""))
+            for child in item.get("items", []):
+                add(child, len(groups) - 1)
+        else:
+            add(item, -1)
+    return {"groups": groups, "options": rows}
+
+
+def data_island(data: Any, **attrs: Any) -> Renderable:
+    """Render ``data`` as a JSON ``<script>`` island.
+
+    Args:
+        data: JSON-serializable payload.
+        **attrs: Attributes for the ``<script>`` tag (e.g. ``x-ref``).
+
+    Returns:
+        Renderable: ``<script type="application/json">`` with the compact JSON.
+    """
+    # "<" is escaped so a label containing "</script>" cannot end the island early.
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("<", "\\u003c")
+    return script(type="application/json", **attrs)[Markup(payload)]
@@ -6,8 +6,16 @@ patterns across the entire component library.
 
 All classes use shadcn-compatible theme tokens (e.g., bg-primary, text-foreground,
 border-border) that map to CSS variables defined in tailwind-themes/theme.css.
+
+Set ``HTPY_UIKIT_COMPACT_CLASSES=1`` before the components are imported to render each
+constant as one short semantic class instead (``uk-btn``, ``uk-btn-primary``,
+``uk-option``). The utilities then live in a stylesheet of ``@apply`` rules generated by
+``compact_stylesheet()`` (``htpyuikit compact-css``), so repeated elements such as
+options, rows and buttons stop carrying hundreds of bytes of classes each.
 """
 
+import os
+
 # ============================================================================
 # Common state patterns
 # ============================================================================
@@ -106,6 +114,16 @@ INPUT_BASE_CLASSES = (
     "file:inline-flex file:h-7 file:border-0 file:bg-transparent file:text-sm file:font-medium"
 )
 
+# Textarea: the input styling with a minimum height and taller padding for multi-line text
+TEXTAREA_BASE_CLASSES = (
+    "appearance-none file:text-foreground placeholder:text-muted-foreground "
+    "selection:bg-primary selection:text-primary-foreground "
+    "dark:bg-input/30 border-input flex min-h-[60px] w-full min-w-0 rounded-md border "
+    "bg-input/40 px-3 py-2 text-base shadow-xs transition-[color,box-shadow] "
+    f"{INTERACTIVE_STATE_CLASSES} md:text-sm "
+    "file:inline-flex file:h-7 file:border-0 file:bg-transparent file:text-sm file:font-medium"
+)
+
 # Native select specific (includes chevron icon background)
 SELECT_NATIVE_BASE_CLASSES = (
     "appearance-none border-input dark:bg-input/30 dark:hover:bg-input/50 "
@@ -157,6 +175,21 @@ LISTBOX_OPTION_BASE_CLASSES = (
     f"{FOCUS_ACCENT_CLASSES} {HOVER_ACCENT_CLASSES}"
 )
 
+# Listbox option with its selected state (select and combobox options)
+LISTBOX_OPTION_CLASSES = (
+    f"{LISTBOX_OPTION_BASE_CLASSES} aria-selected:bg-accent aria-selected:text-accent-foreground"
+)
+
+# Multi-select listbox option
+LISTBOX_MULTI_OPTION_CLASSES = (
+    "relative flex cursor-pointer items-center gap-2 rounded-sm pl-2 py-1.5 pr-7.5 "
+    "text-sm outline-hidden select-none w-full truncate transition-none mb-1 "
+    f"{ICON_INLINE_CLASSES} "
+    f"{FOCUS_ACCENT_CLASSES} hover:bg-accent hover:text-accent-foreground "
+    "aria-selected:bg-accent aria-selected:text-accent-foreground "
+    "aria-selected:hover:bg-accent/80"
+)
+
 # Listbox option selected state (applied via Alpine/JS)
 LISTBOX_OPTION_SELECTED_CLASSES = "bg-accent text-accent-foreground"
 
@@ -240,3 +273,81 @@ TAB_LIST_CONTAINER_CLASSES = (
     "bg-muted text-muted-foreground inline-flex h-9 w-full items-center "
     "justify-center rounded-lg p-[3px] border border-border"
 )
+
+# ============================================================================
+# Table styles
+# ============================================================================
+
+TABLE_BASE_CLASSES = (
+    "w-full caption-bottom text-sm border-border "
+    # Header border color
+    "[&_thead_tr]:border-b [&_thead_tr]:border-border/70 "
+    # Body row borders: subtle but visible
+    "[&_tbody_tr]:border-border/60 [&_tr]:border-b [&_tr]:transition-colors "
+    "[&_tr]:hover:bg-muted/50 "
+    # Footer styling and border color
+    "[&_tfoot]:bg-muted/50 [&_tfoot]:border-t [&_tfoot]:border-border/70 [&_tfoot]:font-medium "
+    "[&_tfoot_tr]:last:border-b-0 "
+    # Cell and header text/layout
+    "[&_th]:text-foreground [&_th]:h-10 [&_th]:px-2 [&_th]:text-left [&_th]:align-middle "
+    "[&_th]:font-medium [&_th]:whitespace-nowrap [&_th:has([role=checkbox])]:pr-0 "
+    "[&_th_[role=checkbox]]:translate-y-[2px] [&_td]:p-2 [&_td]:align-middle "
+    "[&_td]:whitespace-nowrap [&_td:has([role=checkbox])]:pr-0 "
+    "[&_td_[role=checkbox]]:translate-y-[2px] [&_caption]:text-muted-foreground "
+    "[&_caption]:mt-4 [&_caption]:text-sm"
+)
+
+# ============================================================================
+# Compact (semantic class) mode
+# ============================================================================
+
+SEMANTIC_CLASS_PREFIX = "uk-"
+# Short names that don't follow the derived ``<group>-<variant>`` pattern.
+SEMANTIC_CLASS_ALIASES = {"LISTBOX_OPTION": "option"}
+
+# Every constant above, always with its full utility string.
+CLASS_DEFINITIONS: dict[str, str] = {
+    name: value
+    for name, value in globals().items()
+    if name.endswith("_CLASSES") and isinstance(value, str)
+}
+
+COMPACT_MODE = os.environ.get("HTPY_UIKIT_COMPACT_CLASSES", "").lower() in {"1", "true", "yes"}
+
+
+def semantic_class_name(constant: str) -> str:
+    """Return the short semantic class for a ``*_CLASSES`` constant.
+
+    ``BTN_VARIANT_PRIMARY_CLASSES`` becomes ``uk-btn-primary``.
+
+    Args:
+        constant: Name of a ``*_CLASSES`` constant in this module.
+
+    Returns:
+        str: Stable semantic class name; ``BASE`` and ``VARIANT`` segments are dropped.
+    """
+    stem = constant.removesuffix("_CLASSES")
+    if stem in SEMANTIC_CLASS_ALIASES:
+        return SEMANTIC_CLASS_PREFIX + SEMANTIC_CLASS_ALIASES[stem]
+    parts = [p for p in stem.lower().split("_") if p not in {"base", "variant"}]
+    return SEMANTIC_CLASS_PREFIX + "-".join(parts)
+
+
+def compact_stylesheet() -> str:
+    """Return the CSS defining every semantic class with ``@apply``.
+
+    Rules go in the ``components`` layer, so utilities passed via ``class_`` still win,
+    and follow the order of the constants above (base before variants and sizes).
+
+    Returns:
+        str: Stylesheet to include in the Tailwind entry CSS after the theme.
+    """
+    rules = [
+        f"  .{semantic_class_name(name)} {{\n    @apply {value};\n  }}\n"
+        for name, value in CLASS_DEFINITIONS.items()
+    ]
+    return "@layer components {\n" + "\n".join(rules) + "}\n"
+
+
+if COMPACT_MODE:
+    globals().update({name: semantic_class_name(name) for name in CLASS_DEFINITIONS})
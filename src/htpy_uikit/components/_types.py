@@ -5,6 +5,7 @@ This module contains all Literal types and TypedDict classes used throughout
 the component library to ensure consistency and maintainability.
 """
 
+from collections.abc import Callable
 from typing import Literal
 from typing import NotRequired
 from typing import TypedDict
@@ -149,11 +150,16 @@ class BreadcrumbItem(TypedDict):
 
 
 class TabContentItem(TypedDict):
-    """Tab item structure for tabs component."""
+    """Tab item structure for tabs component.
+
+    ``content`` may be a zero-argument callable, which is only called when the panel
+    is rendered. ``url`` makes the panel load from that endpoint on first activation.
+    """
 
     value: str
     label: str | Node
-    content: Node
+    content: NotRequired[Node | Callable[[], Node]]
+    url: NotRequired[str]
     disabled: NotRequired[bool]
 
 
@@ -1,5 +1,9 @@
+import os
 import random
+import re
 import string
+from collections.abc import Callable
+from collections.abc import Iterator
 
 
 def merge_classes(base_classes: str, class_: str | None = None) -> str:
@@ -28,3 +32,173 @@ def random_string(n: int) -> str:
     """
 
     return "".join(random.choices(string.ascii_letters, k=n))
+
+
+# ============================================================================
+# Inline script/style minification
+# ============================================================================
+
+# Set ``HTPY_UIKIT_MINIFY=1`` before the components are imported to ship the inline Alpine
+# state and ``<style>`` blocks without comments and indentation. Templates are minified
+# once at import; rendering only fills in the per-call values.
+MINIFY_MODE = os.environ.get("HTPY_UIKIT_MINIFY", "").lower() in {"1", "true", "yes"}
+
+_JS_WORD_RE = re.compile(r"[\w$\u0080-\uffff]+")
+# After these characters (or keywords) a ``/`` starts a regex literal, not a division.
+_JS_REGEX_PREV = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of", "void"}
+# A line break can be dropped when the line clearly continues: it ends in an operator or
+# opener, or the next line starts with one. Everywhere else it is kept for ASI.
+_JS_JOIN_AFTER = set("{([,;:=&|?*/<>!%^~")
+_JS_JOIN_BEFORE = set("})],;.?:=&|*/<>%^")
+
+
+def iter_js_tokens(code: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(separator, token)`` pairs for a JavaScript snippet.
+
+    ``separator`` is ``"\\n"`` when the token follows a line break, ``" "`` when it follows
+    other whitespace or a comment, and ``""`` otherwise. Strings, template literals and
+    regex literals come back as single tokens; comments are dropped.
+    """
+    i, n = 0, len(code)
+    sep = ""
+    prev = ""
+    while i < n:
+        c = code[i]
+        if c in " \t\r\n\f\v":
+            if c == "\n":
+                sep = "\n"
+            elif not sep:
+                sep = " "
+            i += 1
+            continue
+        if code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end < 0 else end
+            continue
+        if code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            block = code[i : n if end < 0 else end + 2]
+            sep = "\n" if "\n" in block else (sep or " ")
+            i += len(block)
+            continue
+        if c in "'\"`":
+            j = i + 1
+            while j < n and code[j] != c:
+                j += 2 if code[j] == "\\" else 1
+            token = code[i : j + 1]
+        elif c == "/" and (not prev or prev[-1] in _JS_REGEX_PREV or prev in _JS_REGEX_KEYWORDS):
+            j, in_class = i + 1, False
+            while j < n and (in_class or code[j] != "/") and code[j] != "\n":
+                if code[j] == "\\":
+                    j += 1
+                elif code[j] in "[]":
+                    in_class = code[j] == "["
+                j += 1
+            word = _JS_WORD_RE.match(code, j + 1)
+            token = code[i : word.end() if word else j + 1]
+        else:
+            word = _JS_WORD_RE.match(code, i)
+            token = word.group() if word else c
+        yield sep, token
+        sep = ""
+        prev = token
+        i += len(token)
+
+
+def minify_js(code: str) -> str:
+    """Strip comments and redundant whitespace from an inline JavaScript snippet.
+
+    Identifiers are kept as written: Alpine state and method names are referenced from
+    other attributes, so renaming them would change behaviour.
+
+    Args:
+        code: JavaScript source, e.g. an ``x-data`` object or an event handler.
+
+    Returns:
+        str: Equivalent source with the same tokens and the fewest separators that keep
+        them apart (line breaks survive where automatic semicolon insertion needs them).
+    """
+    out: list[str] = []
+    prev = ""
+    for sep, token in iter_js_tokens(code):
+        if sep and prev:
+            if sep == "\n" and prev[-1] not in _JS_JOIN_AFTER and token[0] not in _JS_JOIN_BEFORE:
+                out.append("\n")
+            elif (_JS_WORD_RE.match(prev[-1]) and _JS_WORD_RE.match(token[0])) or (
+                prev[-1] in "+-/" and token[0] == prev[-1]
+            ):
+                out.append(" ")
+        out.append(token)
+        prev = token
+    return "".join(out)
+
+
+_CSS_TOKEN_RE = re.compile(
+    r"""/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|\s+|[{};:,]|[^\s"'/{};:,]+|/""",
+    re.DOTALL,
+)
+
+
+def minify_css(code: str) -> str:
+    """Strip comments and redundant whitespace from an inline stylesheet or style attribute.
+
+    Args:
+        code: CSS rules (``<style>`` content) or declarations (``style=""``).
+
+    Returns:
+        str: Equivalent CSS; whitespace only survives between words and values.
+    """
+    out: list[str] = []
+    space = False
+    for token in _CSS_TOKEN_RE.findall(code):
+        if token.startswith("/*") or token.isspace():
+            space = space or bool(out)
+            continue
+        if space and out[-1][-1] not in "{};:," and token[0] not in "{};,!)":
+            out.append(" ")
+        space = False
+        if token[0] == "}" and out and out[-1] == ";":
+            out.pop()
+        out.append(token)
+    css = "".join(out)
+    return css.removesuffix(";")
+
+
+def _minify_template(template: str, minify: Callable[[str], str]) -> str:
+    # Swap each ``{field}`` for an identifier-like sentinel, minify the literal code, then
+    # restore the fields and the ``{{``/``}}`` escapes so the result is a template again.
+    parts: list[str] = []
+    fields: list[str] = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal)
+        if name is not None:
+            field = name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")
+            parts.append(f"__htpy_field_{len(fields)}__")
+            fields.append("{" + field + "}")
+    code = minify("".join(parts)).replace("{", "{{").replace("}", "}}")
+    for index, field in enumerate(fields):
+        code = code.replace(f"__htpy_field_{index}__", field, 1)
+    return code
+
+
+def inline_js(code: str) -> str:
+    """Return ``code`` minified when ``HTPY_UIKIT_MINIFY`` is on, else unchanged.
+
+    Call it at import time (module-level constants) so the work happens once.
+    """
+    return minify_js(code) if MINIFY_MODE else code
+
+
+def inline_css(code: str) -> str:
+    """Return ``code`` minified when ``HTPY_UIKIT_MINIFY`` is on, else unchanged."""
+    return minify_css(code) if MINIFY_MODE else code
+
+
+def js_template(template: str) -> str:
+    """Return a ``str.format`` JavaScript template, minified when ``HTPY_UIKIT_MINIFY`` is on.
+
+    Placeholders (``{side}``) and brace escapes (``{{``) survive minification, so the
+    template is minified once at import and each render only calls ``.format(...)``.
+    """
+    return _minify_template(template, minify_js) if MINIFY_MODE else template
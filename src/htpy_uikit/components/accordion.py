@@ -9,6 +9,8 @@ from htpy import section
 from htpy import summary
 
 from ._types import AccordionItem
+from .deferred import DeferredPanel
+from .deferred import prefetch_within_js
 from .icons import icon_chevron_down
 
 
@@ -23,6 +25,7 @@ def accordion(
 
     Args:
         items: Sequence of accordion item definitions containing ``title`` and ``content``.
+            A ``DeferredPanel`` content is fetched the first time its item opens.
         default_value: Title whose panel should be expanded initially.
         class_: Additional CSS classes appended to the wrapping section.
         **attrs: Extra HTML attributes forwarded to the section element.
@@ -57,12 +60,18 @@ def accordion(
 
         section_attrs = {"class_": "pb-4"} if idx != total - 1 else {}
 
+        summary_attrs = {"@click.prevent": f"active = active === {idx} ? null : {idx}"}
+        if isinstance(content, DeferredPanel) and content.prefetch:
+            summary_attrs["@mouseenter.once"] = summary_attrs["@focus.once"] = prefetch_within_js(
+                "$el.parentElement"
+            )
+
         item = details(
             {":open": f"active === {idx}"},
             class_="group border-b border-border last:border-b-0",
         )[
             summary(
-                {"@click.prevent": f"active = active === {idx} ? null : {idx}"},
+                summary_attrs,
                 class_=(
                     "w-full focus-visible:border-ring focus-visible:ring-ring/50 "
                     "focus-visible:ring-[3px] transition-all outline-none rounded-md list-none"
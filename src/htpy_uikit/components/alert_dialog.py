@@ -1,4 +1,5 @@
 from typing import Literal
+from typing import NotRequired
 from typing import Optional
 from typing import TypedDict
 
@@ -7,25 +8,76 @@ from htpy import Renderable
 from htpy import article
 from htpy import dialog as dialog_tag
 from htpy import div
+from htpy import form
 from htpy import h2
 from htpy import header
 from htpy import p
 from htpy import section
 from htpy import with_children
+from markupsafe import Markup
+from sourcetypes import js
 
 from ._types import ButtonVariant
+from ._utils import inline_js
 from ._utils import random_string
 from .button import button_component
+from .deferred import deferred_content
+from .deferred import prefetch_js
 
 # Type definitions for alert dialog component
 AlertDialogActionVariant = Literal["default", "destructive"]
 
+# State of ``alert_dialog_host``: a click on any trigger whose ``data-alert-dialog-host``
+# names this host copies the trigger's ``data-dialog-*`` config into the dialog and opens
+# it. Missing values fall back to the host's own ``data-dialog-*`` defaults.
+_ALERT_DIALOG_HOST_ALPINE_DATA: js = inline_js(
+    """
+    {
+        title: '',
+        description: '',
+        action: '',
+        method: 'post',
+        confirmText: '',
+        cancelText: '',
+        variant: 'default',
+        _trigger: null,
+        onClick(event) {
+            const trigger = event.target.closest('[data-alert-dialog-host]');
+            if (!trigger || trigger.dataset.alertDialogHost !== this.$root.id) return;
+            event.preventDefault();
+            const d = trigger.dataset, host = this.$root.dataset;
+            this._trigger = trigger;
+            this.title = d.dialogTitle || '';
+            this.description = d.dialogDescription || '';
+            this.action = d.dialogAction || '';
+            this.method = d.dialogMethod || 'post';
+            this.confirmText = d.dialogConfirm || host.dialogConfirm;
+            this.cancelText = d.dialogCancel || host.dialogCancel;
+            this.variant = d.dialogVariant || host.dialogVariant;
+            this.$refs.dialog.showModal();
+        },
+        confirm(event) {
+            // Lets triggers act on confirmation themselves, e.g. with htmx's hx-trigger
+            this._trigger?.dispatchEvent(new CustomEvent('alert-dialog-confirm', {
+                bubbles: true, detail: { action: this.action, method: this.method }
+            }));
+            if (!this.action) {
+                event.preventDefault();
+                this.$refs.dialog.close();
+            }
+        }
+    }
+"""
+)
+
 
 class AlertDialogTriggerAttrs(TypedDict):
     """Attributes applied to buttons that toggle the native dialog."""
 
     type: Literal["button"]
     onclick: str
+    onmouseenter: NotRequired[str]
+    onfocus: NotRequired[str]
 
 
 @with_children
@@ -38,6 +90,8 @@ def alert_dialog(
     action_text: str = "Continue",
     action_variant: AlertDialogActionVariant = "default",
     show_cancel: bool = True,
+    content_url: str | None = None,
+    loading_content: Node = None,
     **attrs,
 ) -> Renderable:
     """Render a self-contained alert dialog element.
@@ -49,6 +103,10 @@ def alert_dialog(
     `attrs_btn_close_alert_dialog(dialog_id)` to build trigger/close button
     attributes (they call `showModal()` / `close()` respectively).
 
+    With `content_url` the body is not rendered: htmx fetches it the first time
+    the dialog opens (or on trigger hover/focus with
+    `attrs_btn_open_alert_dialog(dialog_id, prefetch=True)`) and keeps it.
+
     Args:
         children: Dialog content (body) or nodes to render inside the dialog
         title: Dialog title
@@ -57,6 +115,8 @@ def alert_dialog(
         action_text: Text for the primary action button (default: "Continue")
         action_variant: Action button styling; one of "default" or "destructive"
         show_cancel: Whether to render a cancel button next to the action
+        content_url: Endpoint returning the body fragment, for a deferred body
+        loading_content: Placeholder shown in a deferred body until it loads
         **attrs: Additional HTML attributes applied to the dialog container
 
     Returns:
@@ -103,6 +163,8 @@ def alert_dialog(
     ]
 
     # Body uses standard padding so content aligns with header/footer
+    if content_url is not None:
+        children = deferred_content(content_url, id=f"{dialog_id}-body", loading=loading_content)
     body_section = section(class_="flex-1 px-0")[children] if children else None
 
     # Footer with actions
@@ -142,19 +204,26 @@ def alert_dialog(
     return div()[dialog_node]
 
 
-def attrs_btn_open_alert_dialog(dialog_id: str) -> AlertDialogTriggerAttrs:
+def attrs_btn_open_alert_dialog(
+    dialog_id: str, *, prefetch: bool = False
+) -> AlertDialogTriggerAttrs:
     """Return attributes for a button to open a native alert dialog.
 
     Args:
         dialog_id: The id of the <dialog> to open.
+        prefetch: Start loading a deferred body (``content_url``) when the button is
+            hovered or focused.
 
     Returns:
         dict: Attributes including an onclick handler calling showModal().
     """
-    return {
+    attrs: AlertDialogTriggerAttrs = {
         "type": "button",
         "onclick": f"document.getElementById('{dialog_id}').showModal()",
     }
+    if prefetch:
+        attrs["onmouseenter"] = attrs["onfocus"] = prefetch_js(f"{dialog_id}-body")
+    return attrs
 
 
 def attrs_btn_close_alert_dialog(dialog_id: str) -> AlertDialogTriggerAttrs:
@@ -186,6 +255,9 @@ def alert_dialog_destructive(
 ) -> Node:
     """Render a destructive alert dialog and optional trigger button.
 
+    For one confirmation per table row, prefer a single ``alert_dialog_host`` with
+    ``attrs_btn_open_alert_dialog_host`` triggers.
+
     Args:
         children: Dialog body content.
         title: Dialog title.
@@ -216,7 +288,7 @@ def alert_dialog_destructive(
     trigger_button = button_component(
         variant=trigger_btn_variant,
         **(trigger_attrs or {}),
-        **attrs_btn_open_alert_dialog(dialog_id),
+        **attrs_btn_open_alert_dialog(dialog_id, prefetch="content_url" in kwargs),
     )[trigger_label]
     return [dialog_node, trigger_button]
 
@@ -236,6 +308,9 @@ def confirm_dialog(
 ) -> Node:
     """Render a confirmation dialog with optional trigger button.
 
+    For one confirmation per table row, prefer a single ``alert_dialog_host`` with
+    ``attrs_btn_open_alert_dialog_host`` triggers.
+
     Args:
         message: Dialog body text.
         title: Dialog title.
@@ -263,6 +338,139 @@ def confirm_dialog(
     trigger_button = button_component(
         variant=trigger_btn_variant,
         **(trigger_attrs or {}),
-        **attrs_btn_open_alert_dialog(dialog_id),
+        **attrs_btn_open_alert_dialog(dialog_id, prefetch="content_url" in kwargs),
     )[trigger_label]
     return [dialog_node, trigger_button]
+
+
+@with_children
+def alert_dialog_host(
+    children: Node,
+    *,
+    id: str = "alert-dialog-host",
+    confirm_text: str = "Continue",
+    cancel_text: str = "Cancel",
+    action_variant: AlertDialogActionVariant = "default",
+) -> Renderable:
+    """Render one alert dialog that every trigger on the page can reuse.
+
+    Instead of an ``alert_dialog``/``confirm_dialog`` per row, render the host once and
+    give each trigger the attributes from ``attrs_btn_open_alert_dialog_host``, which
+    carry only its title, description and action URL. A click on a trigger fills the
+    host and opens it, so the page's size no longer grows with the number of
+    confirmations. Confirming submits a form to the trigger's action URL; without an
+    action it just closes. Either way an ``alert-dialog-confirm`` event is dispatched on
+    the trigger, so an htmx trigger can use ``hx-trigger="alert-dialog-confirm"``.
+
+    Args:
+        children: Extra form content posted with every action (e.g. a CSRF input).
+        id: Host id that triggers reference; use several ids for several hosts.
+        confirm_text: Default confirm label when a trigger sets none.
+        cancel_text: Default cancel label when a trigger sets none.
+        action_variant: Default confirm button style when a trigger sets none.
+
+    Returns:
+        Renderable: Native ``<dialog>`` with its Alpine state.
+    """
+    article_classes = (
+        "bg-card text-card-foreground fixed top-[50%] left-[50%] z-50 flex flex-col w-full "
+        "max-w-lg -translate-x-1/2 -translate-y-1/2 gap-4 rounded-lg border border-border p-6 shadow-lg "
+        "max-h-[calc(100%-2rem)] transition-all scale-95"
+    )
+    close = {"@click": "$refs.dialog.close()"}
+
+    return div(
+        id=id,
+        **{
+            "x-data": Markup(_ALERT_DIALOG_HOST_ALPINE_DATA),
+            "@click.document": "onClick($event)",
+            "data-dialog-confirm": confirm_text,
+            "data-dialog-cancel": cancel_text,
+            "data-dialog-variant": action_variant,
+        },
+    )[
+        dialog_tag(
+            **{
+                "x-ref": "dialog",
+                "aria-labelledby": f"{id}-title",
+                "aria-describedby": f"{id}-description",
+            }
+        )[
+            div(class_="fixed inset-0 bg-black/50"),
+            article(class_=article_classes)[
+                header(class_="flex flex-col gap-2 text-center sm:text-left")[
+                    h2(
+                        id=f"{id}-title",
+                        class_="text-lg font-semibold text-card-foreground",
+                        x_text="title",
+                    ),
+                    p(
+                        id=f"{id}-description",
+                        class_="text-sm text-muted-foreground",
+                        x_text="description",
+                        x_show="description",
+                    ),
+                ],
+                form(
+                    class_="flex flex-col-reverse sm:flex-row sm:justify-end sm:space-x-2 pt-4",
+                    **{":action": "action", ":method": "method", "@submit": "confirm($event)"},
+                )[
+                    children,
+                    button_component(variant="outline", x_text="cancelText", **close),
+                    button_component(
+                        variant="primary",
+                        type="submit",
+                        x_text="confirmText",
+                        x_show="variant !== 'destructive'",
+                    ),
+                    button_component(
+                        variant="destructive",
+                        type="submit",
+                        x_text="confirmText",
+                        x_show="variant === 'destructive'",
+                    ),
+                ],
+            ],
+        ]
+    ]
+
+
+def attrs_btn_open_alert_dialog_host(
+    title: str,
+    *,
+    description: str | None = None,
+    action: str | None = None,
+    method: Literal["get", "post"] = "post",
+    confirm_text: str | None = None,
+    cancel_text: str | None = None,
+    action_variant: AlertDialogActionVariant | None = None,
+    host_id: str = "alert-dialog-host",
+) -> dict[str, str]:
+    """Return attributes that make a button open ``alert_dialog_host`` with this config.
+
+    Args:
+        title: Dialog title.
+        description: Optional description text.
+        action: URL the confirm button submits to; omit to only dispatch
+            ``alert-dialog-confirm`` on the trigger.
+        method: Form method used for ``action``.
+        confirm_text: Confirm label; the host's default when omitted.
+        cancel_text: Cancel label; the host's default when omitted.
+        action_variant: Confirm button style; the host's default when omitted.
+        host_id: Id of the host to open.
+
+    Returns:
+        dict: ``type`` and ``data-*`` attributes suitable for ``button_component``.
+    """
+    attrs = {
+        "type": "button",
+        "data-alert-dialog-host": host_id,
+        "data-dialog-title": title,
+        "data-dialog-description": description,
+        "data-dialog-action": action,
+        "data-dialog-method": None if method == "post" else method,
+        "data-dialog-confirm": confirm_text,
+        "data-dialog-cancel": cancel_text,
+        "data-dialog-variant": action_variant,
+    }
+    return {key: value for key, value in attrs.items() if value is not None}
@@ -1,18 +1,438 @@
+import json
+from collections.abc import Iterable
+from itertools import islice
+
 from htpy import Renderable
 from htpy import div
+from htpy import fragment
 from htpy import header
 from htpy import input as input_
 from htpy import span
+from htpy import template
 from sourcetypes import js
 
-from ._styles import LISTBOX_OPTION_BASE_CLASSES
+from ._option_data import data_island
+from ._option_data import option_data
+from ._styles import LISTBOX_OPTION_CLASSES
 from ._styles import POPOVER_PANEL_PADDED_CLASSES
 from ._types import SelectOption
+from ._utils import js_template
 from .button import button_component
+from .hydrate import LAZY_HYDRATE_ATTRS
 from .icons import icon_check
 from .icons import icon_chevrons_up_down
 from .icons import icon_search
 
+_COMBOBOX_ALPINE_DATA: js = js_template(
+    """{{
+    state: {{
+        open: false,
+        activeIndex: -1,
+        search: '',
+        selected: '{initial_value_js}',
+        options: [],
+        visible: []
+    }},
+    // Remote search config ({{url, param, limit, debounce, minLength, cacheSize}}) or null
+    remote: {remote_js},
+    _remoteTimer: null,
+    _remoteAbort: null,
+    // Recent query -> result HTML, oldest first (a Map keeps insertion order)
+    _remoteCache: new Map(),
+    // Listbox markup from before the first remote swap, restored for short queries
+    _initialHtml: null,
+    // Options still in the JSON data island (lazy_options); the label is server-rendered
+    _lazy: {lazy},
+    _scrollHandler: null,
+    _resizeHandler: null,
+    _clickOutsideHandler: null,
+    init() {{
+        this.$nextTick(() => {{
+            if (!this._lazy) {{
+                this.state.options = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+                this.resetVisible();
+                this.updateLabelFromValue(this.state.selected, false);
+            }}
+            this.$refs.popover.setAttribute('aria-hidden', 'true');
+        }});
+        // Click outside handler
+        this._clickOutsideHandler = (e) => {{
+            if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
+                this.closeMenu(false);
+            }}
+        }};
+        // Watch for search changes and filter automatically
+        this.$watch('state.search', () => {{
+            this.filter();
+        }});
+    }},
+    destroy() {{
+        clearTimeout(this._remoteTimer);
+        if (this._remoteAbort) this._remoteAbort.abort();
+        this._removePositionListeners();
+        if (this._clickOutsideHandler) {{
+            document.removeEventListener('click', this._clickOutsideHandler, true);
+        }}
+    }},
+    _positionPopover() {{
+        const trigger = this.$refs.trigger;
+        const popover = this.$refs.popover;
+        if (!trigger || !popover) return;
+        const rect = trigger.getBoundingClientRect();
+        const popoverRect = popover.getBoundingClientRect();
+        const viewportHeight = window.innerHeight;
+        const viewportWidth = window.innerWidth;
+        const spaceBelow = viewportHeight - rect.bottom;
+        const spaceAbove = rect.top;
+        const popoverHeight = popover.offsetHeight || 200;
+        let top;
+        if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
+            top = rect.bottom + 4;
+        }} else {{
+            top = rect.top - popoverHeight - 4;
+        }}
+        let left = rect.left;
+        if (left + popoverRect.width > viewportWidth) {{
+            left = Math.max(4, viewportWidth - popoverRect.width - 4);
+        }}
+        popover.style.top = top + 'px';
+        popover.style.left = left + 'px';
+        popover.style.minWidth = rect.width + 'px';
+    }},
+    _addPositionListeners() {{
+        this._scrollHandler = () => this._positionPopover();
+        this._resizeHandler = () => this._positionPopover();
+        window.addEventListener('scroll', this._scrollHandler, true);
+        window.addEventListener('resize', this._resizeHandler);
+    }},
+    _removePositionListeners() {{
+        if (this._scrollHandler) {{
+            window.removeEventListener('scroll', this._scrollHandler, true);
+            this._scrollHandler = null;
+        }}
+        if (this._resizeHandler) {{
+            window.removeEventListener('resize', this._resizeHandler);
+            this._resizeHandler = null;
+        }}
+    }},
+    _materialize() {{
+        // Build the option nodes from the data island on first use
+        if (!this._lazy) return;
+        this._lazy = false;
+        const data = JSON.parse(this.$refs.data.textContent);
+        const template = this.$refs.optionTemplate.content.firstElementChild;
+        const nodes = document.createDocumentFragment();
+        data.options.forEach((o) => {{
+            const el = template.cloneNode(true);
+            el.dataset.value = o[0];
+            el.dataset.label = o[1];
+            el.firstElementChild.textContent = o[1];
+            if (o[0] === this.state.selected) {{
+                el.setAttribute('aria-selected', 'true');
+                el.querySelector('svg').style.display = '';
+            }}
+            nodes.append(el);
+        }});
+        this.$refs.listbox.append(nodes);
+        this.state.options = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        this.resetVisible();
+    }},
+    resetVisible() {{
+        this.state.visible = [];
+        this.state.options.forEach((o) => {{
+            o.setAttribute('aria-hidden', 'false');
+            // Ensure option is visible when resetting
+            try {{
+                o.style.display = '';
+            }} catch (e) {{}}
+            this.state.visible.push(o);
+        }});
+    }},
+    filter() {{
+        this._materialize();
+        if (this.remote) {{
+            this.remoteSearch();
+            return;
+        }}
+        const t = this.state.search.trim().toLowerCase();
+        this.state.activeIndex = -1;
+        this.state.visible = [];
+        this.state.options.forEach((o) => {{
+            const text = (o.dataset.label || o.textContent).trim().toLowerCase();
+            const match = text.includes(t);
+            o.setAttribute('aria-hidden', String(!match));
+            // Hide/show the element directly so component is self-contained
+            try {{
+                o.style.display = match ? '' : 'none';
+            }} catch (e) {{}}
+            if (match) this.state.visible.push(o);
+            // ensure check icon hidden by default (we'll show for selected)
+            try {{
+                const chk = o.querySelector('svg');
+                if (chk) chk.style.display = 'none';
+            }} catch (e) {{}}
+        }});
+        this.toggleEmpty();
+    }},
+    toggleEmpty() {{
+        // Manage empty placeholder inside the listbox (self-contained)
+        try {{
+            const lb = this.$refs.listbox;
+            const existing = lb.querySelector('.combobox-empty');
+            if (this.state.visible.length === 0) {{
+                if (!existing) {{
+                    const el = document.createElement('div');
+                    el.className = 'combobox-empty px-3 py-4 text-sm text-muted-foreground';
+                    el.setAttribute('aria-hidden', 'true');
+                    el.textContent = lb.dataset.empty || 'No results found.';
+                    lb.prepend(el);
+                }}
+            }} else {{
+                if (existing) existing.remove();
+            }}
+        }} catch (e) {{ /* noop if DOM not available */ }}
+    }},
+    remoteSearch() {{
+        const q = this.state.search.trim();
+        clearTimeout(this._remoteTimer);
+        if (this._remoteAbort) {{
+            this._remoteAbort.abort();
+            this._remoteAbort = null;
+        }}
+        // Below the minimum length show the server-rendered initial options again
+        if (q.length < this.remote.minLength) {{
+            if (this._initialHtml !== null) {{
+                this.showResults(this._initialHtml);
+                this._initialHtml = null;
+            }}
+            return;
+        }}
+        const cached = this._remoteCache.get(q);
+        if (cached !== undefined) {{
+            this._remoteCache.delete(q);
+            this._remoteCache.set(q, cached);
+            this.showResults(cached);
+            return;
+        }}
+        this._remoteTimer = setTimeout(() => {{
+            const ctrl = new AbortController();
+            this._remoteAbort = ctrl;
+            const url = new URL(this.remote.url, window.location.href);
+            url.searchParams.set(this.remote.param, q);
+            url.searchParams.set('limit', String(this.remote.limit));
+            this.$refs.listbox.setAttribute('aria-busy', 'true');
+            fetch(url, {{ signal: ctrl.signal, headers: {{ 'Accept': 'text/html', 'HX-Request': 'true' }} }})
+                .then((r) => (r.ok ? r.text() : Promise.reject(new Error('HTTP ' + r.status))))
+                .then((html) => {{
+                    this._remoteCache.set(q, html);
+                    if (this._remoteCache.size > this.remote.cacheSize) {{
+                        this._remoteCache.delete(this._remoteCache.keys().next().value);
+                    }}
+                    if (this.state.search.trim() === q) this.showResults(html);
+                }})
+                .catch((e) => {{
+                    if (e.name !== 'AbortError') console.error('combobox search failed', e);
+                }})
+                .finally(() => {{
+                    if (this._remoteAbort !== ctrl) return;
+                    this._remoteAbort = null;
+                    this.$refs.listbox.removeAttribute('aria-busy');
+                }});
+        }}, this.remote.debounce);
+    }},
+    showResults(html) {{
+        // Swap in server-rendered options (combobox_results) and mark the selection
+        this.setActive(-1);
+        if (this._initialHtml === null) this._initialHtml = this.$refs.listbox.innerHTML;
+        this.$refs.listbox.innerHTML = html;
+        this.state.options = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        this.state.visible = this.state.options.slice();
+        this.state.options.forEach((o) => {{
+            const selected = o.dataset.value === this.state.selected;
+            o.setAttribute('aria-selected', String(selected));
+            const chk = o.querySelector('svg');
+            if (chk) chk.style.display = selected ? '' : 'none';
+        }});
+        this.toggleEmpty();
+    }},
+    setActive(i) {{
+        if (this.state.activeIndex > -1 && this.state.options[this.state.activeIndex]) {{
+            this.state.options[this.state.activeIndex].classList.remove('active');
+        }}
+        this.state.activeIndex = i;
+        if (i > -1 && this.state.options[i]) {{
+            const el = this.state.options[i];
+            el.classList.add('active');
+            if (!el.id) el.id = this.$id('opt');
+            this.$refs.trigger.setAttribute('aria-activedescendant', el.id);
+        }} else {{
+            this.$refs.trigger.removeAttribute('aria-activedescendant');
+        }}
+    }},
+    setActiveFromElement(el) {{
+        if (!el) {{
+            this.setActive(-1);
+            return;
+        }}
+        const index = this.state.options.indexOf(el);
+        if (index > -1) {{
+            this.setActive(index);
+        }}
+    }},
+    openMenu() {{
+        this._materialize();
+        this.state.open = true;
+        document.dispatchEvent(new CustomEvent('combobox:popover', {{ detail: {{ source: this.$el }} }}));
+        this.$refs.popover.setAttribute('aria-hidden', 'false');
+        this.$refs.trigger.setAttribute('aria-expanded', 'true');
+        this.$nextTick(() => {{
+            this._positionPopover();
+            this._addPositionListeners();
+            document.addEventListener('click', this._clickOutsideHandler, true);
+            if (this.$refs.filter) this.$refs.filter.focus();
+            const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
+            if (sel) {{
+                this.setActive(this.state.options.indexOf(sel));
+                sel.scrollIntoView({{ block: 'nearest' }});
+            }}
+        }});
+    }},
+    closeMenu(focus = true) {{
+        if (!this.state.open) return;
+        this.state.open = false;
+        this._removePositionListeners();
+        document.removeEventListener('click', this._clickOutsideHandler, true);
+        this.$refs.popover.setAttribute('aria-hidden', 'true');
+        this.$refs.trigger.setAttribute('aria-expanded', 'false');
+        if (this.$refs.filter) {{
+            this.state.search = '';
+            this.resetVisible();
+        }}
+        this.setActive(-1);
+        if (focus) this.$refs.trigger.focus();
+    }},
+    updateLabelFromValue(val, triggerEvent = true) {{
+        this._materialize();
+        const opt = this.state.options.find((o) => o.dataset.value === val) || this.state.options[0];
+        if (!opt) return;
+        this.$refs.selected.innerHTML = opt.dataset.label || opt.innerHTML;
+        this.state.selected = opt.dataset.value || '';
+        this.$refs.input.value = this.state.selected;
+        // Update aria-selected attributes - CSS handles the styling via aria-selected:bg-accent
+        const prev = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
+        if (prev) prev.setAttribute('aria-selected', 'false');
+        opt.setAttribute('aria-selected', 'true');
+        // Update checkmark visibility
+        try {{
+            this.state.options.forEach((o) => {{
+                const chk = o.querySelector('svg');
+                if (chk) chk.style.display = 'none';
+            }});
+            const chk = opt.querySelector('svg');
+            if (chk) chk.style.display = '';
+        }} catch (e) {{}}
+        if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ value: this.state.selected }}, bubbles: true }}));
+    }},
+    selectCurrent() {{
+        if (this.state.activeIndex > -1) {{
+            this.updateLabelFromValue(this.state.options[this.state.activeIndex].dataset.value);
+            this.closeMenu();
+            return;
+        }}
+        // If no active index, select the first visible option
+        if (this.state.visible.length > 0) {{
+            const first = this.state.visible[0];
+            this.updateLabelFromValue(first.dataset.value);
+            this.closeMenu();
+        }}
+    }},
+    onKey(e) {{
+        const open = this.$refs.trigger.getAttribute('aria-expanded') === 'true';
+        if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
+        if (!open) {{
+            if (e.key !== 'Enter' && e.key !== 'Escape') {{
+                e.preventDefault();
+                this.openMenu();
+            }}
+            return;
+        }}
+        e.preventDefault();
+        if (e.key === 'Escape') {{
+            this.closeMenu();
+            return;
+        }}
+        if (this.state.visible.length === 0) return;
+        let currentVisibleIndex = this.state.activeIndex > -1 ? this.state.visible.indexOf(this.state.options[this.state.activeIndex]) : -1;
+        let next = currentVisibleIndex;
+        if (e.key === 'ArrowDown') {{
+            if (currentVisibleIndex < this.state.visible.length - 1) next = currentVisibleIndex + 1;
+            else next = this.state.visible.length - 1;
+        }} else if (e.key === 'ArrowUp') {{
+            if (currentVisibleIndex > 0) next = currentVisibleIndex - 1;
+            else next = 0;
+        }} else if (e.key === 'Home') {{
+            next = 0;
+        }} else if (e.key === 'End') {{
+            next = this.state.visible.length - 1;
+        }} else if (e.key === 'Enter') {{
+            this.selectCurrent();
+            return;
+        }}
+        if (next !== currentVisibleIndex) {{
+            const el = this.state.visible[next];
+            this.setActive(this.state.options.indexOf(el));
+            el.scrollIntoView({{ block: 'nearest' }});
+        }}
+    }}
+}}"""
+)
+
+
+def _combobox_option(option: SelectOption, selected: bool, *, click: bool = True) -> Renderable:
+    # Options as div[role=option] - use CSS for hover/selection states
+    option_attrs = {
+        "data-value": option["value"],
+        "data-label": option["label"],
+        "aria-selected": "true" if selected else "false",
+    }
+    if click:
+        option_attrs["@click"] = "updateLabelFromValue($el.dataset.value); closeMenu();"
+    return div(
+        role="option",
+        **option_attrs,
+        class_=LISTBOX_OPTION_CLASSES,
+    )[
+        span(class_="flex-1 truncate")[option["label"]],
+        # trailing check positioned right (hidden/shown by component JS)
+        span(class_="select-check absolute right-2.5 top-1/2 -translate-y-1/2")[
+            icon_check(class_="size-4 opacity-50", **{"style": "display: none;"})
+        ],
+    ]
+
+
+def combobox_results(
+    options: Iterable[SelectOption],
+    *,
+    value: str | None = None,
+    limit: int | None = None,
+) -> Renderable:
+    """Render the option list a remote-search combobox swaps into its listbox.
+
+    Return it from the endpoint passed as ``search_url``; the options use the same
+    markup as server-rendered ones, and the client marks the current selection.
+
+    Args:
+        options: Matches for the query, best first.
+        value: Selected value to mark, if it is among the matches.
+        limit: Maximum number of options to render (the client sends ``limit``).
+
+    Returns:
+        Renderable: Fragment of option nodes.
+    """
+    return fragment[
+        [_combobox_option(option, option["value"] == value) for option in islice(options, limit)]
+    ]
+
 
 def combobox(
     *,
@@ -25,11 +445,25 @@ def combobox(
     width_class: str = "w-auto",
     popover_width_class: str | None = None,
     empty_text: str = "No results found.",
+    search_url: str | None = None,
+    search_param: str = "q",
+    search_limit: int = 20,
+    search_debounce_ms: int = 250,
+    search_min_length: int = 1,
+    search_cache_size: int = 20,
+    lazy_options: bool = False,
+    lazy_hydrate: bool = False,
     class_: str | None = None,
     **attrs,
 ) -> Renderable:
     """Render a search-enabled popover combobox.
 
+    With ``search_url`` the combobox searches on the server instead of filtering the
+    rendered options: each query is debounced, cancels the request still in flight, and
+    fetches ``search_url?{search_param}=<query>&limit=<search_limit>``, which should
+    return ``combobox_results(...)``. The last ``search_cache_size`` results are kept
+    client-side. Pass the initially selected option in ``options`` so its label renders.
+
     Args:
         name: Hidden input name used for the selected value.
         options: Sequence of selectable option dictionaries.
@@ -40,6 +474,19 @@ def combobox(
         width_class: Tailwind width classes applied to the trigger.
         popover_width_class: Optional width override for the popover.
         empty_text: Message rendered when client-side filtering leaves no options.
+        search_url: Endpoint for remote search; enables remote mode.
+        search_param: Query-string parameter carrying the search text.
+        search_limit: Number of matches requested per query (sent as ``limit``).
+        search_debounce_ms: Quiet time after typing before a request is sent.
+        search_min_length: Shortest query that triggers a request; shorter queries show ``options``.
+        search_cache_size: Number of recent query results cached in the browser.
+        lazy_options: Ship the options as a JSON data island and build their DOM nodes
+            when the popover first opens (or the search changes). The selected label is
+            still server-rendered, so the initial HTML and Alpine init stay flat as the
+            option count grows.
+        lazy_hydrate: Skip Alpine initialization until the component comes near the
+            viewport or is first hovered/focused; render ``lazy_hydration_script()``
+            once on the page.
         class_: Extra CSS classes appended to the container.
         **attrs: Additional HTML attributes forwarded to the container.
 
@@ -102,26 +549,12 @@ def combobox(
     if popover_width_class:
         popover_classes = f"{popover_classes} {popover_width_class}"
 
-    # Options as div[role=option] - use CSS for hover/selection states
-    option_nodes: list[Renderable] = [
-        div(
-            role="option",
-            **{
-                "data-value": option["value"],
-                "data-label": option["label"],
-                "aria-selected": "true" if (option["value"] == initial_value) else "false",
-                "@click": "updateLabelFromValue($el.dataset.value); closeMenu();",
-            },
-            class_=f"{LISTBOX_OPTION_BASE_CLASSES} aria-selected:bg-accent aria-selected:text-accent-foreground",
-        )[
-            span(class_="flex-1 truncate")[option["label"]],
-            # trailing check positioned right (hidden/shown by component JS)
-            span(class_="select-check absolute right-2.5 top-1/2 -translate-y-1/2")[
-                icon_check(class_="size-4 opacity-50", **{"style": "display: none;"})
-            ],
+    lazy = lazy_options and bool(options)
+    option_nodes: list[Renderable] = []
+    if not lazy:
+        option_nodes = [
+            _combobox_option(option, option["value"] == initial_value) for option in options
         ]
-        for option in options
-    ]
 
     popover = div(
         id=popover_id,
@@ -192,6 +625,12 @@ def combobox(
                 ),
             },
         )[*option_nodes],
+        # Row cloned per option by _materialize; clicks are handled by the listbox
+        template(**{"x-ref": "optionTemplate"})[
+            _combobox_option({"value": "", "label": ""}, False, click=False)
+        ]
+        if lazy
+        else None,
     ]
 
     # Hidden input - match reference naming pattern
@@ -203,258 +642,21 @@ def combobox(
     )
 
     # Root attributes with inline Alpine state
-    alpine_data: js = f"""{{
-        state: {{
-            open: false,
-            activeIndex: -1,
-            search: '',
-            selected: '{initial_value_js}',
-            options: [],
-            visible: []
-        }},
-        _scrollHandler: null,
-        _resizeHandler: null,
-        _clickOutsideHandler: null,
-        init() {{
-            this.$nextTick(() => {{
-                this.state.options = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                this.resetVisible();
-                this.updateLabelFromValue(this.state.selected, false);
-                this.$refs.popover.setAttribute('aria-hidden', 'true');
-            }});
-            // Click outside handler
-            this._clickOutsideHandler = (e) => {{
-                if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
-                    this.closeMenu(false);
-                }}
-            }};
-            // Watch for search changes and filter automatically
-            this.$watch('state.search', () => {{
-                this.filter();
-            }});
-        }},
-        destroy() {{
-            this._removePositionListeners();
-            if (this._clickOutsideHandler) {{
-                document.removeEventListener('click', this._clickOutsideHandler, true);
-            }}
-        }},
-        _positionPopover() {{
-            const trigger = this.$refs.trigger;
-            const popover = this.$refs.popover;
-            if (!trigger || !popover) return;
-            const rect = trigger.getBoundingClientRect();
-            const popoverRect = popover.getBoundingClientRect();
-            const viewportHeight = window.innerHeight;
-            const viewportWidth = window.innerWidth;
-            const spaceBelow = viewportHeight - rect.bottom;
-            const spaceAbove = rect.top;
-            const popoverHeight = popover.offsetHeight || 200;
-            let top;
-            if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
-                top = rect.bottom + 4;
-            }} else {{
-                top = rect.top - popoverHeight - 4;
-            }}
-            let left = rect.left;
-            if (left + popoverRect.width > viewportWidth) {{
-                left = Math.max(4, viewportWidth - popoverRect.width - 4);
-            }}
-            popover.style.top = top + 'px';
-            popover.style.left = left + 'px';
-            popover.style.minWidth = rect.width + 'px';
-        }},
-        _addPositionListeners() {{
-            this._scrollHandler = () => this._positionPopover();
-            this._resizeHandler = () => this._positionPopover();
-            window.addEventListener('scroll', this._scrollHandler, true);
-            window.addEventListener('resize', this._resizeHandler);
-        }},
-        _removePositionListeners() {{
-            if (this._scrollHandler) {{
-                window.removeEventListener('scroll', this._scrollHandler, true);
-                this._scrollHandler = null;
-            }}
-            if (this._resizeHandler) {{
-                window.removeEventListener('resize', this._resizeHandler);
-                this._resizeHandler = null;
-            }}
-        }},
-        resetVisible() {{
-            this.state.visible = [];
-            this.state.options.forEach((o) => {{
-                o.setAttribute('aria-hidden', 'false');
-                // Ensure option is visible when resetting
-                try {{
-                    o.style.display = '';
-                }} catch (e) {{}}
-                this.state.visible.push(o);
-            }});
-        }},
-        filter() {{
-            const t = this.state.search.trim().toLowerCase();
-            this.state.activeIndex = -1;
-            this.state.visible = [];
-            this.state.options.forEach((o) => {{
-                const text = (o.dataset.label || o.textContent).trim().toLowerCase();
-                const match = text.includes(t);
-                o.setAttribute('aria-hidden', String(!match));
-                // Hide/show the element directly so component is self-contained
-                try {{
-                    o.style.display = match ? '' : 'none';
-                }} catch (e) {{}}
-                if (match) this.state.visible.push(o);
-                // ensure check icon hidden by default (we'll show for selected)
-                try {{
-                    const chk = o.querySelector('svg');
-                    if (chk) chk.style.display = 'none';
-                }} catch (e) {{}}
-            }});
-            // Manage empty placeholder inside the listbox (self-contained)
-            try {{
-                const lb = this.$refs.listbox;
-                const existing = lb.querySelector('.combobox-empty');
-                if (this.state.visible.length === 0) {{
-                    if (!existing) {{
-                        const el = document.createElement('div');
-                        el.className = 'combobox-empty px-3 py-4 text-sm text-muted-foreground';
-                        el.setAttribute('aria-hidden', 'true');
-                        el.textContent = lb.dataset.empty || 'No results found.';
-                        lb.prepend(el);
-                    }}
-                }} else {{
-                    if (existing) existing.remove();
-                }}
-            }} catch (e) {{ /* noop if DOM not available */ }}
-        }},
-        setActive(i) {{
-            if (this.state.activeIndex > -1 && this.state.options[this.state.activeIndex]) {{
-                this.state.options[this.state.activeIndex].classList.remove('active');
-            }}
-            this.state.activeIndex = i;
-            if (i > -1 && this.state.options[i]) {{
-                const el = this.state.options[i];
-                el.classList.add('active');
-                if (!el.id) el.id = this.$id('opt');
-                this.$refs.trigger.setAttribute('aria-activedescendant', el.id);
-            }} else {{
-                this.$refs.trigger.removeAttribute('aria-activedescendant');
-            }}
-        }},
-        setActiveFromElement(el) {{
-            if (!el) {{
-                this.setActive(-1);
-                return;
-            }}
-            const index = this.state.options.indexOf(el);
-            if (index > -1) {{
-                this.setActive(index);
-            }}
-        }},
-        openMenu() {{
-            this.state.open = true;
-            document.dispatchEvent(new CustomEvent('combobox:popover', {{ detail: {{ source: this.$el }} }}));
-            this.$refs.popover.setAttribute('aria-hidden', 'false');
-            this.$refs.trigger.setAttribute('aria-expanded', 'true');
-            this.$nextTick(() => {{
-                this._positionPopover();
-                this._addPositionListeners();
-                document.addEventListener('click', this._clickOutsideHandler, true);
-                if (this.$refs.filter) this.$refs.filter.focus();
-                const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
-                if (sel) {{
-                    this.setActive(this.state.options.indexOf(sel));
-                    sel.scrollIntoView({{ block: 'nearest' }});
-                }}
-            }});
-        }},
-        closeMenu(focus = true) {{
-            if (!this.state.open) return;
-            this.state.open = false;
-            this._removePositionListeners();
-            document.removeEventListener('click', this._clickOutsideHandler, true);
-            this.$refs.popover.setAttribute('aria-hidden', 'true');
-            this.$refs.trigger.setAttribute('aria-expanded', 'false');
-            if (this.$refs.filter) {{
-                this.state.search = '';
-                this.resetVisible();
-            }}
-            this.setActive(-1);
-            if (focus) this.$refs.trigger.focus();
-        }},
-        updateLabelFromValue(val, triggerEvent = true) {{
-            const opt = this.state.options.find((o) => o.dataset.value === val) || this.state.options[0];
-            if (!opt) return;
-            this.$refs.selected.innerHTML = opt.dataset.label || opt.innerHTML;
-            this.state.selected = opt.dataset.value || '';
-            this.$refs.input.value = this.state.selected;
-            // Update aria-selected attributes - CSS handles the styling via aria-selected:bg-accent
-            const prev = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
-            if (prev) prev.setAttribute('aria-selected', 'false');
-            opt.setAttribute('aria-selected', 'true');
-            // Update checkmark visibility
-            try {{
-                this.state.options.forEach((o) => {{
-                    const chk = o.querySelector('svg');
-                    if (chk) chk.style.display = 'none';
-                }});
-                const chk = opt.querySelector('svg');
-                if (chk) chk.style.display = '';
-            }} catch (e) {{}}
-            if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ value: this.state.selected }}, bubbles: true }}));
-        }},
-        selectCurrent() {{
-            if (this.state.activeIndex > -1) {{
-                this.updateLabelFromValue(this.state.options[this.state.activeIndex].dataset.value);
-                this.closeMenu();
-                return;
-            }}
-            // If no active index, select the first visible option
-            if (this.state.visible.length > 0) {{
-                const first = this.state.visible[0];
-                this.updateLabelFromValue(first.dataset.value);
-                this.closeMenu();
-            }}
-        }},
-        onKey(e) {{
-            const open = this.$refs.trigger.getAttribute('aria-expanded') === 'true';
-            if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
-            if (!open) {{
-                if (e.key !== 'Enter' && e.key !== 'Escape') {{
-                    e.preventDefault();
-                    this.openMenu();
-                }}
-                return;
-            }}
-            e.preventDefault();
-            if (e.key === 'Escape') {{
-                this.closeMenu();
-                return;
-            }}
-            if (this.state.visible.length === 0) return;
-            let currentVisibleIndex = this.state.activeIndex > -1 ? this.state.visible.indexOf(this.state.options[this.state.activeIndex]) : -1;
-            let next = currentVisibleIndex;
-            if (e.key === 'ArrowDown') {{
-                if (currentVisibleIndex < this.state.visible.length - 1) next = currentVisibleIndex + 1;
-                else next = this.state.visible.length - 1;
-            }} else if (e.key === 'ArrowUp') {{
-                if (currentVisibleIndex > 0) next = currentVisibleIndex - 1;
-                else next = 0;
-            }} else if (e.key === 'Home') {{
-                next = 0;
-            }} else if (e.key === 'End') {{
-                next = this.state.visible.length - 1;
-            }} else if (e.key === 'Enter') {{
-                this.selectCurrent();
-                return;
-            }}
-            if (next !== currentVisibleIndex) {{
-                const el = this.state.visible[next];
-                this.setActive(this.state.options.indexOf(el));
-                el.scrollIntoView({{ block: 'nearest' }});
-            }}
-        }}
-    }}"""
+    remote_js = "null"
+    if search_url:
+        remote_js = json.dumps(
+            {
+                "url": search_url,
+                "param": search_param,
+                "limit": search_limit,
+                "debounce": search_debounce_ms,
+                "minLength": search_min_length,
+                "cacheSize": search_cache_size,
+            }
+        )
+    alpine_data: js = _COMBOBOX_ALPINE_DATA.format(
+        initial_value_js=initial_value_js, remote_js=remote_js, lazy="true" if lazy else "false"
+    )
 
     root_attrs: dict[str, str] = {
         "x-data": alpine_data,
@@ -462,10 +664,15 @@ def combobox(
         "data-align": align,
         "@combobox:popover.window": "if($event.detail.source!==$el) closeMenu(false)",
     }
+    if lazy_hydrate:
+        root_attrs.update(LAZY_HYDRATE_ATTRS)
     # Merge caller attrs last so they can override if necessary
     root_attrs.update(attrs)
 
     # Root - no need for external JS file anymore
-    root = div(id=base_id, class_=container_classes, **root_attrs)[hidden, trigger_btn, popover]
+    data = data_island(option_data(options), **{"x-ref": "data"}) if lazy else None
+    root = div(id=base_id, class_=container_classes, **root_attrs)[
+        hidden, trigger_btn, popover, data
+    ]
 
     return root
@@ -0,0 +1,129 @@
+"""Deferred panels: content htmx fetches the first time it is shown.
+
+A deferred container renders only a loading placeholder and an ``hx-get``. htmx fills it
+the first time the container becomes visible (``intersect``), e.g. when the dialog,
+accordion item, popover or dropdown menu around it opens, or earlier when a trigger
+prefetches it by dispatching ``deferred-load`` on it. Both triggers share htmx's
+``once`` flag, so the content is fetched at most once and then stays in the DOM.
+
+``accordion``, ``popover`` and ``dropdown_menu`` accept a ``DeferredPanel`` in place of
+their content. ``DeferredPanels`` maps panel keys to render functions so one endpoint
+serves them all::
+
+    panels = DeferredPanels("/help/panel?key={key}")
+
+    @panels.register("billing")
+    def billing_answer():
+        return expensive_billing_faq()
+
+    accordion([{"title": "Billing", "content": panels.panel("billing", prefetch=True)}])
+
+    @app.get("/help/panel")
+    def help_panel():
+        return str(panels.render(request.args["key"]))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import quote
+
+from htpy import Node
+from htpy import Renderable
+from htpy import div
+
+DEFERRED_EVENT = "deferred-load"
+
+
+def deferred_content(
+    url: str,
+    *,
+    id: str | None = None,
+    loading: Node = None,
+    class_: str | None = None,
+) -> Renderable:
+    """Render an empty container that loads ``url`` into itself when first shown.
+
+    Args:
+        url: Endpoint returning the content fragment.
+        id: Optional container id, for ``prefetch_js``.
+        loading: Placeholder shown until the content arrives.
+        class_: Extra classes for the container.
+
+    Returns:
+        Renderable: Container ``div`` with the htmx attributes.
+    """
+    return div(
+        id=id,
+        class_=class_,
+        **{
+            "hx-get": url,
+            "hx-trigger": f"intersect once, {DEFERRED_EVENT} once",
+            "hx-swap": "innerHTML",
+            "data-deferred": "",
+        },
+    )[loading or div(class_="text-sm text-muted-foreground")["Loading..."]]
+
+
+def prefetch_js(id: str) -> str:
+    """Return JS that starts loading the deferred container ``id`` (no-op if absent)."""
+    return f"document.getElementById('{id}')?.dispatchEvent(new Event('{DEFERRED_EVENT}'))"
+
+
+def prefetch_within_js(scope: str) -> str:
+    """Return JS that starts loading the first deferred container inside ``scope``.
+
+    ``scope`` is a JS expression for an element, e.g. ``$root`` in an Alpine handler.
+    """
+    return f"{scope}.querySelector('[data-deferred]')?.dispatchEvent(new Event('{DEFERRED_EVENT}'))"
+
+
+@dataclass(frozen=True, slots=True)
+class DeferredPanel:
+    """Content placeholder loaded from ``url`` when its panel first opens.
+
+    It renders as a ``deferred_content`` container wherever a node is accepted; the
+    components that take it also wire ``prefetch`` to their trigger's hover/focus.
+    """
+
+    url: str
+    prefetch: bool = False
+    loading: Node = None
+
+    def __html__(self) -> str:
+        return str(deferred_content(self.url, loading=self.loading))
+
+
+class DeferredPanels:
+    """Panel keys mapped to render functions, all served by one endpoint.
+
+    Args:
+        url: Endpoint URL with a ``{key}`` placeholder, replaced by the URL-quoted key.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._renderers: dict[str, Callable[[], Node]] = {}
+
+    def register(self, key: str, render: Callable[[], Node] | None = None):
+        """Register ``render`` for ``key``; without ``render``, return a decorator."""
+        if render is None:
+            return lambda func: self.register(key, func)
+        self._renderers[key] = render
+        return render
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._renderers
+
+    def panel(self, key: str, *, prefetch: bool = False, loading: Node = None) -> DeferredPanel:
+        """Return the ``DeferredPanel`` that loads ``key`` from this endpoint."""
+        if key not in self._renderers:
+            raise KeyError(key)
+        return DeferredPanel(
+            self.url.format(key=quote(key, safe="")), prefetch=prefetch, loading=loading
+        )
+
+    def render(self, key: str) -> Node:
+        """Render the fragment for ``key``; raises ``KeyError`` for unknown keys."""
+        return self._renderers[key]()
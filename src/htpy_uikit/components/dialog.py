@@ -10,6 +10,8 @@ from htpy import span
 from htpy import with_children
 
 from ._utils import merge_classes
+from .deferred import deferred_content
+from .deferred import prefetch_js
 from .icons import icon_close
 
 
@@ -19,20 +21,32 @@ def dialog(
     title: Optional[str] = None,
     description: Optional[str] = None,
     class_: Optional[str] = None,
+    content_url: str | None = None,
+    loading_content: Node = None,
     **attrs,
 ) -> Renderable:
     """Render a Basecoat-style dialog overlay.
 
+    The page controls visibility through ``open`` (``data-state``); there is no trigger
+    or shared host for this dialog. For one dialog reused by many triggers, use
+    ``modal_host`` or ``alert_dialog_host``.
+
     Args:
         open: Whether the dialog is visible.
         title: Title text rendered inside the dialog.
         description: Optional descriptive text.
         class_: Extra classes appended to the outer wrapper.
+        content_url: Endpoint returning the dialog body; htmx fetches it the first
+            time the dialog is shown instead of rendering it with the page. Requires an
+            ``id``: the body is ``{id}-body``, for ``attrs_prefetch_dialog``.
+        loading_content: Placeholder shown in a deferred body until it loads.
         **attrs: Additional HTML attributes forwarded to the wrapper ``div``.
 
     Returns:
         Renderable: Dialog backdrop and content nodes.
     """
+    if content_url and not attrs.get("id"):
+        raise ValueError("dialog(content_url=...) needs an id for its deferred body")
 
     # Base classes
     base_classes = "fixed inset-0 z-50 flex items-center justify-center"
@@ -76,6 +90,13 @@ def dialog(
                 h2(class_="text-lg font-semibold leading-none tracking-tight")[title or ""],
                 p(class_="text-sm text-muted-foreground")[description or ""],
             ],
+            deferred_content(
+                content_url,
+                id=f"{attrs['id']}-body",
+                loading=loading_content,
+            )
+            if content_url
+            else None,
         ],
     ]
 
@@ -203,3 +224,19 @@ def dialog_action_button(children: Node, *, class_: Optional[str] = None, **attr
     attrs["class_"] = merge_classes(classes, class_)
 
     return button(**attrs)[children]
+
+
+def attrs_prefetch_dialog(id: str) -> dict[str, str]:
+    """Return attributes that start loading a deferred dialog body on hover or focus.
+
+    ``dialog`` has no trigger of its own, so spread these onto whatever control makes
+    the page open it (the counterpart of ``attrs_btn_open_modal(id, prefetch=True)``).
+
+    Args:
+        id: Id of the ``dialog`` rendered with ``content_url``.
+
+    Returns:
+        dict: ``onmouseenter``/``onfocus`` attributes.
+    """
+    prefetch = prefetch_js(f"{id}-body")
+    return {"onmouseenter": prefetch, "onfocus": prefetch}
@@ -11,14 +11,158 @@ from sourcetypes import js
 
 from ._styles import MENU_ITEM_BASE_CLASSES
 from ._styles import POPOVER_PANEL_CLASSES
+from ._utils import js_template
 from ._utils import merge_classes
 from .button import button_component
+from .deferred import DeferredPanel
+from .deferred import prefetch_within_js
+from .hydrate import LAZY_HYDRATE_ATTRS
 from .icons import icon_check
 
 TAlign = Literal["start", "center", "end"]
 TSide = Literal["top", "bottom", "left", "right"]
 
 
+_DROPDOWN_MENU_ALPINE_STATE: js = js_template(
+    """
+{{
+    open: false,
+    items: [],
+    activeIndex: -1,
+
+    init() {{
+        this.$nextTick(() => this.refreshItems());
+    }},
+
+    refreshItems() {{
+        this.items = Array.from(this.$refs.menu.querySelectorAll('[role^="menuitem"]'))
+            .filter(el => !el.hasAttribute('disabled') && el.getAttribute('aria-disabled') !== 'true');
+    }},
+
+    close(focus=true) {{
+        if (this.open) {{
+            this.open = false;
+            if (focus) this.$refs.trigger.focus();
+            this.activeIndex = -1;
+            this.$refs.trigger.setAttribute('aria-expanded', 'false');
+            this.$refs.popover.setAttribute('aria-hidden', 'true');
+        }}
+    }},
+
+    openMenu(focus) {{
+        document.dispatchEvent(new CustomEvent('basecoat:popover', {{
+            detail: {{ source: this.$el }}
+        }}));
+        this.open = true;
+        this.$refs.trigger.setAttribute('aria-expanded', 'true');
+        this.$refs.popover.setAttribute('aria-hidden', 'false');
+        if (this.items.length) {{
+            if (focus === 'first') this.activeIndex = 0;
+            else if (focus === 'last') this.activeIndex = this.items.length - 1;
+            this.syncActiveClass();
+        }}
+    }},
+
+    onKey(e) {{
+        const expanded = this.open;
+        if (e.key === 'Escape') {{
+            if (expanded) {{
+                e.preventDefault();
+                this.close();
+            }}
+            return;
+        }}
+        if (!expanded) {{
+            if (['Enter', ' '].includes(e.key)) {{
+                e.preventDefault();
+                this.openMenu(false);
+            }} else if (e.key === 'ArrowDown') {{
+                e.preventDefault();
+                this.openMenu('first');
+            }} else if (e.key === 'ArrowUp') {{
+                e.preventDefault();
+                this.openMenu('last');
+            }}
+            return;
+        }}
+        if (this.items.length === 0) return;
+        let next = this.activeIndex;
+        if (e.key === 'ArrowDown') {{
+            e.preventDefault();
+            next = this.activeIndex < 0 ? 0 : Math.min(this.activeIndex + 1, this.items.length - 1);
+        }} else if (e.key === 'ArrowUp') {{
+            e.preventDefault();
+            next = this.activeIndex < 0 ? this.items.length - 1 : Math.max(this.activeIndex - 1, 0);
+        }} else if (e.key === 'Home') {{
+            e.preventDefault();
+            next = 0;
+        }} else if (e.key === 'End') {{
+            e.preventDefault();
+            next = this.items.length - 1;
+        }} else if (e.key === 'Enter' || e.key === ' ') {{
+            e.preventDefault();
+            if (this.activeIndex > -1) this.items[this.activeIndex].click();
+            this.close();
+            return;
+        }}
+        if (next !== this.activeIndex) {{
+            this.activeIndex = next;
+            const el = this.items[this.activeIndex];
+            if (el) {{
+                if (!el.id) el.id = '{menu_id}-item-' + this.activeIndex;
+                this.$refs.trigger.setAttribute('aria-activedescendant', el.id);
+            }}
+            this.syncActiveClass();
+        }}
+    }},
+
+    hoverMove(ev) {{
+        const t = ev.target.closest('[role^="menuitem"]');
+        if (!t) return;
+        const idx = this.items.indexOf(t);
+        if (idx > -1 && idx !== this.activeIndex) {{
+            this.activeIndex = idx;
+            this.syncActiveClass();
+        }}
+    }},
+
+    resetActive() {{
+        this.activeIndex = -1;
+        this.$refs.trigger.removeAttribute('aria-activedescendant');
+        this.syncActiveClass();
+    }},
+
+    onClick(ev) {{
+        const item = ev.target.closest('[role^="menuitem"]');
+        if (!item) return;
+        const role = item.getAttribute('role');
+        if (role === 'menuitem') {{
+            this.close();
+            return;
+        }}
+        if (role === 'menuitemcheckbox') {{
+            const isChecked = item.getAttribute('aria-checked') === 'true';
+            item.setAttribute('aria-checked', (!isChecked).toString());
+            return;
+        }}
+        if (role === 'menuitemradio') {{
+            const group = item.getAttribute('data-group') || '';
+            const scope = group
+                ? this.$refs.menu.querySelectorAll('[role="menuitemradio"][data-group="' + group + '"]')
+                : this.$refs.menu.querySelectorAll('[role="menuitemradio"]');
+            scope.forEach(el => el.setAttribute('aria-checked', el === item ? 'true' : 'false'));
+            return;
+        }}
+    }},
+
+    syncActiveClass() {{
+        this.items.forEach((it, i) => it.classList.toggle('active', i === this.activeIndex));
+    }}
+}}
+"""
+)
+
+
 @with_children
 def dropdown_menu(
     children: Node,
@@ -26,16 +170,21 @@ def dropdown_menu(
     trigger: Node | str = "Open",
     side: TSide = "bottom",
     align: TAlign = "start",
+    lazy_hydrate: bool = False,
     class_: str | None = None,
     **attrs,
 ) -> Renderable:
     """Render an Alpine-powered dropdown menu.
 
     Args:
-        children: Menu content nodes rendered inside the popover.
+        children: Menu content nodes rendered inside the popover. A ``DeferredPanel``
+            loads the items when the menu first opens.
         trigger: Element used to toggle the popover.
         side: Popover placement relative to the trigger.
         align: Popover alignment relative to the trigger.
+        lazy_hydrate: Skip Alpine initialization until the component comes near the
+            viewport or is first hovered/focused; render ``lazy_hydration_script()``
+            once on the page.
         class_: Extra CSS classes appended to the container.
         **attrs: Additional HTML attributes forwarded to the container.
 
@@ -102,172 +251,43 @@ def dropdown_menu(
         assert_never(side)
 
     # Alpine.js state + keyboard interactions (no JS positioning)
-    alpine_state: js = f"""
-    {{
-        open: false,
-        items: [],
-        activeIndex: -1,
-
-        init() {{
-            this.$nextTick(() => {{
-                this.items = Array.from(this.$refs.menu.querySelectorAll('[role^="menuitem"]'))
-                    .filter(el => !el.hasAttribute('disabled') && el.getAttribute('aria-disabled') !== 'true');
-            }});
-        }},
-
-        close(focus=true) {{
-            if (this.open) {{
-                this.open = false;
-                if (focus) this.$refs.trigger.focus();
-                this.activeIndex = -1;
-                this.$refs.trigger.setAttribute('aria-expanded', 'false');
-                this.$refs.popover.setAttribute('aria-hidden', 'true');
-            }}
-        }},
-
-        openMenu(focus) {{
-            document.dispatchEvent(new CustomEvent('basecoat:popover', {{
-                detail: {{ source: this.$el }}
-            }}));
-            this.open = true;
-            this.$refs.trigger.setAttribute('aria-expanded', 'true');
-            this.$refs.popover.setAttribute('aria-hidden', 'false');
-            if (this.items.length) {{
-                if (focus === 'first') this.activeIndex = 0;
-                else if (focus === 'last') this.activeIndex = this.items.length - 1;
-                this.syncActiveClass();
-            }}
-        }},
-
-        onKey(e) {{
-            const expanded = this.open;
-            if (e.key === 'Escape') {{
-                if (expanded) {{
-                    e.preventDefault();
-                    this.close();
-                }}
-                return;
-            }}
-            if (!expanded) {{
-                if (['Enter', ' '].includes(e.key)) {{
-                    e.preventDefault();
-                    this.openMenu(false);
-                }} else if (e.key === 'ArrowDown') {{
-                    e.preventDefault();
-                    this.openMenu('first');
-                }} else if (e.key === 'ArrowUp') {{
-                    e.preventDefault();
-                    this.openMenu('last');
-                }}
-                return;
-            }}
-            if (this.items.length === 0) return;
-            let next = this.activeIndex;
-            if (e.key === 'ArrowDown') {{
-                e.preventDefault();
-                next = this.activeIndex < 0 ? 0 : Math.min(this.activeIndex + 1, this.items.length - 1);
-            }} else if (e.key === 'ArrowUp') {{
-                e.preventDefault();
-                next = this.activeIndex < 0 ? this.items.length - 1 : Math.max(this.activeIndex - 1, 0);
-            }} else if (e.key === 'Home') {{
-                e.preventDefault();
-                next = 0;
-            }} else if (e.key === 'End') {{
-                e.preventDefault();
-                next = this.items.length - 1;
-            }} else if (e.key === 'Enter' || e.key === ' ') {{
-                e.preventDefault();
-                if (this.activeIndex > -1) this.items[this.activeIndex].click();
-                this.close();
-                return;
-            }}
-            if (next !== this.activeIndex) {{
-                this.activeIndex = next;
-                const el = this.items[this.activeIndex];
-                if (el) {{
-                    if (!el.id) el.id = '{menu_id}-item-' + this.activeIndex;
-                    this.$refs.trigger.setAttribute('aria-activedescendant', el.id);
-                }}
-                this.syncActiveClass();
-            }}
-        }},
-
-        hoverMove(ev) {{
-            const t = ev.target.closest('[role^="menuitem"]');
-            if (!t) return;
-            const idx = this.items.indexOf(t);
-            if (idx > -1 && idx !== this.activeIndex) {{
-                this.activeIndex = idx;
-                this.syncActiveClass();
-            }}
-        }},
-
-        resetActive() {{
-            this.activeIndex = -1;
-            this.$refs.trigger.removeAttribute('aria-activedescendant');
-            this.syncActiveClass();
-        }},
-
-        onClick(ev) {{
-            const item = ev.target.closest('[role^="menuitem"]');
-            if (!item) return;
-            const role = item.getAttribute('role');
-            if (role === 'menuitem') {{
-                this.close();
-                return;
-            }}
-            if (role === 'menuitemcheckbox') {{
-                const isChecked = item.getAttribute('aria-checked') === 'true';
-                item.setAttribute('aria-checked', (!isChecked).toString());
-                return;
-            }}
-            if (role === 'menuitemradio') {{
-                const group = item.getAttribute('data-group') || '';
-                const scope = group
-                    ? this.$refs.menu.querySelectorAll('[role="menuitemradio"][data-group="' + group + '"]')
-                    : this.$refs.menu.querySelectorAll('[role="menuitemradio"]');
-                scope.forEach(el => el.setAttribute('aria-checked', el === item ? 'true' : 'false'));
-                return;
-            }}
-        }},
-
-        syncActiveClass() {{
-            this.items.forEach((it, i) => it.classList.toggle('active', i === this.activeIndex));
-        }}
-    }}
-    """
+    alpine_state: js = _DROPDOWN_MENU_ALPINE_STATE.format(menu_id=menu_id)
 
     alpine_attrs = {
         "x-data": alpine_state,
         "@click.outside": "close(false)",
+        **(LAZY_HYDRATE_ATTRS if lazy_hydrate else {}),
         **attrs,
     }
 
+    trigger_attrs = {
+        "id": trigger_id,
+        "x-ref": "trigger",
+        "@click": "open ? close() : openMenu(false)",
+        "@keydown": "onKey($event)",
+        "aria_haspopup": "menu",
+        "aria_controls": menu_id,
+        "aria_expanded": "false",
+    }
+    menu_attrs = {
+        "x-ref": "menu",
+        "@mousemove": "hoverMove($event)",
+        "@mouseleave": "resetActive()",
+        "@click": "onClick($event)",
+    }
+    if isinstance(children, DeferredPanel):
+        # Keyboard navigation walks the loaded items once htmx has swapped them in.
+        menu_attrs["@htmx:after-swap"] = "refreshItems()"
+        if children.prefetch:
+            trigger_attrs["@mouseenter.once"] = trigger_attrs["@focusin.once"] = prefetch_within_js(
+                "$refs.menu"
+            )
+
     if isinstance(trigger, str):
         trigger_node = button_component(variant="outline")[trigger]
-        trigger_el = span(
-            **{
-                "id": trigger_id,
-                "x-ref": "trigger",
-                "@click": "open ? close() : openMenu(false)",
-                "@keydown": "onKey($event)",
-                "aria_haspopup": "menu",
-                "aria_controls": menu_id,
-                "aria_expanded": "false",
-            }
-        )[trigger_node]
+        trigger_el = span(**trigger_attrs)[trigger_node]
     else:
-        trigger_el = span(
-            **{
-                "id": trigger_id,
-                "x-ref": "trigger",
-                "@click": "open ? close() : openMenu(false)",
-                "@keydown": "onKey($event)",
-                "aria_haspopup": "menu",
-                "aria_controls": menu_id,
-                "aria_expanded": "false",
-            }
-        )[trigger]
+        trigger_el = span(**trigger_attrs)[trigger]
 
     return div(id=container_id, **alpine_attrs)[
         trigger_el,
@@ -296,12 +316,7 @@ def dropdown_menu(
                 role="menu",
                 aria_labelledby=trigger_id,
                 class_=f"{POPOVER_PANEL_CLASSES} p-2 min-w-[16rem]",
-                **{
-                    "x-ref": "menu",
-                    "@mousemove": "hoverMove($event)",
-                    "@mouseleave": "resetActive()",
-                    "@click": "onClick($event)",
-                },
+                **menu_attrs,
             )[children]
         ],
     ]
@@ -0,0 +1,82 @@
+"""Lazy Alpine hydration: attach component state when it is first needed.
+
+Components rendered with ``lazy_hydrate=True`` carry ``x-ignore``, so Alpine's start-up
+walk skips them, plus a ``data-lazy-hydrate`` marker. Their server HTML is already the
+closed state (popovers are ``x-cloak``-hidden, labels and values server-rendered), so
+nothing changes visually. ``lazy_hydration_script()`` initializes each marked component
+when it comes within ``200px`` of the viewport or on the first ``pointerover``/``focusin``
+inside it, whichever happens first, then replays that hover/focus so e.g. a tooltip
+still opens. Render the script once per page, before Alpine starts (any inline position
+works with a ``defer``-loaded Alpine); components swapped in by htmx are picked up too.
+"""
+
+from htpy import Renderable
+from htpy import script
+from markupsafe import Markup
+from sourcetypes import js
+
+from ._utils import inline_js
+
+# Root attributes of a lazily hydrated component.
+LAZY_HYDRATE_ATTRS: dict[str, str] = {"x-ignore": "", "data-lazy-hydrate": ""}
+
+_LAZY_HYDRATION_JS: js = inline_js(
+    """
+(() => {
+    let started = false;
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach((entry) => entry.isIntersecting && hydrate(entry.target));
+    }, { rootMargin: '200px' });
+
+    function hydrate(el, event) {
+        if (!started || !el.hasAttribute('data-lazy-hydrate')) return;
+        // An ignored ancestor would make initTree skip this element, so wake it first.
+        const outer = el.parentElement?.closest('[data-lazy-hydrate]');
+        if (outer) hydrate(outer);
+        observer.unobserve(el);
+        el.removeAttribute('data-lazy-hydrate');
+        el.removeAttribute('x-ignore');
+        // Alpine flagged the element while skipping it; initTree bails out on that flag.
+        delete el._x_ignore;
+        window.Alpine.initTree(el);
+        if (!event) return;
+        // The event that woke the component happened before its listeners existed.
+        if (event.type === 'focusin') {
+            event.target.dispatchEvent(new FocusEvent('focus'));
+        } else {
+            for (let node = event.target; node; node = node === el ? null : node.parentElement) {
+                node.dispatchEvent(new MouseEvent('mouseenter'));
+            }
+        }
+    }
+
+    function scan(root) {
+        if (!started) return;
+        if (root.matches?.('[data-lazy-hydrate]')) observer.observe(root);
+        root.querySelectorAll?.('[data-lazy-hydrate]').forEach((el) => observer.observe(el));
+    }
+
+    function onEvent(event) {
+        const el = event.target.closest?.('[data-lazy-hydrate]');
+        if (el) hydrate(el, event);
+    }
+
+    document.addEventListener('pointerover', onEvent, true);
+    document.addEventListener('focusin', onEvent, true);
+    document.addEventListener('alpine:initialized', () => {
+        started = true;
+        scan(document);
+    });
+    document.addEventListener('htmx:load', (event) => scan(event.detail.elt));
+})();
+"""
+)
+
+
+def lazy_hydration_script() -> Renderable:
+    """Return the ``<script>`` that hydrates ``lazy_hydrate=True`` components on demand.
+
+    Returns:
+        Renderable: Inline script tag; render it once per page.
+    """
+    return script()[Markup(_LAZY_HYDRATION_JS)]
@@ -1,3 +1,5 @@
+"""Inline SVG icon helpers shared across components."""
+
 from htpy import Renderable
 from htpy import circle
 from htpy import div
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from htpy import Renderable
 from htpy import i as i_el
 from htpy import script
 from markupsafe import Markup
 from sourcetypes import js
 
-from ._types_lucide import LucideName
+if TYPE_CHECKING:
+    # ~1,600-member Literal: only type checkers need it, so keep it off the runtime import path.
+    from ._types_lucide import LucideName
 
 
 def lucide_icon(
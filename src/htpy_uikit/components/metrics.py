@@ -0,0 +1,476 @@
+"""Always-on render metrics: counts, bytes and latency per component and per page.
+
+Call ``enable_metrics()`` once at startup. Every public component function is then
+counted on each call; a random ``sample_rate`` fraction of calls is also timed (build
+plus serialization of what it returned, nested components included) and sized. Pages
+rendered through ``render_page`` are always timed, and the same fraction is sized.
+
+Metrics go to a ``MetricsSink``. The default ``MetricsRegistry`` keeps them in memory
+and renders the Prometheus text format for a ``/metrics`` route::
+
+    registry = enable_metrics(sample_rate=0.05)
+
+    def home(request):
+        return HTMLResponse(render_page("home", lambda: home_page(request.user)))
+
+    def metrics(request):
+        return Response(registry.prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+Fragment caches report lookups with ``record_cache`` (from ``_cache_events``, which the
+cached components import instead of this module); it is a no-op until metrics are enabled
+or a request listens for them (``server_timing``).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import ExitStack
+from typing import Any
+from typing import Protocol
+
+from htpy import Node
+from htpy import render_node
+from markupsafe import Markup
+
+# Re-exported: the cache hooks live in ``_cache_events`` so components can report
+# lookups without importing this module.
+from ._cache_events import listen_cache_lookups  # noqa: F401
+from ._cache_events import record_cache  # noqa: F401
+from ._cache_events import set_cache_counter
+from ._instrument import COMPONENTS_PACKAGE
+from ._instrument import ComponentFunction
+from ._instrument import observe_render
+from ._instrument import patch_components
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds: 50µs (a badge) up to 250ms (a large page).
+LATENCY_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+)
+# Bytes: 256B up to 1MB.
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+class MetricsSink(Protocol):
+    """Receives render metrics; implement it to forward them to StatsD, OpenTelemetry..."""
+
+    def count_render(self, component: str) -> None:
+        """Called on every component call, sampled or not."""
+
+    def observe_render(self, component: str, seconds: float, size: int) -> None:
+        """Called for sampled component calls once their output is serialized."""
+
+    def observe_page(self, page: str, seconds: float, size: int | None) -> None:
+        """Called for every ``render_page``; ``size`` is None unless the page was sampled."""
+
+    def count_cache(self, cache: str, hit: bool) -> None:
+        """Called for every fragment cache lookup."""
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds observations ``<= bounds[i]``."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        # One extra bucket for +Inf.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        """``(le, count)`` pairs as Prometheus exposes them."""
+        total = 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts, strict=True):
+            total += count
+            yield _format_value(bound), total
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding quantile ``q``; None when empty or beyond."""
+        if not self.count:
+            return None
+        rank, total = q * self.count, 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            total += count
+            if total >= rank:
+                return bound
+        return None
+
+
+class _Series:
+    __slots__ = ("count", "latency", "size")
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]) -> None:
+        # Exact call count (for components, synced from the per-thread tallies on read);
+        # ``latency.count`` is the number of sampled calls.
+        self.count = 0
+        self.latency = Histogram(latency_buckets)
+        self.size = Histogram(size_buckets)
+
+
+class MetricsRegistry:
+    """In-memory ``MetricsSink`` with a Prometheus text exposition. Thread-safe."""
+
+    def __init__(
+        self,
+        *,
+        prefix: str = "htpy_uikit",
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ) -> None:
+        self.prefix = prefix
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.components: dict[str, _Series] = {}
+        self.pages: dict[str, _Series] = {}
+        # cache name -> [hits, misses]
+        self.caches: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        # Component call counts, tallied per thread: (thread, tally) for live threads and
+        # the folded tallies of finished ones.
+        self._local = threading.local()
+        self._tallies: list[tuple[threading.Thread, dict[str, int]]] = []
+        self._retired: dict[str, int] = {}
+
+    def _series(self, table: dict[str, _Series], name: str) -> _Series:
+        series = table.get(name)
+        if series is None:
+            series = table.setdefault(name, _Series(self.latency_buckets, self.size_buckets))
+        return series
+
+    def count_render(self, component: str) -> None:
+        # The hot path runs on every component call. A shared ``count += 1`` would lose
+        # increments between threads, so each thread bumps a tally only it writes, without
+        # the lock; readers sum the tallies.
+        try:
+            tally = self._local.tally
+        except AttributeError:
+            tally = self._new_tally()
+        tally[component] = tally.get(component, 0) + 1
+
+    def _new_tally(self) -> dict[str, int]:
+        tally: dict[str, int] = {}
+        with self._lock:
+            # Fold finished threads' tallies, so thread-per-request servers stay bounded.
+            live = []
+            for thread, counts in self._tallies:
+                if thread.is_alive():
+                    live.append((thread, counts))
+                else:
+                    _add_counts(self._retired, counts)
+            live.append((threading.current_thread(), tally))
+            self._tallies = live
+            self._local.tally = tally
+        return tally
+
+    def _sync_counts(self) -> None:
+        # Called with the lock held: refresh component counts from the tallies.
+        totals = dict(self._retired)
+        for _, tally in self._tallies:
+            # ``copy`` is atomic, so a concurrent insert by the owner cannot break iteration.
+            _add_counts(totals, tally.copy())
+        for name, count in totals.items():
+            self._series(self.components, name).count = count
+
+    def observe_render(self, component: str, seconds: float, size: int) -> None:
+        with self._lock:
+            series = self._series(self.components, component)
+            series.latency.observe(seconds)
+            series.size.observe(size)
+
+    def observe_page(self, page: str, seconds: float, size: int | None) -> None:
+        with self._lock:
+            series = self._series(self.pages, page)
+            series.count += 1
+            series.latency.observe(seconds)
+            if size is not None:
+                series.size.observe(size)
+
+    def count_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            counts = self.caches.setdefault(cache, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def hit_ratio(self, cache: str | None = None) -> float | None:
+        """Hits over lookups for ``cache`` (all caches by default); None before any lookup."""
+        with self._lock:
+            rows = [self.caches.get(cache, [0, 0])] if cache else list(self.caches.values())
+        hits = sum(r[0] for r in rows)
+        lookups = hits + sum(r[1] for r in rows)
+        return hits / lookups if lookups else None
+
+    def reset(self) -> None:
+        with self._lock:
+            # Fresh thread-local storage: every thread starts a new tally on its next call.
+            self._local = threading.local()
+            self._tallies = []
+            self._retired = {}
+            self.components.clear()
+            self.pages.clear()
+            self.caches.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly summary: counts, sampled mean/p50/p95 latency and mean size."""
+
+        def rows(table: dict[str, _Series]) -> dict[str, dict[str, Any]]:
+            return {
+                name: {
+                    "count": s.count,
+                    "sampled": s.latency.count,
+                    "mean_seconds": s.latency.sum / s.latency.count if s.latency.count else None,
+                    "p50_seconds": s.latency.quantile(0.5),
+                    "p95_seconds": s.latency.quantile(0.95),
+                    "mean_bytes": s.size.sum / s.size.count if s.size.count else None,
+                }
+                for name, s in sorted(table.items())
+            }
+
+        with self._lock:
+            self._sync_counts()
+            return {
+                "components": rows(self.components),
+                "pages": rows(self.pages),
+                "caches": {
+                    name: {"hits": h, "misses": m, "hit_ratio": h / (h + m) if h + m else None}
+                    for name, (h, m) in sorted(self.caches.items())
+                },
+            }
+
+    def prometheus(self) -> str:
+        """The registry in the Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            self._sync_counts()
+            for kind, table in (("component", self.components), ("page", self.pages)):
+                base = f"{self.prefix}_{kind}"
+                _counter(lines, f"{base}_renders_total", f"{kind.title()} renders.", kind, table)
+                _histograms(
+                    lines,
+                    f"{base}_render_seconds",
+                    f"Sampled {kind} render latency: build plus serialization.",
+                    kind,
+                    {name: s.latency for name, s in table.items()},
+                )
+                _histograms(
+                    lines,
+                    f"{base}_render_bytes",
+                    f"Sampled {kind} HTML size in bytes.",
+                    kind,
+                    {name: s.size for name, s in table.items()},
+                )
+            name = f"{self.prefix}_fragment_cache_lookups_total"
+            lines += [f"# HELP {name} Fragment cache lookups.", f"# TYPE {name} counter"]
+            for cache, (hits, misses) in sorted(self.caches.items()):
+                label = _escape_label(cache)
+                lines.append(f'{name}{{cache="{label}",result="hit"}} {hits}')
+                lines.append(f'{name}{{cache="{label}",result="miss"}} {misses}')
+        return "\n".join(lines) + "\n"
+
+
+def _add_counts(totals: dict[str, int], counts: dict[str, int]) -> None:
+    for name, count in counts.items():
+        totals[name] = totals.get(name, 0) + count
+
+
+def _format_value(value: float | str) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counter(
+    lines: list[str], name: str, help_: str, label: str, table: dict[str, _Series]
+) -> None:
+    lines += [f"# HELP {name} {help_}", f"# TYPE {name} counter"]
+    for key, series in sorted(table.items()):
+        lines.append(f'{name}{{{label}="{_escape_label(key)}"}} {series.count}')
+
+
+def _histograms(
+    lines: list[str], name: str, help_: str, label: str, table: dict[str, Histogram]
+) -> None:
+    lines += [f"# HELP {name} {help_}", f"# TYPE {name} histogram"]
+    for key, hist in sorted(table.items()):
+        if not hist.count:
+            continue
+        labels = f'{label}="{_escape_label(key)}"'
+        for le, count in hist.cumulative():
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {_format_value(hist.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+
+def _utf8_size(chunk: str) -> int:
+    # ``isascii`` is O(1) on CPython strings; only non-ASCII text pays for encoding.
+    return len(chunk) if chunk.isascii() else len(chunk.encode())
+
+
+# A private generator, so sampling leaves the ``random`` stream (and seeded ids) untouched.
+_sampler = random.Random()
+
+
+def _skip_count(sample_rate: float) -> int:
+    """Calls to let through before the next sampled one.
+
+    Geometrically distributed, so each call is still sampled with probability
+    ``sample_rate``, but a random number is drawn once per sample instead of per call.
+    """
+    if sample_rate >= 1:
+        return 0
+    if sample_rate <= 0:
+        return sys.maxsize
+    return int(math.log(1.0 - _sampler.random()) / math.log(1.0 - sample_rate))
+
+
+def _metered(
+    target: ComponentFunction, sink: MetricsSink, sample_rate: float
+) -> Callable[..., Any]:
+    func, name = target.func, target.name
+    count, observe = sink.count_render, sink.observe_render
+    clock = time.perf_counter
+    # Unsampled calls only count down. Threads racing on it may shift a sample by a
+    # call, which does not bias the rate.
+    skip = _skip_count(sample_rate)
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal skip
+        count(name)
+        if skip:
+            skip -= 1
+            return func(*args, **kwargs)
+        skip = _skip_count(sample_rate)
+        start = clock()
+        result = func(*args, **kwargs)
+        built = clock() - start
+
+        def around(chunks: Iterator[str]) -> Iterator[str]:
+            # Joining in C keeps a sampled subtree from paying a generator step per chunk,
+            # and keeps the consumer's own time out of the measurement.
+            begin = clock()
+            html = "".join(chunks)
+            observe(name, built + clock() - begin, _utf8_size(html))
+            yield html
+
+        observed = observe_render(result, around)
+        if observed is result:
+            # Not renderable (attribute dicts, JS strings): only the call was timed.
+            observe(name, built, 0)
+        return observed
+
+    return wrapper
+
+
+_lock = threading.Lock()
+_sink: MetricsSink | None = None
+_patches: ExitStack | None = None
+_sample_rate = 0.0
+# Pages to render before the next one is sized: encoding a page to count its UTF-8 bytes
+# costs about as much as all the unsampled component calls on it together.
+_page_skip = 0
+
+
+def enable_metrics(
+    sink: MetricsSink | None = None,
+    *,
+    sample_rate: float = 0.05,
+    package: str = COMPONENTS_PACKAGE,
+) -> MetricsSink:
+    """Start recording component and page metrics into ``sink``.
+
+    Args:
+        sink: Where metrics go; a new ``MetricsRegistry`` by default.
+        sample_rate: Fraction of component calls that are timed and sized, and of
+            ``render_page`` pages that are sized (0 to 1). Every call is counted and
+            every page timed regardless.
+        package: Components package to instrument; defaults to the one this module
+            was vendored into.
+
+    Returns:
+        MetricsSink: The active sink.
+    """
+    global _sink, _patches, _sample_rate, _page_skip
+    if not 0 <= sample_rate <= 1:
+        raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+    active = sink if sink is not None else MetricsRegistry()
+    with _lock:
+        _disable()
+        stack = ExitStack()
+        stack.enter_context(
+            patch_components(lambda target: _metered(target, active, sample_rate), package)
+        )
+        set_cache_counter(active.count_cache)
+        _sink, _patches = active, stack
+        _sample_rate, _page_skip = sample_rate, _skip_count(sample_rate)
+    return active
+
+
+def _disable() -> None:
+    global _sink, _patches
+    if _patches is not None:
+        _patches.close()
+    set_cache_counter(None)
+    _sink = _patches = None
+
+
+def disable_metrics() -> None:
+    """Restore the original component functions and stop recording."""
+    with _lock:
+        _disable()
+
+
+def metrics_sink() -> MetricsSink | None:
+    """The active sink, or None when metrics are off."""
+    return _sink
+
+
+def render_page(page: str, render: Callable[[], Node]) -> Markup:
+    """Build and serialize ``render()``, recording its latency (and, if sampled, its size).
+
+    Args:
+        page: Page label, e.g. the route name.
+        render: Zero-argument callable returning the page node.
+
+    Returns:
+        Markup: The rendered HTML.
+    """
+    global _page_skip
+    sink = _sink
+    if sink is None:
+        return render_node(render())
+    start = time.perf_counter()
+    html = render_node(render())
+    elapsed = time.perf_counter() - start
+    if _page_skip:
+        _page_skip -= 1
+        sink.observe_page(page, elapsed, None)
+    else:
+        _page_skip = _skip_count(_sample_rate)
+        sink.observe_page(page, elapsed, _utf8_size(html))
+    return html
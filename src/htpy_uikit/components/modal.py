@@ -4,13 +4,43 @@ from htpy import button
 from htpy import div
 from htpy import h3
 from htpy import span
+from htpy import template
 from htpy import with_children
 from markupsafe import Markup
 from sourcetypes import js
 
+from ._utils import inline_js
 from ._utils import random_string
+from .deferred import deferred_content
+from .deferred import prefetch_js
 from .icons import icon_close
 
+# State of ``modal_host``: a click on any trigger whose ``data-modal-host`` names this
+# host sets the title, loads ``data-modal-url`` into the body with htmx (unless that URL
+# is already shown) and opens the modal.
+_MODAL_HOST_ALPINE_DATA: js = inline_js(
+    """
+    {
+        show: false,
+        title: '',
+        url: '',
+        onClick(event) {
+            const trigger = event.target.closest('[data-modal-host]');
+            if (!trigger || trigger.dataset.modalHost !== this.$root.id) return;
+            event.preventDefault();
+            this.title = trigger.dataset.modalTitle || '';
+            const url = trigger.dataset.modalUrl;
+            if (url && url !== this.url) {
+                this.url = url;
+                this.$refs.body.innerHTML = this.$refs.loading.innerHTML;
+                htmx.ajax('GET', url, { target: this.$refs.body, swap: 'innerHTML' });
+            }
+            this.show = true;
+        }
+    }
+"""
+)
+
 
 def _modal_panel(
     children: Node,
@@ -19,6 +49,7 @@ def _modal_panel(
     width: str,
     height: str,
     close_button_attrs: dict[str, str] | None = None,
+    title_attrs: dict[str, str] | None = None,
 ) -> Renderable:
     """Render the inner modal panel with consistent styling.
 
@@ -28,6 +59,7 @@ def _modal_panel(
         width: Tailwind width classes applied to the panel container.
         height: Tailwind height classes applied to the panel container.
         close_button_attrs: Attributes merged into the close button.
+        title_attrs: Attributes merged into the heading, e.g. an Alpine ``x-text``.
 
     Returns:
         Renderable: Panel ``div`` containing header and scrollable body.
@@ -50,7 +82,7 @@ def _modal_panel(
 
     return div(**panel_kwargs)[
         div(class_="flex items-center justify-between p-4 md:p-5 border-b rounded-t border-border")[
-            h3(class_="text-lg font-semibold text-card-foreground")[title],
+            h3(class_="text-lg font-semibold text-card-foreground", **(title_attrs or {}))[title],
             button(**button_kwargs)[
                 icon_close(class_="size-5"),
                 span(class_="sr-only")[("Close modal")],
@@ -68,15 +100,24 @@ def modal(
     title: str,
     width: str = "w-full max-w-lg",
     height: str = "h-auto",
+    content_url: str | None = None,
+    loading_content: Node = None,
 ) -> Renderable:
     """Render a modal shell controlled via Alpine custom events.
 
+    With ``content_url`` the body is not rendered: the modal ships as an empty shell and
+    htmx fetches the body from ``content_url`` the first time the modal opens (or when
+    a trigger built with ``attrs_btn_open_modal(id, prefetch=True)`` is hovered or
+    focused), then keeps it.
+
     Args:
-        children: Modal body content.
+        children: Modal body content (ignored when ``content_url`` is set).
         id: Identifier used for the open/close events.
         title: Modal title displayed in the header.
         width: Tailwind width classes for the panel.
         height: Tailwind height classes for the panel.
+        content_url: Endpoint returning the body fragment, for a deferred body.
+        loading_content: Placeholder shown in a deferred body until it loads.
 
     Returns:
         Renderable: Overlay and panel nodes.
@@ -113,7 +154,9 @@ def modal(
         **attrs_btn_close_modal(id),
     )[
         _modal_panel(
-            children,
+            children
+            if content_url is None
+            else deferred_content(content_url, id=f"{id}-body", loading=loading_content),
             title=title,
             width=width,
             height=height,
@@ -122,21 +165,26 @@ def modal(
     ]
 
 
-def attrs_btn_open_modal(id: str) -> dict:
+def attrs_btn_open_modal(id: str, *, prefetch: bool = False) -> dict:
     """Return attributes that dispatch the ``modal-open`` event.
 
     Args:
         id: Modal identifier to include in the event detail.
+        prefetch: Start loading a deferred modal body (``content_url``) when the
+            trigger is hovered or focused.
 
     Returns:
         dict: Attribute dictionary suitable for ``button_component``.
     """
-    return {
+    attrs = {
         "x-data": "",
         "@click": Markup(
             f"window.dispatchEvent(new CustomEvent('modal-open', {{ detail: '{id}' }}));"
         ),
     }
+    if prefetch:
+        attrs["@mouseenter.once"] = attrs["@focus.once"] = Markup(prefetch_js(f"{id}-body"))
+    return attrs
 
 
 def attrs_btn_close_modal(id: str) -> dict:
@@ -151,6 +199,82 @@ def attrs_btn_close_modal(id: str) -> dict:
     }
 
 
+def modal_host(
+    *,
+    id: str = "modal-host",
+    width: str = "w-full max-w-lg",
+    height: str = "h-auto",
+    loading_content: Node = None,
+) -> Renderable:
+    """Render one modal that every trigger on the page can reuse.
+
+    Instead of a ``modal(..., content_url=...)`` per row, render the host once and give
+    each trigger the attributes from ``attrs_btn_open_modal_host``, which carry only its
+    title and body URL. A click on a trigger sets the title, fetches the body with htmx
+    (reopening the same URL keeps the loaded body) and opens the host, so the page's size
+    no longer grows with the number of modals. Requires htmx on the page.
+
+    Args:
+        id: Host id that triggers reference; use several ids for several hosts.
+        width: Tailwind width classes for the panel.
+        height: Tailwind height classes for the panel.
+        loading_content: Placeholder shown while a body loads.
+
+    Returns:
+        Renderable: Overlay and panel nodes with their Alpine state.
+    """
+    close = {"@click": "show = false", "@keydown.escape.window": "show = false"}
+
+    return div(
+        id=id,
+        tabindex="-1",
+        x_cloak="true",
+        x_show="show",
+        class_=(
+            "fixed top-0 right-0 left-0 z-50 flex justify-center items-center w-screen "
+            "inset-0 h-full max-h-full bg-black/50"
+        ),
+        **{
+            "x-data": Markup(_MODAL_HOST_ALPINE_DATA),
+            "@click.document": "onClick($event)",
+            "@click.self": "show = false",
+        },
+    )[
+        template(x_ref="loading")[
+            loading_content or div(class_="text-sm text-muted-foreground")["Loading..."]
+        ],
+        _modal_panel(
+            div(x_ref="body"),
+            title="",
+            width=width,
+            height=height,
+            close_button_attrs=close,
+            title_attrs={"x-text": "title"},
+        ),
+    ]
+
+
+def attrs_btn_open_modal_host(
+    title: str, content_url: str, *, host_id: str = "modal-host"
+) -> dict[str, str]:
+    """Return attributes that make a button open ``modal_host`` with this title and body.
+
+    Args:
+        title: Modal title.
+        content_url: Endpoint returning the body fragment.
+        host_id: Id of the host to open.
+
+    Returns:
+        dict: ``type`` and ``data-*`` attributes suitable for ``button_component``.
+    """
+    return {
+        "type": "button",
+        "data-modal-host": host_id,
+        "data-modal-title": title,
+        "data-modal-url": content_url,
+    }
+
+
 @with_children
 def hx_modal(
     children: Node,
@@ -0,0 +1,402 @@
+"""In-memory search index over select/combobox options for remote-search endpoints.
+
+``OptionIndex`` is built once from ``SelectOption``/``SelectItem`` lists (``SelectGroup``
+entries are flattened) and answers ranked queries without scanning every option:
+
+- a prefix trie over label words finds options whose words start with the query words;
+- a trigram index finds substrings (intersecting the query's trigram postings) and,
+  when those leave fewer than ``limit`` results, typos ranked by trigram similarity;
+- candidates are ranked: exact label, label prefix, word-start substring, substring,
+  word prefixes, then fuzzy. Ties keep insertion order. Broad queries (one letter on a
+  large index) rank the first ``max_candidates`` matches of each kind, shortest words
+  first, so their cost does not grow with the index.
+
+With NumPy installed, fuzzy scoring on indexes of ``numpy_threshold`` options or more
+counts trigram hits with one vectorized ``bincount`` instead of a Python loop. Options
+can be added and removed incrementally; searches may run concurrently from many threads
+while writers take an exclusive lock::
+
+    index = OptionIndex(customers)
+
+    @app.get("/customers/search")
+    def search():
+        matches = index.search(request.args.get("q", ""), limit=20)
+        return str(combobox_results(matches))
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # optional: only speeds up fuzzy scoring on very large indexes
+    np = None
+
+_WORD_RE = re.compile(r"\w+")
+# Trie node keys holding the ids of options that have the word ending at this node,
+# anywhere in the label and as its first word (label prefix matches).
+_END = ""
+_FIRST = "^"
+# Trigram similarity (Dice) an option needs to count as a fuzzy match.
+_MIN_SIMILARITY = 0.4
+
+# Score bands, best first; each band adds a 0..1 bonus for how much of the label matched.
+_EXACT = 6.0
+_LABEL_PREFIX = 5.0
+_WORD_SUBSTRING = 4.0
+_SUBSTRING = 3.0
+_WORD_PREFIXES = 2.0
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _trigrams(text: str) -> set[str]:
+    # Padded so word boundaries count: "ab" -> {"  a", " ab", "ab "}.
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def iter_options(items: Iterable[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+    """Yield the selectable options of ``items``, flattening ``SelectGroup`` entries."""
+    for item in items:
+        if item.get("type") == "group":
+            yield from iter_options(item.get("items", ()))
+        elif "value" in item:
+            yield item
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class OptionIndex:
+    """Ranked prefix, substring and fuzzy search over options, keyed by ``value``.
+
+    Args:
+        options: Initial ``SelectOption``/``SelectItem``/``SelectGroup`` entries.
+        max_candidates: Cap on the options collected per match kind (label prefix,
+            word prefix, substring) and ranked, bounding the cost of broad queries such
+            as one letter. Prefix matches are collected shortest word first.
+        numpy_threshold: Index size from which fuzzy scoring is vectorized when NumPy
+            is installed; None disables it.
+    """
+
+    def __init__(
+        self,
+        options: Iterable[Mapping[str, Any]] = (),
+        *,
+        max_candidates: int = 1_000,
+        numpy_threshold: int | None = 50_000,
+    ) -> None:
+        self.max_candidates = max_candidates
+        self.numpy_threshold = numpy_threshold
+        self._lock = _ReadWriteLock()
+        self._next_id = 0
+        # id -> (option, normalized label, label words, trigram count)
+        self._entries: dict[int, tuple[Mapping[str, Any], str, tuple[str, ...], int]] = {}
+        self._ids: dict[str, int] = {}
+        self._trie: dict[str, Any] = {}
+        self._grams: dict[str, set[int]] = {}
+        # NumPy state, rebuilt lazily after a change: trigram count per id and postings.
+        self._np_counts: Any = None
+        self._np_postings: dict[str, Any] = {}
+        # Serializes searches that add postings to the NumPy cache; they hold only the
+        # read lock, so they can run at the same time.
+        self._np_lock = threading.Lock()
+        self.update(options)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._ids
+
+    def get(self, value: str) -> Mapping[str, Any] | None:
+        """The option with ``value``, if indexed."""
+        entry_id = self._ids.get(value)
+        return self._entries[entry_id][0] if entry_id is not None else None
+
+    # -- writes --------------------------------------------------------------------
+
+    def add(self, option: Mapping[str, Any]) -> None:
+        """Index ``option``, replacing any option with the same ``value``."""
+        self.update((option,))
+
+    def update(self, options: Iterable[Mapping[str, Any]]) -> None:
+        """Index every option of ``options`` (groups flattened)."""
+        with self._lock.write():
+            for option in iter_options(options):
+                self._remove(str(option["value"]))
+                self._insert(option)
+            self._np_counts = None
+            self._np_postings = {}
+
+    def remove(self, value: str) -> bool:
+        """Drop the option with ``value``; return whether it was indexed."""
+        with self._lock.write():
+            self._np_counts = None
+            self._np_postings = {}
+            return self._remove(value)
+
+    def _insert(self, option: Mapping[str, Any]) -> None:
+        entry_id = self._next_id
+        self._next_id += 1
+        label = _normalize(str(option.get("label", option["value"])))
+        words = tuple(dict.fromkeys(_WORD_RE.findall(label)))
+        grams = _trigrams(label)
+        self._entries[entry_id] = (option, label, words, len(grams))
+        self._ids[str(option["value"])] = entry_id
+        for position, word in enumerate(words):
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node.setdefault(_END, set()).add(entry_id)
+            if not position:
+                node.setdefault(_FIRST, set()).add(entry_id)
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(entry_id)
+
+    def _remove(self, value: str) -> bool:
+        entry_id = self._ids.pop(value, None)
+        if entry_id is None:
+            return False
+        _, label, words, _ = self._entries.pop(entry_id)
+        for word in words:
+            path = [self._trie]
+            for char in word:
+                path.append(path[-1][char])
+            node = path[-1]
+            for key in (_END, _FIRST):
+                ids = node.get(key)
+                if ids is not None:
+                    ids.discard(entry_id)
+                    if not ids:
+                        del node[key]
+            # Prune nodes left without words below them.
+            for parent, char in zip(reversed(path[:-1]), reversed(word), strict=True):
+                if parent[char]:
+                    break
+                del parent[char]
+        for gram in _trigrams(label):
+            ids = self._grams[gram]
+            ids.discard(entry_id)
+            if not ids:
+                del self._grams[gram]
+        return True
+
+    # -- reads ---------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 20) -> list[Mapping[str, Any]]:
+        """Return up to ``limit`` options best matching ``query``.
+
+        An empty query returns the first ``limit`` options in insertion order.
+        """
+        return [option for option, _ in self.search_scored(query, limit)]
+
+    def search_scored(self, query: str, limit: int = 20) -> list[tuple[Mapping[str, Any], float]]:
+        """Like ``search`` but with each option's score (higher is better)."""
+        q = _normalize(query)
+        with self._lock.read():
+            if not q:
+                return [(entry[0], 0.0) for entry in islice(self._entries.values(), limit)]
+            qwords = _WORD_RE.findall(q)
+            scores: dict[int, float] = {}
+            for entry_id in self._candidates(q, qwords, limit):
+                score = self._score(entry_id, q, qwords)
+                if score:
+                    scores[entry_id] = score
+            if len(scores) < limit and len(q) >= 3:
+                fuzzy = self._numpy_fuzzy if self._use_numpy() else self._fuzzy
+                for entry_id, similarity in fuzzy(q, limit):
+                    scores.setdefault(entry_id, similarity)
+            # Higher score first, then insertion order (lower id).
+            best = heapq.nsmallest(limit, ((-score, i) for i, score in scores.items()))
+            return [(self._entries[i][0], -neg) for neg, i in best]
+
+    def prefix(self, word: str, limit: int | None = None) -> list[Mapping[str, Any]]:
+        """Options with a label word starting with ``word``.
+
+        Shortest words first; at most ``limit`` (default ``max_candidates``) options.
+        """
+        with self._lock.read():
+            ids = self._word_prefix_ids(_normalize(word), limit or self.max_candidates)
+            return [self._entries[i][0] for i in ids]
+
+    def _candidates(self, q: str, qwords: list[str], limit: int) -> dict[int, None]:
+        # Ordered by score band, each kind capped at ``max_candidates``.
+        cap = self.max_candidates
+        if not qwords:
+            # Only punctuation: no word to look up, and labels are matched by words.
+            return {}
+        if len(qwords) == 1:
+            found = dict.fromkeys(self._word_prefix_ids(qwords[0], cap, _FIRST))
+            if len(found) >= limit and q == qwords[0]:
+                # Enough label prefix matches, and every other kind scores lower.
+                return found
+            words = self._word_prefix_ids(qwords[0], cap)
+            found.update(dict.fromkeys(words))
+            if len(words) >= cap:
+                # Word prefixes fill the cap; mid-word substrings score lower.
+                return found
+        else:
+            # Intersect the full sets (in C) before capping, or the cap would drop matches.
+            sets = sorted((set().union(*self._word_prefix_sets(w)) for w in qwords), key=len)
+            found = dict.fromkeys(islice(sets[0].intersection(*sets[1:]), cap))
+        if len(q) >= 3 and len(found) < cap:
+            # Every label containing ``q`` has all of q's unpadded trigrams.
+            grams = {q[i : i + 3] for i in range(len(q) - 2)}
+            postings = sorted((self._grams.get(g, set()) for g in grams), key=len)
+            found.update(dict.fromkeys(islice(postings[0].intersection(*postings[1:]), cap)))
+        return found
+
+    def _word_prefix_sets(self, prefix: str, key: str = _END) -> Iterator[set[int]]:
+        # Id sets of the words starting with ``prefix``, breadth-first: shortest words,
+        # the best-scoring completions, come first.
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return
+        level = [node]
+        while level:
+            below = []
+            for current in level:
+                ids = current.get(key)
+                if ids:
+                    yield ids
+                below.extend(v for k, v in current.items() if k not in (_END, _FIRST))
+            level = below
+
+    def _word_prefix_ids(self, prefix: str, cap: int, key: str = _END) -> list[int]:
+        found: dict[int, None] = {}
+        for ids in self._word_prefix_sets(prefix, key):
+            found.update(dict.fromkeys(islice(ids, cap - len(found))))
+            if len(found) >= cap:
+                break
+        return list(found)
+
+    def _score(self, entry_id: int, q: str, qwords: list[str]) -> float:
+        _, label, words, _ = self._entries[entry_id]
+        coverage = len(q) / len(label)
+        if label == q:
+            return _EXACT
+        if label.startswith(q):
+            return _LABEL_PREFIX + coverage
+        pos = label.find(q)
+        if pos > 0:
+            word_start = not label[pos - 1].isalnum()
+            return (_WORD_SUBSTRING if word_start else _SUBSTRING) + coverage
+        if all(any(w.startswith(qw) for w in words) for qw in qwords):
+            return _WORD_PREFIXES + coverage
+        return 0.0
+
+    def _fuzzy(self, q: str, limit: int) -> list[tuple[int, float]]:
+        """Top ``limit`` options by trigram Dice similarity to ``q``."""
+        grams = _trigrams(q)
+        postings = sorted((self._grams.get(g, set()) for g in grams), key=len)
+        # Dice >= s needs ``need`` shared trigrams at the least (labels are never shorter
+        # than one trigram), and an option sharing ``need`` appears in one of the
+        # ``len - need + 1`` smallest postings: only those are counted in full, the
+        # larger postings just top up options already counted.
+        need = max(1, int(_MIN_SIMILARITY * (len(grams) + 1) / 2 + 0.999))
+        head = len(postings) - need + 1
+        counts: dict[int, int] = {}
+        for posting in postings[:head]:
+            for entry_id in posting:
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+        for posting in postings[head:]:
+            for entry_id in counts:
+                if entry_id in posting:
+                    counts[entry_id] += 1
+        scored = []
+        for entry_id, count in counts.items():
+            similarity = 2 * count / (len(grams) + self._entries[entry_id][3])
+            if similarity >= _MIN_SIMILARITY:
+                scored.append((similarity, -entry_id))
+        return [(-neg_id, s) for s, neg_id in heapq.nlargest(limit, scored)]
+
+    def _use_numpy(self) -> bool:
+        return (
+            np is not None
+            and self.numpy_threshold is not None
+            and len(self._entries) >= self.numpy_threshold
+        )
+
+    def _numpy_fuzzy(self, q: str, limit: int) -> list[tuple[int, float]]:
+        """``_fuzzy`` with the trigram hits counted by one ``bincount``."""
+        # Built lazily under the read lock: the arrays are built in locals and published
+        # with one assignment (the counts) or one ``_np_lock``-guarded update (postings),
+        # so readers never see a half-built array. Concurrent builds produce equal arrays.
+        gram_counts = self._np_counts
+        if gram_counts is None:
+            gram_counts = np.zeros(self._next_id, dtype=np.float64)
+            ids = np.fromiter(self._entries, dtype=np.int64, count=len(self._entries))
+            gram_counts[ids] = [entry[3] for entry in self._entries.values()]
+            self._np_counts = gram_counts
+        grams = _trigrams(q)
+        postings = self._np_postings
+        built: dict[str, Any] = {}
+        arrays = []
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                ids_set = self._grams.get(gram, ())
+                posting = built[gram] = np.fromiter(ids_set, dtype=np.int64, count=len(ids_set))
+            arrays.append(posting)
+        if built:
+            # In place: copying the cache would cost O(cached postings) per query.
+            with self._np_lock:
+                postings.update(built)
+        hits = np.bincount(np.concatenate(arrays), minlength=len(gram_counts))
+        # Removed ids have a zero count and no hits, so they never pass the threshold.
+        similarity = 2 * hits / (len(grams) + np.maximum(gram_counts, 1))
+        matched = np.flatnonzero(similarity >= _MIN_SIMILARITY)
+        # ``flatnonzero`` is in id order, so a stable sort keeps insertion order on ties.
+        matched = matched[np.argsort(-similarity[matched], kind="stable")[:limit]]
+        return list(zip(matched.tolist(), similarity[matched].tolist(), strict=True))
@@ -8,6 +8,8 @@ from htpy import with_children
 from ._utils import merge_classes
 from .button import ButtonVariant
 from .button import button_component
+from .deferred import DeferredPanel
+from .deferred import prefetch_within_js
 
 
 @with_children
@@ -24,7 +26,7 @@ def popover(
     """Render an Alpine-controlled popover shell.
 
     Args:
-        children: Popover body content.
+        children: Popover body content; a ``DeferredPanel`` is fetched on first open.
         id: Root element id used to derive the popover content id.
         trigger: Node that toggles the popover.
         side: Popover placement relative to the trigger.
@@ -54,15 +56,19 @@ def popover(
     # Alpine.js implementation for popover
     alpine_attrs = {"x-data": "{ open: false }", **attrs}
 
+    trigger_attrs = {
+        "@click": "open = !open",
+        "@keydown.escape": "open = false",
+        ":aria-expanded": "open",
+    }
+    if isinstance(children, DeferredPanel) and children.prefetch:
+        trigger_attrs["@mouseenter.once"] = trigger_attrs["@focusin.once"] = prefetch_within_js(
+            "$root"
+        )
+
     return div(id=id, **alpine_attrs)[
         # Trigger element with Alpine.js
-        div(
-            **{
-                "@click": "open = !open",
-                "@keydown.escape": "open = false",
-                ":aria-expanded": "open",
-            },
-        )[trigger],
+        div(**trigger_attrs)[trigger],
         # Popover content with Alpine.js
         div(
             id=popover_id,
@@ -1,3 +1,7 @@
+import threading
+import time
+from collections import OrderedDict
+
 from htpy import Renderable
 from htpy import div
 from htpy import input as input_
@@ -5,23 +9,89 @@ from htpy import label
 from htpy import option
 from htpy import select
 from htpy import span
+from htpy import template
+from markupsafe import Markup
 from sourcetypes import js
 
-from ._styles import FOCUS_ACCENT_CLASSES
-from ._styles import ICON_INLINE_CLASSES
+from ._cache_events import record_cache
+from ._option_data import data_island
+from ._option_data import option_data
 from ._styles import LISTBOX_EMPTY_CLASSES
-from ._styles import LISTBOX_OPTION_BASE_CLASSES
+from ._styles import LISTBOX_MULTI_OPTION_CLASSES
+from ._styles import LISTBOX_OPTION_CLASSES
 from ._styles import LISTBOX_SECTION_HEADING_CLASSES
 from ._styles import POPOVER_PANEL_PADDED_CLASSES
 from ._styles import SELECT_NATIVE_BASE_CLASSES
 from ._types import SelectGroup
 from ._types import SelectItem
 from ._types import SelectOption
+from ._utils import js_template
+from ._utils import merge_classes
 from .button import button_component
+from .hydrate import LAZY_HYDRATE_ATTRS
 from .icons import icon_check
 from .icons import icon_chevron_down
 from .icons import icon_circle_alert
 
+# Rendered <option> blocks of native_select, keyed by the options' (value, label) pairs,
+# least recently used first. Only the ``selected`` attribute varies between renders.
+_OPTIONS_CACHE_SIZE = 256
+_options_cache: OrderedDict[tuple, tuple[str, dict[str, list[int]]]] = OrderedDict()
+_options_cache_lock = threading.Lock()
+_SELECTED_ATTR = ' selected="true"'
+
+
+def _render_options(key: tuple) -> tuple[str, dict[str, list[int]]]:
+    """Render ``(value, label)`` pairs as ``<option>`` elements.
+
+    Returns:
+        tuple[str, dict[str, list[int]]]: The markup and, per value, the offsets of its
+        options' start-tag ``>`` (where ``selected`` is spliced in).
+    """
+    parts: list[str] = []
+    offsets: dict[str, list[int]] = {}
+    size = 0
+    for value, text in key:
+        html = str(option(value=value)[text])
+        # Attribute values and text are escaped, so the first ">" ends the start tag.
+        offsets.setdefault(value, []).append(size + html.index(">"))
+        parts.append(html)
+        size += len(html)
+    return "".join(parts), offsets
+
+
+def _options_markup(options: list[SelectOption], value: str | None) -> Markup:
+    """Return the ``<option>`` elements for ``options`` with ``value`` selected.
+
+    With text labels, the block is rendered once per distinct list of (value, label) pairs
+    and cached; each call only splices the ``selected`` attribute in. Lookups are reported to
+    ``record_cache`` as ``native_select``.
+    """
+    start = time.perf_counter()
+    key = tuple((opt["value"], opt["label"]) for opt in options)
+    # Only text labels are cached: element labels hash by identity (or not at all), so a
+    # list rebuilt per request would never hit and would fill the cache with markup.
+    if not all(isinstance(text, str) for _, text in key):
+        html, offsets = _render_options(key)
+    else:
+        with _options_cache_lock:
+            cached = _options_cache.get(key)
+            if cached is not None:
+                _options_cache.move_to_end(key)
+        hit = cached is not None
+        if cached is None:
+            cached = _render_options(key)
+            with _options_cache_lock:
+                _options_cache[key] = cached
+                if len(_options_cache) > _OPTIONS_CACHE_SIZE:
+                    _options_cache.popitem(last=False)
+        html, offsets = cached
+        record_cache("native_select", hit, time.perf_counter() - start)
+    # From the last offset back, so earlier offsets stay valid.
+    for offset in reversed(offsets.get(value, ())):
+        html = f"{html[:offset]}{_SELECTED_ATTR}{html[offset:]}"
+    return Markup(html)
+
 
 def native_select(
     *,
@@ -104,13 +174,9 @@ def native_select(
             option(value="", disabled="true", selected="" if value is None else None)[placeholder]
         )
 
-    # Add actual options
+    # Add actual options (rendered once per distinct list, see _options_markup)
     if options:
-        for opt in options:
-            option_attrs = {"value": opt["value"]}
-            if value == opt["value"]:
-                option_attrs["selected"] = "true"
-            option_elements.append(option(**option_attrs)[opt["label"]])
+        option_elements.append(_options_markup(options, value))
 
     # Build the component
     elements = []
@@ -158,6 +224,535 @@ def _coerce_id(id_hint: str | None) -> str:
     return id_hint or f"select-{str(uuid.uuid4())[:6]}"
 
 
+_SELECT_ALPINE_DATA: js = js_template(
+    """{{
+    state: {{
+        open: false,
+        activeIndex: -1,
+        selected: '{initial_value_js}'
+    }},
+    // Options still in the JSON data island (lazy_options); the label is server-rendered
+    _lazy: {lazy},
+    _scrollHandler: null,
+    _resizeHandler: null,
+    _clickOutsideHandler: null,
+    init() {{
+        this.$nextTick(() => {{
+            if (!this._lazy) this.updateFromValue(this.state.selected, false);
+            this.$refs.popover.setAttribute('aria-hidden', 'true');
+            this.$el.selectByValue = (v) => this.updateFromValue(v);
+        }});
+        // Click outside handler
+        this._clickOutsideHandler = (e) => {{
+            if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
+                this.closeMenu(false);
+            }}
+        }};
+    }},
+    destroy() {{
+        this._removePositionListeners();
+        if (this._clickOutsideHandler) {{
+            document.removeEventListener('click', this._clickOutsideHandler, true);
+        }}
+    }},
+    _positionPopover() {{
+        const trigger = this.$refs.trigger;
+        const popover = this.$refs.popover;
+        if (!trigger || !popover) return;
+        const rect = trigger.getBoundingClientRect();
+        const popoverRect = popover.getBoundingClientRect();
+        const viewportHeight = window.innerHeight;
+        const viewportWidth = window.innerWidth;
+        const spaceBelow = viewportHeight - rect.bottom;
+        const spaceAbove = rect.top;
+        const popoverHeight = popover.offsetHeight || 200;
+        // Decide whether to show above or below
+        let top;
+        if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
+            top = rect.bottom + 4;
+        }} else {{
+            top = rect.top - popoverHeight - 4;
+        }}
+        // Horizontal positioning
+        let left = rect.left;
+        if (left + popoverRect.width > viewportWidth) {{
+            left = Math.max(4, viewportWidth - popoverRect.width - 4);
+        }}
+        popover.style.top = top + 'px';
+        popover.style.left = left + 'px';
+        popover.style.minWidth = rect.width + 'px';
+    }},
+    _addPositionListeners() {{
+        this._scrollHandler = () => this._positionPopover();
+        this._resizeHandler = () => this._positionPopover();
+        window.addEventListener('scroll', this._scrollHandler, true);
+        window.addEventListener('resize', this._resizeHandler);
+    }},
+    _removePositionListeners() {{
+        if (this._scrollHandler) {{
+            window.removeEventListener('scroll', this._scrollHandler, true);
+            this._scrollHandler = null;
+        }}
+        if (this._resizeHandler) {{
+            window.removeEventListener('resize', this._resizeHandler);
+            this._resizeHandler = null;
+        }}
+    }},
+    _materialize() {{
+        // Build the option nodes from the data island on first use
+        if (!this._lazy) return;
+        this._lazy = false;
+        const data = JSON.parse(this.$refs.data.textContent);
+        const nodes = document.createDocumentFragment();
+        let group = -1;
+        let parent = nodes;
+        data.options.forEach((o) => {{
+            if (o[2] !== group) {{
+                group = o[2];
+                parent = nodes;
+                if (group > -1) {{
+                    parent = this.$refs.groupTemplate.content.firstElementChild.cloneNode(true);
+                    const heading = parent.firstElementChild;
+                    heading.id = this.$refs.listbox.id + '-group-' + group;
+                    heading.textContent = data.groups[group];
+                    parent.setAttribute('aria-labelledby', heading.id);
+                    nodes.append(parent);
+                }}
+            }}
+            const el = this.$refs.optionTemplate.content.firstElementChild.cloneNode(true);
+            const content = el.querySelector('.select-content');
+            el.dataset.value = o[0];
+            if (o[3]) {{
+                content.classList.add('flex', 'items-center', 'gap-2');
+                content.innerHTML = o[3];
+                content.append(o[1]);
+            }} else {{
+                content.textContent = o[1];
+                el.dataset.label = o[1];
+            }}
+            if (o[0] === this.state.selected) {{
+                el.setAttribute('aria-selected', 'true');
+                el.querySelector('.select-check svg').style.display = '';
+            }}
+            parent.append(el);
+        }});
+        this.$refs.listbox.append(nodes);
+    }},
+    setActive(i) {{
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        if (this.state.activeIndex > -1 && opts[this.state.activeIndex]) {{
+            opts[this.state.activeIndex].classList.remove('active');
+        }}
+        this.state.activeIndex = i;
+        if (i > -1 && opts[i]) {{
+            const el = opts[i];
+            el.classList.add('active');
+            if (!el.id) el.id = this.$id('opt');
+            this.$refs.trigger?.setAttribute('aria-activedescendant', el.id);
+        }} else {{
+            this.$refs.trigger?.removeAttribute('aria-activedescendant');
+        }}
+    }},
+    setActiveFromEl(el) {{
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        const idx = opts.indexOf(el);
+        if (idx > -1) {{
+            this.setActive(idx);
+        }}
+    }},
+    openMenu() {{
+        if ({disabled}) return;
+        this._materialize();
+        this.state.open = true;
+        document.dispatchEvent(new CustomEvent('select:popover', {{ detail: {{ source: this.$el }} }}));
+        this.$refs.popover.setAttribute('aria-hidden', 'false');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'true');
+        this.$nextTick(() => {{
+            this._positionPopover();
+            this._addPositionListeners();
+            document.addEventListener('click', this._clickOutsideHandler, true);
+            const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
+            if (sel) {{
+                const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+                this.setActive(opts.indexOf(sel));
+                sel.scrollIntoView({{ block: 'nearest' }});
+            }}
+        }});
+    }},
+    closeMenu(focus = true) {{
+        if (!this.state.open) return;
+        this.state.open = false;
+        this._removePositionListeners();
+        document.removeEventListener('click', this._clickOutsideHandler, true);
+        this.$refs.popover.setAttribute('aria-hidden', 'true');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'false');
+        this.setActive(-1);
+        if (focus) this.$refs.trigger?.focus();
+    }},
+    updateFromValue(val, triggerEvent = true) {{
+        this._materialize();
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        const opt = opts.find((o) => o.dataset.value === val) || opts[0];
+        if (!opt) return;
+        const content = opt.querySelector('.select-content');
+        this.$refs.selected.innerHTML = content ? content.outerHTML : (opt.dataset.label || opt.innerHTML);
+        this.state.selected = opt.dataset.value || '';
+        this.$refs.input.value = this.state.selected;
+        // Update aria-selected attributes - CSS handles the styling via aria-selected:bg-accent
+        const prev = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
+        if (prev) prev.setAttribute('aria-selected', 'false');
+        opt.setAttribute('aria-selected', 'true');
+        // Update checkmark visibility
+        try {{
+            opts.forEach((o) => {{
+                const s = o.querySelector('.select-check svg');
+                if (s) s.style.display = 'none';
+            }});
+            const s = opt.querySelector('.select-check svg');
+            if (s) s.style.display = '';
+        }} catch (e) {{}}
+        if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ value: this.state.selected }}, bubbles: true }}));
+    }},
+    selectCurrent() {{
+        if (this.state.activeIndex > -1) {{
+            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+            this.updateFromValue(opts[this.state.activeIndex].dataset.value);
+            this.closeMenu();
+            return;
+        }}
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        if (opts.length > 0) {{
+            this.updateFromValue(opts[0].dataset.value);
+            this.closeMenu();
+        }}
+    }},
+    onKey(e) {{
+        const open = this.$refs.trigger?.getAttribute('aria-expanded') === 'true';
+        if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
+        if (!open) {{
+            if (e.key !== 'Enter' && e.key !== 'Escape') {{
+                e.preventDefault();
+                this.openMenu();
+            }}
+            return;
+        }}
+        e.preventDefault();
+        const vis = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        if (e.key === 'Escape') {{
+            this.closeMenu();
+            return;
+        }}
+        if (vis.length === 0) return;
+        let current = this.state.activeIndex > -1 ? vis.indexOf(vis[this.state.activeIndex]) : -1;
+        let next = current;
+        if (e.key === 'ArrowDown') next = Math.min(current + 1, vis.length - 1);
+        else if (e.key === 'ArrowUp') next = Math.max(current - 1, 0);
+        else if (e.key === 'Home') next = 0;
+        else if (e.key === 'End') next = vis.length - 1;
+        else if (e.key === 'Enter') {{
+            this.selectCurrent();
+            return;
+        }}
+        if (next !== current) {{
+            const el = vis[next];
+            const all = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+            this.setActive(all.indexOf(el));
+            el.scrollIntoView({{ block: 'nearest' }});
+        }}
+    }} 
+}}"""
+)
+
+
+# Virtualized variant: options come from a JSON data island and only the rows in view
+# (plus overscan) exist in the DOM. Rows are absolutely positioned inside a spacer sized
+# for the full list; ``activeIndex`` is an index into the full logical option list.
+_VIRTUAL_SELECT_ALPINE_DATA: js = js_template(
+    """{{
+    state: {{
+        open: false,
+        activeIndex: -1,
+        selected: '{initial_value_js}'
+    }},
+    rowHeight: {row_height},
+    overscan: {overscan},
+    // Parsed from the data island on first use: [[value, label, group, icon?], ...]
+    options: null,
+    groups: [],
+    // Display rows: an option index (>= 0) or a group heading (-1 - group index)
+    rows: [],
+    _rowOf: [],
+    _indexOf: null,
+    _rendered: '',
+    _scrollHandler: null,
+    _resizeHandler: null,
+    _clickOutsideHandler: null,
+    init() {{
+        this.$nextTick(() => {{
+            this.$refs.popover.setAttribute('aria-hidden', 'true');
+            this.$el.selectByValue = (v) => this.updateFromValue(v);
+        }});
+        // Click outside handler
+        this._clickOutsideHandler = (e) => {{
+            if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
+                this.closeMenu(false);
+            }}
+        }};
+    }},
+    destroy() {{
+        this._removePositionListeners();
+        if (this._clickOutsideHandler) {{
+            document.removeEventListener('click', this._clickOutsideHandler, true);
+        }}
+    }},
+    _positionPopover() {{
+        const trigger = this.$refs.trigger;
+        const popover = this.$refs.popover;
+        if (!trigger || !popover) return;
+        const rect = trigger.getBoundingClientRect();
+        const popoverRect = popover.getBoundingClientRect();
+        const viewportHeight = window.innerHeight;
+        const viewportWidth = window.innerWidth;
+        const spaceBelow = viewportHeight - rect.bottom;
+        const spaceAbove = rect.top;
+        const popoverHeight = popover.offsetHeight || 200;
+        let top;
+        if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
+            top = rect.bottom + 4;
+        }} else {{
+            top = rect.top - popoverHeight - 4;
+        }}
+        let left = rect.left;
+        if (left + popoverRect.width > viewportWidth) {{
+            left = Math.max(4, viewportWidth - popoverRect.width - 4);
+        }}
+        popover.style.top = top + 'px';
+        popover.style.left = left + 'px';
+        popover.style.minWidth = rect.width + 'px';
+    }},
+    _addPositionListeners() {{
+        this._scrollHandler = () => this._positionPopover();
+        this._resizeHandler = () => this._positionPopover();
+        window.addEventListener('scroll', this._scrollHandler, true);
+        window.addEventListener('resize', this._resizeHandler);
+    }},
+    _removePositionListeners() {{
+        if (this._scrollHandler) {{
+            window.removeEventListener('scroll', this._scrollHandler, true);
+            this._scrollHandler = null;
+        }}
+        if (this._resizeHandler) {{
+            window.removeEventListener('resize', this._resizeHandler);
+            this._resizeHandler = null;
+        }}
+    }},
+    _load() {{
+        if (this.options) return;
+        const data = JSON.parse(this.$refs.data.textContent);
+        this.options = data.options;
+        this.groups = data.groups;
+        this._indexOf = new Map();
+        let group = -1;
+        this.options.forEach((o, i) => {{
+            if (o[2] !== group && o[2] > -1) this.rows.push(-1 - o[2]);
+            group = o[2];
+            this._rowOf.push(this.rows.length);
+            this.rows.push(i);
+            if (!this._indexOf.has(o[0])) this._indexOf.set(o[0], i);
+        }});
+        this.$refs.spacer.style.height = this.rows.length * this.rowHeight + 'px';
+    }},
+    _optionId(i) {{
+        return this.$refs.listbox.id + '-opt-' + i;
+    }},
+    _renderRow(r) {{
+        const i = this.rows[r];
+        let el;
+        if (i < 0) {{
+            el = this.$refs.headingTemplate.content.firstElementChild.cloneNode(true);
+            el.textContent = this.groups[-1 - i];
+        }} else {{
+            const o = this.options[i];
+            const selected = o[0] === this.state.selected;
+            el = this.$refs.optionTemplate.content.firstElementChild.cloneNode(true);
+            el.id = this._optionId(i);
+            el.dataset.value = o[0];
+            el.dataset.index = i;
+            el.setAttribute('aria-posinset', i + 1);
+            el.setAttribute('aria-setsize', this.options.length);
+            el.setAttribute('aria-selected', String(selected));
+            if (i === this.state.activeIndex) el.classList.add('active');
+            const content = el.querySelector('.select-content');
+            if (o[3]) {{
+                content.classList.add('flex', 'items-center', 'gap-2');
+                content.innerHTML = o[3];
+                content.append(o[1]);
+            }} else {{
+                content.textContent = o[1];
+            }}
+            if (selected) el.querySelector('.select-check svg').style.display = '';
+        }}
+        el.style.top = r * this.rowHeight + 'px';
+        return el;
+    }},
+    renderWindow() {{
+        if (!this.options) return;
+        const box = this.$refs.listbox;
+        const offset = box.scrollTop - this.$refs.spacer.offsetTop;
+        const first = Math.max(0, Math.floor(offset / this.rowHeight) - this.overscan);
+        const last = Math.min(this.rows.length, Math.ceil((offset + box.clientHeight) / this.rowHeight) + this.overscan);
+        const key = [first, last, this.state.selected].join(':');
+        if (key !== this._rendered) {{
+            this._rendered = key;
+            const rows = [];
+            for (let r = first; r < last; r++) rows.push(this._renderRow(r));
+            this.$refs.spacer.replaceChildren(...rows);
+        }}
+        // The active option stays in the DOM, even scrolled away, for aria-activedescendant
+        const i = this.state.activeIndex;
+        if (i > -1 && !document.getElementById(this._optionId(i))) {{
+            this.$refs.spacer.append(this._renderRow(this._rowOf[i]));
+        }}
+    }},
+    _scrollToRow(r) {{
+        const box = this.$refs.listbox;
+        // Bring a group's heading into view along with its first option
+        const head = r > 0 && this.rows[r - 1] < 0 ? 1 : 0;
+        const top = this.$refs.spacer.offsetTop + (r - head) * this.rowHeight;
+        const bottom = this.$refs.spacer.offsetTop + (r + 1) * this.rowHeight;
+        if (top < box.scrollTop) box.scrollTop = top;
+        else if (bottom > box.scrollTop + box.clientHeight) box.scrollTop = bottom - box.clientHeight;
+    }},
+    setActive(i, scroll = true) {{
+        this.state.activeIndex = i;
+        if (i > -1 && scroll) this._scrollToRow(this._rowOf[i]);
+        this.renderWindow();
+        // Toggle the class in place: re-rendering under the pointer would swallow clicks
+        this.$refs.spacer.querySelector('.active')?.classList.remove('active');
+        const el = i > -1 ? document.getElementById(this._optionId(i)) : null;
+        if (el) {{
+            el.classList.add('active');
+            this.$refs.trigger?.setAttribute('aria-activedescendant', el.id);
+        }} else {{
+            this.$refs.trigger?.removeAttribute('aria-activedescendant');
+        }}
+    }},
+    setActiveFromEl(el) {{
+        if (el.dataset.index) this.setActive(Number(el.dataset.index), false);
+    }},
+    openMenu() {{
+        if ({disabled}) return;
+        this._load();
+        this.state.open = true;
+        document.dispatchEvent(new CustomEvent('select:popover', {{ detail: {{ source: this.$el }} }}));
+        this.$refs.popover.setAttribute('aria-hidden', 'false');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'true');
+        this.$nextTick(() => {{
+            this._positionPopover();
+            this._addPositionListeners();
+            document.addEventListener('click', this._clickOutsideHandler, true);
+            const i = this._indexOf.get(this.state.selected) ?? -1;
+            const box = this.$refs.listbox;
+            if (i > -1) box.scrollTop = this._rowOf[i] * this.rowHeight - (box.clientHeight - this.rowHeight) / 2;
+            this.setActive(i, false);
+        }});
+    }},
+    closeMenu(focus = true) {{
+        if (!this.state.open) return;
+        this.state.open = false;
+        this._removePositionListeners();
+        document.removeEventListener('click', this._clickOutsideHandler, true);
+        this.$refs.popover.setAttribute('aria-hidden', 'true');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'false');
+        this.setActive(-1);
+        if (focus) this.$refs.trigger?.focus();
+    }},
+    updateFromValue(val, triggerEvent = true) {{
+        this._load();
+        const o = this.options[this._indexOf.get(val) ?? 0];
+        if (!o) return;
+        if (o[3]) {{
+            const content = document.createElement('span');
+            content.className = 'flex items-center gap-2';
+            content.innerHTML = o[3];
+            content.append(o[1]);
+            this.$refs.selected.replaceChildren(content);
+        }} else {{
+            this.$refs.selected.textContent = o[1];
+        }}
+        this.state.selected = o[0];
+        this.$refs.input.value = this.state.selected;
+        this.renderWindow();
+        if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ value: this.state.selected }}, bubbles: true }}));
+    }},
+    selectCurrent() {{
+        this._load();
+        const o = this.options[this.state.activeIndex > -1 ? this.state.activeIndex : 0];
+        if (!o) return;
+        this.updateFromValue(o[0]);
+        this.closeMenu();
+    }},
+    onKey(e) {{
+        const open = this.$refs.trigger?.getAttribute('aria-expanded') === 'true';
+        if (!['ArrowDown', 'ArrowUp', 'PageDown', 'PageUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
+        if (!open) {{
+            if (e.key !== 'Enter' && e.key !== 'Escape') {{
+                e.preventDefault();
+                this.openMenu();
+            }}
+            return;
+        }}
+        e.preventDefault();
+        if (e.key === 'Escape') {{
+            this.closeMenu();
+            return;
+        }}
+        const count = this.options.length;
+        if (count === 0) return;
+        if (e.key === 'Enter') {{
+            this.selectCurrent();
+            return;
+        }}
+        const current = this.state.activeIndex;
+        const page = Math.max(1, Math.floor(this.$refs.listbox.clientHeight / this.rowHeight) - 1);
+        let next = current;
+        if (e.key === 'ArrowDown') next = Math.min(current + 1, count - 1);
+        else if (e.key === 'ArrowUp') next = Math.max(current - 1, 0);
+        else if (e.key === 'PageDown') next = Math.min(current + page, count - 1);
+        else if (e.key === 'PageUp') next = Math.max(current - page, 0);
+        else if (e.key === 'Home') next = 0;
+        else if (e.key === 'End') next = count - 1;
+        if (next !== current) this.setActive(next);
+    }}
+}}"""
+)
+
+
+def _option_template(class_: str | None = None, **attrs) -> Renderable:
+    """Return the ``<template>`` option row cloned for options shipped as JSON.
+
+    Args:
+        class_: Extra classes for the row (e.g. positioning for virtualized rows).
+        **attrs: Additional attributes for the row.
+
+    Returns:
+        Renderable: ``<template x-ref="optionTemplate">`` holding an empty option row.
+    """
+    return template(**{"x-ref": "optionTemplate"})[
+        div(
+            role="option",
+            aria_selected="false",
+            class_=merge_classes(f"{LISTBOX_OPTION_CLASSES} transition-none", class_),
+            **attrs,
+        )[
+            span(class_="select-content flex-1 truncate"),
+            span(class_="select-check absolute right-2.5 top-1/2 -translate-y-1/2")[
+                icon_check(class_="size-4 opacity-50", style="display: none;")
+            ],
+        ]
+    ]
+
+
 def select_component(
     *,
     id: str | None = None,
@@ -171,6 +766,11 @@ def select_component(
     width_class: str = "w-[180px]",
     scrollable: bool = False,
     empty_text: str = "No options available",
+    lazy_options: bool = False,
+    virtualized: bool = False,
+    row_height: int = 32,
+    overscan: int = 8,
+    lazy_hydrate: bool = False,
     class_: str | None = None,
     **attrs,
 ) -> Renderable:
@@ -188,6 +788,17 @@ def select_component(
         width_class: Tailwind width utilities shared by the trigger and popover.
         scrollable: Whether the listbox scrolls when overflowing its max height.
         empty_text: Message displayed when ``options`` does not contain selectable entries.
+        lazy_options: Ship the options as a JSON data island and build their DOM nodes
+            when the popover first opens. The selected label is still server-rendered,
+            so the initial HTML and Alpine init stay flat as the option count grows.
+        virtualized: Ship the options as a JSON data island and render only the rows in
+            view (plus ``overscan``) while the popover is open. For thousands of options;
+            the listbox always scrolls and rows are fixed-height and truncated.
+        row_height: Height in pixels of each virtualized row (option or group heading).
+        overscan: Rows rendered above and below the visible window when virtualized.
+        lazy_hydrate: Skip Alpine initialization until the component comes near the
+            viewport or is first hovered/focused; render ``lazy_hydration_script()``
+            once on the page.
         class_: Additional CSS classes appended to the root container.
         **attrs: Additional HTML attributes forwarded to the component root.
 
@@ -208,6 +819,8 @@ def select_component(
         return flat
 
     flat_items = flatten_items(options)
+    virtual = virtualized and bool(flat_items)
+    lazy = lazy_options and bool(flat_items) and not virtual
     base_id = _coerce_id(id)
     trigger_id = f"{base_id}-trigger"
     popover_id = f"{base_id}-popover"
@@ -291,27 +904,51 @@ def select_component(
         return div(
             role="option",
             **attrs,
-            class_=f"{LISTBOX_OPTION_BASE_CLASSES} transition-none aria-selected:bg-accent aria-selected:text-accent-foreground",
+            class_=f"{LISTBOX_OPTION_CLASSES} transition-none",
         )[*children]
 
-    group_index = 0
-    for entry in options:
-        if isinstance(entry, dict) and entry.get("type") == "group":
-            group_index += 1
-            heading_id = f"group-label-{base_id}-items-{group_index}"
-            heading = div(
-                role="heading",
-                id=heading_id,
-                class_=LISTBOX_SECTION_HEADING_CLASSES,
-            )[entry.get("label", "")]
-            option_nodes.append(
-                div(role="group", aria_labelledby=heading_id)[
-                    heading,
-                    *(build_item_node(it) for it in entry.get("items", [])),
-                ]
-            )
-        else:
-            option_nodes.append(build_item_node(entry))  # type: ignore[arg-type]
+    if virtual:
+        # Row templates cloned by the Alpine state; the options themselves stay in JSON.
+        has_selectable_item = True
+        row_style = f"height: {row_height}px"
+        option_nodes.append(div(class_="relative", **{"x-ref": "spacer"}))
+        option_nodes.append(_option_template("absolute inset-x-0", style=row_style))
+        option_nodes.append(
+            template(**{"x-ref": "headingTemplate"})[
+                div(
+                    role="presentation",
+                    class_=f"{LISTBOX_SECTION_HEADING_CLASSES} absolute inset-x-0",
+                    style=row_style,
+                )
+            ]
+        )
+    elif lazy:
+        has_selectable_item = True
+        template_nodes = [
+            _option_template(),
+            template(**{"x-ref": "groupTemplate"})[
+                div(role="group")[div(role="heading", class_=LISTBOX_SECTION_HEADING_CLASSES)]
+            ],
+        ]
+    else:
+        group_index = 0
+        for entry in options:
+            if isinstance(entry, dict) and entry.get("type") == "group":
+                group_index += 1
+                heading_id = f"group-label-{base_id}-items-{group_index}"
+                heading = div(
+                    role="heading",
+                    id=heading_id,
+                    class_=LISTBOX_SECTION_HEADING_CLASSES,
+                )[entry.get("label", "")]
+                option_nodes.append(
+                    div(role="group", aria_labelledby=heading_id)[
+                        heading,
+                        *(build_item_node(it) for it in entry.get("items", [])),
+                    ]
+                )
+            else:
+                option_nodes.append(build_item_node(entry))  # type: ignore[arg-type]
 
     if not has_selectable_item:
         option_nodes.append(
@@ -325,8 +962,12 @@ def select_component(
     pop_children: list[Renderable] = []
 
     listbox_classes = "p-1"
-    if scrollable:
+    if scrollable or virtual:
         listbox_classes = f"{listbox_classes} scrollbar overflow-y-auto max-h-64"
+    listbox_attrs: dict[str, str] = {}
+    if virtual:
+        listbox_classes = f"{listbox_classes} relative"
+        listbox_attrs["@scroll.passive"] = "renderWindow()"
 
     pop_children.append(
         div(
@@ -344,9 +985,12 @@ def select_component(
                 "@click": (
                     "$event.target.closest('[role=\"option\"]') && updateFromValue($event.target.closest('[role=\"option\"]').dataset.value); closeMenu()"
                 ),
+                **listbox_attrs,
             },
         )[*option_nodes]
     )
+    if lazy:
+        pop_children.extend(template_nodes)
 
     popover = div(
         id=popover_id,
@@ -379,198 +1023,19 @@ def select_component(
 
     initial_value_js = initial_value.replace("'", "\\'") if isinstance(initial_value, str) else ""
 
-    alpine_data: js = f"""{{
-        state: {{
-            open: false,
-            activeIndex: -1,
-            selected: '{initial_value_js}'
-        }},
-        _scrollHandler: null,
-        _resizeHandler: null,
-        _clickOutsideHandler: null,
-        init() {{
-            this.$nextTick(() => {{
-                this.updateFromValue(this.state.selected, false);
-                this.$refs.popover.setAttribute('aria-hidden', 'true');
-                this.$el.selectByValue = (v) => this.updateFromValue(v);
-            }});
-            // Click outside handler
-            this._clickOutsideHandler = (e) => {{
-                if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
-                    this.closeMenu(false);
-                }}
-            }};
-        }},
-        destroy() {{
-            this._removePositionListeners();
-            if (this._clickOutsideHandler) {{
-                document.removeEventListener('click', this._clickOutsideHandler, true);
-            }}
-        }},
-        _positionPopover() {{
-            const trigger = this.$refs.trigger;
-            const popover = this.$refs.popover;
-            if (!trigger || !popover) return;
-            const rect = trigger.getBoundingClientRect();
-            const popoverRect = popover.getBoundingClientRect();
-            const viewportHeight = window.innerHeight;
-            const viewportWidth = window.innerWidth;
-            const spaceBelow = viewportHeight - rect.bottom;
-            const spaceAbove = rect.top;
-            const popoverHeight = popover.offsetHeight || 200;
-            // Decide whether to show above or below
-            let top;
-            if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
-                top = rect.bottom + 4;
-            }} else {{
-                top = rect.top - popoverHeight - 4;
-            }}
-            // Horizontal positioning
-            let left = rect.left;
-            if (left + popoverRect.width > viewportWidth) {{
-                left = Math.max(4, viewportWidth - popoverRect.width - 4);
-            }}
-            popover.style.top = top + 'px';
-            popover.style.left = left + 'px';
-            popover.style.minWidth = rect.width + 'px';
-        }},
-        _addPositionListeners() {{
-            this._scrollHandler = () => this._positionPopover();
-            this._resizeHandler = () => this._positionPopover();
-            window.addEventListener('scroll', this._scrollHandler, true);
-            window.addEventListener('resize', this._resizeHandler);
-        }},
-        _removePositionListeners() {{
-            if (this._scrollHandler) {{
-                window.removeEventListener('scroll', this._scrollHandler, true);
-                this._scrollHandler = null;
-            }}
-            if (this._resizeHandler) {{
-                window.removeEventListener('resize', this._resizeHandler);
-                this._resizeHandler = null;
-            }}
-        }},
-        setActive(i) {{
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            if (this.state.activeIndex > -1 && opts[this.state.activeIndex]) {{
-                opts[this.state.activeIndex].classList.remove('active');
-            }}
-            this.state.activeIndex = i;
-            if (i > -1 && opts[i]) {{
-                const el = opts[i];
-                el.classList.add('active');
-                if (!el.id) el.id = this.$id('opt');
-                this.$refs.trigger?.setAttribute('aria-activedescendant', el.id);
-            }} else {{
-                this.$refs.trigger?.removeAttribute('aria-activedescendant');
-            }}
-        }},
-        setActiveFromEl(el) {{
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            const idx = opts.indexOf(el);
-            if (idx > -1) {{
-                this.setActive(idx);
-            }}
-        }},
-        openMenu() {{
-            if ({"true" if disabled else "false"}) return;
-            this.state.open = true;
-            document.dispatchEvent(new CustomEvent('select:popover', {{ detail: {{ source: this.$el }} }}));
-            this.$refs.popover.setAttribute('aria-hidden', 'false');
-            this.$refs.trigger?.setAttribute('aria-expanded', 'true');
-            this.$nextTick(() => {{
-                this._positionPopover();
-                this._addPositionListeners();
-                document.addEventListener('click', this._clickOutsideHandler, true);
-                const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
-                if (sel) {{
-                    const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                    this.setActive(opts.indexOf(sel));
-                    sel.scrollIntoView({{ block: 'nearest' }});
-                }}
-            }});
-        }},
-        closeMenu(focus = true) {{
-            if (!this.state.open) return;
-            this.state.open = false;
-            this._removePositionListeners();
-            document.removeEventListener('click', this._clickOutsideHandler, true);
-            this.$refs.popover.setAttribute('aria-hidden', 'true');
-            this.$refs.trigger?.setAttribute('aria-expanded', 'false');
-            this.setActive(-1);
-            if (focus) this.$refs.trigger?.focus();
-        }},
-        updateFromValue(val, triggerEvent = true) {{
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            const opt = opts.find((o) => o.dataset.value === val) || opts[0];
-            if (!opt) return;
-            const content = opt.querySelector('.select-content');
-            this.$refs.selected.innerHTML = content ? content.outerHTML : (opt.dataset.label || opt.innerHTML);
-            this.state.selected = opt.dataset.value || '';
-            this.$refs.input.value = this.state.selected;
-            // Update aria-selected attributes - CSS handles the styling via aria-selected:bg-accent
-            const prev = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
-            if (prev) prev.setAttribute('aria-selected', 'false');
-            opt.setAttribute('aria-selected', 'true');
-            // Update checkmark visibility
-            try {{
-                opts.forEach((o) => {{
-                    const s = o.querySelector('.select-check svg');
-                    if (s) s.style.display = 'none';
-                }});
-                const s = opt.querySelector('.select-check svg');
-                if (s) s.style.display = '';
-            }} catch (e) {{}}
-            if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ value: this.state.selected }}, bubbles: true }}));
-        }},
-        selectCurrent() {{
-            if (this.state.activeIndex > -1) {{
-                const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                this.updateFromValue(opts[this.state.activeIndex].dataset.value);
-                this.closeMenu();
-                return;
-            }}
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            if (opts.length > 0) {{
-                this.updateFromValue(opts[0].dataset.value);
-                this.closeMenu();
-            }}
-        }},
-        onKey(e) {{
-            const open = this.$refs.trigger?.getAttribute('aria-expanded') === 'true';
-            if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
-            if (!open) {{
-                if (e.key !== 'Enter' && e.key !== 'Escape') {{
-                    e.preventDefault();
-                    this.openMenu();
-                }}
-                return;
-            }}
-            e.preventDefault();
-            const vis = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            if (e.key === 'Escape') {{
-                this.closeMenu();
-                return;
-            }}
-            if (vis.length === 0) return;
-            let current = this.state.activeIndex > -1 ? vis.indexOf(vis[this.state.activeIndex]) : -1;
-            let next = current;
-            if (e.key === 'ArrowDown') next = Math.min(current + 1, vis.length - 1);
-            else if (e.key === 'ArrowUp') next = Math.max(current - 1, 0);
-            else if (e.key === 'Home') next = 0;
-            else if (e.key === 'End') next = vis.length - 1;
-            else if (e.key === 'Enter') {{
-                this.selectCurrent();
-                return;
-            }}
-            if (next !== current) {{
-                const el = vis[next];
-                const all = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                this.setActive(all.indexOf(el));
-                el.scrollIntoView({{ block: 'nearest' }});
-            }}
-        }} 
-    }}"""
+    if virtual:
+        alpine_data: js = _VIRTUAL_SELECT_ALPINE_DATA.format(
+            initial_value_js=initial_value_js,
+            disabled="true" if disabled else "false",
+            row_height=int(row_height),
+            overscan=int(overscan),
+        )
+    else:
+        alpine_data = _SELECT_ALPINE_DATA.format(
+            initial_value_js=initial_value_js,
+            disabled="true" if disabled else "false",
+            lazy="true" if lazy else "false",
+        )
 
     root_attrs: dict[str, str] = {
         "x-data": alpine_data,
@@ -578,6 +1043,8 @@ def select_component(
         "data-align": align,
         "@select:popover.window": "if($event.detail.source!==$el) closeMenu(false)",
     }
+    if lazy_hydrate:
+        root_attrs.update(LAZY_HYDRATE_ATTRS)
     root_attrs.update(attrs)
 
     container_classes = "select relative inline-flex"
@@ -587,7 +1054,245 @@ def select_component(
     if disabled:
         container_classes = f"{container_classes} cursor-not-allowed"
 
-    return div(id=base_id, class_=container_classes, **root_attrs)[hidden_input, trigger, popover]
+    data = data_island(option_data(options), **{"x-ref": "data"}) if virtual or lazy else None
+    return div(id=base_id, class_=container_classes, **root_attrs)[
+        hidden_input, trigger, popover, data
+    ]
+
+
+_MULTISELECT_ALPINE_DATA: js = js_template(
+    """{{
+    state: {{
+        open: false,
+        activeIndex: -1,
+        selected: {initial_values_js}
+    }},
+    _scrollHandler: null,
+    _resizeHandler: null,
+    _clickOutsideHandler: null,
+    init() {{
+        this.$nextTick(() => {{
+            this.updateTrigger(false);
+            this.$refs.popover.setAttribute('aria-hidden', 'true');
+            this.syncHiddenInputs();
+            this.applySelectionStyles();
+        }});
+        this._clickOutsideHandler = (e) => {{
+            if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
+                this.closeMenu(false);
+            }}
+        }};
+    }},
+    destroy() {{
+        this._removePositionListeners();
+        if (this._clickOutsideHandler) {{
+            document.removeEventListener('click', this._clickOutsideHandler, true);
+        }}
+    }},
+    _positionPopover() {{
+        const trigger = this.$refs.trigger;
+        const popover = this.$refs.popover;
+        if (!trigger || !popover) return;
+        const rect = trigger.getBoundingClientRect();
+        const popoverRect = popover.getBoundingClientRect();
+        const viewportHeight = window.innerHeight;
+        const viewportWidth = window.innerWidth;
+        const spaceBelow = viewportHeight - rect.bottom;
+        const spaceAbove = rect.top;
+        const popoverHeight = popover.offsetHeight || 200;
+        let top;
+        if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
+            top = rect.bottom + 4;
+        }} else {{
+            top = rect.top - popoverHeight - 4;
+        }}
+        let left = rect.left;
+        if (left + popoverRect.width > viewportWidth) {{
+            left = Math.max(4, viewportWidth - popoverRect.width - 4);
+        }}
+        popover.style.top = top + 'px';
+        popover.style.left = left + 'px';
+        popover.style.minWidth = rect.width + 'px';
+    }},
+    _addPositionListeners() {{
+        this._scrollHandler = () => this._positionPopover();
+        this._resizeHandler = () => this._positionPopover();
+        window.addEventListener('scroll', this._scrollHandler, true);
+        window.addEventListener('resize', this._resizeHandler);
+    }},
+    _removePositionListeners() {{
+        if (this._scrollHandler) {{
+            window.removeEventListener('scroll', this._scrollHandler, true);
+            this._scrollHandler = null;
+        }}
+        if (this._resizeHandler) {{
+            window.removeEventListener('resize', this._resizeHandler);
+            this._resizeHandler = null;
+        }}
+    }},
+    setActive(i) {{
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        if (this.state.activeIndex > -1 && opts[this.state.activeIndex]) {{
+            opts[this.state.activeIndex].classList.remove('active');
+        }}
+        this.state.activeIndex = i;
+        if (i > -1 && opts[i]) {{
+            const el = opts[i];
+            el.classList.add('active');
+            if (!el.id) el.id = this.$id('opt');
+            this.$refs.trigger?.setAttribute('aria-activedescendant', el.id);
+        }} else {{
+            this.$refs.trigger?.removeAttribute('aria-activedescendant');
+        }}
+    }},
+    setActiveFromEl(el) {{
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        const idx = opts.indexOf(el);
+        if (idx > -1) this.setActive(idx);
+    }},
+    openMenu() {{
+        if ({disabled}) return;
+        this.state.open = true;
+        document.dispatchEvent(new CustomEvent('multiselect:popover', {{ detail: {{ source: this.$el }} }}));
+        this.$refs.popover.setAttribute('aria-hidden', 'false');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'true');
+        this.$nextTick(() => {{
+            this._positionPopover();
+            this._addPositionListeners();
+            document.addEventListener('click', this._clickOutsideHandler, true);
+            const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
+            if (sel) {{
+                const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+                this.setActive(opts.indexOf(sel));
+                sel.scrollIntoView({{ block: 'nearest' }});
+            }}
+        }});
+    }},
+    closeMenu(focus = true) {{
+        if (!this.state.open) return;
+        this.state.open = false;
+        this._removePositionListeners();
+        document.removeEventListener('click', this._clickOutsideHandler, true);
+        this.$refs.popover.setAttribute('aria-hidden', 'true');
+        this.$refs.trigger?.setAttribute('aria-expanded', 'false');
+        this.setActive(-1);
+        if (focus) this.$refs.trigger?.focus();
+    }},
+    toggleFromEl(el) {{
+        if (!el) return;
+        const val = el.dataset.value || '';
+        this.toggleValue(val);
+    }},
+    toggleValue(val) {{
+        const idx = this.state.selected.indexOf(val);
+        if (idx > -1) this.state.selected.splice(idx, 1);
+        else this.state.selected.push(val);
+        this.applySelectionStyles();
+        this.updateTrigger();
+        this.syncHiddenInputs();
+    }},
+    applySelectionStyles() {{
+        try {{
+            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+            opts.forEach((o) => {{
+                const selected = this.state.selected.includes(o.dataset.value || '');
+                o.setAttribute('aria-selected', String(selected));
+                o.dataset.selected = selected ? 'true' : 'false';
+                const s = o.querySelector('.select-check svg');
+                if (s) s.style.display = selected ? '' : 'none';
+            }});
+        }} catch (e) {{}}
+    }},
+    updateTrigger(triggerEvent = true) {{
+        const ph = '{placeholder}';
+        const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        const labels = this.state.selected.map((v) => {{
+            const opt = opts.find((o) => o.dataset.value === v);
+            if (!opt) return v;
+            const content = opt.querySelector('.select-content');
+            const txt = (opt.dataset.label || (content ? content.textContent : opt.textContent) || '').trim();
+            return txt;
+        }}).filter(Boolean);
+        if (labels.length === 0) {{
+            this.$refs.selected.textContent = ph;
+            this.$refs.selected.removeAttribute('title');
+        }} else {{
+            const triggerWidth = this.$refs.trigger ? this.$refs.trigger.clientWidth : 180;
+            const approxCharPx = 8;
+            const maxChars = Math.max(10, Math.floor(triggerWidth / approxCharPx) - 8);
+            let acc = '';
+            let shown = [];
+            for (const lbl of labels) {{
+                const next = shown.length ? (acc + '; ' + lbl) : lbl;
+                if (next.length > maxChars) break;
+                shown.push(lbl);
+                acc = next;
+            }}
+            const hiddenCount = labels.length - shown.length;
+            const display = hiddenCount > 0 ? (shown.join('; ') + ' …') : shown.join('; ');
+            this.$refs.selected.textContent = display;
+            this.$refs.selected.setAttribute('title', labels.join('; '));
+        }}
+        if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ values: this.state.selected.slice() }}, bubbles: true }}));
+    }},
+    syncHiddenInputs() {{
+        try {{
+            const container = this.$refs.inputs;
+            while (container.firstChild) container.removeChild(container.firstChild);
+            const nm = '{input_name_js}';
+            this.state.selected.forEach((v) => {{
+                const i = document.createElement('input');
+                i.type = 'hidden';
+                i.name = nm;
+                i.value = v;
+                container.appendChild(i);
+            }});
+        }} catch (e) {{}}
+    }},
+    selectCurrent() {{
+        if (this.state.activeIndex > -1) {{
+            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+            const val = opts[this.state.activeIndex].dataset.value;
+            if (val != null) this.toggleValue(val);
+            return;
+        }}
+    }},
+    onKey(e) {{
+        const open = this.$refs.trigger?.getAttribute('aria-expanded') === 'true';
+        if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
+        if (!open) {{
+            if (e.key !== 'Enter' && e.key !== 'Escape') {{
+                e.preventDefault();
+                this.openMenu();
+            }}
+            return;
+        }}
+        e.preventDefault();
+        const vis = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+        if (e.key === 'Escape') {{
+            this.closeMenu();
+            return;
+        }}
+        if (vis.length === 0) return;
+        let current = this.state.activeIndex > -1 ? vis.indexOf(vis[this.state.activeIndex]) : -1;
+        let next = current;
+        if (e.key === 'ArrowDown') next = Math.min(current + 1, vis.length - 1);
+        else if (e.key === 'ArrowUp') next = Math.max(current - 1, 0);
+        else if (e.key === 'Home') next = 0;
+        else if (e.key === 'End') next = vis.length - 1;
+        else if (e.key === 'Enter') {{
+            this.selectCurrent();
+            return;
+        }}
+        if (next !== current) {{
+            const el = vis[next];
+            const all = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
+            this.setActive(all.indexOf(el));
+            el.scrollIntoView({{ block: 'nearest' }});
+        }}
+    }}
+}}"""
+)
 
 
 def multiselect_component(
@@ -654,14 +1359,6 @@ def multiselect_component(
     inputs_id = f"{base_id}-inputs"
 
     initial_values = values or []
-    option_classes = (
-        "relative flex cursor-pointer items-center gap-2 rounded-sm pl-2 py-1.5 pr-7.5 "
-        "text-sm outline-hidden select-none w-full truncate transition-none mb-1 "
-        f"{ICON_INLINE_CLASSES} "
-        f"{FOCUS_ACCENT_CLASSES} hover:bg-accent hover:text-accent-foreground "
-        "aria-selected:bg-accent aria-selected:text-accent-foreground "
-        "aria-selected:hover:bg-accent/80"
-    )
 
     # Trigger button
     trigger = button_component(
@@ -718,7 +1415,7 @@ def multiselect_component(
         return div(
             role="option",
             **attrs_i,
-            class_=option_classes,
+            class_=LISTBOX_MULTI_OPTION_CLASSES,
         )[*children]
 
     group_index = 0
@@ -801,237 +1498,12 @@ def multiselect_component(
     initial_values_js = "[" + ",".join(f"'{_escape_js(v)}'" for v in initial_values) + "]"
     input_name_js = (name or f"{base_id}-values").replace("'", "\\'")
 
-    alpine_data: js = f"""{{
-        state: {{
-            open: false,
-            activeIndex: -1,
-            selected: {initial_values_js}
-        }},
-        _scrollHandler: null,
-        _resizeHandler: null,
-        _clickOutsideHandler: null,
-        init() {{
-            this.$nextTick(() => {{
-                this.updateTrigger(false);
-                this.$refs.popover.setAttribute('aria-hidden', 'true');
-                this.syncHiddenInputs();
-                this.applySelectionStyles();
-            }});
-            this._clickOutsideHandler = (e) => {{
-                if (this.state.open && !this.$el.contains(e.target) && !this.$refs.popover.contains(e.target)) {{
-                    this.closeMenu(false);
-                }}
-            }};
-        }},
-        destroy() {{
-            this._removePositionListeners();
-            if (this._clickOutsideHandler) {{
-                document.removeEventListener('click', this._clickOutsideHandler, true);
-            }}
-        }},
-        _positionPopover() {{
-            const trigger = this.$refs.trigger;
-            const popover = this.$refs.popover;
-            if (!trigger || !popover) return;
-            const rect = trigger.getBoundingClientRect();
-            const popoverRect = popover.getBoundingClientRect();
-            const viewportHeight = window.innerHeight;
-            const viewportWidth = window.innerWidth;
-            const spaceBelow = viewportHeight - rect.bottom;
-            const spaceAbove = rect.top;
-            const popoverHeight = popover.offsetHeight || 200;
-            let top;
-            if (spaceBelow >= popoverHeight || spaceBelow >= spaceAbove) {{
-                top = rect.bottom + 4;
-            }} else {{
-                top = rect.top - popoverHeight - 4;
-            }}
-            let left = rect.left;
-            if (left + popoverRect.width > viewportWidth) {{
-                left = Math.max(4, viewportWidth - popoverRect.width - 4);
-            }}
-            popover.style.top = top + 'px';
-            popover.style.left = left + 'px';
-            popover.style.minWidth = rect.width + 'px';
-        }},
-        _addPositionListeners() {{
-            this._scrollHandler = () => this._positionPopover();
-            this._resizeHandler = () => this._positionPopover();
-            window.addEventListener('scroll', this._scrollHandler, true);
-            window.addEventListener('resize', this._resizeHandler);
-        }},
-        _removePositionListeners() {{
-            if (this._scrollHandler) {{
-                window.removeEventListener('scroll', this._scrollHandler, true);
-                this._scrollHandler = null;
-            }}
-            if (this._resizeHandler) {{
-                window.removeEventListener('resize', this._resizeHandler);
-                this._resizeHandler = null;
-            }}
-        }},
-        setActive(i) {{
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            if (this.state.activeIndex > -1 && opts[this.state.activeIndex]) {{
-                opts[this.state.activeIndex].classList.remove('active');
-            }}
-            this.state.activeIndex = i;
-            if (i > -1 && opts[i]) {{
-                const el = opts[i];
-                el.classList.add('active');
-                if (!el.id) el.id = this.$id('opt');
-                this.$refs.trigger?.setAttribute('aria-activedescendant', el.id);
-            }} else {{
-                this.$refs.trigger?.removeAttribute('aria-activedescendant');
-            }}
-        }},
-        setActiveFromEl(el) {{
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            const idx = opts.indexOf(el);
-            if (idx > -1) this.setActive(idx);
-        }},
-        openMenu() {{
-            if ({"true" if disabled else "false"}) return;
-            this.state.open = true;
-            document.dispatchEvent(new CustomEvent('multiselect:popover', {{ detail: {{ source: this.$el }} }}));
-            this.$refs.popover.setAttribute('aria-hidden', 'false');
-            this.$refs.trigger?.setAttribute('aria-expanded', 'true');
-            this.$nextTick(() => {{
-                this._positionPopover();
-                this._addPositionListeners();
-                document.addEventListener('click', this._clickOutsideHandler, true);
-                const sel = this.$refs.listbox.querySelector('[role="option"][aria-selected="true"]');
-                if (sel) {{
-                    const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                    this.setActive(opts.indexOf(sel));
-                    sel.scrollIntoView({{ block: 'nearest' }});
-                }}
-            }});
-        }},
-        closeMenu(focus = true) {{
-            if (!this.state.open) return;
-            this.state.open = false;
-            this._removePositionListeners();
-            document.removeEventListener('click', this._clickOutsideHandler, true);
-            this.$refs.popover.setAttribute('aria-hidden', 'true');
-            this.$refs.trigger?.setAttribute('aria-expanded', 'false');
-            this.setActive(-1);
-            if (focus) this.$refs.trigger?.focus();
-        }},
-        toggleFromEl(el) {{
-            if (!el) return;
-            const val = el.dataset.value || '';
-            this.toggleValue(val);
-        }},
-        toggleValue(val) {{
-            const idx = this.state.selected.indexOf(val);
-            if (idx > -1) this.state.selected.splice(idx, 1);
-            else this.state.selected.push(val);
-            this.applySelectionStyles();
-            this.updateTrigger();
-            this.syncHiddenInputs();
-        }},
-        applySelectionStyles() {{
-            try {{
-                const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                opts.forEach((o) => {{
-                    const selected = this.state.selected.includes(o.dataset.value || '');
-                    o.setAttribute('aria-selected', String(selected));
-                    o.dataset.selected = selected ? 'true' : 'false';
-                    const s = o.querySelector('.select-check svg');
-                    if (s) s.style.display = selected ? '' : 'none';
-                }});
-            }} catch (e) {{}}
-        }},
-        updateTrigger(triggerEvent = true) {{
-            const ph = '{placeholder}';
-            const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            const labels = this.state.selected.map((v) => {{
-                const opt = opts.find((o) => o.dataset.value === v);
-                if (!opt) return v;
-                const content = opt.querySelector('.select-content');
-                const txt = (opt.dataset.label || (content ? content.textContent : opt.textContent) || '').trim();
-                return txt;
-            }}).filter(Boolean);
-            if (labels.length === 0) {{
-                this.$refs.selected.textContent = ph;
-                this.$refs.selected.removeAttribute('title');
-            }} else {{
-                const triggerWidth = this.$refs.trigger ? this.$refs.trigger.clientWidth : 180;
-                const approxCharPx = 8;
-                const maxChars = Math.max(10, Math.floor(triggerWidth / approxCharPx) - 8);
-                let acc = '';
-                let shown = [];
-                for (const lbl of labels) {{
-                    const next = shown.length ? (acc + '; ' + lbl) : lbl;
-                    if (next.length > maxChars) break;
-                    shown.push(lbl);
-                    acc = next;
-                }}
-                const hiddenCount = labels.length - shown.length;
-                const display = hiddenCount > 0 ? (shown.join('; ') + ' …') : shown.join('; ');
-                this.$refs.selected.textContent = display;
-                this.$refs.selected.setAttribute('title', labels.join('; '));
-            }}
-            if (triggerEvent) this.$el.dispatchEvent(new CustomEvent('change', {{ detail: {{ values: this.state.selected.slice() }}, bubbles: true }}));
-        }},
-        syncHiddenInputs() {{
-            try {{
-                const container = this.$refs.inputs;
-                while (container.firstChild) container.removeChild(container.firstChild);
-                const nm = '{input_name_js}';
-                this.state.selected.forEach((v) => {{
-                    const i = document.createElement('input');
-                    i.type = 'hidden';
-                    i.name = nm;
-                    i.value = v;
-                    container.appendChild(i);
-                }});
-            }} catch (e) {{}}
-        }},
-        selectCurrent() {{
-            if (this.state.activeIndex > -1) {{
-                const opts = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                const val = opts[this.state.activeIndex].dataset.value;
-                if (val != null) this.toggleValue(val);
-                return;
-            }}
-        }},
-        onKey(e) {{
-            const open = this.$refs.trigger?.getAttribute('aria-expanded') === 'true';
-            if (!['ArrowDown', 'ArrowUp', 'Home', 'End', 'Enter', 'Escape'].includes(e.key)) return;
-            if (!open) {{
-                if (e.key !== 'Enter' && e.key !== 'Escape') {{
-                    e.preventDefault();
-                    this.openMenu();
-                }}
-                return;
-            }}
-            e.preventDefault();
-            const vis = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-            if (e.key === 'Escape') {{
-                this.closeMenu();
-                return;
-            }}
-            if (vis.length === 0) return;
-            let current = this.state.activeIndex > -1 ? vis.indexOf(vis[this.state.activeIndex]) : -1;
-            let next = current;
-            if (e.key === 'ArrowDown') next = Math.min(current + 1, vis.length - 1);
-            else if (e.key === 'ArrowUp') next = Math.max(current - 1, 0);
-            else if (e.key === 'Home') next = 0;
-            else if (e.key === 'End') next = vis.length - 1;
-            else if (e.key === 'Enter') {{
-                this.selectCurrent();
-                return;
-            }}
-            if (next !== current) {{
-                const el = vis[next];
-                const all = Array.from(this.$refs.listbox.querySelectorAll('[role="option"]'));
-                this.setActive(all.indexOf(el));
-                el.scrollIntoView({{ block: 'nearest' }});
-            }}
-        }}
-    }}"""
+    alpine_data: js = _MULTISELECT_ALPINE_DATA.format(
+        initial_values_js=initial_values_js,
+        disabled="true" if disabled else "false",
+        placeholder=placeholder,
+        input_name_js=input_name_js,
+    )
 
     root_attrs: dict[str, str] = {
         "x-data": alpine_data,
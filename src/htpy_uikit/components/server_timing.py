@@ -0,0 +1,218 @@
+"""Server-Timing headers for page renders: build, serialization and cache lookups.
+
+Browser devtools show a response's ``Server-Timing`` entries in the network panel's
+Timing tab. A ``ServerTiming`` collects them for one request; ``render_timed`` builds and
+serializes a page under it, ``timed_section`` times one part of the page (its build and
+its serialization), and fragment cache lookups reported through ``record_cache``
+are summed into a ``cache`` entry::
+
+    app = Flask(__name__)
+    init_flask(app)
+
+    @app.get("/")
+    def index():
+        return render_timed(lambda: page(sidebar=timed_section("sidebar", sidebar)))
+
+For ASGI apps, wrap the app in ``ServerTimingMiddleware``. Outside a timed request the
+helpers render normally and record nothing.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from htpy import Node
+from htpy import render_node
+from markupsafe import Markup
+
+from ._cache_events import listen_cache_lookups
+from ._instrument import observe_render
+
+HEADER = "Server-Timing"
+
+_NON_TOKEN_RE = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]+")
+
+_current: ContextVar[ServerTiming | None] = ContextVar("htpy_uikit_server_timing", default=None)
+
+
+class ServerTiming:
+    """Timing entries for one response, rendered as a ``Server-Timing`` header value."""
+
+    def __init__(self) -> None:
+        # name -> [seconds, description]; insertion order is header order.
+        self.entries: dict[str, list[Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_seconds = 0.0
+
+    def add(self, name: str, seconds: float, description: str | None = None) -> None:
+        """Add ``seconds`` to entry ``name`` (created on first use); replace its description."""
+        entry = self.entries.setdefault(_NON_TOKEN_RE.sub("-", name), [0.0, None])
+        entry[0] += seconds
+        if description is not None:
+            entry[1] = description
+
+    @contextmanager
+    def measure(self, name: str, description: str | None = None) -> Iterator[None]:
+        """Time the block into entry ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, description)
+
+    def _record_cache(self, cache: str, hit: bool, seconds: float) -> None:
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        self.cache_seconds += seconds
+
+    def header(self) -> str:
+        """The header value, e.g. ``build;dur=12.31;desc="Tree construction", ...``."""
+        parts = []
+        for name, (seconds, description) in self.entries.items():
+            part = f"{name};dur={seconds * 1000:.2f}"
+            if description:
+                part += f';desc="{_quote(description)}"'
+            parts.append(part)
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            parts.append(
+                f"cache;dur={self.cache_seconds * 1000:.2f};"
+                f'desc="Fragment cache: {self.cache_hits}/{lookups} hits"'
+            )
+        return ", ".join(parts)
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _latin1(value: str) -> bytes:
+    # Header values are latin-1; section names outside it degrade to "?".
+    return value.encode("latin-1", "replace")
+
+
+@contextmanager
+def server_timing() -> Iterator[ServerTiming]:
+    """Make a new ``ServerTiming`` current for the block."""
+    timing = ServerTiming()
+    token = _current.set(timing)
+    try:
+        yield timing
+    finally:
+        _current.reset(token)
+
+
+def current_timing() -> ServerTiming | None:
+    """The ``ServerTiming`` of the current request, if one is active."""
+    return _current.get()
+
+
+def render_timed(render: Callable[[], Node]) -> Markup:
+    """Build ``render()`` and serialize it, timing both phases and any cache lookups.
+
+    Args:
+        render: Zero-argument callable returning the page node.
+
+    Returns:
+        Markup: The rendered HTML.
+    """
+    timing = _current.get()
+    if timing is None:
+        return render_node(render())
+    # Page phases first in the header, ahead of the sections timed while building.
+    timing.add("build", 0.0, "Tree construction")
+    timing.add("serialize", 0.0, "Serialization")
+    with listen_cache_lookups(timing._record_cache):
+        with timing.measure("build"):
+            node = render()
+        with timing.measure("serialize"):
+            return render_node(node)
+
+
+def timed_section(name: str, render: Callable[[], Node]) -> Node:
+    """Build ``render()`` now and time it, plus its later serialization, as entry ``name``.
+
+    Section entries overlap the page's ``build`` and ``serialize`` entries; the
+    description splits the section's own time between the two phases.
+
+    Args:
+        name: Entry name, e.g. ``"sidebar"``.
+        render: Zero-argument callable returning the section node.
+
+    Returns:
+        Node: The section, unchanged when no timing is active.
+    """
+    timing = _current.get()
+    if timing is None:
+        return render()
+    start = time.perf_counter()
+    node = render()
+    built = time.perf_counter() - start
+    timing.add(name, built, f"{name} (build {built * 1000:.2f} ms)")
+
+    def around(chunks: Iterator[str]) -> Iterator[str]:
+        begin = time.perf_counter()
+        html = "".join(chunks)
+        serialized = time.perf_counter() - begin
+        description = f"{name} (build {built * 1000:.2f} ms, serialize {serialized * 1000:.2f} ms)"
+        timing.add(name, serialized, description)
+        yield html
+
+    return observe_render(node, around)
+
+
+def init_flask(app: Any) -> None:
+    """Time every request of the Flask ``app`` and send its ``Server-Timing`` header."""
+    from flask import g
+
+    @app.before_request
+    def _start_server_timing() -> None:
+        g._server_timing_token = _current.set(ServerTiming())
+
+    @app.after_request
+    def _send_server_timing(response: Any) -> Any:
+        timing = _current.get()
+        if timing is not None and (value := timing.header()):
+            response.headers[HEADER] = _latin1(value).decode("latin-1")
+        return response
+
+    @app.teardown_request
+    def _stop_server_timing(exc: BaseException | None) -> None:
+        token = g.pop("_server_timing_token", None)
+        if token is not None:
+            _current.reset(token)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware timing each HTTP request and adding its ``Server-Timing`` header.
+
+    The header is added when the response starts, so it covers pages rendered before
+    the response is sent (not streamed bodies).
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with server_timing() as timing:
+
+            async def send_with_header(message: dict[str, Any]) -> None:
+                if message["type"] == "http.response.start" and (value := timing.header()):
+                    headers = [*message.get("headers", ()), (b"server-timing", _latin1(value))]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_header)
@@ -10,6 +10,7 @@ from htpy import label
 from htpy import span
 
 from ._utils import merge_classes
+from .hydrate import LAZY_HYDRATE_ATTRS
 
 
 def slider(
@@ -24,6 +25,7 @@ def slider(
     label_text: str | None = None,
     label_alias: str | None = None,
     show_value: bool = False,
+    lazy_hydrate: bool = False,
     class_: str | None = None,
     **attrs,
 ) -> Renderable:
@@ -40,6 +42,9 @@ def slider(
         label_text: Optional label displayed next to the slider.
         label_alias: Backwards-compatible alias for ``label_text``.
         show_value: Whether to render the live value text.
+        lazy_hydrate: Skip Alpine initialization until the slider comes near the
+            viewport or is first hovered/focused; render ``lazy_hydration_script()``
+            once on the page.
         class_: Extra classes appended to the visual track wrapper.
         **attrs: Additional HTML attributes forwarded to the ``input`` element.
 
@@ -85,12 +90,17 @@ def slider(
         base_wrapper = base_wrapper + " opacity-60 cursor-not-allowed"
     wrapper_class = merge_classes(base_wrapper, class_)
 
-    # Alpine container that owns the state and updates the CSS variable
+    # Alpine container that owns the state and updates the CSS variable. The initial
+    # position is also rendered server-side so the track is right before Alpine runs.
+    percent = (value - min) / (max - min) * 100 if max != min else 0
     container_attrs = {
         "x-data": f"{{ val: {value} }}",
         "x-effect": f"$el.style.setProperty('--slider-value', (((val-({min}))/(({max})-({min})))*100)+'%')",
+        "style": f"--slider-value: {percent:g}%",
         "class_": "flex items-center gap-2 w-full",
     }
+    if lazy_hydrate:
+        container_attrs.update(LAZY_HYDRATE_ATTRS)
 
     # Build the component
     elements = []
@@ -152,7 +162,9 @@ def slider(
         expr = (
             "(String(val).endsWith('%') ? Math.round(parseFloat(val)/100*({max}-{min})+{min}) : val)"
         ).format(min=min, max=max)
-        container_children.append(span(class_="text-sm text-muted-foreground", **{"x-text": expr}))
+        container_children.append(
+            span(class_="text-sm text-muted-foreground", **{"x-text": expr})[str(value)]
+        )
 
     elements.append(div(**container_attrs)[*container_children])
 
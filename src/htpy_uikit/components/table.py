@@ -8,6 +8,7 @@ from htpy import th
 from htpy import thead
 from htpy import tr
 
+from ._styles import TABLE_BASE_CLASSES
 from ._utils import merge_classes
 
 
@@ -30,28 +31,8 @@ def table_component(
         Renderable: Scrollable wrapper containing the table markup.
     """
 
-    # Base classes - using Tailwind equivalent of Basecoat table
-    base_classes = (
-        "w-full caption-bottom text-sm border-border "
-        # Header border color
-        "[&_thead_tr]:border-b [&_thead_tr]:border-border/70 "
-        # Body row borders: subtle but visible
-        "[&_tbody_tr]:border-border/60 [&_tr]:border-b [&_tr]:transition-colors "
-        "[&_tr]:hover:bg-muted/50 "
-        # Footer styling and border color
-        "[&_tfoot]:bg-muted/50 [&_tfoot]:border-t [&_tfoot]:border-border/70 [&_tfoot]:font-medium "
-        "[&_tfoot_tr]:last:border-b-0 "
-        # Cell and header text/layout
-        "[&_th]:text-foreground [&_th]:h-10 [&_th]:px-2 [&_th]:text-left [&_th]:align-middle "
-        "[&_th]:font-medium [&_th]:whitespace-nowrap [&_th:has([role=checkbox])]:pr-0 "
-        "[&_th_[role=checkbox]]:translate-y-[2px] [&_td]:p-2 [&_td]:align-middle "
-        "[&_td]:whitespace-nowrap [&_td:has([role=checkbox])]:pr-0 "
-        "[&_td_[role=checkbox]]:translate-y-[2px] [&_caption]:text-muted-foreground "
-        "[&_caption]:mt-4 [&_caption]:text-sm"
-    )
-
     # Add custom classes
-    attrs["class_"] = merge_classes(base_classes, class_)
+    attrs["class_"] = merge_classes(TABLE_BASE_CLASSES, class_)
 
     # Build table header
     header_cells = [th(scope="col")[header] for header in headers]
@@ -1,3 +1,6 @@
+from urllib.parse import quote
+
+from htpy import BaseElement
 from htpy import Node
 from htpy import Renderable
 from htpy import button
@@ -12,6 +15,39 @@ from ._types import TabContentItem
 from ._utils import merge_classes
 
 
+def _is_deferred(content) -> bool:
+    # htpy elements are callable too (calling one sets attributes), so exclude them.
+    return callable(content) and not isinstance(content, BaseElement)
+
+
+def _render_content(content) -> Node:
+    # Callable content is only evaluated for panels that are actually rendered.
+    if _is_deferred(content):
+        content = content()
+    return div[""] if content is None else content
+
+
+def tab_panel(tabs_content: list[TabContentItem], value: str) -> Node:
+    """Render the content of one tab, for the endpoint a lazy panel loads from.
+
+    Return it from the URL given as the item's ``url`` (or ``panel_url``); it is swapped
+    into the panel as is. Only this tab's ``content`` callable is called.
+
+    Args:
+        tabs_content: The same tab items passed to ``tabs``.
+        value: Value of the tab to render.
+
+    Returns:
+        Node: The panel content.
+    """
+    for item in tabs_content:
+        if item.get("value") == value:
+            if item.get("content") is None:
+                raise ValueError(f"Tab {value!r} has no content to render")
+            return _render_content(item["content"])
+    raise ValueError(f"No tab with value {value!r}")
+
+
 def tabs(
     tabs_content: list[TabContentItem],
     active_tab: str,
@@ -20,17 +56,29 @@ def tabs(
     class_: str | None = None,
     disabled_values: set[str] | None = None,
     background: bool = True,
+    panel_url: str | None = None,
+    loading_content: Node = None,
     **kwargs,
 ) -> Renderable:
     """Render Basecoat-style tabs with Alpine state management.
 
+    Panels are lazy when their item has a ``url``, or when ``panel_url`` is set and
+    the item's ``content`` is a callable. Only the active panel renders inline; the
+    others render ``loading_content`` and fetch their content with htmx the first time
+    they are activated, then keep it (switching back does not refetch). The endpoint
+    returns ``tab_panel(tabs_content, value)``.
+
     Args:
-        tabs_content: Sequence of tab dictionaries with ``value``, ``label``, and ``content``.
+        tabs_content: Sequence of tab dictionaries with ``value``, ``label``, and
+            ``content`` (a node, or a callable returning one) and optionally ``url``.
         active_tab: Value of the currently selected tab.
         id: Optional id for the tabs container; generated from content when omitted.
         class_: Extra classes appended to the tabs container.
         disabled_values: Tab values that should be disabled.
         background: Whether to wrap tab panels in card-like backgrounds.
+        panel_url: URL for lazy panels without their own ``url``; ``{value}`` is
+            replaced with the URL-quoted tab value (e.g. ``"/dashboard/tab?tab={value}"``).
+        loading_content: Placeholder shown in a lazy panel until it loads.
         **kwargs: Additional HTML attributes forwarded to the tabs container.
 
     Returns:
@@ -43,6 +91,7 @@ def tabs(
     disabled_values = disabled_values or set()
 
     normalized: list[tuple[str, Node, Node]] = []
+    urls: list[str | None] = []
     for item in tabs_content:
         if not isinstance(item, dict):
             raise TypeError("tabs_content must be a list of TabContentItem mappings")
@@ -53,7 +102,11 @@ def tabs(
             raise ValueError("TabContentItem missing required 'value' key")
         if item.get("disabled"):
             disabled_values.add(v)
-        normalized.append((v, lbl or "", cnt or div[""]))
+        url = item.get("url")
+        if url is None and panel_url is not None and _is_deferred(cnt):
+            url = panel_url.format(value=quote(v, safe=""))
+        urls.append(url)
+        normalized.append((v, lbl or "", cnt))
 
     # Determine active index after normalization
     active_index = next((i for i, (val, _, _) in enumerate(normalized) if val == active_tab), 0)
@@ -80,19 +133,34 @@ def tabs(
     # Create panels with Alpine.js show/hide
     panel_elements = []
     for index, (tab_value, tab_label, tab_content) in enumerate(normalized):
+        url = urls[index]
+        panel_attrs = {
+            "role": "tabpanel",
+            "id": f"{container_id}-panel-{index}",
+            "aria-labelledby": f"{container_id}-tab-{index}",
+            "tabindex": "-1",
+            ":aria-selected": f"activeTab === {index}",
+            ":hidden": f"activeTab !== {index}",
+        }
+        if url is None or (index == active_index and tab_content is not None):
+            body = _render_content(tab_content)
+        else:
+            # Lazy panel: htmx fetches it once, on the first activation (or on load when it
+            # starts active without inline content). The event does not bubble, so lazy
+            # tabs nested inside a loaded panel cannot trigger this one.
+            panel_attrs.update({"hx-get": url, "hx-swap": "innerHTML", "hx-trigger": "load"})
+            if index != active_index:
+                panel_attrs["hx-trigger"] = "tab-activate once"
+                panel_attrs["x-effect"] = (
+                    f"activeTab === {index} && $el.dispatchEvent(new Event('tab-activate'))"
+                )
+            body = loading_content or div(class_="p-4 text-sm text-muted-foreground")["Loading..."]
         # Panel background and container styling to match card component (no extra padding)
         panel_elements.append(
             div(
-                **{
-                    "role": "tabpanel",
-                    "id": f"{container_id}-panel-{index}",
-                    "aria-labelledby": f"{container_id}-tab-{index}",
-                    "tabindex": "-1",
-                    ":aria-selected": f"activeTab === {index}",
-                    ":hidden": f"activeTab !== {index}",
-                },
+                **panel_attrs,
                 class_=(f"mt-3 outline-none {CARD_BASE_CLASSES}" if background else "mt-3"),
-            )[tab_content]
+            )[body]
         )
 
     # Tab list container with keyboard navigation
@@ -5,7 +5,7 @@ from htpy import div
 from htpy import span
 from htpy import textarea
 
-from ._styles import INPUT_BASE_CLASSES
+from ._styles import TEXTAREA_BASE_CLASSES
 from .label import label_component
 
 
@@ -46,12 +46,8 @@ def textarea_component(
         Renderable: Textarea node optionally wrapped with label/error nodes.
     """
 
-    # Use shared input base classes (textarea shares same styling as input)
-    # Adjust height and padding for multi-line input
-    base_classes = INPUT_BASE_CLASSES.replace("h-9", "min-h-[60px]").replace("py-1", "py-2")
-
     # Build class list
-    classes = [base_classes]
+    classes = [TEXTAREA_BASE_CLASSES]
 
     # Add custom classes
     if class_:
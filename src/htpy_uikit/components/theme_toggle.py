@@ -2,38 +2,41 @@ from htpy import button
 from htpy import div
 from sourcetypes import js
 
+from ._utils import inline_js
 from .icons import icon_moon
 from .icons import icon_sun
 
+_THEME_TOGGLE_ALPINE_DATA: js = inline_js(
+    """
+{
+    darkMode: (localStorage.getItem('color-theme') ?? 'dark') === 'dark',
+    toggle() {
+        this.darkMode = !this.darkMode;
+        if (this.darkMode) {
+            document.documentElement.classList.add('dark');
+            localStorage.setItem('color-theme', 'dark');
+        } else {
+            document.documentElement.classList.remove('dark');
+            localStorage.setItem('color-theme', 'light');
+        }
+    },
+    init() {
+        if (this.darkMode) {
+            document.documentElement.classList.add('dark');
+        } else {
+            document.documentElement.classList.remove('dark');
+        }
+    }
+}
+"""
+)
+
 
 def theme_toggle():
     """Render an Alpine-powered button that toggles dark/light theme."""
 
-    x_data: js = """
-    {
-        darkMode: (localStorage.getItem('color-theme') ?? 'dark') === 'dark',
-        toggle() {
-            this.darkMode = !this.darkMode;
-            if (this.darkMode) {
-                document.documentElement.classList.add('dark');
-                localStorage.setItem('color-theme', 'dark');
-            } else {
-                document.documentElement.classList.remove('dark');
-                localStorage.setItem('color-theme', 'light');
-            }
-        },
-        init() {
-            if (this.darkMode) {
-                document.documentElement.classList.add('dark');
-            } else {
-                document.documentElement.classList.remove('dark');
-            }
-        }
-    }
-    """
-
     return div(
-        x_data=x_data,
+        x_data=_THEME_TOGGLE_ALPINE_DATA,
         x_init="init()",
         class_="cursor-pointer",
     )[
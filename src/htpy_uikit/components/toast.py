@@ -17,12 +17,205 @@ from sourcetypes import js
 
 from ._types import TAlign
 from ._types import TCategory
+from ._utils import inline_css
+from ._utils import inline_js
 from ._utils import merge_classes
 from .button import button_component
 from .icons import toast_icon_error
 from .icons import toast_icon_info
 from .icons import toast_icon_success
 
+# Alpine state and methods with enhanced animations
+_TOASTER_ALPINE_DATA: js = inline_js(
+    """
+{
+    toasts: [],
+    nextId: 1,
+    isPaused: false,
+    hoverCount: 0,
+    addToast(cfg) {
+        cfg = cfg || {};
+        const id = this.nextId++;
+        const d = (cfg.duration === -1) ? -1 : (cfg.duration ?? (cfg.category === 'error' ? 8000 : 5000));
+        const toast = {
+            id,
+            open: true,
+            duration: d,
+            index: this.toasts.length,
+            remainingTime: d,
+            timeoutId: null,
+            startTime: null,
+            ...cfg
+        };
+        // Prepend so newest appears on top
+        this.toasts.unshift(toast);
+        if (d !== -1 && !this.isPaused) {
+            toast.startTime = Date.now();
+            toast.timeoutId = setTimeout(() => this.close(id), d);
+        }
+        this.updateIndices();
+    },
+    onToastEnter() {
+        this.hoverCount++;
+        if (!this.isPaused) {
+            this.pauseAll();
+        }
+    },
+    onToastLeave() {
+        if (this.hoverCount > 0) this.hoverCount--;
+        if (this.hoverCount === 0) {
+            this.resumeAll();
+        }
+    },
+    pauseAll() {
+        if (this.isPaused) return;
+        this.isPaused = true;
+        this.toasts.forEach((t) => {
+            if (!t.open || t.duration === -1) return;
+            if (t.timeoutId) {
+                clearTimeout(t.timeoutId);
+                t.timeoutId = null;
+                if (t.startTime != null) {
+                    t.remainingTime = t.remainingTime - (Date.now() - t.startTime);
+                }
+            }
+        });
+    },
+    resumeAll() {
+        if (!this.isPaused) return;
+        this.isPaused = false;
+        this.toasts.forEach((t) => {
+            if (!t.open || t.duration === -1 || t.timeoutId) return;
+            if (t.remainingTime > 0) {
+                t.startTime = Date.now();
+                t.timeoutId = setTimeout(() => this.close(t.id), t.remainingTime);
+            } else {
+                this.close(t.id);
+            }
+        });
+    },
+    close(id) {
+        const i = this.toasts.findIndex(t => t.id === id);
+        if (i > -1) {
+            const t = this.toasts[i];
+            if (t.timeoutId) clearTimeout(t.timeoutId);
+            t.timeoutId = null;
+            // guard against double-close jitter
+            if (!t.open) return;
+            t.open = false;
+        }
+    },
+    updateIndices() {
+        this.toasts.forEach((toast, i) => {
+            toast.index = i;
+        });
+    },
+    finalizeCloseOnTransition(id, evt) {
+        // Only act on the wrapper element's own transition end
+        if (evt && evt.target !== evt.currentTarget) return;
+        const i = this.toasts.findIndex(t => t.id === id);
+        if (i === -1) return;
+        const t = this.toasts[i];
+        // If it's still open or already removed, ignore
+        if (t.open || t._removed) return;
+        t._removed = true;
+        this.toasts.splice(i, 1);
+        this.updateIndices();
+    },
+    runAction(onclick, id) {
+        if (!onclick) return;
+        try {
+            (new Function('close', onclick))(() => this.close(id));
+        } catch (e) {
+            console.error(e);
+            this.close(id);
+        }
+    },
+    runCancel(onclick, id) {
+        if (onclick) {
+            try {
+                (new Function('close', onclick))(() => this.close(id));
+            } catch (e) {
+                console.error(e);
+                this.close(id);
+            }
+        } else {
+            this.close(id);
+        }
+    }
+}
+"""
+)
+
+_TOAST_KEYFRAMES_CSS = inline_css(
+    """
+    /* Toast animation keyframes */
+    @keyframes toast-in {
+        from {
+            opacity: 0;
+            transform: translateY(14px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+    @keyframes toast-out {
+        from {
+            opacity: 1;
+            transform: translateY(0);
+        }
+        to {
+            opacity: 0;
+            transform: translateY(6px);
+        }
+    }
+    """
+)
+
+
+_TOAST_ITEM_STYLE = inline_css(
+    """
+    will-change: transform, opacity; display: grid;
+    grid-template-rows: 1fr;
+    transition: grid-template-rows 260ms ease, opacity 260ms ease, margin 260ms ease;
+    animation: toast-in 0.26s ease-out;
+    """
+)
+
+_TOAST_ITEM_BIND_STYLE = inline_js(
+    """
+    {
+        gridTemplateRows: t.open ? '1fr' : '0fr',
+        opacity: t.open ? 1 : 0,
+        marginTop: t.open ? '0.5rem' : 0,
+        overflow: t.open ? '' : 'hidden'
+    }
+    """
+)
+
+_TOAST_ACCENT_COLORS = inline_js(
+    """
+    {
+        'bg-green-400': t.category === 'success',
+        'bg-red-400': t.category === 'error',
+        'bg-blue-400': t.category === 'info',
+        'bg-yellow-400': t.category === 'warning'
+    }
+    """
+)
+
+_TOAST_ICON_COLORS = inline_js(
+    """
+    {
+        'text-green-400': t.category === 'success',
+        'text-red-400': t.category === 'error',
+        'text-blue-400': t.category === 'info',
+        'text-yellow-400': t.category === 'warning'
+    }
+    """
+)
+
 
 def toaster(
     *, align: TAlign = "end", id: str = "toaster", class_: str | None = None, **attrs
@@ -61,126 +254,6 @@ def toaster(
         class_=class_,
     )
 
-    # Alpine state and methods with enhanced animations
-    alpine_data: js = """
-    {
-        toasts: [],
-        nextId: 1,
-        isPaused: false,
-        hoverCount: 0,
-        addToast(cfg) {
-            cfg = cfg || {};
-            const id = this.nextId++;
-            const d = (cfg.duration === -1) ? -1 : (cfg.duration ?? (cfg.category === 'error' ? 8000 : 5000));
-            const toast = {
-                id,
-                open: true,
-                duration: d,
-                index: this.toasts.length,
-                remainingTime: d,
-                timeoutId: null,
-                startTime: null,
-                ...cfg
-            };
-            // Prepend so newest appears on top
-            this.toasts.unshift(toast);
-            if (d !== -1 && !this.isPaused) {
-                toast.startTime = Date.now();
-                toast.timeoutId = setTimeout(() => this.close(id), d);
-            }
-            this.updateIndices();
-        },
-        onToastEnter() {
-            this.hoverCount++;
-            if (!this.isPaused) {
-                this.pauseAll();
-            }
-        },
-        onToastLeave() {
-            if (this.hoverCount > 0) this.hoverCount--;
-            if (this.hoverCount === 0) {
-                this.resumeAll();
-            }
-        },
-        pauseAll() {
-            if (this.isPaused) return;
-            this.isPaused = true;
-            this.toasts.forEach((t) => {
-                if (!t.open || t.duration === -1) return;
-                if (t.timeoutId) {
-                    clearTimeout(t.timeoutId);
-                    t.timeoutId = null;
-                    if (t.startTime != null) {
-                        t.remainingTime = t.remainingTime - (Date.now() - t.startTime);
-                    }
-                }
-            });
-        },
-        resumeAll() {
-            if (!this.isPaused) return;
-            this.isPaused = false;
-            this.toasts.forEach((t) => {
-                if (!t.open || t.duration === -1 || t.timeoutId) return;
-                if (t.remainingTime > 0) {
-                    t.startTime = Date.now();
-                    t.timeoutId = setTimeout(() => this.close(t.id), t.remainingTime);
-                } else {
-                    this.close(t.id);
-                }
-            });
-        },
-        close(id) {
-            const i = this.toasts.findIndex(t => t.id === id);
-            if (i > -1) {
-                const t = this.toasts[i];
-                if (t.timeoutId) clearTimeout(t.timeoutId);
-                t.timeoutId = null;
-                // guard against double-close jitter
-                if (!t.open) return;
-                t.open = false;
-            }
-        },
-        updateIndices() {
-            this.toasts.forEach((toast, i) => {
-                toast.index = i;
-            });
-        },
-        finalizeCloseOnTransition(id, evt) {
-            // Only act on the wrapper element's own transition end
-            if (evt && evt.target !== evt.currentTarget) return;
-            const i = this.toasts.findIndex(t => t.id === id);
-            if (i === -1) return;
-            const t = this.toasts[i];
-            // If it's still open or already removed, ignore
-            if (t.open || t._removed) return;
-            t._removed = true;
-            this.toasts.splice(i, 1);
-            this.updateIndices();
-        },
-        runAction(onclick, id) {
-            if (!onclick) return;
-            try {
-                (new Function('close', onclick))(() => this.close(id));
-            } catch (e) {
-                console.error(e);
-                this.close(id);
-            }
-        },
-        runCancel(onclick, id) {
-            if (onclick) {
-                try {
-                    (new Function('close', onclick))(() => this.close(id));
-                } catch (e) {
-                    console.error(e);
-                    this.close(id);
-                }
-            } else {
-                this.close(id);
-            }
-        }
-    }
-    """
-
     toast_classes = "toast pointer-events-auto w-full"
 
     content_classes = (
@@ -194,39 +267,13 @@ def toaster(
     return div(
         id=id,
         class_=wrapper_classes,
-        x_data=Markup(alpine_data),
+        x_data=Markup(_TOASTER_ALPINE_DATA),
         **{
             "@ui:toast.window": Markup("addToast($event.detail || {})"),
         },
         **attrs,
     )[
-        style()[
-            Markup(
-                """
-                /* Toast animation keyframes */
-                @keyframes toast-in {
-                    from {
-                        opacity: 0;
-                        transform: translateY(14px);
-                    }
-                    to {
-                        opacity: 1;
-                        transform: translateY(0);
-                    }
-                }
-                @keyframes toast-out {
-                    from {
-                        opacity: 1;
-                        transform: translateY(0);
-                    }
-                    to {
-                        opacity: 0;
-                        transform: translateY(6px);
-                    }
-                }
-                """
-            )
-        ],
+        style()[Markup(_TOAST_KEYFRAMES_CSS)],
         template(x_for="t in toasts", x_key="t.id")[
             div(
                 class_=toast_classes,
@@ -234,22 +281,8 @@ def toaster(
                 **{":role": Markup("t.category === 'error' ? 'alert' : 'status'")},
                 **{":aria-hidden": Markup("!t.open")},
                 **{
-                    "style": """
-                        will-change: transform, opacity; display: grid; 
-                        grid-template-rows: 1fr;
-                        transition: grid-template-rows 260ms ease, opacity 260ms ease, margin 260ms ease; 
-                        animation: toast-in 0.26s ease-out;
-                    """,
-                    "x-bind:style": Markup(
-                        """
-                        { 
-                            gridTemplateRows: t.open ? '1fr' : '0fr',
-                            opacity: t.open ? 1 : 0,
-                            marginTop: t.open ? '0.5rem' : 0,
-                            overflow: t.open ? '' : 'hidden' 
-                        }
-                        """
-                    ),
+                    "style": _TOAST_ITEM_STYLE,
+                    "x-bind:style": Markup(_TOAST_ITEM_BIND_STYLE),
                     "@mouseenter": "onToastEnter()",
                     "@mouseleave": "onToastLeave()",
                     "@transitionend": "finalizeCloseOnTransition(t.id, $event)",
@@ -262,29 +295,11 @@ def toaster(
                     # Left accent bar for category color
                     div(
                         class_="w-1 self-stretch rounded-sm",
-                        **{
-                            ":class": Markup("""
-                            {
-                                'bg-green-400': t.category === 'success',
-                                'bg-red-400': t.category === 'error',
-                                'bg-blue-400': t.category === 'info',
-                                'bg-yellow-400': t.category === 'warning'
-                            }
-                        """)
-                        },
+                        **{":class": Markup(_TOAST_ACCENT_COLORS)},
                     ),
                     span(
                         class_="inline-flex",
-                        **{
-                            ":class": Markup("""
-                            {
-                                'text-green-400': t.category === 'success',
-                                'text-red-400': t.category === 'error',
-                                'text-blue-400': t.category === 'info',
-                                'text-yellow-400': t.category === 'warning'
-                            }
-                        """)
-                        },
+                        **{":class": Markup(_TOAST_ICON_COLORS)},
                     )[
                         div(x_show="t.category === 'success'", x_cloak="")[toast_icon_success()],
                         div(x_show="t.category === 'error'", x_cloak="")[toast_icon_error()],
@@ -8,7 +8,71 @@ from sourcetypes import js
 
 from ._types import TAlign
 from ._types import TSide
+from ._utils import js_template
 from ._utils import merge_classes
+from .hydrate import LAZY_HYDRATE_ATTRS
+
+_TOOLTIP_ALPINE_DATA: js = js_template(
+    """
+    {{
+        open: false,
+        style: '',
+        side: '{side}',
+        align: '{align}',
+        _raf: null,
+        schedule() {{
+            cancelAnimationFrame(this._raf || 0);
+            this._raf = requestAnimationFrame(() => {{
+                this.update();
+                // Run a second time next frame to account for late layout/teleport
+                this._raf = requestAnimationFrame(() => this.update());
+            }});
+        }},
+        cancel() {{
+            cancelAnimationFrame(this._raf || 0);
+            this._raf = null;
+        }},
+        update() {{
+            const trigger = this.$refs.trigger;
+            const bubble = this.$refs.bubble;
+            if (!trigger || !bubble) return;
+            const r = trigger.getBoundingClientRect();
+            const spacing = 6;
+            let top = 0, left = 0;
+            const bw = bubble.offsetWidth, bh = bubble.offsetHeight;
+
+            if (this.side === 'top') {{
+                top = r.top - bh - spacing;
+                if (this.align === 'start') left = r.left;
+                else if (this.align === 'end') left = r.right - bw;
+                else left = r.left + (r.width - bw) / 2;
+            }} else if (this.side === 'bottom') {{
+                top = r.bottom + spacing;
+                if (this.align === 'start') left = r.left;
+                else if (this.align === 'end') left = r.right - bw;
+                else left = r.left + (r.width - bw) / 2;
+            }} else if (this.side === 'left') {{
+                left = r.left - bw - spacing;
+                if (this.align === 'start') top = r.top;
+                else if (this.align === 'end') top = r.bottom - bh;
+                else top = r.top + (r.height - bh) / 2;
+            }} else if (this.side === 'right') {{
+                left = r.right + spacing;
+                if (this.align === 'start') top = r.top;
+                else if (this.align === 'end') top = r.bottom - bh;
+                else top = r.top + (r.height - bh) / 2;
+            }}
+
+            // Clamp to viewport with padding
+            const pad = 8;
+            const vw = window.innerWidth, vh = window.innerHeight;
+            left = Math.max(pad, Math.min(left, vw - bw - pad));
+            top = Math.max(pad, Math.min(top, vh - bh - pad));
+            this.style = `top:${{top}}px;left:${{left}}px`;
+        }}
+    }}
+"""
+)
 
 
 @with_children
@@ -18,6 +82,7 @@ def tooltip(
     content: Node,
     side: TSide = "top",
     align: TAlign = "center",
+    lazy_hydrate: bool = False,
     class_: str | None = None,
     **attrs,
 ) -> Renderable:
@@ -33,6 +98,9 @@ def tooltip(
         children: Trigger element
         side: One of "top", "bottom", "left", "right" (default: "top")
         align: One of "start", "center", "end" (default: "center")
+        lazy_hydrate: Skip Alpine initialization until the trigger comes near the
+            viewport or is first hovered/focused; render `lazy_hydration_script()`
+            once on the page
         class_: Extra classes for the trigger wrapper
         **attrs: Extra attributes forwarded to the tooltip bubble
 
@@ -48,65 +116,7 @@ def tooltip(
         "text-xs whitespace-nowrap pointer-events-none transform transition-all"
     )
 
-    x_data: js = f"""
-        {{
-            open: false,
-            style: '',
-            side: '{side}',
-            align: '{align}',
-            _raf: null,
-            schedule() {{
-                cancelAnimationFrame(this._raf || 0);
-                this._raf = requestAnimationFrame(() => {{
-                    this.update();
-                    // Run a second time next frame to account for late layout/teleport
-                    this._raf = requestAnimationFrame(() => this.update());
-                }});
-            }},
-            cancel() {{
-                cancelAnimationFrame(this._raf || 0);
-                this._raf = null;
-            }},
-            update() {{
-                const trigger = this.$refs.trigger;
-                const bubble = this.$refs.bubble;
-                if (!trigger || !bubble) return;
-                const r = trigger.getBoundingClientRect();
-                const spacing = 6;
-                let top = 0, left = 0;
-                const bw = bubble.offsetWidth, bh = bubble.offsetHeight;
-
-                if (this.side === 'top') {{
-                    top = r.top - bh - spacing;
-                    if (this.align === 'start') left = r.left;
-                    else if (this.align === 'end') left = r.right - bw;
-                    else left = r.left + (r.width - bw) / 2;
-                }} else if (this.side === 'bottom') {{
-                    top = r.bottom + spacing;
-                    if (this.align === 'start') left = r.left;
-                    else if (this.align === 'end') left = r.right - bw;
-                    else left = r.left + (r.width - bw) / 2;
-                }} else if (this.side === 'left') {{
-                    left = r.left - bw - spacing;
-                    if (this.align === 'start') top = r.top;
-                    else if (this.align === 'end') top = r.bottom - bh;
-                    else top = r.top + (r.height - bh) / 2;
-                }} else if (this.side === 'right') {{
-                    left = r.right + spacing;
-                    if (this.align === 'start') top = r.top;
-                    else if (this.align === 'end') top = r.bottom - bh;
-                    else top = r.top + (r.height - bh) / 2;
-                }}
-
-                // Clamp to viewport with padding
-                const pad = 8;
-                const vw = window.innerWidth, vh = window.innerHeight;
-                left = Math.max(pad, Math.min(left, vw - bw - pad));
-                top = Math.max(pad, Math.min(top, vh - bh - pad));
-                this.style = `top:${{top}}px;left:${{left}}px`;
-            }}
-        }}
-    """
+    x_data: js = _TOOLTIP_ALPINE_DATA.format(side=side, align=align)
 
     # Wrapper attributes: Alpine handles open state on hover/focus
     wrapper_attrs = {
@@ -122,6 +132,8 @@ def tooltip(
         "tabindex": "0",
         "aria-describedby": "",
     }
+    if lazy_hydrate:
+        wrapper_attrs.update(LAZY_HYDRATE_ATTRS)
 
     # Build tooltip bubble with Alpine show/transition attributes
     bubble_attrs = {
@@ -0,0 +1,1351 @@
+"""Pure-Python CSS for the kit's Tailwind class vocabulary.
+
+The components only use a finite, statically known set of utilities (see
+``classes.collect_classes``), so their CSS can be produced without Node: each class is
+split into variants and a utility, the utility is resolved against the theme (the
+``@theme`` block of ``tailwind-themes/theme.css`` over a built-in subset of Tailwind's
+defaults) and the variants become selectors and at-rule wrappers, in Tailwind v4
+semantics. Classes outside the supported subset are reported, not guessed.
+
+Results are cached on disk by a hash of the inputs, so a dev server restart with an
+unchanged vocabulary and theme reads one file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+# Bump when the generated output changes for the same inputs (invalidates the cache).
+GENERATOR_VERSION = 2
+
+# Subset of Tailwind v4's default theme used by the kit; theme.css ``@theme`` wins.
+DEFAULT_THEME: dict[str, str] = {
+    "--font-sans": (
+        'ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", '
+        '"Segoe UI Symbol", "Noto Color Emoji"'
+    ),
+    "--font-mono": (
+        'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", '
+        '"Courier New", monospace'
+    ),
+    "--color-black": "#000",
+    "--color-white": "#fff",
+    "--color-red-50": "oklch(97.1% 0.013 17.38)",
+    "--color-red-200": "oklch(88.5% 0.062 18.334)",
+    "--color-red-400": "oklch(70.4% 0.191 22.216)",
+    "--color-red-500": "oklch(63.7% 0.237 25.331)",
+    "--color-red-600": "oklch(57.7% 0.245 27.325)",
+    "--color-red-700": "oklch(50.5% 0.213 27.518)",
+    "--color-yellow-50": "oklch(98.7% 0.026 102.212)",
+    "--color-yellow-200": "oklch(94.5% 0.129 101.54)",
+    "--color-yellow-400": "oklch(85.2% 0.199 91.936)",
+    "--color-yellow-500": "oklch(79.5% 0.184 86.047)",
+    "--color-yellow-600": "oklch(68.1% 0.162 75.834)",
+    "--color-yellow-700": "oklch(55.4% 0.135 66.442)",
+    "--color-green-50": "oklch(98.2% 0.018 155.826)",
+    "--color-green-200": "oklch(92.5% 0.084 155.995)",
+    "--color-green-400": "oklch(79.2% 0.209 151.711)",
+    "--color-green-500": "oklch(72.3% 0.219 149.579)",
+    "--color-green-600": "oklch(62.7% 0.194 149.214)",
+    "--color-green-700": "oklch(52.7% 0.154 150.069)",
+    "--color-blue-50": "oklch(97% 0.014 254.604)",
+    "--color-blue-200": "oklch(88.2% 0.059 254.128)",
+    "--color-blue-400": "oklch(70.7% 0.165 254.624)",
+    "--color-blue-500": "oklch(62.3% 0.214 259.815)",
+    "--color-blue-600": "oklch(54.6% 0.245 262.881)",
+    "--color-blue-700": "oklch(48.8% 0.243 264.376)",
+    "--spacing": "0.25rem",
+    "--breakpoint-sm": "40rem",
+    "--breakpoint-md": "48rem",
+    "--breakpoint-lg": "64rem",
+    "--breakpoint-xl": "80rem",
+    "--breakpoint-2xl": "96rem",
+    "--container-3xs": "16rem",
+    "--container-2xs": "18rem",
+    "--container-xs": "20rem",
+    "--container-sm": "24rem",
+    "--container-md": "28rem",
+    "--container-lg": "32rem",
+    "--container-xl": "36rem",
+    "--container-2xl": "42rem",
+    "--container-3xl": "48rem",
+    "--container-4xl": "56rem",
+    "--container-5xl": "64rem",
+    "--container-6xl": "72rem",
+    "--container-7xl": "80rem",
+    "--text-xs": "0.75rem",
+    "--text-xs--line-height": "calc(1 / 0.75)",
+    "--text-sm": "0.875rem",
+    "--text-sm--line-height": "calc(1.25 / 0.875)",
+    "--text-base": "1rem",
+    "--text-base--line-height": "calc(1.5 / 1)",
+    "--text-lg": "1.125rem",
+    "--text-lg--line-height": "calc(1.75 / 1.125)",
+    "--text-xl": "1.25rem",
+    "--text-xl--line-height": "calc(1.75 / 1.25)",
+    "--text-2xl": "1.5rem",
+    "--text-2xl--line-height": "calc(2 / 1.5)",
+    "--text-3xl": "1.875rem",
+    "--text-3xl--line-height": "calc(2.25 / 1.875)",
+    "--text-4xl": "2.25rem",
+    "--text-4xl--line-height": "calc(2.5 / 2.25)",
+    "--font-weight-normal": "400",
+    "--font-weight-medium": "500",
+    "--font-weight-semibold": "600",
+    "--font-weight-bold": "700",
+    "--font-weight-extrabold": "800",
+    "--tracking-tight": "-0.025em",
+    "--tracking-wider": "0.05em",
+    "--tracking-widest": "0.1em",
+    "--leading-tight": "1.25",
+    "--leading-snug": "1.375",
+    "--leading-normal": "1.5",
+    "--leading-relaxed": "1.625",
+    "--radius-xs": "0.125rem",
+    "--radius-sm": "0.25rem",
+    "--radius-md": "0.375rem",
+    "--radius-lg": "0.5rem",
+    "--radius-xl": "0.75rem",
+    "--shadow-2xs": "0 1px var(--tw-shadow-color, rgb(0 0 0 / 0.05))",
+    "--shadow-xs": "0 1px 2px 0 var(--tw-shadow-color, rgb(0 0 0 / 0.05))",
+    "--shadow-sm": (
+        "0 1px 3px 0 var(--tw-shadow-color, rgb(0 0 0 / 0.1)), "
+        "0 1px 2px -1px var(--tw-shadow-color, rgb(0 0 0 / 0.1))"
+    ),
+    "--shadow-md": (
+        "0 4px 6px -1px var(--tw-shadow-color, rgb(0 0 0 / 0.1)), "
+        "0 2px 4px -2px var(--tw-shadow-color, rgb(0 0 0 / 0.1))"
+    ),
+    "--shadow-lg": (
+        "0 10px 15px -3px var(--tw-shadow-color, rgb(0 0 0 / 0.1)), "
+        "0 4px 6px -4px var(--tw-shadow-color, rgb(0 0 0 / 0.1))"
+    ),
+    "--shadow-xl": (
+        "0 20px 25px -5px var(--tw-shadow-color, rgb(0 0 0 / 0.1)), "
+        "0 8px 10px -6px var(--tw-shadow-color, rgb(0 0 0 / 0.1))"
+    ),
+    "--blur-xs": "4px",
+    "--blur-sm": "8px",
+    "--blur-md": "12px",
+    "--blur-lg": "16px",
+    "--ease-in": "cubic-bezier(0.4, 0, 1, 1)",
+    "--ease-out": "cubic-bezier(0, 0, 0.2, 1)",
+    "--ease-in-out": "cubic-bezier(0.4, 0, 0.2, 1)",
+    "--animate-spin": "spin 1s linear infinite",
+    "--animate-pulse": "pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite",
+    "--default-transition-duration": "150ms",
+    "--default-transition-timing-function": "cubic-bezier(0.4, 0, 0.2, 1)",
+    "--default-font-family": "var(--font-sans)",
+    "--default-mono-font-family": "var(--font-mono)",
+}
+
+_KEYFRAMES = {
+    "spin": "@keyframes spin {\n  to {\n    transform: rotate(360deg);\n  }\n}\n",
+    "pulse": "@keyframes pulse {\n  50% {\n    opacity: 0.5;\n  }\n}\n",
+}
+
+# Initial values of the composable ``--tw-*`` properties (Tailwind registers these with
+# ``@property``; a universal rule gives the same non-inherited defaults).
+_PROPERTY_DEFAULTS = """\
+*, ::before, ::after, ::backdrop {
+  --tw-border-style: solid;
+  --tw-outline-style: solid;
+  --tw-translate-x: 0;
+  --tw-translate-y: 0;
+  --tw-translate-z: 0;
+  --tw-scale-x: 1;
+  --tw-scale-y: 1;
+  --tw-scale-z: 1;
+  --tw-space-x-reverse: 0;
+  --tw-space-y-reverse: 0;
+  --tw-shadow: 0 0 #0000;
+  --tw-inset-shadow: 0 0 #0000;
+  --tw-inset-ring-shadow: 0 0 #0000;
+  --tw-ring-offset-width: 0px;
+  --tw-ring-offset-color: #fff;
+  --tw-ring-offset-shadow: 0 0 #0000;
+  --tw-ring-shadow: 0 0 #0000;
+  --tw-content: "";
+}
+"""
+
+# Condensed Tailwind v4 preflight.
+_PREFLIGHT = """\
+*, ::after, ::before, ::backdrop, ::file-selector-button {
+  box-sizing: border-box;
+  margin: 0;
+  padding: 0;
+  border: 0 solid;
+}
+html, :host {
+  line-height: 1.5;
+  -webkit-text-size-adjust: 100%;
+  tab-size: 4;
+  font-family: var(--default-font-family);
+  -webkit-tap-highlight-color: transparent;
+}
+hr {
+  height: 0;
+  color: inherit;
+  border-top-width: 1px;
+}
+h1, h2, h3, h4, h5, h6 {
+  font-size: inherit;
+  font-weight: inherit;
+}
+a {
+  color: inherit;
+  text-decoration: inherit;
+}
+b, strong {
+  font-weight: bolder;
+}
+code, kbd, samp, pre {
+  font-family: var(--default-mono-font-family);
+  font-size: 1em;
+}
+small {
+  font-size: 80%;
+}
+table {
+  text-indent: 0;
+  border-color: inherit;
+  border-collapse: collapse;
+}
+summary {
+  display: list-item;
+}
+ol, ul, menu {
+  list-style: none;
+}
+img, svg, video, canvas, audio, iframe, embed, object {
+  display: block;
+  vertical-align: middle;
+}
+img, video {
+  max-width: 100%;
+  height: auto;
+}
+button, input, select, optgroup, textarea, ::file-selector-button {
+  font: inherit;
+  font-feature-settings: inherit;
+  font-variation-settings: inherit;
+  letter-spacing: inherit;
+  color: inherit;
+  border-radius: 0;
+  background-color: transparent;
+  opacity: 1;
+}
+::placeholder {
+  opacity: 1;
+  color: color-mix(in oklab, currentcolor 50%, transparent);
+}
+textarea {
+  resize: vertical;
+}
+button, input:where([type="button"], [type="reset"], [type="submit"]), ::file-selector-button {
+  appearance: button;
+}
+::-webkit-inner-spin-button, ::-webkit-outer-spin-button {
+  height: auto;
+}
+[hidden]:where(:not([hidden="until-found"])) {
+  display: none !important;
+}
+"""
+
+_BOX_SHADOW = (
+    "var(--tw-inset-shadow), var(--tw-inset-ring-shadow), var(--tw-ring-offset-shadow), "
+    "var(--tw-ring-shadow), var(--tw-shadow)"
+)
+_TRANSITION_PROPERTIES = {
+    "": (
+        "color, background-color, border-color, outline-color, text-decoration-color, fill, "
+        "stroke, --tw-gradient-from, --tw-gradient-via, --tw-gradient-to, opacity, box-shadow, "
+        "transform, translate, scale, rotate, filter, -webkit-backdrop-filter, "
+        "backdrop-filter, display, visibility, content-visibility, overlay, pointer-events"
+    ),
+    "all": "all",
+    "colors": (
+        "color, background-color, border-color, outline-color, text-decoration-color, fill, "
+        "stroke, --tw-gradient-from, --tw-gradient-via, --tw-gradient-to"
+    ),
+    "opacity": "opacity",
+    "shadow": "box-shadow",
+    "transform": "transform, translate, scale, rotate",
+}
+
+Decls = list[tuple[str, str]]
+
+
+@dataclass
+class Theme:
+    """Theme variables plus custom variants, parsed from a theme stylesheet."""
+
+    vars: dict[str, str]
+    # Custom variant name -> selector template (``&`` stands for the element).
+    variants: dict[str, str] = field(default_factory=dict)
+    # The stylesheet with ``@theme`` and ``@custom-variant`` removed.
+    css: str = ""
+
+    def color(self, name: str) -> str | None:
+        if name in {"current", "currentcolor"}:
+            return "currentcolor"
+        if name in {"transparent", "inherit"}:
+            return name
+        key = f"--color-{name}"
+        return f"var({key})" if key in self.vars else None
+
+
+def parse_theme(css: str) -> Theme:
+    """Split a Tailwind theme stylesheet into variables, custom variants and plain CSS."""
+    theme_vars = dict(DEFAULT_THEME)
+    variants: dict[str, str] = {}
+    for m in re.finditer(r"@custom-variant\s+([\w-]+)\s*\((.*?)\);", css):
+        variants[m[1]] = m[2].strip()
+    css = re.sub(r"@custom-variant\s+[\w-]+\s*\(.*?\);\s*", "", css)
+    while (m := re.search(r"@theme(?:\s+inline)?\s*\{", css)) is not None:
+        close = _matching_brace(css, m.end() - 1)
+        for decl in css[m.end() : close].split(";"):
+            name, _, value = decl.partition(":")
+            if name.strip().startswith("--") and value.strip():
+                theme_vars[name.strip()] = value.strip()
+        css = css[: m.start()] + css[close + 1 :].lstrip("\n")
+    return Theme(vars=theme_vars, variants=variants, css=css.strip() + "\n")
+
+
+def _matching_brace(text: str, open_idx: int) -> int:
+    depth = 0
+    for i in range(open_idx, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(text) - 1
+
+
+# -- class parsing ------------------------------------------------------------------
+
+
+def split_variants(cls: str) -> list[str]:
+    """Split ``cls`` on ``:`` outside brackets/parentheses; the last part is the utility."""
+    parts: list[str] = []
+    depth = 0
+    cur = ""
+    for ch in cls:
+        if ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        if ch == ":" and depth == 0:
+            parts.append(cur)
+            cur = ""
+        else:
+            cur += ch
+    parts.append(cur)
+    return parts
+
+
+def _arbitrary(value: str) -> str:
+    """Decode an arbitrary value: ``_`` means space, ``\\_`` a literal underscore."""
+    return value.replace("\\_", "\0").replace("_", " ").replace("\0", "_")
+
+
+def escape_class(cls: str) -> str:
+    """Escape ``cls`` for use as a CSS class selector."""
+    out = []
+    for i, ch in enumerate(cls):
+        if ch.isalnum() and ch.isascii() or ch in "-_":
+            if i == 0 and ch.isdigit():
+                out.append(f"\\3{ch} ")
+            else:
+                out.append(ch)
+        else:
+            out.append("\\" + ch)
+    return "".join(out)
+
+
+def _split_modifier(value: str) -> tuple[str, str | None]:
+    depth = 0
+    for i in range(len(value) - 1, -1, -1):
+        ch = value[i]
+        if ch in "])":
+            depth += 1
+        elif ch in "[(":
+            depth -= 1
+        elif ch == "/" and depth == 0:
+            return value[:i], value[i + 1 :]
+    return value, None
+
+
+_NUMBER_RE = re.compile(r"^\d+(\.\d+)?$")
+_FRACTION_RE = re.compile(r"^\d+/\d+$")
+
+
+def _with_alpha(color: str, alpha: str | None) -> str:
+    if alpha is None:
+        return color
+    if alpha.startswith("[") and alpha.endswith("]"):
+        pct = _arbitrary(alpha[1:-1])
+    elif _NUMBER_RE.match(alpha):
+        pct = f"{alpha}%"
+    else:
+        return color
+    return f"color-mix(in oklab, {color} {pct}, transparent)"
+
+
+class _Resolver:
+    """Resolve utilities (the part after the variants) to declarations."""
+
+    def __init__(self, theme: Theme) -> None:
+        self.theme = theme
+
+    # -- value helpers --------------------------------------------------------------
+
+    def spacing(self, value: str, *, fractions: bool = False, keywords=None) -> str | None:
+        keywords = keywords or {}
+        if value in keywords:
+            return keywords[value]
+        if value.startswith("[") and value.endswith("]"):
+            return _arbitrary(value[1:-1])
+        if value.startswith("(") and value.endswith(")"):
+            return f"var({value[1:-1]})"
+        if value == "px":
+            return "1px"
+        if _NUMBER_RE.match(value):
+            return f"calc(var(--spacing) * {value})"
+        if fractions and _FRACTION_RE.match(value):
+            return f"calc({value} * 100%)"
+        return None
+
+    def color(self, value: str) -> str | None:
+        base, alpha = _split_modifier(value)
+        if base.startswith("[") and base.endswith("]"):
+            color = _arbitrary(base[1:-1])
+        elif base.startswith("(") and base.endswith(")"):
+            color = f"var({base[1:-1]})"
+        else:
+            color = self.theme.color(base)
+        return _with_alpha(color, alpha) if color else None
+
+    def themed(self, namespace: str, value: str) -> str | None:
+        if value.startswith("[") and value.endswith("]"):
+            return _arbitrary(value[1:-1])
+        if value.startswith("(") and value.endswith(")"):
+            return f"var({value[1:-1]})"
+        key = f"--{namespace}-{value}"
+        return f"var({key})" if key in self.theme.vars else None
+
+    @staticmethod
+    def length(value: str, unit: str = "px") -> str | None:
+        if value.startswith("[") and value.endswith("]"):
+            return _arbitrary(value[1:-1])
+        if _NUMBER_RE.match(value):
+            return f"{value}{unit}"
+        return None
+
+
+# Display-only utilities with fixed declarations.
+_STATIC: dict[str, Decls] = {
+    "sr-only": [
+        ("position", "absolute"),
+        ("width", "1px"),
+        ("height", "1px"),
+        ("padding", "0"),
+        ("margin", "-1px"),
+        ("overflow", "hidden"),
+        ("clip", "rect(0, 0, 0, 0)"),
+        ("white-space", "nowrap"),
+        ("border-width", "0"),
+    ],
+    "pointer-events-none": [("pointer-events", "none")],
+    "pointer-events-auto": [("pointer-events", "auto")],
+    "visible": [("visibility", "visible")],
+    "invisible": [("visibility", "hidden")],
+    "static": [("position", "static")],
+    "fixed": [("position", "fixed")],
+    "absolute": [("position", "absolute")],
+    "relative": [("position", "relative")],
+    "sticky": [("position", "sticky")],
+    "block": [("display", "block")],
+    "inline-block": [("display", "inline-block")],
+    "inline": [("display", "inline")],
+    "flex": [("display", "flex")],
+    "inline-flex": [("display", "inline-flex")],
+    "grid": [("display", "grid")],
+    "inline-grid": [("display", "inline-grid")],
+    "contents": [("display", "contents")],
+    "hidden": [("display", "none")],
+    "aspect-square": [("aspect-ratio", "1 / 1")],
+    "aspect-video": [("aspect-ratio", "var(--aspect-video, 16 / 9)")],
+    "flex-1": [("flex", "1")],
+    "flex-auto": [("flex", "auto")],
+    "flex-none": [("flex", "none")],
+    "shrink": [("flex-shrink", "1")],
+    "shrink-0": [("flex-shrink", "0")],
+    "grow": [("flex-grow", "1")],
+    "grow-0": [("flex-grow", "0")],
+    "caption-bottom": [("caption-side", "bottom")],
+    "transform": [
+        (
+            "transform",
+            (
+                "var(--tw-rotate-x,) var(--tw-rotate-y,) var(--tw-rotate-z,) "
+                "var(--tw-skew-x,) var(--tw-skew-y,)"
+            ),
+        )
+    ],
+    "select-none": [("-webkit-user-select", "none"), ("user-select", "none")],
+    "appearance-none": [("appearance", "none")],
+    "list-none": [("list-style-type", "none")],
+    "list-decimal": [("list-style-type", "decimal")],
+    "list-disc": [("list-style-type", "disc")],
+    "auto-rows-min": [("grid-auto-rows", "min-content")],
+    "auto-rows-max": [("grid-auto-rows", "max-content")],
+    "flex-row": [("flex-direction", "row")],
+    "flex-row-reverse": [("flex-direction", "row-reverse")],
+    "flex-col": [("flex-direction", "column")],
+    "flex-col-reverse": [("flex-direction", "column-reverse")],
+    "flex-wrap": [("flex-wrap", "wrap")],
+    "flex-nowrap": [("flex-wrap", "nowrap")],
+    "items-start": [("align-items", "flex-start")],
+    "items-end": [("align-items", "flex-end")],
+    "items-center": [("align-items", "center")],
+    "items-baseline": [("align-items", "baseline")],
+    "items-stretch": [("align-items", "stretch")],
+    "justify-start": [("justify-content", "flex-start")],
+    "justify-end": [("justify-content", "flex-end")],
+    "justify-center": [("justify-content", "center")],
+    "justify-between": [("justify-content", "space-between")],
+    "justify-around": [("justify-content", "space-around")],
+    "justify-items-start": [("justify-items", "start")],
+    "justify-items-end": [("justify-items", "end")],
+    "justify-items-center": [("justify-items", "center")],
+    "justify-items-center-safe": [("justify-items", "safe center")],
+    "self-auto": [("align-self", "auto")],
+    "self-start": [("align-self", "flex-start")],
+    "self-end": [("align-self", "flex-end")],
+    "self-center": [("align-self", "center")],
+    "self-stretch": [("align-self", "stretch")],
+    "truncate": [
+        ("overflow", "hidden"),
+        ("text-overflow", "ellipsis"),
+        ("white-space", "nowrap"),
+    ],
+    "rounded": [("border-radius", "0.25rem")],
+    "rounded-none": [("border-radius", "0")],
+    "rounded-full": [("border-radius", "calc(infinity * 1px)")],
+    "rounded-t": [("border-top-left-radius", "0.25rem"), ("border-top-right-radius", "0.25rem")],
+    "bg-no-repeat": [("background-repeat", "no-repeat")],
+    "bg-repeat": [("background-repeat", "repeat")],
+    "mask-center": [("mask-position", "center")],
+    "mask-no-repeat": [("mask-repeat", "no-repeat")],
+    "object-cover": [("object-fit", "cover")],
+    "object-contain": [("object-fit", "contain")],
+    "text-left": [("text-align", "left")],
+    "text-center": [("text-align", "center")],
+    "text-right": [("text-align", "right")],
+    "align-middle": [("vertical-align", "middle")],
+    "align-top": [("vertical-align", "top")],
+    "leading-none": [("--tw-leading", "1"), ("line-height", "1")],
+    "whitespace-nowrap": [("white-space", "nowrap")],
+    "whitespace-normal": [("white-space", "normal")],
+    "whitespace-pre-wrap": [("white-space", "pre-wrap")],
+    "break-all": [("word-break", "break-all")],
+    "break-words": [("overflow-wrap", "break-word")],
+    "uppercase": [("text-transform", "uppercase")],
+    "lowercase": [("text-transform", "lowercase")],
+    "capitalize": [("text-transform", "capitalize")],
+    "italic": [("font-style", "italic")],
+    "tabular-nums": [("font-variant-numeric", "tabular-nums")],
+    "underline": [("text-decoration-line", "underline")],
+    "no-underline": [("text-decoration-line", "none")],
+    "outline-none": [("--tw-outline-style", "none"), ("outline-style", "none")],
+    "outline-hidden": [("--tw-outline-style", "none"), ("outline-style", "none")],
+    "grayscale": [("filter", "grayscale(100%)")],
+    "will-change-transform": [("will-change", "transform")],
+    "resize-none": [("resize", "none")],
+}
+
+_CURSORS = {"auto", "default", "pointer", "wait", "text", "move", "not-allowed", "grab", "help"}
+_OVERFLOW = {"auto", "hidden", "clip", "visible", "scroll"}
+_SIZE_KEYWORDS = {
+    "auto": "auto",
+    "full": "100%",
+    "min": "min-content",
+    "max": "max-content",
+    "fit": "fit-content",
+}
+_SIDES = {
+    "": ("",),
+    "x": ("-left", "-right"),
+    "y": ("-top", "-bottom"),
+    "t": ("-top",),
+    "r": ("-right",),
+    "b": ("-bottom",),
+    "l": ("-left",),
+    "s": ("-inline-start",),
+    "e": ("-inline-end",),
+}
+
+# Positioning roots and the properties they set.
+_INSET_PROPS = {
+    "inset": ("top", "right", "bottom", "left"),
+    "inset-x": ("inset-inline",),
+    "inset-y": ("inset-block",),
+    "top": ("top",),
+    "right": ("right",),
+    "bottom": ("bottom",),
+    "left": ("left",),
+}
+
+
+def _functional(r: _Resolver, root: str, value: str, negative: bool):
+    """Return ``(declarations, selector_template)`` for a functional utility, or None."""
+
+    def neg(v: str | None) -> str | None:
+        return f"calc({v} * -1)" if v is not None and negative else v
+
+    # Spacing: padding/margin on every side.
+    if root[0] in "pm" and root[1:] in _SIDES and len(root) <= 2:
+        prop = "padding" if root[0] == "p" else "margin"
+        if prop == "padding" and negative:
+            return None
+        v = neg(r.spacing(value, keywords={"auto": "auto"} if prop == "margin" else None))
+        if v is None:
+            return None
+        return [(f"{prop}{side}", v) for side in _SIDES[root[1:]]], None
+    if root in _INSET_PROPS:
+        v = neg(r.spacing(value, fractions=True, keywords={"auto": "auto", "full": "100%"}))
+        if v is None:
+            return None
+        return [(p, v) for p in _INSET_PROPS[root]], None
+    if root in {"gap", "gap-x", "gap-y"}:
+        v = r.spacing(value)
+        prop = {"gap": "gap", "gap-x": "column-gap", "gap-y": "row-gap"}[root]
+        return ([(prop, v)], None) if v else None
+    if root in {"space-x", "space-y"}:
+        v = neg(r.spacing(value))
+        if v is None:
+            return None
+        axis, start, end = (
+            ("x", "inline-start", "inline-end")
+            if root == "space-x"
+            else ("y", "block-start", "block-end")
+        )
+        return [
+            (f"--tw-space-{axis}-reverse", "0"),
+            (f"margin-{start}", f"calc({v} * var(--tw-space-{axis}-reverse))"),
+            (f"margin-{end}", f"calc({v} * calc(1 - var(--tw-space-{axis}-reverse)))"),
+        ], ":where(& > :not(:last-child))"
+    if root in {"w", "h", "size", "min-w", "min-h", "max-w", "max-h"}:
+        kw = dict(_SIZE_KEYWORDS)
+        kw["screen"] = "100vh" if root.endswith("h") else "100vw"
+        if root.startswith("max"):
+            kw["none"] = "none"
+        v = r.spacing(value, fractions=True, keywords=kw)
+        if v is None and root in {"w", "min-w", "max-w", "size"}:
+            v = r.themed("container", value)
+        if v is None:
+            return None
+        props = {
+            "w": ("width",),
+            "h": ("height",),
+            "size": ("width", "height"),
+            "min-w": ("min-width",),
+            "min-h": ("min-height",),
+            "max-w": ("max-width",),
+            "max-h": ("max-height",),
+        }[root]
+        return [(p, v) for p in props], None
+    if root in {"translate-x", "translate-y"}:
+        v = neg(r.spacing(value, fractions=True, keywords={"full": "100%"}))
+        if v is None:
+            return None
+        axis = root[-1]
+        return [
+            (f"--tw-translate-{axis}", v),
+            ("translate", "var(--tw-translate-x) var(--tw-translate-y)"),
+        ], None
+    if root == "scale" and _NUMBER_RE.match(value):
+        v = f"calc({value}% * -1)" if negative else f"{value}%"
+        return [
+            ("--tw-scale-x", v),
+            ("--tw-scale-y", v),
+            ("--tw-scale-z", v),
+            ("scale", "var(--tw-scale-x) var(--tw-scale-y)"),
+        ], None
+    if root == "rotate":
+        v = r.length(value, "deg")
+        return ([("rotate", neg(v))], None) if v else None
+    if root == "z":
+        v = r.length(value, "")
+        return ([("z-index", neg(v))], None) if v else None
+    if root == "opacity":
+        v = r.length(value, "%")
+        return ([("opacity", v)], None) if v else None
+    if root == "order":
+        v = r.length(value, "")
+        return ([("order", neg(v))], None) if v else None
+    if negative:
+        return None
+
+    if root == "grid-cols" or root == "grid-rows":
+        prop = "grid-template-columns" if root == "grid-cols" else "grid-template-rows"
+        if value.isdigit():
+            return [(prop, f"repeat({value}, minmax(0, 1fr))")], None
+        v = r.length(value, "")
+        return ([(prop, v)], None) if v and not value.isdigit() else None
+    if root == "col-span" and value.isdigit():
+        return [("grid-column", f"span {value} / span {value}")], None
+    if root in {"col-start", "col-end", "row-start", "row-end"} and value.isdigit():
+        return [(f"grid-{root.replace('col', 'column')}", value)], None
+    if root == "line-clamp" and value.isdigit():
+        return [
+            ("overflow", "hidden"),
+            ("display", "-webkit-box"),
+            ("-webkit-box-orient", "vertical"),
+            ("-webkit-line-clamp", value),
+        ], None
+    if root == "cursor" and value in _CURSORS:
+        return [("cursor", value)], None
+    if root in {"overflow", "overflow-x", "overflow-y"} and value in _OVERFLOW:
+        return [(root, value)], None
+    if root == "animate":
+        v = r.themed("animate", value)
+        return ([("animation", v)], None) if v else None
+    if root == "rounded" or root.startswith("rounded-"):
+        corners = {
+            "rounded": ("border-radius",),
+            "rounded-t": ("border-top-left-radius", "border-top-right-radius"),
+            "rounded-b": ("border-bottom-left-radius", "border-bottom-right-radius"),
+            "rounded-l": ("border-top-left-radius", "border-bottom-left-radius"),
+            "rounded-r": ("border-top-right-radius", "border-bottom-right-radius"),
+        }.get(root)
+        v = {"full": "calc(infinity * 1px)", "none": "0"}.get(value) or r.themed("radius", value)
+        return ([(p, v) for p in corners], None) if corners and v else None
+    if root in {"border", "border-x", "border-y", "border-t", "border-r", "border-b", "border-l"}:
+        sides = _SIDES[root[7:] if len(root) > 6 else ""]
+        width = r.length(value)
+        if width is not None:
+            decls: Decls = []
+            for side in sides:
+                decls += [
+                    (f"border{side}-style", "var(--tw-border-style)"),
+                    (f"border{side}-width", width),
+                ]
+            return decls, None
+        color = r.color(value)
+        if color is not None:
+            return [(f"border{side}-color", color) for side in sides], None
+        return None
+    if root == "bg":
+        if value.startswith("(image:") and value.endswith(")"):
+            return [("background-image", f"var({value[7:-1]})")], None
+        color = r.color(value)
+        return ([("background-color", color)], None) if color else None
+    if root in {"bg-position", "bg-size", "mask-size", "mask-position"}:
+        prop = {"bg": "background", "mask": "mask"}[root.split("-")[0]] + "-" + root.split("-")[1]
+        v = r.length(value, "")
+        return ([(prop, v)], None) if v and value.startswith("[") else None
+    if root == "mask":
+        if value.startswith("(") and value.endswith(")"):
+            return [("mask-image", f"var({value[1:-1]})")], None
+        return None
+    if root == "text":
+        size = r.themed("text", value)
+        if size is not None and not value.startswith("("):
+            lh = f"--text-{value}--line-height"
+            decls = [("font-size", size)]
+            if lh in r.theme.vars:
+                decls.append(("line-height", f"var(--tw-leading, var({lh}))"))
+            return decls, None
+        color = r.color(value)
+        return ([("color", color)], None) if color else None
+    if root == "font":
+        v = r.themed("font-weight", value)
+        if v is not None:
+            return [("--tw-font-weight", v), ("font-weight", v)], None
+        v = r.themed("font", value)
+        return ([("font-family", v)], None) if v else None
+    if root == "leading":
+        v = r.themed("leading", value) or r.spacing(value)
+        return ([("--tw-leading", v), ("line-height", v)], None) if v else None
+    if root == "tracking":
+        v = r.themed("tracking", value)
+        return ([("--tw-tracking", v), ("letter-spacing", v)], None) if v else None
+    if root == "underline-offset":
+        v = r.length(value)
+        return ([("text-underline-offset", v)], None) if v else None
+    if root == "shadow":
+        if value == "none":
+            return [("--tw-shadow", "0 0 #0000"), ("box-shadow", _BOX_SHADOW)], None
+        v = r.themed("shadow", value)
+        if v is not None:
+            return [("--tw-shadow", v), ("box-shadow", _BOX_SHADOW)], None
+        color = r.color(value)
+        return ([("--tw-shadow-color", color)], None) if color else None
+    if root == "ring":
+        width = r.length(value)
+        if width is not None:
+            return [
+                (
+                    "--tw-ring-shadow",
+                    (
+                        "var(--tw-ring-inset,) 0 0 0 calc("
+                        f"{width} + var(--tw-ring-offset-width)) var(--tw-ring-color, currentcolor)"
+                    ),
+                ),
+                ("box-shadow", _BOX_SHADOW),
+            ], None
+        color = r.color(value)
+        return ([("--tw-ring-color", color)], None) if color else None
+    if root == "ring-offset":
+        width = r.length(value)
+        if width is not None:
+            return [
+                ("--tw-ring-offset-width", width),
+                (
+                    "--tw-ring-offset-shadow",
+                    (
+                        "var(--tw-ring-inset,) 0 0 0 var(--tw-ring-offset-width) "
+                        "var(--tw-ring-offset-color)"
+                    ),
+                ),
+            ], None
+        color = r.color(value)
+        return ([("--tw-ring-offset-color", color)], None) if color else None
+    if root == "outline":
+        width = r.length(value)
+        if width is not None:
+            return [("outline-style", "var(--tw-outline-style)"), ("outline-width", width)], None
+        color = r.color(value)
+        return ([("outline-color", color)], None) if color else None
+    if root in {"backdrop-blur", "blur"}:
+        v = r.themed("blur", value)
+        if v is None:
+            return None
+        if root == "blur":
+            return [("filter", f"blur({v})")], None
+        return [("-webkit-backdrop-filter", f"blur({v})"), ("backdrop-filter", f"blur({v})")], None
+    if root == "transition":
+        if value.startswith("[") and value.endswith("]"):
+            props = _arbitrary(value[1:-1])
+        elif value == "none":
+            return [("transition-property", "none")], None
+        else:
+            props = _TRANSITION_PROPERTIES.get(value)
+        if props is None:
+            return None
+        return [
+            ("transition-property", props),
+            (
+                "transition-timing-function",
+                "var(--tw-ease, var(--default-transition-timing-function))",
+            ),
+            ("transition-duration", "var(--tw-duration, var(--default-transition-duration))"),
+        ], None
+    if root == "duration":
+        v = r.length(value, "ms")
+        return ([("--tw-duration", v), ("transition-duration", v)], None) if v else None
+    if root == "ease":
+        v = r.themed("ease", value) or {"linear": "linear"}.get(value)
+        return ([("--tw-ease", v), ("transition-timing-function", v)], None) if v else None
+    if root == "content":
+        v = r.length(value, "")
+        if v is None or not value.startswith("["):
+            return None
+        return [("--tw-content", v), ("content", "var(--tw-content)")], None
+    if root == "@container":
+        return [("container-type", "inline-size"), ("container-name", value)], None
+    return None
+
+
+# Bare utilities whose value is implicit (``border`` == ``border-1px``).
+_BARE = {
+    "border": "1",
+    "border-t": "1",
+    "border-b": "1",
+    "border-l": "1",
+    "border-r": "1",
+    "border-x": "1",
+    "border-y": "1",
+    "ring": "1",
+    "shadow": "sm",
+    "transition": "",
+    "backdrop-blur": "sm",
+    "blur": "sm",
+    "outline": "1",
+}
+
+# Functional roots, longest first so ``gap-x`` wins over ``gap``.
+_ROOTS = sorted(
+    {
+        *(f"{p}{s}" for p in "pm" for s in _SIDES),
+        *_INSET_PROPS,
+        "gap",
+        "gap-x",
+        "gap-y",
+        "space-x",
+        "space-y",
+        "w",
+        "h",
+        "size",
+        "min-w",
+        "min-h",
+        "max-w",
+        "max-h",
+        "translate-x",
+        "translate-y",
+        "scale",
+        "rotate",
+        "z",
+        "opacity",
+        "order",
+        "grid-cols",
+        "grid-rows",
+        "col-span",
+        "col-start",
+        "col-end",
+        "row-start",
+        "row-end",
+        "line-clamp",
+        "cursor",
+        "overflow",
+        "overflow-x",
+        "overflow-y",
+        "animate",
+        "rounded",
+        "rounded-t",
+        "rounded-b",
+        "rounded-l",
+        "rounded-r",
+        "border",
+        "border-x",
+        "border-y",
+        "border-t",
+        "border-r",
+        "border-b",
+        "border-l",
+        "bg",
+        "bg-position",
+        "bg-size",
+        "mask",
+        "mask-size",
+        "mask-position",
+        "text",
+        "font",
+        "leading",
+        "tracking",
+        "underline-offset",
+        "shadow",
+        "ring",
+        "ring-offset",
+        "outline",
+        "backdrop-blur",
+        "blur",
+        "transition",
+        "duration",
+        "ease",
+        "content",
+        "@container",
+    },
+    key=len,
+    reverse=True,
+)
+
+# Cascade order of utility families: later families override earlier ones.
+_FAMILY_ORDER = [
+    "sr-only", "pointer-events", "visible", "invisible", "static", "fixed", "absolute",
+    "relative", "sticky", "inset", "inset-x", "inset-y", "top", "right", "bottom", "left", "z",
+    "order", "col-span", "col-start", "col-end", "row-start", "row-end", "m", "mx", "my", "ms",
+    "me", "mt", "mr", "mb", "ml", "line-clamp", "block", "inline-block", "inline", "flex",
+    "inline-flex", "grid", "inline-grid", "contents", "hidden", "aspect", "size", "h",
+    "max-h", "min-h", "w", "min-w", "max-w", "flex-1", "flex-auto", "flex-none", "shrink",
+    "grow", "caption", "translate-x", "translate-y", "scale", "rotate", "transform",
+    "animate", "cursor", "select", "resize", "appearance", "list", "auto-rows", "grid-cols",
+    "grid-rows", "flex-row", "flex-col", "flex-wrap", "flex-nowrap", "items", "justify",
+    "justify-items", "gap", "gap-x", "gap-y", "space-x", "space-y", "self", "truncate",
+    "overflow", "overflow-x", "overflow-y", "rounded", "rounded-t", "rounded-b", "rounded-l",
+    "rounded-r", "border", "border-x", "border-y", "border-t", "border-r", "border-b",
+    "border-l", "bg", "bg-size", "bg-position", "bg-no-repeat", "bg-repeat", "mask",
+    "mask-size", "mask-position", "mask-center", "mask-no-repeat", "object", "p", "px", "py",
+    "ps", "pe", "pt", "pr", "pb", "pl", "text-align", "align", "font", "text", "leading",
+    "tracking", "whitespace", "break", "text-color", "uppercase", "lowercase", "capitalize",
+    "italic", "tabular-nums", "underline", "no-underline", "underline-offset", "opacity",
+    "shadow", "ring", "ring-offset", "outline-none", "outline-hidden", "outline", "blur",
+    "grayscale", "backdrop-blur", "transition", "duration", "ease", "will-change", "content",
+    "@container",
+]  # fmt: skip
+_FAMILY_RANK = {name: i for i, name in enumerate(_FAMILY_ORDER)}
+
+
+def _family(utility: str, root: str | None) -> int:
+    if root == "text":
+        # Sizes sort before colors so ``text-sm text-primary`` never fight.
+        return _FAMILY_RANK["text"]
+    key = root or utility
+    while key:
+        if key in _FAMILY_RANK:
+            return _FAMILY_RANK[key]
+        key = key.rpartition("-")[0]
+    if utility.startswith("text-"):
+        return _FAMILY_RANK["text-align"]
+    return len(_FAMILY_ORDER)
+
+
+# -- variants -----------------------------------------------------------------------
+
+_PSEUDO_CLASSES = {
+    "first": "&:first-child",
+    "last": "&:last-child",
+    "only": "&:only-child",
+    "odd": "&:nth-child(odd)",
+    "even": "&:nth-child(even)",
+    "visited": "&:visited",
+    "open": "&:is([open], :popover-open, :open)",
+    "focus-within": "&:focus-within",
+    "hover": "&:hover",
+    "focus": "&:focus",
+    "focus-visible": "&:focus-visible",
+    "active": "&:active",
+    "enabled": "&:enabled",
+    "disabled": "&:disabled",
+    "checked": "&:checked",
+    "required": "&:required",
+    "invalid": "&:invalid",
+    "empty": "&:empty",
+}
+_PSEUDO_ELEMENTS = {
+    "before": "&::before",
+    "after": "&::after",
+    "placeholder": "&::placeholder",
+    "file": "&::file-selector-button",
+    "selection": "& *::selection, &::selection",
+    "marker": "& *::marker, &::marker",
+}
+# Sort rank of each variant kind (Tailwind v4 registration order, condensed).
+_VARIANT_RANK = {
+    name: i
+    for i, name in enumerate(
+        [
+            "not",
+            "group",
+            "peer",
+            "arbitrary",
+            "before",
+            "after",
+            "placeholder",
+            "file",
+            "selection",
+            "marker",
+            "first",
+            "last",
+            "only",
+            "odd",
+            "even",
+            "visited",
+            "open",
+            "focus-within",
+            "hover",
+            "focus",
+            "focus-visible",
+            "active",
+            "enabled",
+            "disabled",
+            "checked",
+            "required",
+            "invalid",
+            "empty",
+            "has",
+            "aria",
+            "data",
+            "supports",
+            "dark",
+            "max",
+            "breakpoint",
+            "container",
+        ]
+    )
+}
+
+
+@dataclass
+class _Variant:
+    kind: str
+    # Selector template (``&`` is the current selector) or None for wrapper-only variants.
+    selector: str | None = None
+    # At-rule prelude wrapping the rule, e.g. ``@media (hover: hover)``.
+    wrapper: str | None = None
+    sort: tuple[int, ...] = ()
+
+
+def _condition(name: str, theme: Theme) -> str | None:
+    """Selector condition (relative to an element) for ``group-*``/``peer-*``/``has-*``."""
+    if name in _PSEUDO_CLASSES:
+        return _PSEUDO_CLASSES[name].replace("&", "")
+    if name.startswith("not-"):
+        inner = _condition(name[4:], theme)
+        return f":not(*{inner})" if inner else None
+    if name.startswith("[") and name.endswith("]"):
+        inner = _arbitrary(name[1:-1])
+        return inner.replace("&", "") if "&" in inner else f":is({inner})"
+    if name.startswith("aria-"):
+        value = name[5:]
+        if value.startswith("["):
+            return f"[aria-{_arbitrary(value[1:-1])}]"
+        return f'[aria-{value}="true"]'
+    if name.startswith("data-"):
+        value = name[5:]
+        return f"[data-{_arbitrary(value[1:-1])}]" if value.startswith("[") else f"[data-{value}]"
+    return None
+
+
+def parse_variant(name: str, theme: Theme) -> _Variant | None:
+    if name in theme.variants:
+        return _Variant("dark" if name == "dark" else "arbitrary", selector=theme.variants[name])
+    if name == "dark":
+        return _Variant("dark", wrapper="@media (prefers-color-scheme: dark)")
+    if name == "hover":
+        return _Variant("hover", selector="&:hover", wrapper="@media (hover: hover)")
+    if name in _PSEUDO_CLASSES:
+        return _Variant(name, selector=_PSEUDO_CLASSES[name])
+    if name in _PSEUDO_ELEMENTS:
+        return _Variant(name, selector=_PSEUDO_ELEMENTS[name])
+    if name.startswith("[") and name.endswith("]"):
+        sel = _arbitrary(name[1:-1])
+        if sel.startswith("@"):
+            return _Variant("arbitrary", wrapper=sel)
+        return _Variant("arbitrary", selector=sel if "&" in sel else f"&:is({sel})")
+    if name.startswith(("group-", "peer-")):
+        kind, _, rest = name.partition("-")
+        cond = _condition(rest, theme)
+        if cond is None:
+            return None
+        relation = " *" if kind == "group" else " ~ *"
+        wrapper = "@media (hover: hover)" if rest == "hover" else None
+        return _Variant(kind, selector=f"&:is(:where(.{kind}){cond}{relation})", wrapper=wrapper)
+    if name.startswith("not-"):
+        cond = _condition(name[4:], theme)
+        return _Variant("not", selector=f"&:not(*{cond})") if cond else None
+    if name.startswith("has-"):
+        rest = name[4:]
+        if rest.startswith("[") and rest.endswith("]"):
+            return _Variant("has", selector=f"&:has({_arbitrary(rest[1:-1])})")
+        cond = _condition(rest, theme)
+        if cond is None:
+            return None
+        inner = cond if cond.startswith(":") else f"*{cond}"
+        return _Variant("has", selector=f"&:has({inner})")
+    if name.startswith(("aria-", "data-")):
+        cond = _condition(name, theme)
+        return _Variant(name[:4], selector=f"&{cond}") if cond else None
+    if name.startswith("supports-[") and name.endswith("]"):
+        cond = _arbitrary(name[10:-1])
+        if ":" not in cond:
+            cond = f"{cond}: var(--tw)"
+        return _Variant("supports", wrapper=f"@supports ({cond})")
+    bp = theme.vars.get(f"--breakpoint-{name.removeprefix('max-')}")
+    if bp is not None:
+        if name.startswith("max-"):
+            return _Variant("max", wrapper=f"@media (width < {bp})", sort=(-_bp_rank(bp),))
+        return _Variant("breakpoint", wrapper=f"@media (width >= {bp})", sort=(_bp_rank(bp),))
+    if name.startswith("@"):
+        size = theme.vars.get(f"--container-{name[1:]}")
+        if size is not None:
+            return _Variant(
+                "container", wrapper=f"@container (width >= {size})", sort=(_bp_rank(size),)
+            )
+    return None
+
+
+def _bp_rank(size: str) -> int:
+    m = re.match(r"([\d.]+)rem", size)
+    return int(float(m[1]) * 16) if m else 0
+
+
+# -- generation ---------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Rule:
+    selector: str
+    decls: tuple[tuple[str, str], ...]
+    wrappers: tuple[str, ...]
+    sort: tuple
+
+
+@dataclass(frozen=True)
+class CSSBuild:
+    """Result of a generation: the stylesheet plus classes it could not resolve."""
+
+    css: str
+    unsupported: tuple[str, ...]
+    digest: str
+
+
+def resolve_class(cls: str, theme: Theme) -> _Rule | None:
+    """Compile one class to a rule, or None when it is not a supported utility."""
+    *variant_names, utility = split_variants(cls)
+    important = False
+    if utility.endswith("!"):
+        utility, important = utility[:-1], True
+    elif utility.startswith("!"):
+        utility, important = utility[1:], True
+    negative = utility.startswith("-")
+    if negative:
+        utility = utility[1:]
+    if not utility:
+        return None
+
+    resolver = _Resolver(theme)
+    resolved = None
+    root = None
+    if not negative and utility in _STATIC:
+        resolved = (_STATIC[utility], None)
+    else:
+        for candidate in _ROOTS:
+            if utility == candidate and candidate in _BARE:
+                root, value = candidate, _BARE[candidate]
+            elif utility.startswith(candidate + "-") or (
+                candidate == "@container" and utility.startswith("@container/")
+            ):
+                root, value = candidate, utility[len(candidate) + 1 :]
+            else:
+                continue
+            resolved = _functional(resolver, root, value, negative)
+            if resolved is not None:
+                break
+        if resolved is None and utility == "@container":
+            root, resolved = "@container", ([("container-type", "inline-size")], None)
+    if resolved is None:
+        return None
+    decls, template = resolved
+
+    selector = "." + escape_class(cls)
+    wrappers: list[str] = []
+    ranks: list[tuple[int, ...]] = []
+    pseudo_element = False
+    for name in variant_names:
+        variant = parse_variant(name, theme)
+        if variant is None:
+            return None
+        if variant.selector:
+            selector = ", ".join(
+                part.strip().replace("&", selector) for part in variant.selector.split(", ")
+            )
+        if variant.wrapper:
+            wrappers.append(variant.wrapper)
+        pseudo_element |= variant.kind in {"before", "after"}
+        ranks.append((_VARIANT_RANK[variant.kind], *variant.sort))
+    if template:
+        selector = template.replace("&", selector)
+    if pseudo_element and not any(p == "content" for p, _ in decls):
+        decls = [*decls, ("content", "var(--tw-content)")]
+    if important:
+        decls = [(p, f"{v} !important") for p, v in decls]
+    sort = (tuple(sorted(ranks)), _family(utility, root), cls)
+    return _Rule(selector=selector, decls=tuple(decls), wrappers=tuple(wrappers), sort=sort)
+
+
+def _render_rule(rule: _Rule) -> str:
+    indent = "  " * len(rule.wrappers)
+    body = "".join(f"{indent}  {p}: {v};\n" for p, v in rule.decls)
+    out = f"{indent}{rule.selector} {{\n{body}{indent}}}\n"
+    for depth, wrapper in reversed(list(enumerate(rule.wrappers))):
+        pad = "  " * depth
+        out = f"{pad}{wrapper} {{\n{out}{pad}}}\n"
+    return out
+
+
+def generate_css(classes: Iterable[str], theme_css: str) -> CSSBuild:
+    """Generate the stylesheet for ``classes`` with the theme in ``theme_css``.
+
+    The output mirrors a Tailwind v4 build: theme variables, a preflight, the theme's
+    own CSS, then one rule per class in the ``utilities`` layer, in cascade order.
+    """
+    theme = parse_theme(theme_css)
+    rules: list[_Rule] = []
+    unsupported: list[str] = []
+    for cls in sorted(set(classes)):
+        rule = resolve_class(cls, theme)
+        if rule is None:
+            unsupported.append(cls)
+        else:
+            rules.append(rule)
+    rules.sort(key=lambda r: r.sort)
+
+    theme_vars = "".join(f"    {k}: {v};\n" for k, v in theme.vars.items())
+    utilities = "\n".join(_render_rule(r) for r in rules)
+    utilities = "".join(f"  {line}\n" if line else "\n" for line in utilities.splitlines())
+    used_keyframes = [
+        frames
+        for name, frames in _KEYFRAMES.items()
+        if any(f"animate-{name}" in cls for cls in classes)
+    ]
+    css = (
+        "@layer theme, base, components, utilities;\n"
+        f"@layer theme {{\n  :root, :host {{\n{theme_vars}  }}\n}}\n"
+        "@layer base {\n"
+        + "".join(f"  {line}\n" if line else "\n" for line in _PREFLIGHT.splitlines())
+        + "".join(f"  {line}\n" for line in _PROPERTY_DEFAULTS.splitlines())
+        + "}\n"
+        + theme.css
+        + f"@layer utilities {{\n{utilities}}}\n"
+        + "".join(used_keyframes)
+    )
+    return CSSBuild(css=css, unsupported=tuple(unsupported), digest="")
+
+
+# -- vocabulary and caching -----------------------------------------------------------
+
+# ``class="..."`` attributes (not ``:class`` bindings) in rendered HTML.
+_CLASS_ATTR_RE = re.compile(r"""(?<![\w:@.-])class=(?:"([^"]*)"|'([^']*)')""")
+
+
+def html_classes(markup: str) -> set[str]:
+    """Classes used in ``class`` attributes of rendered HTML."""
+    out: set[str] = set()
+    for m in _CLASS_ATTR_RE.finditer(markup):
+        out.update(html.unescape(m[1] if m[1] is not None else m[2]).split())
+    return out
+
+
+def _cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "htpy-uikit" / "css"
+
+
+def build_css(classes: Iterable[str], theme_css: str, *, use_cache: bool = True) -> CSSBuild:
+    """Like ``generate_css`` but cached on disk by a hash of the classes and theme."""
+    vocabulary = sorted(set(classes))
+    h = hashlib.sha256(f"{GENERATOR_VERSION}\n{theme_css}\n".encode())
+    h.update("\n".join(vocabulary).encode())
+    digest = h.hexdigest()[:16]
+    path = _cache_dir() / f"{digest}.css"
+    unsupported_path = path.with_suffix(".unsupported")
+    if use_cache:
+        try:
+            css = path.read_text(encoding="utf-8")
+            unsupported = unsupported_path.read_text(encoding="utf-8").split()
+            return CSSBuild(css=css, unsupported=tuple(unsupported), digest=digest)
+        except OSError:
+            pass
+    result = generate_css(vocabulary, theme_css)
+    if use_cache:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(result.css, encoding="utf-8")
+            unsupported_path.write_text("\n".join(result.unsupported), encoding="utf-8")
+        except OSError:
+            pass  # the cache is an optimisation; a read-only home must not break the build
+    return CSSBuild(css=result.css, unsupported=result.unsupported, digest=digest)
@@ -1,5 +1,11 @@
+from contextvars import ContextVar
+
 from htpy import Node, div, h2, p, span
 
+# True while the page is built for ``python -m scripts.server_demo``, which serves the
+# /demo/* endpoints that the remote demos fetch from; the static build has none.
+DEMO_SERVER: ContextVar[bool] = ContextVar("htpy_uikit_demo_server", default=False)
+
 
 def _demo_section(title: str, description: str | None = None, content: list[Node] = []) -> Node:
     """Helper function to create demo sections."""
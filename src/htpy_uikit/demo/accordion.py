@@ -1,9 +1,31 @@
 from htpy import Node
+from htpy import div
+from htpy import p
 
 from htpy_uikit.components.accordion import accordion
+from htpy_uikit.components.deferred import DeferredPanels
 
+from ._utils import DEMO_SERVER
 from ._utils import _demo_section
 
+# Deferred FAQ answers; `python -m scripts.server_demo` serves them from /demo/panels.
+FAQ_PANELS = DeferredPanels("/demo/panels?key={key}")
+FAQ_TOPICS = ("Billing", "Shipping", "Returns", "Accounts")
+for _topic in FAQ_TOPICS:
+    FAQ_PANELS.register(
+        _topic.lower(),
+        lambda topic=_topic: div(class_="grid gap-2")[
+            [p(class_="text-sm")[f"{topic} answer, part {i + 1}."] for i in range(3)]
+        ],
+    )
+
+
+def _faq_answer(key: str) -> Node:
+    if not DEMO_SERVER.get():
+        # Static build: no /demo/panels endpoint, so the answer renders with the page.
+        return FAQ_PANELS.render(key)
+    return FAQ_PANELS.panel(key, prefetch=True)
+
 
 def accordion_section() -> Node:
     return _demo_section(
@@ -25,6 +47,14 @@ def accordion_section() -> Node:
                         "content": "Yes! All components accept class overrides and additional attributes.",
                     },
                 ]
-            )
+            ),
+            # Answers load on first expand (prefetched on hover)
+            accordion(
+                [
+                    {"title": f"{topic} questions", "content": _faq_answer(topic.lower())}
+                    for topic in FAQ_TOPICS
+                ],
+                class_="mt-6",
+            ),
         ],
     )
@@ -1,9 +1,11 @@
-from htpy import Node, div, p
+from htpy import Node, div, p, span
 
 from htpy_uikit.components.alert_dialog import (
     alert_dialog,
     alert_dialog_destructive,
+    alert_dialog_host,
     attrs_btn_open_alert_dialog,
+    attrs_btn_open_alert_dialog_host,
     confirm_dialog,
 )
 from htpy_uikit.components.button import button_component
@@ -48,6 +50,26 @@ def alert_dialog_section() -> Node:
                     variant="outline",
                     **attrs_btn_open_alert_dialog("manual-alert-dialog"),
                 )["Open manual dialog"],
+                # One host for many triggers: each row carries only its data attributes
+                alert_dialog_host(id="demo-alert-dialog-host", action_variant="destructive"),
+                div(class_="grid gap-2 max-w-sm")[
+                    [
+                        div(class_="flex items-center justify-between")[
+                            span(class_="text-sm")[name],
+                            button_component(
+                                variant="outline",
+                                size="sm",
+                                **attrs_btn_open_alert_dialog_host(
+                                    f"Delete {name}?",
+                                    description="This cannot be undone.",
+                                    confirm_text="Delete",
+                                    host_id="demo-alert-dialog-host",
+                                ),
+                            )["Delete"],
+                        ]
+                        for name in ("Invoice 1042", "Invoice 1043", "Invoice 1044")
+                    ]
+                ],
             ]
         ],
     )
@@ -2,7 +2,29 @@ from htpy import Node, div
 
 from htpy_uikit.components.combobox import combobox
 
-from ._utils import _demo_section
+from ._utils import DEMO_SERVER, _demo_section
+
+
+def _customer_combobox() -> Node:
+    if not DEMO_SERVER.get():
+        # Static build: no search endpoint, so filter a short list in the browser.
+        return combobox(
+            name="customer",
+            options=[{"value": f"c-{i:05}", "label": f"Customer {i:05}"} for i in range(50)],
+            value="c-00042",
+            placeholder="Search customers...",
+            width_class="w-[220px]",
+        )
+    # Remote search: options come from the server per query
+    # (scripts/server_demo.py serves 80,000 customers).
+    return combobox(
+        name="customer",
+        options=[{"value": "c-00042", "label": "Customer 00042"}],
+        value="c-00042",
+        placeholder="Search customers...",
+        width_class="w-[220px]",
+        search_url="/demo/customers",
+    )
 
 
 def combobox_section() -> Node:
@@ -38,6 +60,16 @@ def combobox_section() -> Node:
                     width_class="w-[220px]",
                     popover_width_class="w-72",
                 ),
+                _customer_combobox(),
+                # Lazy options: 2,000 options ship as JSON and become DOM on first open
+                combobox(
+                    name="ticket",
+                    options=[{"value": f"t-{i}", "label": f"Ticket #{i:04}"} for i in range(2000)],
+                    value="t-1200",
+                    placeholder="Search tickets...",
+                    width_class="w-[220px]",
+                    lazy_options=True,
+                ),
             ]
         ],
     )
@@ -1,9 +1,48 @@
-from htpy import Node, div, p
+from htpy import Node, div, form as form_, p
 
 from htpy_uikit.components.button import button_component
+from htpy_uikit.components.input import input_component
+from htpy_uikit.components.label import label_component
 from htpy_uikit.components.modal import attrs_btn_open_modal, modal
 
-from ._utils import _demo_section
+from ._utils import DEMO_SERVER, _demo_section
+
+
+def edit_profile_form() -> Node:
+    # Body of the deferred modal; `python -m scripts.server_demo` serves it from
+    # /demo/dialog/edit-profile the first time the modal opens.
+    return form_(class_="form grid gap-4")[
+        div(class_="grid gap-2")[
+            label_component(for_="demo-deferred-name")["Name"],
+            input_component(type="text", id="demo-deferred-name", value="Pedro Duarte"),
+        ],
+        div(class_="grid gap-2")[
+            label_component(for_="demo-deferred-username")["Username"],
+            input_component(type="text", id="demo-deferred-username", value="@peduarte"),
+        ],
+        button_component(variant="primary")["Save changes"],
+    ]
+
+
+def _deferred_modal() -> Node:
+    if not DEMO_SERVER.get():
+        # Static build: no /demo/dialog endpoint, so the body renders with the page.
+        return [
+            button_component(variant="outline", **attrs_btn_open_modal("demo-modal-deferred"))[
+                "Edit profile"
+            ],
+            modal(id="demo-modal-deferred", title="Edit profile")[edit_profile_form()],
+        ]
+    return [
+        button_component(
+            variant="outline", **attrs_btn_open_modal("demo-modal-deferred", prefetch=True)
+        )["Edit profile (deferred)"],
+        modal(
+            id="demo-modal-deferred",
+            title="Edit profile",
+            content_url="/demo/dialog/edit-profile",
+        ),
+    ]
 
 
 def dialog_section() -> Node:
@@ -21,6 +60,7 @@ def dialog_section() -> Node:
                         ],
                     ]
                 ],
+                _deferred_modal(),
             ]
         ],
     )
@@ -0,0 +1,89 @@
+"""Init-time benchmark page: 500 interactive components, hydrated eagerly or lazily.
+
+`build_demo_assets` writes `hydration.html` (eager) and `hydration-lazy.html`
+(`lazy_hydrate=True`); `python -m scripts.server_demo` serves both. The banner reports
+how long `Alpine.start()` took and when the first frame after it was painted (which
+includes the components' `$nextTick` work), so the two pages can be compared directly
+(use CPU throttling in devtools to approximate a low-end device).
+"""
+
+from htpy import Node
+from htpy import a
+from htpy import body
+from htpy import div
+from htpy import head
+from htpy import html
+from htpy import link
+from htpy import meta
+from htpy import p
+from htpy import script
+from htpy import title
+from markupsafe import Markup
+
+from htpy_uikit.components.combobox import combobox
+from htpy_uikit.components.dropdown_menu import dropdown_menu
+from htpy_uikit.components.dropdown_menu import dropdown_menu_item
+from htpy_uikit.components.hydrate import lazy_hydration_script
+from htpy_uikit.components.select import select_component
+from htpy_uikit.components.slider import slider
+from htpy_uikit.components.tooltip import tooltip
+
+# Five components per row.
+ROWS = 100
+
+_MEASURE_JS = """
+document.addEventListener('alpine:init', () => { window.__alpineStart = performance.now(); });
+document.addEventListener('alpine:initialized', () => {
+    const start = window.__alpineStart, ms = (t) => (t - start).toFixed(1) + ' ms';
+    const done = performance.now();
+    requestAnimationFrame(() => {
+        const frame = performance.now();
+        document.getElementById('hydration-result').textContent =
+            'Alpine.start(): ' + ms(done) + ', first frame after start: ' + ms(frame);
+    });
+});
+"""
+
+
+def _row(index: int, lazy: bool) -> Node:
+    options = [{"value": f"{index}-{i}", "label": f"Option {i}"} for i in range(10)]
+    return div(class_="grid grid-cols-5 items-center gap-4 py-2 border-b border-border")[
+        select_component(
+            id=f"hydration-select-{index}", options=options, value=f"{index}-0", lazy_hydrate=lazy
+        ),
+        combobox(id=f"hydration-combobox-{index}", options=options, lazy_hydrate=lazy),
+        dropdown_menu(trigger="Actions", id=f"hydration-menu-{index}", lazy_hydrate=lazy)[
+            dropdown_menu_item("Edit"),
+            dropdown_menu_item("Duplicate"),
+            dropdown_menu_item("Delete"),
+        ],
+        tooltip(content=f"Row {index}", lazy_hydrate=lazy)[p(class_="text-sm")["Hover me"]],
+        slider(value=index % 100, show_value=True, lazy_hydrate=lazy),
+    ]
+
+
+def hydration_document(*, lazy: bool, rows: int = ROWS) -> Node:
+    """Return the benchmark page with ``rows * 5`` components."""
+    mode = "lazy" if lazy else "eager"
+    return html(lang="en")[
+        head()[
+            meta(charset="utf-8"),
+            meta(name="viewport", content="width=device-width, initial-scale=1"),
+            title()[f"htpy-uikit hydration ({mode})"],
+            link(rel="stylesheet", href="output.css"),
+            script[Markup(_MEASURE_JS)],
+            lazy and lazy_hydration_script(),
+            script(defer=True, src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js"),
+        ],
+        body(class_="bg-background text-foreground")[
+            div(class_="sticky top-0 z-40 bg-background border-b border-border p-4 text-sm")[
+                p(class_="font-medium")[f"{rows * 5} components, {mode} hydration"],
+                p(id="hydration-result", class_="text-muted-foreground")["Measuring..."],
+                p(class_="flex gap-4")[
+                    a(href="hydration.html", class_="underline")["Eager"],
+                    a(href="hydration-lazy.html", class_="underline")["Lazy"],
+                ],
+            ],
+            div(class_="p-4")[[_row(index, lazy) for index in range(rows)]],
+        ],
+    ]
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from htpy import (
     Node,
     body,
@@ -20,8 +22,10 @@ from htpy_uikit.components.lucide import (
     lucide_icon,
 )
 from htpy_uikit.components.navbar import navbar_simple
+from htpy_uikit.components.server_timing import timed_section
 from htpy_uikit.components.theme_toggle import theme_toggle
 
+from ._utils import DEMO_SERVER
 from .accordion import accordion_section
 from .alert import alert_section
 from .alert_dialog import alert_dialog_section
@@ -51,8 +55,53 @@ from .toast import toast_section
 from .tooltip import tooltip_section
 
 
-def demo_page() -> str:
-    doc = html(lang="en")[
+# (Server-Timing entry name, section) in page order.
+DEMO_SECTIONS: tuple[tuple[str, Callable[[], Node]], ...] = (
+    ("accordion", accordion_section),
+    ("alert", alert_section),
+    ("alert-dialog", alert_dialog_section),
+    ("avatar", avatar_section),
+    ("badge", badge_section),
+    ("breadcrumb", breadcrumb_section),
+    ("button", button_section),
+    ("card", card_section),
+    ("checkbox", checkbox_section),
+    ("combobox", combobox_section),
+    ("dialog", dialog_section),
+    ("dropdown-menu", dropdown_menu_section),
+    ("form", form_section),
+    ("input", input_section),
+    ("label", label_section),
+    ("pagination", pagination_section),
+    ("popover", popover_section),
+    ("radio-group", radio_group_section),
+    ("select", select_section),
+    ("skeleton", skeleton_section),
+    ("slider", slider_section),
+    ("switch", switch_section),
+    ("table", table_section),
+    ("tabs", tabs_section),
+    ("textarea", textarea_section),
+    ("toast", toast_section),
+    ("tooltip", tooltip_section),
+)
+
+
+def demo_page(*, server: bool = False) -> str:
+    return str(demo_document(server=server))
+
+
+def demo_document(*, server: bool = False) -> Node:
+    """Return the demo page; ``server`` enables the demos backed by /demo/* endpoints."""
+    token = DEMO_SERVER.set(server)
+    try:
+        return _demo_document()
+    finally:
+        DEMO_SERVER.reset(token)
+
+
+def _demo_document() -> Node:
+    return html(lang="en")[
         head()[
             meta(charset="utf-8"),
             meta(name="viewport", content="width=device-width, initial-scale=1"),
@@ -60,6 +109,7 @@ def demo_page() -> str:
             link(rel="stylesheet", href="output.css"),
             script(defer=True, src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js"),
             script(defer=True, src="https://unpkg.com/lucide@latest"),
+            script(defer=True, src="https://unpkg.com/htmx.org@2.0.4"),
             # Initialize theme inline to avoid FOUC
             script[
                 Markup(
@@ -77,7 +127,6 @@ def demo_page() -> str:
             lucide_auto_init_script(),
         ],
     ]
-    return str(doc)
 
 
 def components_demo_page() -> Node:
@@ -95,7 +144,9 @@ def components_demo_page() -> Node:
             # Header
             div(class_="relative overflow-hidden bg-background mt-6 w-full")[
                 div(class_="relative max-w-7xl py-4")[
-                    h1(class_="text-3xl font-bold tracking-tight text-foreground mb-2 inline-flex gap-3")[
+                    h1(
+                        class_="text-3xl font-bold tracking-tight text-foreground mb-2 inline-flex gap-3"
+                    )[
                         "Kitchen Sink",
                         lucide_icon("rocket"),
                     ],
@@ -106,33 +157,8 @@ def components_demo_page() -> Node:
             ],
             # Main content
             div(class_="space-y-16")[
-                accordion_section(),
-                alert_section(),
-                alert_dialog_section(),
-                avatar_section(),
-                badge_section(),
-                breadcrumb_section(),
-                button_section(),
-                card_section(),
-                checkbox_section(),
-                combobox_section(),
-                dialog_section(),
-                dropdown_menu_section(),
-                form_section(),
-                input_section(),
-                label_section(),
-                pagination_section(),
-                popover_section(),
-                radio_group_section(),
-                select_section(),
-                skeleton_section(),
-                slider_section(),
-                switch_section(),
-                table_section(),
-                tabs_section(),
-                textarea_section(),
-                toast_section(),
-                tooltip_section(),
+                # Each section is its own Server-Timing entry when the page is timed.
+                [timed_section(name, section) for name, section in DEMO_SECTIONS]
             ],
         ],
     ]
@@ -73,16 +73,35 @@ def select_section() -> Node:
                     ],
                     value="apple",
                 ),
-                # Scrollable long list
+                # Scrollable long list; options built on first open from a JSON island
                 select_component(
                     id="select-scrollbar",
                     width_class="w-[180px]",
                     scrollable=True,
+                    lazy_options=True,
                     options=[
                         *({"value": f"item-{i}", "label": f"Item {i}"} for i in range(0, 99))
                     ],
                     value="item-0",
                 ),
+                # Virtualized: 5k grouped options from a JSON island, only visible rows in the DOM
+                select_component(
+                    id="select-virtualized",
+                    width_class="w-[180px]",
+                    virtualized=True,
+                    options=[
+                        {
+                            "type": "group",
+                            "label": f"Items {start}-{start + 999}",
+                            "items": [
+                                {"value": f"row-{i}", "label": f"Row {i}"}
+                                for i in range(start, start + 1000)
+                            ],
+                        }
+                        for start in range(0, 5000, 1000)
+                    ],
+                    value="row-4200",
+                ),
                 # Disabled
                 select_component(
                     id="select-disabled",
@@ -6,7 +6,27 @@ from htpy_uikit.components.input import input_component
 from htpy_uikit.components.label import label_component
 from htpy_uikit.components.tabs import tabs
 
-from ._utils import _demo_section
+from ._utils import DEMO_SERVER, _demo_section
+
+
+def _dashboard_panel(title: str, rows: int) -> Node:
+    # Stands in for a panel that runs its own queries; only called when rendered.
+    return div(class_="p-4 grid gap-2")[
+        h2(class_="font-semibold")[title],
+        [p(class_="text-sm text-muted-foreground")[f"{title} item {i + 1}"] for i in range(rows)],
+    ]
+
+
+# Lazy dashboard tabs: only the active panel renders with the page; `python -m
+# scripts.server_demo` serves the others from /demo/tabs (see `tab_panel`).
+DASHBOARD_TABS = [
+    {
+        "value": value,
+        "label": value.title(),
+        "content": lambda v=value: _dashboard_panel(v.title(), 5),
+    }
+    for value in ("overview", "activity", "reports", "billing")
+]
 
 
 def tabs_section() -> Node:
@@ -161,5 +181,15 @@ def tabs_section() -> Node:
                     "preview",
                 )
             ],
+            # 5) Lazy panels, loaded with htmx on first activation; the static build
+            # has no /demo/tabs endpoint, so there every panel renders inline.
+            div(class_="mt-6 max-w-[420px]")[
+                tabs(
+                    DASHBOARD_TABS,
+                    "overview",
+                    id="demo-tabs-lazy",
+                    panel_url="/demo/tabs?tab={value}" if DEMO_SERVER.get() else None,
+                )
+            ],
         ],
     )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from .registry import sha256_file
+
+# Written next to the vendored components by `add` and `update`.
+LOCKFILE_NAME = "htpy-uikit.lock.json"
+LOCK_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LockEntry:
+    """One vendored file: where it came from and what it looked like when installed."""
+
+    # Package-relative key of the upstream module (e.g. "components/button.py").
+    source: str
+    # Hash of the upstream content that was copied (== installed content at that time).
+    sha256: str
+    # Stat of the installed file right after copying; lets unchanged files skip hashing.
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class Lockfile:
+    path: Path
+    entries: dict[str, LockEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, dest_dir: Path) -> Lockfile:
+        path = dest_dir / LOCKFILE_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path=path)
+        if not isinstance(data, dict) or data.get("version") != LOCK_VERSION:
+            return cls(path=path)
+        entries: dict[str, LockEntry] = {}
+        for name, raw in (data.get("files") or {}).items():
+            try:
+                entries[name] = LockEntry(**raw)
+            except TypeError:
+                continue
+        return cls(path=path, entries=entries)
+
+    def save(self) -> None:
+        data = {
+            "version": LOCK_VERSION,
+            "files": {name: asdict(e) for name, e in sorted(self.entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def record(self, dest: Path, source: str, sha256: str) -> None:
+        """Record ``dest`` as an unmodified copy of upstream ``source`` with hash ``sha256``."""
+        st = dest.stat()
+        self.entries[dest.name] = LockEntry(
+            source=source, sha256=sha256, size=st.st_size, mtime_ns=st.st_mtime_ns
+        )
+
+    def is_modified(self, dest: Path) -> bool:
+        """Whether the installed ``dest`` differs from what was recorded at install time.
+
+        A matching size and mtime is trusted without reading the file; otherwise the file
+        is hashed and compared to the recorded upstream hash.
+        """
+        entry = self.entries.get(dest.name)
+        if entry is None:
+            return True
+        try:
+            st = dest.stat()
+        except OSError:
+            return True
+        if st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns:
+            return False
+        if st.st_size != entry.size:
+            return True
+        return sha256_file(dest) != entry.sha256
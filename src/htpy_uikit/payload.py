@@ -0,0 +1,292 @@
+"""Attribute rendered HTML bytes to the component functions that produced them.
+
+``measure_payload`` renders a page with every public component patched to wrap its
+output in private-use marker characters, then strips the markers and splits each
+component's own bytes (its output minus nested components) into class attributes,
+Alpine/JS, SVG, text and other markup. Powers ``htpyuikit size``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import re
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from .components._instrument import COMPONENTS_PACKAGE
+from .components._instrument import ComponentFunction
+from .components._instrument import observe_render
+from .components._instrument import patch_components
+
+CATEGORIES = ("class", "js", "svg", "text", "other")
+# Report key for bytes rendered outside any component (the page's own markup).
+PAGE = "(page)"
+TOTAL = "total"
+
+# Unicode private-use characters: never produced by the components themselves.
+_OPEN = "\ue000"
+_OPEN_END = "\ue001"
+_CLOSE = "\ue002"
+_MARKER_RE = re.compile(f"{_OPEN}([^{_OPEN_END}]*){_OPEN_END}|{_CLOSE}")
+
+_HTML_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|</?([a-zA-Z][\w:-]*)[^>]*>|[^<]+|<",
+    re.DOTALL | re.IGNORECASE,
+)
+_ATTR_RE = re.compile(r"""\s+([^\s=/>"']+)(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+))?""")
+# Alpine directives and shorthands, inline handlers and htmx's hx-on.
+_JS_ATTR_RE = re.compile(r"^(?:x-|@|:|on[a-z]|hx-on)", re.IGNORECASE)
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(b|kb|kib|k|mb|mib|m)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {None: 1, "b": 1, "k": 1024, "kb": 1024, "kib": 1024}
+_SIZE_UNITS.update(dict.fromkeys(("m", "mb", "mib"), 1024 * 1024))
+BUDGET_METRICS = ("raw", "inclusive", "gzip", "brotli", *CATEGORIES)
+
+
+@dataclass
+class ComponentPayload:
+    """Bytes one component function put on the page, summed over its calls."""
+
+    name: str
+    calls: int = 0
+    # Everything between the outermost call's markers, nested components included.
+    inclusive: int = 0
+    # The component's own bytes per category (nested components excluded).
+    bytes: dict[str, int] = field(default_factory=lambda: dict.fromkeys(CATEGORIES, 0))
+    # Standalone compressed size of the component's own bytes (an estimate: compression
+    # across the whole page is not additive).
+    gzip: int = 0
+    brotli: int | None = None
+
+    @property
+    def raw(self) -> int:
+        return sum(self.bytes.values())
+
+    def metric(self, name: str) -> int | None:
+        if name == "raw":
+            return self.raw
+        if name in ("inclusive", "gzip", "brotli"):
+            return getattr(self, name)
+        return self.bytes.get(name)
+
+
+@dataclass
+class PayloadReport:
+    html: str
+    raw: int
+    gzip: int
+    brotli: int | None
+    components: dict[str, ComponentPayload]
+
+    def sorted_components(self) -> list[ComponentPayload]:
+        return sorted(self.components.values(), key=lambda c: (-c.raw, c.name))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            TOTAL: {"raw": self.raw, "gzip": self.gzip, "brotli": self.brotli},
+            "components": {
+                c.name: {
+                    "calls": c.calls,
+                    "raw": c.raw,
+                    "inclusive": c.inclusive,
+                    "gzip": c.gzip,
+                    "brotli": c.brotli,
+                    **c.bytes,
+                }
+                for c in self.sorted_components()
+            },
+        }
+
+
+def brotli_size(data: bytes) -> int | None:
+    """Brotli-compressed size, or None when neither ``brotli`` nor ``brotlicffi`` is installed."""
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    return len(brotli.compress(data))
+
+
+def _marking_wrapper(target: ComponentFunction) -> Callable[..., Any]:
+    func = target.func
+    opener = f"{_OPEN}{target.name}{_OPEN_END}"
+
+    def around(chunks: Iterator[str]) -> Iterator[str]:
+        yield opener
+        yield from chunks
+        yield _CLOSE
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return observe_render(func(*args, **kwargs), around)
+
+    return wrapper
+
+
+def measure_payload(render: Callable[[], Any], package: str = COMPONENTS_PACKAGE) -> PayloadReport:
+    """Render ``render()`` with ``package``'s components marked and attribute its bytes."""
+    with patch_components(_marking_wrapper, package):
+        marked = str(render())
+    return analyze_marked(marked)
+
+
+def _category_spans(html: str) -> Iterator[tuple[int, int, str]]:
+    """Yield ``(start, end, category)`` spans covering ``html``."""
+    svg_depth = 0
+    for m in _HTML_TOKEN_RE.finditer(html):
+        start, end = m.span()
+        raw_tag, tag = m[1], m[2]
+        if raw_tag:
+            category = "svg" if svg_depth else ("js" if raw_tag.lower() == "script" else "other")
+            yield start, end, category
+            continue
+        if not tag:
+            yield start, end, "svg" if svg_depth else ("other" if m[0] == "<" else "text")
+            continue
+        closing = m[0].startswith("</")
+        if tag.lower() == "svg":
+            svg_depth += -1 if closing else 1
+            if closing or svg_depth:
+                yield start, end, "svg"
+                continue
+        if svg_depth:
+            yield start, end, "svg"
+            continue
+        if closing:
+            yield start, end, "other"
+            continue
+        pos = start
+        for attr in _ATTR_RE.finditer(html, start + 1 + len(tag), end):
+            name = attr[1].lower()
+            if name == "class":
+                category = "class"
+            elif _JS_ATTR_RE.match(name):
+                category = "js"
+            else:
+                continue
+            yield pos, attr.start(), "other"
+            yield attr.start(), attr.end(), category
+            pos = attr.end()
+        yield pos, end, "other"
+
+
+def analyze_marked(marked: str) -> PayloadReport:
+    """Strip the markers from ``marked`` and attribute every byte to its component."""
+    # Pass 1: clean HTML plus (start, end, owner) runs; owner indexes ``names``.
+    parts: list[str] = []
+    owners: list[tuple[int, int, int]] = []
+    names: list[str] = []
+    spans: list[list[int]] = []
+    stack: list[int] = []
+    pos = clean_len = 0
+    for m in _MARKER_RE.finditer(marked):
+        if m.start() > pos:
+            text = marked[pos : m.start()]
+            parts.append(text)
+            owners.append((clean_len, clean_len + len(text), stack[-1] if stack else -1))
+            clean_len += len(text)
+        if m[1] is not None:
+            stack.append(len(names))
+            names.append(m[1])
+            spans.append([clean_len, clean_len])
+        elif stack:
+            spans[stack.pop()][1] = clean_len
+        pos = m.end()
+    if pos < len(marked):
+        parts.append(marked[pos:])
+        owners.append((clean_len, len(marked) - pos + clean_len, stack[-1] if stack else -1))
+    html = "".join(parts)
+
+    components: dict[str, ComponentPayload] = {}
+    chunks: dict[str, list[str]] = {}
+
+    def entry(name: str) -> ComponentPayload:
+        if name not in components:
+            components[name] = ComponentPayload(name)
+            chunks[name] = []
+        return components[name]
+
+    # Calls and inclusive bytes; a call nested in a call of the same name counts once.
+    open_names: list[tuple[str, int]] = []
+    for name, (start, end) in zip(names, spans, strict=True):
+        while open_names and open_names[-1][1] <= start:
+            open_names.pop()
+        comp = entry(name)
+        comp.calls += 1
+        if all(n != name for n, _ in open_names):
+            comp.inclusive += len(html[start:end].encode())
+        open_names.append((name, end))
+
+    # Pass 2: intersect the owner runs with the category spans.
+    runs = iter(owners)
+    run = next(runs, None)
+    for start, end, category in _category_spans(html):
+        while start < end and run is not None:
+            if run[1] <= start:
+                run = next(runs, None)
+                continue
+            cut = min(end, run[1])
+            text = html[start:cut]
+            name = names[run[2]] if run[2] >= 0 else PAGE
+            entry(name).bytes[category] += len(text.encode())
+            chunks[name].append(text)
+            start = cut
+
+    for name, comp in components.items():
+        data = "".join(chunks[name]).encode()
+        comp.gzip = len(gzip.compress(data)) if data else 0
+        comp.brotli = brotli_size(data) if data else 0
+    encoded = html.encode()
+    return PayloadReport(
+        html=html,
+        raw=len(encoded),
+        gzip=len(gzip.compress(encoded)),
+        brotli=brotli_size(encoded),
+        components=components,
+    )
+
+
+def parse_size(value: str | int) -> int:
+    """Parse ``"20KB"``, ``"1.5 MB"`` or ``512`` into bytes (1 KB = 1024 bytes)."""
+    if isinstance(value, int):
+        return value
+    m = _SIZE_RE.match(value)
+    if not m:
+        raise ValueError(f"invalid size {value!r}; use e.g. 512, 20KB or 1.5MB")
+    unit = m[2].lower() if m[2] else None
+    return int(float(m[1]) * _SIZE_UNITS[unit])
+
+
+def check_budgets(
+    report: PayloadReport, budgets: Mapping[str, str | int]
+) -> tuple[list[str], list[str]]:
+    """Compare ``report`` with ``NAME[.METRIC] -> size`` budgets.
+
+    ``NAME`` is a component function, ``(page)`` or ``total``; ``METRIC`` is one of
+    ``BUDGET_METRICS`` and defaults to ``raw`` (the component's own bytes). Returns
+    ``(failures, skipped)`` messages; brotli budgets are skipped without a brotli module.
+    """
+    failures: list[str] = []
+    skipped: list[str] = []
+    for key, limit in budgets.items():
+        name, _, metric = key.partition(".")
+        metric = metric or "raw"
+        if metric not in BUDGET_METRICS:
+            raise ValueError(f"unknown metric {metric!r} in budget {key!r}")
+        limit_bytes = parse_size(limit)
+        if name == TOTAL:
+            actual = {"raw": report.raw, "gzip": report.gzip, "brotli": report.brotli}.get(metric)
+        else:
+            comp = report.components.get(name)
+            actual = comp.metric(metric) if comp else 0
+        if actual is None:
+            skipped.append(f"{key}: not measured (install brotli)")
+        elif actual > limit_bytes:
+            failures.append(f"{key}: {actual} B exceeds budget of {limit_bytes} B")
+    return failures, skipped
@@ -0,0 +1,224 @@
+"""Attribute render CPU time and peak memory to the component functions.
+
+``ComponentProfiler`` is an opt-in context manager: while active, every public
+component function is patched (see ``components/_instrument.py``) to open a frame
+around its call ("build") and around the serialization of what it returned
+("serialize"). Frames nest like a call stack, so each component gets inclusive and
+exclusive time, and with ``memory=True`` the peak memory tracemalloc saw while it
+ran, above the level it started at::
+
+    with ComponentProfiler() as prof:
+        html = str(page())
+    for row in prof.stats():
+        ...
+
+Powers ``htpyuikit profile``; ``collapsed()`` and ``speedscope()`` export the frames
+for flame graph viewers.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import ExitStack
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from typing import Self
+
+from .components._instrument import COMPONENTS_PACKAGE
+from .components._instrument import ComponentFunction
+from .components._instrument import observe_render
+from .components._instrument import patch_components
+
+BUILD = "build"
+SERIALIZE = "serialize"
+SORT_KEYS = ("exclusive", "inclusive", "calls", "peak")
+
+
+@dataclass
+class ComponentStats:
+    """Time and peak memory of one component function over its calls."""
+
+    name: str
+    calls: int = 0
+    # Nanoseconds; inclusive counts the outermost frame only when a component nests itself.
+    inclusive_ns: int = 0
+    exclusive_ns: int = 0
+    # Exclusive time split by phase.
+    build_ns: int = 0
+    serialize_ns: int = 0
+    # Largest peak of traced memory above the frame's starting level, over all calls.
+    # A peak rather than an end-minus-start delta, which goes negative when a frame
+    # frees more than it keeps.
+    peak_bytes: int = 0
+
+
+class ComponentProfiler:
+    """Context manager recording a frame event stream for every component render."""
+
+    def __init__(self, package: str = COMPONENTS_PACKAGE, *, memory: bool = True) -> None:
+        self.package = package
+        self.memory = memory
+        # (opened, frame label, phase, perf_counter_ns, traced bytes, peak since last event)
+        self.events: list[tuple[bool, str, str, int, int, int]] = []
+        self._stack: ExitStack | None = None
+
+    def __enter__(self) -> Self:
+        stack = ExitStack()
+        stack.enter_context(patch_components(self._wrapper, self.package))
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            stack.callback(tracemalloc.stop)
+        self._stack = stack
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+    def _traced(self) -> tuple[int, int]:
+        if not self.memory:
+            return 0, 0
+        traced = tracemalloc.get_traced_memory()
+        # Every event starts a new peak window; _walk folds the windows into frames.
+        tracemalloc.reset_peak()
+        return traced
+
+    def _open(self, name: str, phase: str) -> None:
+        self.events.append((True, name, phase, time.perf_counter_ns(), *self._traced()))
+
+    def _close(self, name: str, phase: str) -> None:
+        self.events.append((False, name, phase, time.perf_counter_ns(), *self._traced()))
+
+    @contextmanager
+    def frame(self, name: str, phase: str = BUILD) -> Iterator[None]:
+        """Record a frame for non-component work, e.g. the page callable itself."""
+        self._open(name, phase)
+        try:
+            yield
+        finally:
+            self._close(name, phase)
+
+    def _wrapper(self, target: ComponentFunction) -> Callable[..., Any]:
+        func, name = target.func, target.name
+
+        def around(chunks: Iterator[str]) -> Iterator[str]:
+            self._open(name, SERIALIZE)
+            try:
+                yield from chunks
+            finally:
+                self._close(name, SERIALIZE)
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._open(name, BUILD)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                self._close(name, BUILD)
+            return observe_render(result, around)
+
+        return wrapper
+
+    def _walk(self) -> Iterator[tuple[list[str], str, str, int, int, int]]:
+        """Yield ``(stack, name, phase, inclusive_ns, exclusive_ns, peak_bytes)``."""
+        # Open frames: [name, phase, start_ns, start_bytes, child_ns, peak_traced]
+        open_frames: list[list[Any]] = []
+        for opened, name, phase, at, traced, peak in self.events:
+            # The window that just ended ran inside the innermost open frame.
+            if open_frames:
+                open_frames[-1][5] = max(open_frames[-1][5], peak)
+            if opened:
+                open_frames.append([name, phase, at, traced, 0, traced])
+                continue
+            if not open_frames:
+                continue
+            _, _, start, start_traced, child_ns, peak_traced = open_frames.pop()
+            inclusive = at - start
+            if open_frames:
+                open_frames[-1][4] += inclusive
+                open_frames[-1][5] = max(open_frames[-1][5], peak_traced)
+            stack = [f[0] for f in open_frames] + [name]
+            yield stack, name, phase, inclusive, inclusive - child_ns, peak_traced - start_traced
+
+    def stats(self, sort: str = "exclusive") -> list[ComponentStats]:
+        """Per-component totals, largest first by ``sort`` (one of ``SORT_KEYS``)."""
+        rows: dict[str, ComponentStats] = {}
+        for stack, name, phase, inclusive, exclusive, peak in self._walk():
+            row = rows.setdefault(name, ComponentStats(name))
+            if phase == BUILD:
+                row.calls += 1
+                row.build_ns += exclusive
+            else:
+                row.serialize_ns += exclusive
+            if name not in stack[:-1]:
+                row.inclusive_ns += inclusive
+            row.exclusive_ns += exclusive
+            row.peak_bytes = max(row.peak_bytes, peak)
+        key = {
+            "exclusive": lambda r: r.exclusive_ns,
+            "inclusive": lambda r: r.inclusive_ns,
+            "calls": lambda r: r.calls,
+            "peak": lambda r: r.peak_bytes,
+        }[sort]
+        return sorted(rows.values(), key=lambda r: (-key(r), r.name))
+
+    def collapsed(self) -> str:
+        """Exclusive microseconds per stack in Brendan Gregg's collapsed-stack format."""
+        totals: dict[str, int] = {}
+        for stack, _, phase, _, exclusive, _ in self._walk():
+            labels = [*stack[:-1], stack[-1] + (" (serialize)" if phase == SERIALIZE else "")]
+            key = ";".join(labels)
+            totals[key] = totals.get(key, 0) + exclusive
+        return "".join(f"{k} {v // 1000}\n" for k, v in sorted(totals.items()) if v >= 1000)
+
+    def speedscope(self, name: str = "htpy-uikit render") -> dict[str, Any]:
+        """The event stream as a speedscope "evented" profile (https://www.speedscope.app)."""
+        frames: dict[str, int] = {}
+        events = []
+        start = self.events[0][3] if self.events else 0
+        end = self.events[-1][3] if self.events else 0
+        for opened, label, phase, at, _, _ in self.events:
+            label = label + (" (serialize)" if phase == SERIALIZE else "")
+            index = frames.setdefault(label, len(frames))
+            events.append({"type": "O" if opened else "C", "frame": index, "at": at - start})
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": label} for label in frames]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": end - start,
+                    "events": events,
+                }
+            ],
+            "exporter": "htpy-uikit",
+        }
+
+
+def profile_render(
+    render: Callable[[], Any],
+    package: str = COMPONENTS_PACKAGE,
+    *,
+    label: str = "page",
+    memory: bool = True,
+    repeat: int = 1,
+) -> ComponentProfiler:
+    """Profile ``str(render())`` ``repeat`` times.
+
+    The call is the page's build frame and ``str`` its serialize frame; component frames
+    nest inside those.
+    """
+    with ComponentProfiler(package, memory=memory) as prof:
+        for _ in range(repeat):
+            with prof.frame(label, BUILD):
+                result = render()
+            with prof.frame(label, SERIALIZE):
+                str(result)
+    return prof
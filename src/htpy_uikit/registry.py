@@ -1,41 +1,380 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from collections import deque
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Iterable
 
+if TYPE_CHECKING:
+    import ast
+
 
 PKG_NAME = "htpy_uikit"
 PKG_DIR = Path(__file__).resolve().parent
 COMPONENTS_DIR = PKG_DIR / "components"
+# Generated by scripts/gen_registry_manifest.py; optional, the index falls back to scanning.
+MANIFEST_PATH = PKG_DIR / "registry.json"
+MANIFEST_VERSION = 2
 
 
 # Files considered internal/shared; they may be dependencies but are not end-user components.
 # Support files that shouldn't be listed as user-facing components
 INTERNAL_COMPONENT_MODULES = {"__init__", "_utils", "_types", "_styles"}
 INTERNAL_ROOT_MODULES = {"__init__"}
+# Public support modules: helpers and runtime tooling rather than components (compare
+# ``components/_instrument.TOOLING_MODULES``). Marked ``support`` in the manifest, they are
+# left out of ``list`` and ``add --all`` but still copied as dependencies or by name.
+SUPPORT_COMPONENT_MODULES = {"deferred", "hydrate", "metrics", "option_index", "server_timing"}
 
 
 @dataclass(frozen=True)
 class Component:
     name: str
     path: Path
+    summary: str = ""
+    exports: tuple[str, ...] = ()
+    # Package-relative POSIX paths of the package modules this file imports.
+    deps: tuple[str, ...] = ()
+    sha256: str = ""
+    # A support module (see ``SUPPORT_COMPONENT_MODULES``), not a listed component.
+    support: bool = False
 
+    @property
+    def key(self) -> str:
+        """Package-relative POSIX path identifying this module in the index."""
+        return self.path.relative_to(PKG_DIR).as_posix()
 
-def iter_component_files() -> Iterable[Path]:
+
+@dataclass(frozen=True)
+class RegistryIndex:
+    """All package modules with their metadata, plus an alias table for O(1) lookups."""
+
+    modules: dict[str, Component]
+    aliases: dict[str, str]
+    components: tuple[Component, ...]
+
+    def get(self, name_or_filename: str) -> Component | None:
+        key = self.aliases.get(name_or_filename.strip())
+        return self.modules.get(key) if key else None
+
+    def for_path(self, path: Path) -> Component | None:
+        try:
+            return self.modules.get(path.resolve().relative_to(PKG_DIR).as_posix())
+        except ValueError:
+            return None
+
+
+def _iter_module_files(base: Path, parts: list[str], names: Iterable[str]) -> Iterable[Path]:
+    """Yield ``base/<parts>.py``, or the ``names`` submodules when ``parts`` is a package."""
+    if parts:
+        cand = base.joinpath(*parts).with_suffix(".py")
+        if cand.exists():
+            yield cand
+            return
+    pkg = base.joinpath(*parts)
+    for name in names:
+        cand = pkg / f"{name}.py"
+        if cand.exists():
+            yield cand
+
+
+def iter_internal_imports(
+    tree: ast.AST,
+    file_dir: Path,
+    *,
+    pkg_name: str = PKG_NAME,
+    pkg_dir: Path = PKG_DIR,
+) -> Iterable[Path]:
+    """Yield package file paths imported from this module tree (relative and absolute).
+
+    ``pkg_name``/``pkg_dir`` name the package whose absolute imports are followed; they
+    default to this package but can point at a project's vendored components directory.
+    """
+    import ast
+
+    prefix = pkg_name.split(".")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            names = [n.name for n in node.names]
+            # Relative imports e.g. from .icons import x
+            if node.level:
+                # level=1 -> current package; level=2 -> parent, etc.
+                base = file_dir
+                steps_up = max(0, node.level - 1)
+                for _ in range(steps_up):
+                    base = base.parent
+                parts = node.module.split(".") if node.module else []
+                yield from _iter_module_files(base, parts, names)
+            # Absolute import from our package, e.g. from htpy_uikit.components import button
+            elif node.module and node.module.split(".")[: len(prefix)] == prefix:
+                parts = node.module.split(".")[len(prefix) :]
+                yield from _iter_module_files(pkg_dir, parts, names)
+        elif isinstance(node, ast.Import):
+            # import htpy_uikit.icons as icons
+            for n in node.names:
+                parts = n.name.split(".")
+                if parts[: len(prefix)] == prefix and len(parts) > len(prefix):
+                    yield from _iter_module_files(pkg_dir, parts[len(prefix) :], ())
+
+
+def _display_name(path: Path) -> str:
+    """Kebab-case name for user-facing components; internal and root modules keep their stem."""
+    if path.parent == COMPONENTS_DIR and not path.stem.startswith("_"):
+        return path.stem.replace("_", "-")
+    return path.stem
+
+
+def _is_support(path: Path) -> bool:
+    return path.parent == COMPONENTS_DIR and path.stem in SUPPORT_COMPONENT_MODULES
+
+
+def _summary(tree: ast.Module, stem: str) -> str:
+    """First docstring line of the module, else of its main public def."""
+    import ast
+
+    doc = ast.get_docstring(tree)
+    if not doc:
+        defs = [
+            node
+            for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and not node.name.startswith("_")
+        ]
+        # Prefer the function named after the module (``select`` -> ``select_component``).
+        defs.sort(key=lambda n: n.name not in {stem, f"{stem}_component"})
+        doc = next((d for d in map(ast.get_docstring, defs) if d), None)
+    return doc.strip().splitlines()[0] if doc else ""
+
+
+def scan_module(path: Path) -> Component:
+    """Parse ``path`` once and return it with exports, summary, deps and content hash."""
+    import ast  # only needed when the manifest is missing or stale
+
+    data = path.read_bytes()
+    name = _display_name(path)
+    try:
+        tree = ast.parse(data)
+    except SyntaxError:
+        return Component(
+            name=name,
+            path=path,
+            sha256=hashlib.sha256(data).hexdigest(),
+            support=_is_support(path),
+        )
+    exports = tuple(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and not node.name.startswith("_")
+    )
+    deps = dict.fromkeys(
+        p.relative_to(PKG_DIR).as_posix()
+        for p in iter_internal_imports(tree, file_dir=path.parent)
+        if p != path
+    )
+    return Component(
+        name=name,
+        path=path,
+        summary=_summary(tree, path.stem),
+        exports=exports,
+        deps=tuple(deps),
+        sha256=hashlib.sha256(data).hexdigest(),
+        support=_is_support(path),
+    )
+
+
+def _iter_package_files() -> Iterable[Path]:
     if COMPONENTS_DIR.exists():
-        for p in COMPONENTS_DIR.glob("*.py"):
-            if p.stem.startswith("_"):
-                continue
-            if p.stem in INTERNAL_COMPONENT_MODULES:
-                continue
-            yield p
+        yield from sorted(COMPONENTS_DIR.glob("*.py"))
+    yield from sorted(PKG_DIR.glob("*.py"))
+
+
+def _load_manifest() -> dict[str, dict]:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    modules = data.get("modules")
+    return modules if isinstance(modules, dict) else {}
+
+
+def _from_manifest(path: Path, entry: dict) -> Component:
+    name = _display_name(path)
+    return Component(
+        name=name,
+        path=path,
+        summary=entry.get("summary", ""),
+        exports=tuple(entry.get("exports", ())),
+        deps=tuple(entry.get("deps", ())),
+        sha256=entry.get("sha256", ""),
+        support=bool(entry.get("support", False)),
+    )
+
+
+def build_index(use_manifest: bool = True) -> RegistryIndex:
+    """Build the registry index from the shipped manifest, scanning files it doesn't cover."""
+    manifest = _load_manifest() if use_manifest else {}
+    modules: dict[str, Component] = {}
+    aliases: dict[str, str] = {}
+    for path in _iter_package_files():
+        key = path.relative_to(PKG_DIR).as_posix()
+        entry = manifest.get(key)
+        modules[key] = _from_manifest(path, entry) if entry else scan_module(path)
+        # Components directory wins over root modules (e.g. utils) for the same alias.
+        for alias in (path.stem, path.stem.replace("_", "-"), path.name):
+            aliases.setdefault(alias, key)
+
+    components = tuple(
+        sorted(
+            (
+                c
+                for c in modules.values()
+                if c.path.parent == COMPONENTS_DIR
+                and not c.path.stem.startswith("_")
+                and c.path.stem not in INTERNAL_COMPONENT_MODULES
+                and not c.support
+            ),
+            key=lambda c: c.name,
+        )
+    )
+    return RegistryIndex(modules=modules, aliases=aliases, components=components)
+
+
+@cache
+def get_index() -> RegistryIndex:
+    """Return the process-wide registry index, built on first use."""
+    return build_index()
+
+
+def _deps_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "htpy-uikit" / "deps-cache.json"
+
+
+def _load_deps_cache() -> dict[str, list[str]]:
+    try:
+        data = json.loads(_deps_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_deps_cache(data: dict[str, list[str]]) -> None:
+    path = _deps_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+    except OSError:
+        pass  # the cache is an optimisation; a read-only home must not break the CLI
+
+
+def sha256_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@cache
+def file_hashes() -> dict[str, str]:
+    """Return the current content hash of every package module, computed once per process."""
+    return {key: sha256_file(c.path) for key, c in get_index().modules.items()}
+
+
+@cache
+def get_graph() -> dict[str, tuple[str, ...]]:
+    """Return the package import graph (module key -> direct internal deps).
+
+    Deps come from the index (manifest) whenever a file's content hash still matches.
+    Locally edited files are re-parsed once per content hash; the result is kept in an
+    on-disk cache under ``$XDG_CACHE_HOME/htpy-uikit`` so later runs skip the parse.
+    """
+    index = get_index()
+    hashes = file_hashes()
+    disk_cache: dict[str, list[str]] | None = None
+    fresh: dict[str, list[str]] = {}
+    graph: dict[str, tuple[str, ...]] = {}
+    for key, comp in index.modules.items():
+        digest = hashes[key]
+        if digest == comp.sha256:
+            graph[key] = comp.deps
+            continue
+        if disk_cache is None:
+            disk_cache = _load_deps_cache()
+        cache_key = f"{key}:{digest}"
+        deps = disk_cache.get(cache_key)
+        if deps is None:
+            deps = list(scan_module(comp.path).deps)
+        fresh[cache_key] = deps
+        graph[key] = tuple(deps)
+    # Keep only entries for the current file contents so the cache cannot grow unbounded.
+    if disk_cache is not None and disk_cache != fresh:
+        _save_deps_cache(fresh)
+    return graph
+
+
+def transitive_deps(keys: Iterable[str]) -> list[str]:
+    """Return ``keys`` plus everything they import, transitively (BFS order, unique)."""
+    graph = get_graph()
+    seen = dict.fromkeys(keys)
+    queue = deque(seen)
+    while queue:
+        for dep in graph.get(queue.popleft(), ()):
+            if dep not in seen:
+                seen[dep] = None
+                queue.append(dep)
+    return list(seen)
+
+
+def dependency_chains(target: str) -> dict[str, list[str]]:
+    """Map every module that (transitively) imports ``target`` to its shortest import chain.
+
+    Each chain starts at the dependent module and ends at ``target``.
+    """
+    reverse: dict[str, list[str]] = {}
+    for key, deps in get_graph().items():
+        for dep in deps:
+            reverse.setdefault(dep, []).append(key)
+    chains: dict[str, list[str]] = {target: [target]}
+    queue = deque([target])
+    while queue:
+        cur = queue.popleft()
+        for parent in reverse.get(cur, ()):
+            if parent not in chains:
+                chains[parent] = [parent, *chains[cur]]
+                queue.append(parent)
+    del chains[target]
+    return chains
+
+
+def build_manifest() -> dict:
+    """Return manifest data for every package module, freshly scanned from disk."""
+    index = build_index(use_manifest=False)
+    return {
+        "version": MANIFEST_VERSION,
+        "modules": {
+            key: {
+                "summary": c.summary,
+                "exports": list(c.exports),
+                "deps": list(c.deps),
+                "sha256": c.sha256,
+                "support": c.support,
+            }
+            for key, c in index.modules.items()
+        },
+    }
+
+
+def iter_component_files() -> Iterable[Path]:
+    for c in get_index().components:
+        yield c.path
 
 
 def list_components() -> list[Component]:
-    comps = [Component(name=p.stem.replace("_", "-"), path=p) for p in iter_component_files()]
     # stable, user-friendly ordering
-    return sorted(comps, key=lambda c: c.name)
+    return list(get_index().components)
 
 
 def resolve_name_to_path(name_or_filename: str) -> Path | None:
@@ -43,18 +382,8 @@ def resolve_name_to_path(name_or_filename: str) -> Path | None:
 
     Accepts component name in kebab-case (e.g. "alert-dialog") or module filename (e.g. "alert_dialog").
     """
-    raw = name_or_filename.strip()
-    candidates = {raw, raw.replace("-", "_")}
-    # Prefer components directory
-    if COMPONENTS_DIR.exists():
-        for p in COMPONENTS_DIR.glob("*.py"):
-            if p.stem in candidates:
-                return p
-    # Fallback to root modules (e.g., utils)
-    for p in PKG_DIR.glob("*.py"):
-        if p.stem in candidates:
-            return p
-    return None
+    comp = get_index().get(name_or_filename)
+    return comp.path if comp else None
 
 
 def is_internal_module(name: str) -> bool:
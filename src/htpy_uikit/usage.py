@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .registry import iter_internal_imports
+
+if TYPE_CHECKING:
+    import ast
+
+
+# Directories never scanned for project imports.
+SKIP_DIRS = {
+    ".git",
+    ".hg",
+    ".venv",
+    "venv",
+    "node_modules",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".ruff_cache",
+    "build",
+    "dist",
+}
+
+
+@dataclass
+class UsageReport:
+    """Which vendored component files a project imports, directly or transitively."""
+
+    dest: Path
+    # Vendored module filename -> path (``__init__.py`` excluded).
+    vendored: dict[str, Path]
+    # Vendored filenames imported by project code.
+    used: set[str]
+    # ``used`` plus everything those files import, transitively.
+    needed: set[str]
+    # Vendored filename -> vendored filenames importing it.
+    imported_by: dict[str, set[str]]
+    project_files: list[Path]
+    # Class-like string tokens per vendored file, and across kept (needed + project) files.
+    tokens: dict[str, set[str]] = field(default_factory=dict)
+    kept_tokens: set[str] = field(default_factory=set)
+
+    @property
+    def unused(self) -> list[str]:
+        return sorted(set(self.vendored) - self.needed)
+
+    @property
+    def unused_components(self) -> list[str]:
+        """Unused files no other vendored file imports: the roots of what can be pruned."""
+        return [n for n in self.unused if not self.imported_by.get(n)]
+
+    @property
+    def transitive_only(self) -> list[str]:
+        """Unused files that are only imported by other unused files."""
+        return [n for n in self.unused if self.imported_by.get(n)]
+
+    def unique_tokens(self, name: str) -> set[str]:
+        """Tokens of ``name`` used by no kept file and no other unused file."""
+        others = set().union(*(self.tokens[n] for n in self.unused if n != name))
+        return self.tokens.get(name, set()) - self.kept_tokens - others
+
+    def prunable_tokens(self) -> set[str]:
+        """Tokens that disappear from the project once every unused file is removed."""
+        return set().union(*(self.tokens[n] for n in self.unused)) - self.kept_tokens
+
+
+def package_name_for(directory: Path) -> str:
+    """Dotted import name of ``directory``, following ``__init__.py`` files upward."""
+    parts: list[str] = []
+    cur = directory.resolve()
+    while (cur / "__init__.py").exists():
+        parts.append(cur.name)
+        cur = cur.parent
+    return ".".join(reversed(parts)) or directory.name
+
+
+def iter_project_files(root: Path, exclude: Path) -> Iterable[Path]:
+    """Yield project ``.py`` files under ``root``, skipping ``exclude`` and tool directories."""
+    exclude = exclude.resolve()
+    for dirpath, dirnames, filenames in os.walk(root):
+        here = Path(dirpath).resolve()
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d not in SKIP_DIRS and not d.startswith(".") and here / d != exclude
+        ]
+        for fn in filenames:
+            if fn.endswith(".py"):
+                yield Path(dirpath) / fn
+
+
+def _parse(path: Path) -> ast.Module | None:
+    import ast
+
+    try:
+        return ast.parse(path.read_bytes())
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def string_tokens(tree: ast.AST) -> set[str]:
+    """Whitespace-separated tokens of every string literal (f-string parts included).
+
+    This mirrors how Tailwind scans sources: over-collecting is harmless because tokens
+    only count once they match a class in the compiled CSS.
+    """
+    import ast
+
+    tokens: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            tokens.update(node.value.split())
+    return tokens
+
+
+def analyze_usage(dest: Path, root: Path, with_tokens: bool = False) -> UsageReport:
+    """Scan ``root`` for imports of the vendored components in ``dest``.
+
+    Uses the same import resolution as the CLI's dependency walker, so relative imports,
+    ``from pkg.components import button`` and ``import pkg.components.button`` all count.
+    """
+    dest = dest.resolve()
+    pkg_name = package_name_for(dest)
+    vendored = {p.name: p for p in sorted(dest.glob("*.py")) if p.name != "__init__.py"}
+
+    def imports_of(tree: ast.AST, file_dir: Path) -> set[str]:
+        found = iter_internal_imports(tree, file_dir, pkg_name=pkg_name, pkg_dir=dest)
+        return {p.name for p in found if p.parent.resolve() == dest and p.name in vendored}
+
+    tokens: dict[str, set[str]] = {}
+    deps: dict[str, set[str]] = {}
+    imported_by: dict[str, set[str]] = {}
+    for name, path in vendored.items():
+        tree = _parse(path)
+        deps[name] = imports_of(tree, dest) - {name} if tree else set()
+        for dep in deps[name]:
+            imported_by.setdefault(dep, set()).add(name)
+        if with_tokens:
+            tokens[name] = string_tokens(tree) if tree else set()
+
+    # The package __init__ may re-export components; treat it as project code.
+    project_files = list(iter_project_files(root, exclude=dest))
+    if (dest / "__init__.py").exists():
+        project_files.append(dest / "__init__.py")
+    used: set[str] = set()
+    kept_tokens: set[str] = set()
+    for path in project_files:
+        tree = _parse(path)
+        if tree is None:
+            continue
+        used |= imports_of(tree, path.parent.resolve())
+        if with_tokens:
+            kept_tokens |= string_tokens(tree)
+
+    needed = set(used)
+    stack = list(used)
+    while stack:
+        for dep in deps.get(stack.pop(), ()):
+            if dep not in needed:
+                needed.add(dep)
+                stack.append(dep)
+    for name in needed:
+        kept_tokens |= tokens.get(name, set())
+
+    return UsageReport(
+        dest=dest,
+        vendored=vendored,
+        used=used,
+        needed=needed,
+        imported_by=imported_by,
+        project_files=project_files,
+        tokens=tokens,
+        kept_tokens=kept_tokens,
+    )
+
+
+# A class selector, e.g. ``.hover\:bg-accent`` or ``.size-\[3px\]``.
+_CLASS_SELECTOR_RE = re.compile(r"\.((?:\\[0-9a-fA-F]{1,6}\s?|\\.|[\w-])+)")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_ESCAPE_RE = re.compile(r"\\([0-9a-fA-F]{1,6})\s?|\\(.)")
+
+
+def _unescape_css(ident: str) -> str:
+    return _CSS_ESCAPE_RE.sub(lambda m: chr(int(m[1], 16)) if m[1] else m[2], ident)
+
+
+def css_bytes_by_class(css: str) -> dict[str, int]:
+    """Attribute the bytes of each top-level class rule in compiled CSS to its class.
+
+    Rules nested in at-rules (``@layer``, ``@media``) are followed; a class rule's own
+    nested blocks (``&:hover { ... }``) count towards that class. Bytes of a rule with
+    several class selectors are split evenly between them.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    sizes: dict[str, int] = {}
+
+    def walk(start: int, end: int) -> None:
+        i = start
+        prelude_start = start
+        while i < end:
+            ch = css[i]
+            if ch == ";" or ch == "}":
+                prelude_start = i + 1
+            elif ch == "{":
+                close = _matching_brace(css, i)
+                prelude = css[prelude_start:i].strip()
+                if prelude.startswith("@"):
+                    walk(i + 1, close)
+                else:
+                    classes = {_unescape_css(m) for m in _CLASS_SELECTOR_RE.findall(prelude)}
+                    if classes:
+                        share = (close + 1 - prelude_start) // len(classes)
+                        for cls in classes:
+                            sizes[cls] = sizes.get(cls, 0) + share
+                i = close
+                prelude_start = close + 1
+            i += 1
+
+    walk(0, len(css))
+    return sizes
+
+
+def _matching_brace(css: str, open_idx: int) -> int:
+    depth = 0
+    for i in range(open_idx, len(css)):
+        if css[i] == "{":
+            depth += 1
+        elif css[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(css) - 1